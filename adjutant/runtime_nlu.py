@@ -14,6 +14,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import json
+import logging
 from pathlib import Path
 import re
 import time
@@ -27,6 +28,7 @@ from nlu_pipeline.runtime import PortableIntentModel
 from openra_api.production_names import normalize_production_name
 from unit_registry import UnitRegistry
 
+logger = logging.getLogger(__name__)
 
 _ROOT = Path(__file__).resolve().parents[1]
 _DEFAULT_CONFIG_PATH = _ROOT / "nlu_pipeline" / "configs" / "runtime_gateway.yaml"
@@ -412,9 +414,12 @@ class RuntimeNLURouter:
         if not self.model_path.exists():
             return None
         try:
-            return PortableIntentModel.load(self.model_path)
-        except Exception:
+            model = PortableIntentModel.load(self.model_path)
+        except Exception as e:
+            logger.warning("RuntimeNLURouter failed to load model %s: %s", self.model_path, e)
             return None
+        logger.info("RuntimeNLURouter runtime model loaded: %s (artifact=%s)", self.model_path, model.artifact_path)
+        return model
 
     @staticmethod
     def _rewrite_router_text(text: str) -> str:
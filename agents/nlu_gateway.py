@@ -104,9 +104,10 @@ class Phase2NLUGateway:
             self.model = PortableIntentModel.load(self.runtime_model_path)
             self.model_loaded = True
             logger.info(
-                "NLUGateway[%s] runtime model loaded: %s labels=%d",
+                "NLUGateway[%s] runtime model loaded: %s (artifact=%s) labels=%d",
                 self.name,
                 self.runtime_model_path,
+                self.model.artifact_path,
                 len(self.model.labels),
             )
         except Exception as e:
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+from collections import deque
 from contextlib import ContextDecorator
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from functools import wraps
+from itertools import islice
 import json
 from pathlib import Path
 from threading import RLock
 from time import perf_counter
-from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Union
+from typing import Any, Callable, Deque, Dict, Iterable, List, Literal, Optional, Union
+
+from .histogram import LatencyHistogram, WindowedHistogram
 
 
 BenchmarkTag = Literal[
@@ -50,9 +54,28 @@ class BenchmarkRecord:
         return payload
 
 
+DEFAULT_MAX_RECORDS = 10000
+
+
 class BenchmarkStore:
-    def __init__(self) -> None:
-        self._records: List[BenchmarkRecord] = []
+    """Benchmark aggregates plus a bounded ring of raw samples.
+
+    Every record feeds a streaming histogram per ``(tag, name)`` (see
+    :meth:`stats`), so percentiles cover the whole process lifetime without
+    keeping the records. Only the newest ``max_records`` raw records are
+    retained for drill-down (``query``/``records_from``/``tail``); pass
+    ``max_records=0`` to keep aggregates only. Offsets used by
+    ``records_from`` are monotonic and survive eviction.
+    """
+
+    def __init__(self, max_records: int = DEFAULT_MAX_RECORDS, *, window_slice_s: float = 10.0, window_slices: int = 30) -> None:
+        self.max_records = max(0, int(max_records))
+        self._records: Deque[BenchmarkRecord] = deque(maxlen=self.max_records)
+        self._first_offset = 0
+        self._next_offset = 0
+        self._window_slice_s = window_slice_s
+        self._window_slices = window_slices
+        self._stats: Dict[tuple[str, str], WindowedHistogram] = {}
         self._subscribers: List[Callable[[BenchmarkRecord], None]] = []
         self._lock = RLock()
 
@@ -75,7 +98,18 @@ class BenchmarkStore:
             metadata=dict(metadata or {}),
         )
         with self._lock:
-            self._records.append(record)
+            if self.max_records:
+                if len(self._records) == self.max_records:
+                    self._first_offset += 1
+                self._records.append(record)
+            else:
+                self._first_offset += 1
+            self._next_offset += 1
+            histogram = self._stats.get((tag, name))
+            if histogram is None:
+                histogram = WindowedHistogram(slice_s=self._window_slice_s, max_slices=self._window_slices)
+                self._stats[(tag, name)] = histogram
+            histogram.record(duration_ms, ended_at.timestamp())
             subscribers = list(self._subscribers)
         for subscriber in subscribers:
             try:
@@ -84,6 +118,42 @@ class BenchmarkStore:
                 continue
         return record
 
+    def stats(
+        self,
+        *,
+        tag: Optional[BenchmarkTag] = None,
+        name: Optional[str] = None,
+        by_name: bool = False,
+        window_s: Optional[float] = None,
+        now: Optional[Union[datetime, float, int]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Streaming count/avg/p50/p95/p99/max/total per tag (or per tag+name).
+
+        ``window_s`` limits the aggregate to roughly the last ``window_s``
+        seconds (slice granularity); None covers the process lifetime.
+        """
+        now_dt = _normalize_time(now) or _utc_now()
+        grouped: Dict[tuple[str, ...], List[LatencyHistogram]] = {}
+        with self._lock:
+            for (record_tag, record_name), histogram in self._stats.items():
+                if tag is not None and record_tag != tag:
+                    continue
+                if name is not None and record_name != name:
+                    continue
+                key = (record_tag, record_name) if by_name else (record_tag,)
+                grouped.setdefault(key, []).append(histogram.window(window_s, now_dt.timestamp()))
+            summary: List[Dict[str, Any]] = []
+            for key in sorted(grouped):
+                merged = LatencyHistogram.merged(grouped[key])
+                if merged.count == 0:
+                    continue
+                item: Dict[str, Any] = {"tag": key[0]}
+                if by_name:
+                    item["name"] = key[1]
+                item.update(merged.summary())
+                summary.append(item)
+        return summary
+
     def query(
         self,
         *,
@@ -93,6 +163,7 @@ class BenchmarkStore:
         top_n: Optional[int] = None,
         slowest_first: bool = True,
     ) -> List[BenchmarkRecord]:
+        """Filter the retained raw records (see ``max_records``)."""
         start_dt = _normalize_time(start_time)
         end_dt = _normalize_time(end_time)
         with self._lock:
@@ -110,20 +181,23 @@ class BenchmarkStore:
             results = results[:top_n]
         return results
 
-    def records_from(self, offset: int, *, limit: Optional[int] = None) -> List[BenchmarkRecord]:
-        start = max(0, int(offset))
+    def records_since(self, offset: int, *, limit: Optional[int] = None) -> tuple[List[BenchmarkRecord], int]:
+        """Records from ``offset`` on plus the offset to resume from (evicted offsets skip ahead)."""
         with self._lock:
-            if start >= len(self._records):
-                return []
-            records = self._records[start:] if limit is None else self._records[start : start + max(0, int(limit))]
-            return list(records)
+            start = min(max(self._first_offset, int(offset)), self._next_offset)
+            stop = self._next_offset if limit is None else min(self._next_offset, start + max(0, int(limit)))
+            base = start - self._first_offset
+            return list(islice(self._records, base, base + (stop - start))), stop
+
+    def records_from(self, offset: int, *, limit: Optional[int] = None) -> List[BenchmarkRecord]:
+        return self.records_since(offset, limit=limit)[0]
 
     def tail(self, *, limit: int = 100) -> List[BenchmarkRecord]:
         remaining = max(0, int(limit))
         if remaining == 0:
             return []
         with self._lock:
-            return list(self._records[-remaining:])
+            return list(islice(self._records, max(0, len(self._records) - remaining), None))
 
     def export_json(
         self,
@@ -154,6 +228,9 @@ class BenchmarkStore:
     def clear(self) -> None:
         with self._lock:
             self._records.clear()
+            self._first_offset = 0
+            self._next_offset = 0
+            self._stats.clear()
 
     def subscribe(self, callback: Callable[[BenchmarkRecord], None]) -> None:
         with self._lock:
@@ -325,6 +402,20 @@ def records_from(offset: int, *, limit: Optional[int] = None) -> List[BenchmarkR
     return _DEFAULT_STORE.records_from(offset, limit=limit)
 
 
+def records_since(offset: int, *, limit: Optional[int] = None) -> tuple[List[BenchmarkRecord], int]:
+    return _DEFAULT_STORE.records_since(offset, limit=limit)
+
+
+def stats(
+    *,
+    tag: Optional[BenchmarkTag] = None,
+    name: Optional[str] = None,
+    by_name: bool = False,
+    window_s: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    return _DEFAULT_STORE.stats(tag=tag, name=name, by_name=by_name, window_s=window_s)
+
+
 def tail_records(*, limit: int = 100) -> List[BenchmarkRecord]:
     return _DEFAULT_STORE.tail(limit=limit)
 
@@ -341,6 +432,7 @@ __all__ = [
     "BenchmarkRecord",
     "BenchmarkStore",
     "BenchmarkTag",
+    "LatencyHistogram",
     "Timer",
     "clear",
     "export_json",
@@ -348,7 +440,9 @@ __all__ = [
     "record",
     "records",
     "records_from",
+    "records_since",
     "span",
+    "stats",
     "subscribe",
     "tail_records",
     "timed",
@@ -0,0 +1,129 @@
+"""Streaming latency histograms used by ``BenchmarkStore`` aggregates."""
+
+from __future__ import annotations
+
+from collections import deque
+import math
+from typing import Any, Dict, Iterable, Optional
+
+# Bucket boundaries grow geometrically by this factor (~1% relative error on percentiles).
+BUCKET_GROWTH = 1.02
+MIN_TRACKABLE_MS = 0.001
+_LOG_GROWTH = math.log(BUCKET_GROWTH)
+
+
+class LatencyHistogram:
+    """Log-bucketed (HDR-style) histogram with exact count/total/min/max.
+
+    Memory is bounded by the number of distinct buckets (about 1000 between
+    1us and 1000s), independent of how many samples are recorded.
+    """
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @staticmethod
+    def _bucket(value: float) -> int:
+        if value <= MIN_TRACKABLE_MS:
+            return 0
+        return int(math.log(value / MIN_TRACKABLE_MS) / _LOG_GROWTH) + 1
+
+    @staticmethod
+    def _bucket_value(bucket: int) -> float:
+        if bucket <= 0:
+            return MIN_TRACKABLE_MS
+        # Geometric midpoint of [growth^(b-1), growth^b) * MIN.
+        return MIN_TRACKABLE_MS * BUCKET_GROWTH ** (bucket - 0.5)
+
+    def record(self, value: float) -> None:
+        value = float(value)
+        bucket = self._bucket(value)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, pct: float) -> float:
+        """Approximate percentile (``pct`` in 0..1), clamped to the observed min/max."""
+        if self.count == 0:
+            return 0.0
+        if pct <= 0:
+            return self.min
+        if pct >= 1:
+            return self.max
+        rank = pct * (self.count - 1)
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen > rank:
+                return min(max(self._bucket_value(bucket), self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        if self.count == 0:
+            return {"count": 0, "avg_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0, "total_ms": 0.0}
+        return {
+            "count": self.count,
+            "avg_ms": self.total / self.count,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max,
+            "total_ms": self.total,
+        }
+
+    @classmethod
+    def merged(cls, histograms: Iterable["LatencyHistogram"]) -> "LatencyHistogram":
+        result = cls()
+        for histogram in histograms:
+            result.merge(histogram)
+        return result
+
+
+class WindowedHistogram:
+    """Lifetime histogram plus fixed-width time slices for recent-window percentiles."""
+
+    __slots__ = ("lifetime", "slice_s", "_slices")
+
+    def __init__(self, *, slice_s: float = 10.0, max_slices: int = 30) -> None:
+        self.lifetime = LatencyHistogram()
+        self.slice_s = max(float(slice_s), 0.001)
+        self._slices: deque[tuple[float, LatencyHistogram]] = deque(maxlen=max(1, int(max_slices)))
+
+    @property
+    def max_window_s(self) -> float:
+        return self.slice_s * (self._slices.maxlen or 1)
+
+    def record(self, value: float, timestamp: float) -> None:
+        self.lifetime.record(value)
+        slice_start = math.floor(timestamp / self.slice_s) * self.slice_s
+        if not self._slices or self._slices[-1][0] < slice_start:
+            self._slices.append((slice_start, LatencyHistogram()))
+        # Late samples land in the newest slice rather than reopening an old one.
+        self._slices[-1][1].record(value)
+
+    def window(self, window_s: Optional[float], now: float) -> LatencyHistogram:
+        """Histogram of the slices overlapping the last ``window_s`` seconds (lifetime when None)."""
+        if window_s is None:
+            return self.lifetime
+        cutoff = now - float(window_s)
+        return LatencyHistogram.merged(
+            histogram for slice_start, histogram in self._slices if slice_start + self.slice_s > cutoff
+        )
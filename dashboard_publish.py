@@ -3,16 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import time
 from typing import Any, Awaitable, Callable, Optional
 
 import benchmark
 
 from adjutant import NotificationManager
-from logging_system import get_logger, records_from as log_records_from
+from logging_system import first_record_offset, get_logger, records_from as log_records_from, records_since as log_records_since
 from models import TaskMessage, TaskMessageType
-from ws_server import WSServer
+from ws_server import DeltaStream, WSServer
 
 slog = get_logger("dashboard_publish")
 
@@ -35,7 +34,10 @@ class DashboardPublisher:
         self._dashboard_payload_builder = dashboard_payload_builder
         self._task_payload_builder = task_payload_builder
 
-        self.task_fingerprints: dict[str, str] = {}
+        # Task payloads per publish: the stream version only moves when a payload changed.
+        self.task_stream = DeltaStream("task_list")
+        self.task_update_version = 0  # task_stream version last pushed as task_update
+        self._dashboard_tasks: Optional[list[dict[str, Any]]] = None
         self.task_message_offset = 0
         self.notification_manager: Optional[NotificationManager] = None
         self.log_offset = 0
@@ -84,7 +86,9 @@ class DashboardPublisher:
         if self.publish_task is not None and not self.publish_task.done():
             self.publish_task.cancel()
         self.publish_task = None
-        self.task_fingerprints.clear()
+        self.task_stream = DeltaStream("task_list")
+        self.task_update_version = 0
+        self._dashboard_tasks = None
         self.task_message_offset = 0
         self.notification_manager = None
         self.log_offset = 0
@@ -96,6 +100,7 @@ class DashboardPublisher:
         if self.ws_server is None or not self.ws_server.is_running:
             return
         async with self.publish_lock:
+            self._dashboard_tasks = None
             had_fault = False
             had_fault |= not await self._run_publish_stage("dashboard", self.broadcast_current_dashboard)
             had_fault |= not await self._run_publish_stage("task_updates", self.publish_task_updates)
@@ -153,18 +158,36 @@ class DashboardPublisher:
         return dict(self._runtime_fault_state)
 
     async def publish_task_updates(self) -> None:
+        """Push task_update for each task whose payload changed since the last push.
+
+        Reuses the task payloads built by the dashboard stage of the same
+        publish when available. The payload list is recorded in ``task_stream``
+        without a JSON copy; an unchanged list keeps its version and nothing
+        is compared per task.
+        """
         assert self.ws_server is not None
-        runtime_state = self.kernel.runtime_state()
-        for task in self.kernel.list_tasks():
-            payload = self._task_payload_builder(
-                task,
-                self.kernel.jobs_for_task(task.task_id),
-                runtime_state=runtime_state,
-            )
-            fingerprint = json.dumps(payload, ensure_ascii=False, sort_keys=True)
-            if self.task_fingerprints.get(task.task_id) == fingerprint:
+        tasks, self._dashboard_tasks = self._dashboard_tasks, None
+        if tasks is None:
+            runtime_state = self.kernel.runtime_state()
+            tasks = [
+                self._task_payload_builder(
+                    task,
+                    self.kernel.jobs_for_task(task.task_id),
+                    runtime_state=runtime_state,
+                )
+                for task in self.kernel.list_tasks()
+            ]
+        version = self.task_stream.publish(tasks, canonical=False)
+        if version == self.task_update_version:
+            return
+        previous = {
+            payload.get("task_id"): payload
+            for payload in self.task_stream.get(self.task_update_version) or []
+        }
+        self.task_update_version = version
+        for payload in tasks:
+            if previous.get(payload.get("task_id")) == payload:
                 continue
-            self.task_fingerprints[task.task_id] = fingerprint
             await self.ws_server.send_task_update(payload)
 
     async def publish_task_messages(self) -> None:
@@ -198,8 +221,7 @@ class DashboardPublisher:
 
     async def publish_logs(self) -> None:
         assert self.ws_server is not None
-        new_records = log_records_from(self.log_offset, limit=self.log_publish_batch_size)
-        self.log_offset += len(new_records)
+        new_records, self.log_offset = log_records_since(self.log_offset, limit=self.log_publish_batch_size)
         for record in new_records:
             if record.component == "benchmark":
                 continue
@@ -207,10 +229,9 @@ class DashboardPublisher:
 
     async def publish_benchmarks(self) -> None:
         assert self.ws_server is not None
-        new_records = benchmark.records_from(self.benchmark_offset)
+        new_records, self.benchmark_offset = benchmark.records_since(self.benchmark_offset)
         if not new_records:
             return
-        self.benchmark_offset += len(new_records)
         await self.ws_server.send_benchmark(
             {
                 "records": [record.to_dict() for record in new_records],
@@ -221,6 +242,7 @@ class DashboardPublisher:
     async def broadcast_current_dashboard(self) -> None:
         assert self.ws_server is not None
         dashboard = self._dashboard_payload_builder()
+        self._dashboard_tasks = dashboard["tasks"]
         await self.ws_server.send_world_snapshot(dashboard["world_snapshot"])
         await self.ws_server.send_task_list(
             dashboard["tasks"],
@@ -339,9 +361,10 @@ class DashboardPublisher:
         if self.ws_server is None or not self.ws_server.is_running:
             return
 
+        history_start = first_record_offset()
         history_logs = [
             record.to_dict()
-            for record in log_records_from(0, limit=self.log_offset)
+            for record in log_records_from(history_start, limit=max(0, self.log_offset - history_start))
             if record.component != "benchmark"
         ][-500:]
         for entry in history_logs:
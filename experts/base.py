@@ -9,11 +9,13 @@ Expert types (design.md §4, not mergeable):
 from __future__ import annotations
 
 import logging
+import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field, is_dataclass
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterator, Optional
 
 from benchmark import span as bm_span
 from logging_system import get_logger
@@ -92,6 +94,30 @@ class PlannerExpert(ABC):
         """
 
 
+# ---------------------------------------------------------------------------
+# Signal capture — lets GameLoop tick Jobs on worker threads and deliver
+# their Signals afterwards in a deterministic order.
+# ---------------------------------------------------------------------------
+
+_signal_capture = threading.local()
+
+
+@contextmanager
+def capture_signals() -> Iterator[list[tuple[SignalCallback, ExpertSignal]]]:
+    """Buffer Signals emitted on the current thread instead of delivering them.
+
+    Yields a list of ``(callback, signal)`` pairs; the caller is responsible
+    for invoking each callback once the buffered tick has finished.
+    """
+    previous = getattr(_signal_capture, "buffer", None)
+    buffer: list[tuple[SignalCallback, ExpertSignal]] = []
+    _signal_capture.buffer = buffer
+    try:
+        yield buffer
+    finally:
+        _signal_capture.buffer = previous
+
+
 # ---------------------------------------------------------------------------
 # Job — runtime instance of an Execution Expert
 # ---------------------------------------------------------------------------
@@ -280,6 +306,10 @@ class BaseJob(ABC):
             data=data or {},
             decision=decision or {},
         )
+        buffer = getattr(_signal_capture, "buffer", None)
+        if buffer is not None:
+            buffer.append((self._signal_callback, signal))
+            return
         self._signal_callback(signal)
 
     # --- Constraint reading ---
@@ -13,11 +13,13 @@ from __future__ import annotations
 
 import logging
 import math
+from collections.abc import Mapping
 from enum import Enum
 from typing import Any, Optional, Protocol
 
 from models import CombatJobConfig, EngagementMode, JobStatus, ResourceKind, ResourceNeed, SignalKind
 from openra_api.models import Actor, Location
+from world_model.views import query_view
 
 from .base import BaseJob, ConstraintProvider, ExecutionExpert, SignalCallback
 from .game_api_protocol import GameAPILike
@@ -382,7 +384,7 @@ class CombatJob(BaseJob):
     def _choose_threat_direction(self, fallback_pos: tuple[int, int]) -> tuple[int, int]:
         """Return the best guess at where enemies are. Priority: known positions → map center → fallback."""
         # Priority 1: known enemy actor positions centroid
-        result = self.world_model.query("enemy_actors")
+        result = query_view(self.world_model, "enemy_actors")
         actors = result.get("actors", []) if isinstance(result, dict) else []
         if actors:
             xs = [a["position"][0] for a in actors if a.get("position")]
@@ -396,7 +398,7 @@ class CombatJob(BaseJob):
             w = map_info.get("width", 0)
             h = map_info.get("height", 0)
             if w and h:
-                base_result = self.world_model.query("my_actors", {"category": "building"})
+                base_result = query_view(self.world_model, "my_actors", {"category": "building"})
                 buildings = base_result.get("actors", []) if isinstance(base_result, dict) else []
                 if buildings:
                     positions = [a["position"] for a in buildings if a.get("position")]
@@ -427,17 +429,17 @@ class CombatJob(BaseJob):
         self.game_api.move_units_by_location(actors, loc, attack_move=attack_move)
 
     def _attack_unit(self, actor_ids: list[int], target_id: int) -> None:
-        """Wrapper: attack a specific enemy unit."""
-        for aid in actor_ids:
-            self.game_api.attack_target(Actor(actor_id=aid), Actor(actor_id=target_id))
+        """Wrapper: attack a specific enemy unit with all actors in one order."""
+        target = Actor(actor_id=target_id)
+        self.game_api.attack_targets([(Actor(actor_id=aid), target) for aid in actor_ids])
 
     def _visible_target_actor(self, target_actor_id: Optional[int]) -> Optional[dict[str, Any]]:
         """Return the currently visible/known target actor, if available."""
         if target_actor_id is None:
             return None
-        result = self.world_model.query("actor_by_id", {"actor_id": target_actor_id})
+        result = query_view(self.world_model, "actor_by_id", {"actor_id": target_actor_id})
         actor = result.get("actor") if isinstance(result, dict) else None
-        if isinstance(actor, dict) and actor.get("position"):
+        if isinstance(actor, Mapping) and actor.get("position"):
             return actor
         return None
 
@@ -479,7 +481,7 @@ class CombatJob(BaseJob):
 
     def _find_enemies_near(self, position: tuple[int, int], radius: float) -> list[dict]:
         """Query WorldModel for enemy actors near a position (visible + frozen)."""
-        result = self.world_model.query("enemy_actors")
+        result = query_view(self.world_model, "enemy_actors")
         actors = result.get("actors", []) if isinstance(result, dict) else []
         nearby = []
         for a in actors:
@@ -500,7 +502,7 @@ class CombatJob(BaseJob):
         """Get the centroid position of our units."""
         positions = []
         for aid in actor_ids:
-            result = self.world_model.query("actor_by_id", {"actor_id": aid})
+            result = query_view(self.world_model, "actor_by_id", {"actor_id": aid})
             actor = result.get("actor") if isinstance(result, dict) else None
             if actor and actor.get("position"):
                 positions.append(actor["position"])
@@ -514,7 +516,7 @@ class CombatJob(BaseJob):
         """Get average HP ratio of our units."""
         ratios = []
         for aid in actor_ids:
-            result = self.world_model.query("actor_by_id", {"actor_id": aid})
+            result = query_view(self.world_model, "actor_by_id", {"actor_id": aid})
             actor = result.get("actor") if isinstance(result, dict) else None
             if actor:
                 hp = float(actor.get("hp", 100))
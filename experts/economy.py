@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import time
+from collections.abc import Mapping
 from typing import Any, Optional, Protocol
 
 from benchmark import span as bm_span
@@ -11,6 +12,7 @@ from models import ConstraintEnforcement, EventType, JobStatus, EconomyJobConfig
 from openra_api.game_api import GameAPIError
 from openra_api.production_names import normalize_production_name, production_name_matches
 from openra_state.data.dataset import demo_faction_hint_for_unit_types
+from world_model.views import query_view
 
 from .base import BaseJob, ConstraintProvider, ExecutionExpert, SignalCallback
 from .knowledge import (
@@ -204,7 +206,7 @@ class EconomyJob(BaseJob):
         """Detect idle harvesters and send them to mine."""
         if not self._is_economy_unit():
             return
-        result = self.world_model.query("my_actors")
+        result = query_view(self.world_model, "my_actors")
         actors = result.get("actors", []) if isinstance(result, dict) else []
         harvesters = [a for a in actors if a.get("category") == "harvester" and a.get("position")]
 
@@ -439,13 +441,13 @@ class EconomyJob(BaseJob):
 
     def _matching_self_actor_ids(self) -> set[int]:
         try:
-            payload = self.world_model.query("my_actors")
+            payload = query_view(self.world_model, "my_actors")
         except Exception:
             return set()
         actors = payload.get("actors", []) if isinstance(payload, dict) else []
         matching_ids: set[int] = set()
         for actor in actors:
-            if not isinstance(actor, dict):
+            if not isinstance(actor, Mapping):
                 continue
             if production_name_matches(
                 self.config.unit_type,
@@ -460,13 +462,13 @@ class EconomyJob(BaseJob):
     def _player_faction(self) -> str:
         """Best-effort faction inference from current self actors, fallback Soviet."""
         try:
-            payload = self.world_model.query("my_actors")
+            payload = query_view(self.world_model, "my_actors")
         except Exception:
             return "soviet"
         actors = payload.get("actors", []) if isinstance(payload, dict) else []
         unit_types: list[str] = []
         for actor in actors:
-            if not isinstance(actor, dict):
+            if not isinstance(actor, Mapping):
                 continue
             normalized = normalize_production_name(actor.get("name") or actor.get("display_name") or "")
             if normalized:
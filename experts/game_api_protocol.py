@@ -6,7 +6,7 @@ Experts import this instead of defining their own ad-hoc protocols.
 
 from __future__ import annotations
 
-from typing import List, Optional, Protocol
+from typing import Dict, List, Optional, Protocol, Tuple
 
 from openra_api.models import Actor, Location, TargetsQueryParam
 
@@ -26,6 +26,8 @@ class GameAPILike(Protocol):
 
     def attack_target(self, attacker: Actor, target: Actor) -> bool: ...
 
+    def attack_targets(self, pairs: List[Tuple[Actor, Actor]]) -> Dict[int, bool]: ...
+
     def stop(self, actors: List[Actor]) -> None: ...
 
     def repair_units(self, actors: List[Actor]) -> None: ...
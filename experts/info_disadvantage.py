@@ -1,6 +1,9 @@
 import math
+from collections import deque
 from typing import Any, Dict, List, Tuple
 
+from world_model.spatial import SpatialIndex
+
 class DisadvantageAssessor:
     """Information Expert: evaluates tactical disadvantage.
     
@@ -74,6 +77,7 @@ class DisadvantageAssessor:
         # A simple grid-based local clustering for friendly units
         if friendly_mobile and enemy_mobile:
             clusters = self._cluster_units(friendly_mobile, eps=15.0)
+            enemy_index = SpatialIndex(enemy_mobile, cell_size=int(self._LOCAL_THREAT_RADIUS))
             for i, cluster in enumerate(clusters):
                 squad_score = sum(u.combat_value for u in cluster)
                 if squad_score <= 0:
@@ -83,11 +87,9 @@ class DisadvantageAssessor:
                 cy = sum(u.position[1] for u in cluster) / len(cluster)
 
                 # Find enemies near this squad center
-                nearby_enemy_score = 0.0
-                for eu in enemy_mobile:
-                    dist = math.hypot(eu.position[0] - cx, eu.position[1] - cy)
-                    if dist <= self._LOCAL_THREAT_RADIUS:
-                        nearby_enemy_score += eu.combat_value
+                nearby_enemy_score = sum(
+                    eu.combat_value for eu in enemy_index.within((cx, cy), self._LOCAL_THREAT_RADIUS)
+                )
 
                 ratio = nearby_enemy_score / max(1.0, squad_score)
                 diff = nearby_enemy_score - squad_score
@@ -112,27 +114,27 @@ class DisadvantageAssessor:
         
         clusters: List[List[Any]] = []
         visited = set()
+        # Neighbour lookups go through a grid index instead of rescanning every unit.
+        index = SpatialIndex(units, cell_size=max(int(math.ceil(eps)), 1))
 
-        for i, u1 in enumerate(units):
-            if i in visited:
+        for u1 in units:
+            if id(u1) in visited:
                 continue
             
             # Start a new cluster
             current_cluster = [u1]
-            visited.add(i)
+            visited.add(id(u1))
             
             # Expand cluster
-            queue = [u1]
+            queue = deque([u1])
             while queue:
-                current_u = queue.pop(0)
-                for j, u2 in enumerate(units):
-                    if j in visited:
+                current_u = queue.popleft()
+                for u2 in index.within(current_u.position, eps):
+                    if id(u2) in visited:
                         continue
-                    dist = math.hypot(current_u.position[0] - u2.position[0], current_u.position[1] - u2.position[1])
-                    if dist <= eps:
-                        visited.add(j)
-                        current_cluster.append(u2)
-                        queue.append(u2)
+                    visited.add(id(u2))
+                    current_cluster.append(u2)
+                    queue.append(u2)
             
             clusters.append(current_cluster)
             
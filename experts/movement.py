@@ -13,6 +13,7 @@ from typing import Any, Optional, Protocol
 
 from models import ConstraintEnforcement, MovementJobConfig, MoveMode, ResourceKind, ResourceNeed, SignalKind
 from openra_api.models import Actor, Location
+from world_model.views import query_view
 
 from .base import BaseJob, ConstraintProvider, ExecutionExpert, SignalCallback
 from .game_api_protocol import GameAPILike
@@ -169,7 +170,7 @@ class MovementJob(BaseJob):
         """Compute centroid of all living actors."""
         positions = []
         for aid in actor_ids:
-            result = self.world_model.query("actor_by_id", {"actor_id": aid})
+            result = query_view(self.world_model, "actor_by_id", {"actor_id": aid})
             actor = result.get("actor") if isinstance(result, dict) else None
             if actor and actor.get("position"):
                 positions.append(actor["position"])
@@ -218,7 +219,7 @@ class MovementJob(BaseJob):
         """
         alive_count = 0
         for aid in actor_ids:
-            result = self.world_model.query("actor_by_id", {"actor_id": aid})
+            result = query_view(self.world_model, "actor_by_id", {"actor_id": aid})
             actor = result.get("actor") if isinstance(result, dict) else None
             if actor is None:
                 continue  # Dead actor — skip
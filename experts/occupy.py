@@ -7,6 +7,7 @@ from typing import Any, Optional, Protocol
 
 from models import JobStatus, OccupyJobConfig, ResourceKind, ResourceNeed, SignalKind
 from openra_api.models import Actor
+from world_model.views import query_view
 
 from .base import BaseJob, ConstraintProvider, ExecutionExpert, SignalCallback
 from .game_api_protocol import GameAPILike
@@ -72,7 +73,7 @@ class OccupyJob(BaseJob):
         if not self.resources and not self._issued:
             return
 
-        result = self.world_model.query("actor_by_id", {"actor_id": config.target_actor_id})
+        result = query_view(self.world_model, "actor_by_id", {"actor_id": config.target_actor_id})
         actor = result.get("actor") if isinstance(result, dict) else None
         if actor and actor.get("owner") == "self":
             self.status = JobStatus.SUCCEEDED
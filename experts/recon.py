@@ -19,7 +19,9 @@ from typing import Any, Optional, Protocol
 from benchmark import span as bm_span
 
 from models import ConstraintEnforcement, JobStatus, ReconJobConfig, ResourceKind, ResourceNeed, SignalKind
+from openra_api.frontier import LAYOUTS, FrontierGrid, detect_grid_origin, frontier_grid
 from openra_api.models import Actor, Location
+from world_model.views import query_view
 
 from .base import BaseJob, ConstraintProvider, ExecutionExpert, SignalCallback
 from .knowledge import awareness_recovery_package, has_awareness_gateway, radar_loss_impact
@@ -28,116 +30,12 @@ from .knowledge import awareness_recovery_package, has_awareness_gateway, radar_
 # ---------------------------------------------------------------------------
 # Grid helpers (adapted from openra_api/jobs/explore.py)
 # All positions are cell coordinates (int tuples). Layout describes the axis
-# ordering of the IsExplored list-of-lists.
+# ordering of the IsExplored list-of-lists. Whole-grid passes (frontier mask,
+# block counts, path ratios) go through the shared openra_api.frontier engine.
 # ---------------------------------------------------------------------------
 
 _GOLDEN_ANGLE = 2.399963229728653  # radians
-
-
-def _is_explored_cell(
-    exp: list, x: int, y: int, w: int, h: int, layout: str
-) -> bool:
-    """Return True if grid cell (x, y) is marked as explored."""
-    if x < 0 or y < 0 or x >= w or y >= h:
-        return False
-    try:
-        if layout == "col_major":
-            col = exp[x] if x < len(exp) else []
-            return bool(col[y]) if y < len(col) else False
-        row = exp[y] if y < len(exp) else []
-        return bool(row[x]) if x < len(row) else False
-    except Exception:
-        return False
-
-
-def _bresenham_pts(x0: int, y0: int, x1: int, y1: int) -> list[tuple[int, int]]:
-    """4-connected Bresenham line cells from (x0,y0) to (x1,y1)."""
-    pts: list[tuple[int, int]] = []
-    dx, dy = abs(x1 - x0), abs(y1 - y0)
-    sx = 1 if x0 < x1 else -1
-    sy = 1 if y0 < y1 else -1
-    err = dx - dy
-    x, y = x0, y0
-    while True:
-        pts.append((x, y))
-        if x == x1 and y == y1:
-            break
-        e2 = err * 2
-        if e2 > -dy:
-            err -= dy
-            x += sx
-        if e2 < dx:
-            err += dx
-            y += sy
-    return pts
-
-
-def _unexplored_ratio(
-    exp: list,
-    w: int,
-    h: int,
-    layout: str,
-    origin: int,
-    cur: tuple[int, int],
-    tgt: tuple[int, int],
-) -> float:
-    """Fraction of cells along cur→tgt line (skipping start) that are unexplored."""
-    x0 = max(0, min(w - 1, cur[0] - origin))
-    y0 = max(0, min(h - 1, cur[1] - origin))
-    x1 = max(0, min(w - 1, tgt[0] - origin))
-    y1 = max(0, min(h - 1, tgt[1] - origin))
-    pts = _bresenham_pts(x0, y0, x1, y1)
-    if len(pts) <= 1:
-        return 0.0
-    total = unexp = 0
-    for px, py in pts[1:]:
-        total += 1
-        if not _is_explored_cell(exp, px, py, w, h, layout):
-            unexp += 1
-    return unexp / total if total > 0 else 0.0
-
-
-def _detect_grid_origin(positions: list[tuple[int, int]], w: int, h: int) -> int:
-    """Infer whether grid uses 0-indexed or 1-indexed cell coordinates."""
-    if not positions or not w or not h:
-        return 1
-    xs = [p[0] for p in positions]
-    ys = [p[1] for p in positions]
-    if any(v == 0 for v in xs + ys):
-        return 0
-    if any(v == w or v == h for v in xs + ys):
-        return 1
-    if max(xs) <= w - 1 and max(ys) <= h - 1:
-        return 0
-    return 1
-
-
-def _choose_grid_layout(
-    exp: list,
-    w: int,
-    h: int,
-    origin: int,
-    positions: list[tuple[int, int]],
-) -> str:
-    """Determine row_major vs col_major by checking explored-ness at known positions.
-
-    Uses multiple probe positions for accuracy. Ties default to col_major
-    (OpenRA's native format).
-    """
-    def score(layout: str) -> int:
-        s = 0
-        for pos in positions:
-            gx = max(0, min(w - 1, pos[0] - origin))
-            gy = max(0, min(h - 1, pos[1] - origin))
-            s += 1000 if _is_explored_cell(exp, gx, gy, w, h, layout) else -1000
-            for dy in (-1, 0, 1):
-                for dx in (-1, 0, 1):
-                    x2, y2 = gx + dx, gy + dy
-                    if 0 <= x2 < w and 0 <= y2 < h and _is_explored_cell(exp, x2, y2, w, h, layout):
-                        s += 1
-        return s
-    # Ties default to col_major (OpenRA native format).
-    return "row_major" if score("row_major") > score("col_major") else "col_major"
+_FRONTIER_BLOCK = 8
 
 
 def _xorshift32(v: int) -> int:
@@ -288,6 +186,35 @@ class ReconJob(BaseJob):
         for aid in list(self._scout_states):
             ReconJob._global_scout_targets.pop(aid, None)
 
+    def _frontier_grid(self) -> Optional[FrontierGrid]:
+        """Shared frontier engine for the current map_raw, or None without map dimensions."""
+        now = self._now()
+        if self._cached_grid is None or now - self._grid_cache_time >= self._grid_cache_ttl:
+            self._cached_grid = self.world_model.query("map_raw")
+            self._grid_cache_time = now
+        map_info = self._cached_grid
+        w = int(map_info.get("width") or 0)
+        h = int(map_info.get("height") or 0)
+        if not w or not h:
+            return None
+        return frontier_grid(map_info.get("is_explored"), w, h)
+
+    def _grid_geometry(self, grid: FrontierGrid, cur: tuple[int, int]) -> tuple[int, str]:
+        """Grid origin/layout published on map_raw, detected from scout + base only as a fallback."""
+        map_info = self._cached_grid or {}
+        origin = map_info.get("grid_origin")
+        layout = map_info.get("grid_layout")
+        if origin is not None and layout in LAYOUTS:
+            return int(origin), layout
+        # Base position + scout position: base is far from the diagonal and
+        # always explored, giving a reliable signal.
+        probe_positions = [cur]
+        base = self._base_centroid()
+        if base:
+            probe_positions.append(base)
+        origin = detect_grid_origin([cur], grid.width, grid.height)
+        return origin, grid.choose_layout(origin, probe_positions)
+
     def _effective_search_region(self) -> str:
         """Widen enemy_half to full_map when explored_pct > 60%."""
         region = self.config.search_region
@@ -369,7 +296,7 @@ class ReconJob(BaseJob):
             if not resource_id.startswith("actor:"):
                 continue
             actor_id = int(resource_id.split(":", 1)[1])
-            payload = self.world_model.query("actor_by_id", {"actor_id": actor_id})
+            payload = query_view(self.world_model, "actor_by_id", {"actor_id": actor_id})
             actor = payload.get("actor") if isinstance(payload, dict) else None
             if actor:
                 result.append(actor)
@@ -482,48 +409,22 @@ class ReconJob(BaseJob):
         groups them into 8x8 clusters, and picks the closest cluster center that is
         far from other scouts and within the search_region direction constraint.
         """
-        now = self._now()
-        if self._cached_grid is None or now - self._grid_cache_time >= self._grid_cache_ttl:
-            self._cached_grid = self.world_model.query("map_raw")
-            self._grid_cache_time = now
-        map_info = self._cached_grid
-        exp: list = list(map_info.get("is_explored") or [])
-        w = int(map_info.get("width") or 0)
-        h = int(map_info.get("height") or 0)
-        if not w or not h:
+        grid = self._frontier_grid()
+        if grid is None:
             return None
+        w, h = grid.width, grid.height
+        origin, layout = self._grid_geometry(grid, cur)
 
-        origin = _detect_grid_origin([cur], w, h)
-        probe_positions = [cur]
-        base = self._base_centroid()
-        if base:
-            probe_positions.append(base)
-        layout = _choose_grid_layout(exp, w, h, origin, probe_positions)
-
-        # Scan grid in 8x8 blocks, count frontier cells per block.
-        # A frontier cell = unexplored cell with at least one explored neighbor.
-        block = 8
+        # Frontier cells (unexplored with an explored 4-neighbour) counted per
+        # 8x8 block; shared across scouts until the map layer refreshes.
+        block = _FRONTIER_BLOCK
         clusters: list[tuple[int, int, int]] = []  # (cx, cy, frontier_count)
-        for by in range(0, h, block):
-            for bx in range(0, w, block):
-                frontier_count = 0
-                for dy in range(min(block, h - by)):
-                    for dx in range(min(block, w - bx)):
-                        gx, gy = bx + dx, by + dy
-                        if _is_explored_cell(exp, gx, gy, w, h, layout):
-                            continue
-                        # Check if any neighbor is explored
-                        for nx, ny in ((gx-1, gy), (gx+1, gy), (gx, gy-1), (gx, gy+1)):
-                            if 0 <= nx < w and 0 <= ny < h and _is_explored_cell(exp, nx, ny, w, h, layout):
-                                frontier_count += 1
-                                break
-                if frontier_count == 0:
-                    continue
-                cx = bx + block // 2 + origin
-                cy = by + block // 2 + origin
-                if f"{cx},{cy}" in st.visited:
-                    continue
-                clusters.append((cx, cy, frontier_count))
+        for bx, by, frontier_count in grid.blocks(layout, "frontier", block):
+            cx = bx + block // 2 + origin
+            cy = by + block // 2 + origin
+            if f"{cx},{cy}" in st.visited:
+                continue
+            clusters.append((cx, cy, frontier_count))
 
         if not clusters:
             return None
@@ -572,25 +473,11 @@ class ReconJob(BaseJob):
         radius and lowers threshold on each unsuccessful pass. Returns None only
         if all expansions fail (very unlikely on unexplored maps).
         """
-        now = self._now()
-        if self._cached_grid is None or now - self._grid_cache_time >= self._grid_cache_ttl:
-            self._cached_grid = self.world_model.query("map_raw")
-            self._grid_cache_time = now
-        map_info = self._cached_grid
-        exp: list = list(map_info.get("is_explored") or [])
-        w = int(map_info.get("width") or 0)
-        h = int(map_info.get("height") or 0)
-        if not w or not h:
+        grid = self._frontier_grid()
+        if grid is None:
             return None
-
-        origin = _detect_grid_origin([cur], w, h)
-        # Use base position + scout position for layout detection — base is
-        # far from diagonal and always explored, giving a reliable signal.
-        probe_positions = [cur]
-        base = self._base_centroid()
-        if base:
-            probe_positions.append(base)
-        layout = _choose_grid_layout(exp, w, h, origin, probe_positions)
+        w, h = grid.width, grid.height
+        origin, layout = self._grid_geometry(grid, cur)
 
         # 1-second time bucket stabilises direction between ticks but allows drift
         t_bucket = int(self._now() // 1.0)
@@ -628,7 +515,7 @@ class ReconJob(BaseJob):
                 # Target must itself be unexplored
                 gx = max(0, min(w - 1, tx - origin))
                 gy = max(0, min(h - 1, ty - origin))
-                if _is_explored_cell(exp, gx, gy, w, h, layout):
+                if grid.is_explored(gx, gy, layout):
                     continue
 
                 # Repulsion: keep scouts apart
@@ -639,7 +526,7 @@ class ReconJob(BaseJob):
                     continue
 
                 # Path quality: require sufficient unexplored ratio
-                ratio = _unexplored_ratio(exp, w, h, layout, origin, cur, tgt)
+                ratio = grid.unexplored_ratio(layout, origin, cur, tgt)
                 if ratio >= thr:
                     return tgt
 
@@ -651,41 +538,23 @@ class ReconJob(BaseJob):
         st: _ScoutState,
     ) -> Optional[tuple[int, int]]:
         """When random-ray finds no target, scan the grid for the densest unexplored area."""
-        now = self._now()
-        if self._cached_grid is None or now - self._grid_cache_time >= self._grid_cache_ttl:
-            self._cached_grid = self.world_model.query("map_raw")
-            self._grid_cache_time = now
-        map_info = self._cached_grid
-        exp: list = list(map_info.get("is_explored") or [])
-        w = int(map_info.get("width") or 0)
-        h = int(map_info.get("height") or 0)
-        if not w or not h:
+        grid = self._frontier_grid()
+        if grid is None:
             return None
+        w, h = grid.width, grid.height
+        origin, layout = self._grid_geometry(grid, cur)
 
-        origin = _detect_grid_origin([cur], w, h)
-        probe_positions = [cur]
-        base = self._base_centroid()
-        if base:
-            probe_positions.append(base)
-        layout = _choose_grid_layout(exp, w, h, origin, probe_positions)
-
-        # Scan grid in 8x8 blocks, find the block with most unexplored cells
-        block = 8
+        # 8x8 block with the most unexplored cells
+        block = _FRONTIER_BLOCK
         best_count = 0
         best_cx, best_cy = w // 2, h // 2
-        for by in range(0, h, block):
-            for bx in range(0, w, block):
-                count = 0
-                for dy in range(min(block, h - by)):
-                    for dx in range(min(block, w - bx)):
-                        if not _is_explored_cell(exp, bx + dx, by + dy, w, h, layout):
-                            count += 1
-                if count > best_count:
-                    key = f"{bx + block // 2},{by + block // 2}"
-                    if key not in st.visited:
-                        best_count = count
-                        best_cx = bx + block // 2 + origin
-                        best_cy = by + block // 2 + origin
+        for bx, by, count in grid.blocks(layout, "unexplored", block):
+            if count > best_count:
+                key = f"{bx + block // 2},{by + block // 2}"
+                if key not in st.visited:
+                    best_count = count
+                    best_cx = bx + block // 2 + origin
+                    best_cy = by + block // 2 + origin
         if best_count == 0:
             return None
         return (min(best_cx, w - 1 + origin), min(best_cy, h - 1 + origin))
@@ -802,7 +671,7 @@ class ReconJob(BaseJob):
     # -----------------------------------------------------------------------
 
     def _find_primary_target(self) -> Optional[dict[str, Any]]:
-        enemy_payload = self.world_model.query("enemy_actors")
+        enemy_payload = query_view(self.world_model, "enemy_actors")
         actors = list(enemy_payload.get("actors", []))
         if self.config.target_type == "base":
             matches = [a for a in actors if a.get("category") == "building"]
@@ -818,7 +687,7 @@ class ReconJob(BaseJob):
     def _find_tracking_clue(self) -> Optional[dict[str, Any]]:
         if self.config.target_type != "base":
             return None
-        enemy_payload = self.world_model.query("enemy_actors")
+        enemy_payload = query_view(self.world_model, "enemy_actors")
         actors = list(enemy_payload.get("actors", []))
         harvesters = [a for a in actors if a.get("category") == "harvester"]
         if not harvesters:
@@ -837,7 +706,7 @@ class ReconJob(BaseJob):
     # -----------------------------------------------------------------------
 
     def _base_centroid(self) -> Optional[tuple[int, int]]:
-        result = self.world_model.query("my_actors", {"category": "building"})
+        result = query_view(self.world_model, "my_actors", {"category": "building"})
         actors = result.get("actors", []) if isinstance(result, dict) else []
         positions = [a.get("position") for a in actors if a.get("position")]
         if not positions:
@@ -879,7 +748,7 @@ class ReconJob(BaseJob):
     # -----------------------------------------------------------------------
 
     def _safe_position(self, actor: dict[str, Any]) -> tuple[int, int]:
-        buildings = self.world_model.query("my_actors", {"category": "building"}).get("actors", [])
+        buildings = query_view(self.world_model, "my_actors", {"category": "building"}).get("actors", [])
         if buildings:
             return tuple(buildings[0]["position"])
         map_info = self.world_model.query("map_raw")
@@ -889,7 +758,7 @@ class ReconJob(BaseJob):
         return (max(int(width * 0.15), int(current_x * 0.25)), min(int(height * 0.85), current_y))
 
     def _awareness_status(self) -> dict[str, Any]:
-        payload = self.world_model.query("my_actors", {"category": "building"})
+        payload = query_view(self.world_model, "my_actors", {"category": "building"})
         actors = payload.get("actors", []) if isinstance(payload, dict) else []
         if has_awareness_gateway(list(actors)):
             return {"status": "online", "impact": None, "recommendation": None}
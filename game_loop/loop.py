@@ -1,11 +1,24 @@
 """GameLoop — single-threaded 10Hz main loop (design.md §2).
 
 Tick sequence:
+  0. Wait up to the tick budget for Job ticks still running from an earlier
+     tick (they read WorldModel); ones still stuck are skipped, not waited on
   1. WorldModel.refresh() — layered refresh + event detection
   2. Collect events from WorldModel
   3. Forward events to Kernel (route_events)
-  4. Tick due Jobs (per Job tick_interval)
+  4. Tick due Jobs (per Job tick_interval) on a bounded pool — one worker by
+     default; more workers (``job_workers``) tick Jobs concurrently and
+     require thread-safe Jobs. Signals are delivered afterwards in
+     registration order
   5. Push dashboard updates (placeholder)
+
+Each phase is timed against the tick budget. Once the budget is spent,
+low-priority work is shed: the dashboard push is deferred (for at most
+``max_dashboard_deferrals`` consecutive ticks), due Jobs of lower-priority
+Tasks that are not yet overdue wait for the next tick (urgent Tasks and
+high-priority combat are never shed), and after an over-budget tick
+WorldModel reuses its last non-urgent Information Expert analysis. Per-phase
+histograms and overrun counters are exposed through ``GameLoop.tick_stats()``.
 """
 
 from __future__ import annotations
@@ -13,11 +26,14 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Callable, Optional, Protocol
+from typing import Any, Callable, Iterator, Optional, Protocol
 
 from benchmark import span as bm_span
-from experts.base import BaseJob
+from benchmark.histogram import LatencyHistogram
+from experts.base import BaseJob, capture_signals
 from logging_system import get_logger
 from models import Event, EventType, JobStatus, SignalKind
 from task_agent.queue import AgentQueue
@@ -62,12 +78,36 @@ class GameLoopConfig:
     """Configuration for the GameLoop."""
 
     tick_hz: float = 10.0  # ticks per second (10Hz default)
+    job_workers: int = 1  # threads ticking Jobs; >1 opts into concurrent Job ticks
+    job_deadline_s: float = 0.5  # run time of one Job tick before it counts as an overrun
+    tick_budget_s: Optional[float] = None  # work budget per tick; defaults to tick_interval
+    max_dashboard_deferrals: int = 5  # consecutive ticks the dashboard push may be shed
+    urgent_job_priority: int = 80  # Jobs of Tasks at/above this priority are never shed
+    combat_job_priority: int = 60  # CombatExpert Jobs at/above this priority are never shed
 
     @property
     def tick_interval(self) -> float:
         """Seconds between ticks."""
         return 1.0 / self.tick_hz
 
+    @property
+    def tick_budget(self) -> float:
+        """Seconds of work one tick may spend before low-priority work is shed."""
+        return self.tick_budget_s if self.tick_budget_s is not None else self.tick_interval
+
+
+TICK_PHASES: tuple[str, ...] = (
+    "job_drain",
+    "refresh",
+    "route_events",
+    "kernel_tick",
+    "health",
+    "jobs",
+    "agents",
+    "queue_manager",
+    "dashboard",
+)
+
 
 @dataclass
 class _RegisteredJob:
@@ -76,6 +116,30 @@ class _RegisteredJob:
     job: BaseJob
     last_tick_at: float = 0.0
     last_status: str = ""  # last known status before the tick; used to detect terminal transitions
+    overruns: int = 0  # ticks that missed GameLoopConfig.job_deadline_s
+
+
+@dataclass
+class _JobTick:
+    """One Job tick submitted to the worker pool."""
+
+    reg: _RegisteredJob
+    future: "asyncio.Future[_JobTickOutcome]"
+    outcome: "_JobTickOutcome"
+    prev_status: str
+    produced_before: int
+
+    def overran(self, deadline_s: float, now: float) -> bool:
+        """Whether the tick has been running on a worker for longer than ``deadline_s``."""
+        started_at = self.outcome.started_at
+        return started_at is not None and now - started_at >= deadline_s
+
+
+@dataclass
+class _JobTickOutcome:
+    signals: list[tuple[Callable[[Any], None], Any]] = field(default_factory=list)
+    error: Optional[BaseException] = None
+    started_at: Optional[float] = None  # time.monotonic() when a worker picked the tick up
 
 
 @dataclass
@@ -118,6 +182,15 @@ class GameLoop:
         self._world_stale_since: Optional[float] = None   # timestamp when staleness began
         self._world_stale_escalated = False               # escalation (>30s) sent once
         self._paused_for_recovery: set[str] = set()
+        self._job_executor: Optional[ThreadPoolExecutor] = None
+        self._inflight_jobs: dict[str, _JobTick] = {}  # overran their deadline, still running
+        # Tick budget telemetry
+        self._tick_started: float = 0.0
+        self._tick_histogram = LatencyHistogram()
+        self._phase_histograms: dict[str, LatencyHistogram] = {name: LatencyHistogram() for name in TICK_PHASES}
+        self._tick_overruns = 0
+        self._deferred_counts: dict[str, int] = {"dashboard": 0, "jobs": 0, "info_analysis": 0}
+        self._dashboard_deferrals = 0  # consecutive ticks without a dashboard push
 
     # --- Job registration ---
 
@@ -194,6 +267,7 @@ class GameLoop:
             raise
         finally:
             self._running = False
+            self._shutdown_job_executor()
             logger.info("GameLoop stopped after %d ticks", self._tick_count)
             slog.info("GameLoop stopped", event="game_loop_stopped", tick_count=self._tick_count)
 
@@ -218,6 +292,21 @@ class GameLoop:
     def is_running(self) -> bool:
         return self._running
 
+    def tick_stats(self) -> dict[str, Any]:
+        """Tick latency, per-phase histograms (ms), budget overruns and shed work."""
+        return {
+            "ticks": self._tick_histogram.count,
+            "budget_ms": self.config.tick_budget * 1000.0,
+            "overruns": self._tick_overruns,
+            "tick": self._tick_histogram.summary(),
+            "phases": {name: histogram.summary() for name, histogram in self._phase_histograms.items()},
+            "deferred": dict(self._deferred_counts),
+        }
+
+    def job_overruns(self) -> dict[str, int]:
+        """Per-job count of ticks that missed the job deadline."""
+        return {job_id: reg.overruns for job_id, reg in self._jobs.items() if reg.overruns}
+
     @property
     def tick_count(self) -> int:
         return self._tick_count
@@ -228,38 +317,93 @@ class GameLoop:
         """Execute one tick of the game loop."""
         self._tick_count += 1
         now = time.time()
+        self._tick_started = time.monotonic()
 
         with bm_span("job_tick", name=f"game_loop:tick_{self._tick_count}"):
+            # 0. Job ticks that overran an earlier deadline still read WorldModel:
+            #    give them up to the tick budget to finish before refresh swaps
+            #    its state; one stuck longer must not stall the whole loop
+            if self._inflight_jobs:
+                with self._phase("job_drain"):
+                    await self._drain_inflight_jobs(now)
+
             # 1. WorldModel refresh (layered refresh + internal event detection)
-            await asyncio.to_thread(self.world_model.refresh, now=now)
+            with self._phase("refresh"):
+                await asyncio.to_thread(self.world_model.refresh, now=now)
 
-            # 2. Collect events (single source — avoids double-counting)
-            events = self.world_model.detect_events(clear=True)
+            with self._phase("route_events"):
+                # 2. Collect events (single source — avoids double-counting)
+                events = self.world_model.detect_events(clear=True)
 
-            # 3. Forward events to Kernel
-            if events:
-                self.kernel.route_events(events)
-                slog.debug("Forwarded WorldModel events to Kernel", event="events_forwarded", tick=self._tick_count, event_count=len(events))
+                # 3. Forward events to Kernel
+                if events:
+                    self.kernel.route_events(events)
+                    slog.debug("Forwarded WorldModel events to Kernel", event="events_forwarded", tick=self._tick_count, event_count=len(events))
 
             # 3b. Kernel tick (pending question timeout scan)
-            self.kernel.tick(now=now)
+            with self._phase("kernel_tick"):
+                self.kernel.tick(now=now)
 
             # 3c. Recovery / stale handling
-            self._handle_world_model_health(now)
+            with self._phase("health"):
+                self._handle_world_model_health(now)
 
             # 4. Tick due Jobs
-            await self._tick_jobs(now)
+            with self._phase("jobs"):
+                await self._tick_jobs(now)
 
             # 5. Check review_interval for Task Agents (1.8)
-            self._check_agent_reviews(now)
+            with self._phase("agents"):
+                self._check_agent_reviews(now)
 
             # 6. Shared queue manager
             if self._queue_manager is not None:
-                await asyncio.to_thread(self._queue_manager.tick, now=now)
+                with self._phase("queue_manager"):
+                    await asyncio.to_thread(self._queue_manager.tick, now=now)
 
-            # 7. Dashboard push (placeholder)
+            # 7. Dashboard push (placeholder) — first to be shed when over budget
             if self._dashboard_callback:
-                self._dashboard_callback(self._tick_count, now)
+                if self._budget_exhausted() and self._dashboard_deferrals < self.config.max_dashboard_deferrals:
+                    self._dashboard_deferrals += 1
+                    self._deferred_counts["dashboard"] += 1
+                else:
+                    self._dashboard_deferrals = 0
+                    with self._phase("dashboard"):
+                        self._dashboard_callback(self._tick_count, now)
+
+        elapsed = time.monotonic() - self._tick_started
+        self._tick_started = 0.0
+        self._tick_histogram.record(elapsed * 1000.0)
+        over_budget = elapsed > self.config.tick_budget
+        # Until the next tick, on-demand runtime facts reuse the last non-urgent
+        # Information Expert analysis instead of re-running the experts.
+        defer_info_analysis = getattr(self.world_model, "defer_info_analysis", None)
+        if callable(defer_info_analysis):
+            defer_info_analysis(over_budget)
+            if over_budget:
+                self._deferred_counts["info_analysis"] += 1
+        if over_budget:
+            self._tick_overruns += 1
+            slog.debug(
+                "Tick exceeded budget",
+                event="tick_overrun",
+                tick=self._tick_count,
+                elapsed_ms=round(elapsed * 1000.0, 2),
+                budget_ms=round(self.config.tick_budget * 1000.0, 2),
+            )
+
+    @contextmanager
+    def _phase(self, name: str) -> Iterator[None]:
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._phase_histograms[name].record((time.monotonic() - started) * 1000.0)
+
+    def _budget_exhausted(self) -> bool:
+        if not self._tick_started:
+            return False
+        return time.monotonic() - self._tick_started >= self.config.tick_budget
 
     _TERMINAL_STATUSES: frozenset = frozenset({"succeeded", "failed", "aborted"})
 
@@ -299,59 +443,228 @@ class GameLoop:
         )
 
     async def _tick_jobs(self, now: float) -> None:
-        """Tick all registered Jobs that are due."""
+        """Tick all registered Jobs that are due.
+
+        Due Jobs run concurrently on a bounded thread pool. Signals they emit
+        are buffered and delivered from the loop thread in registration order
+        once the tick finishes, so Kernel routing stays single-threaded and
+        deterministic. The deadline runs from the moment a worker starts a
+        Job's tick, so Jobs queued behind a busy worker are not charged for
+        the wait. A Job still running ``job_deadline_s`` after it started
+        counts as an overrun: it is not ticked again until it finishes, and
+        the next ``_tick`` waits for it (up to the tick budget) before
+        refreshing WorldModel and applies its outcome then. Jobs still queued
+        behind overrunning ones are carried over the same way without
+        counting as overruns.
+        """
+        ticks = [tick for tick in self._inflight_jobs.values() if tick.future.done()]
+        for tick in ticks:
+            self._inflight_jobs.pop(tick.reg.job.job_id, None)
+
+        executor = self._ensure_job_executor()
+        loop = asyncio.get_running_loop()
+        over_budget = self._budget_exhausted()
+        submitted: list[_JobTick] = []
         for reg in list(self._jobs.values()):
             job = reg.job
+            if job.job_id in self._inflight_jobs:
+                continue
             # Skip if not enough time has passed since last tick
             if now - reg.last_tick_at < job.tick_interval:
                 continue
             # Skip terminated jobs
             if job.status.value in self._TERMINAL_STATUSES:
                 continue
+            # Over budget: sheddable jobs run only once overdue (a full extra interval late)
+            if (
+                over_budget
+                and reg.last_tick_at
+                and now - reg.last_tick_at < 2 * job.tick_interval
+                and self._job_sheddable(job)
+            ):
+                self._deferred_counts["jobs"] += 1
+                continue
 
             prev_status = reg.last_status
             produced_before = int(getattr(job, "produced_count", 0) or 0)
             reg.last_tick_at = now
+            outcome = _JobTickOutcome()
+            submitted.append(
+                _JobTick(
+                    reg=reg,
+                    future=loop.run_in_executor(executor, self._run_job_tick, job, outcome),
+                    outcome=outcome,
+                    prev_status=prev_status,
+                    produced_before=produced_before,
+                )
+            )
+
+        await self._wait_job_ticks(submitted)
+        deadline_s = self.config.job_deadline_s
+        clock = time.monotonic()
+        for tick in submitted:
+            if tick.future.done():
+                ticks.append(tick)
+                continue
+            self._inflight_jobs[tick.reg.job.job_id] = tick
+            if not tick.overran(deadline_s, clock):
+                continue  # still queued behind an overrunning Job
+            tick.reg.overruns += 1
+            slog.warn(
+                "Job tick overran deadline",
+                event="job_tick_overrun",
+                job_id=tick.reg.job.job_id,
+                task_id=tick.reg.job.task_id,
+                deadline_s=self.config.job_deadline_s,
+                overruns=tick.reg.overruns,
+            )
+
+        for tick in ticks:
+            self._finish_job_tick(tick, now)
+
+    def _job_sheddable(self, job: BaseJob) -> bool:
+        """Whether an over-budget tick may defer ``job``, judged by its Task's priority."""
+        task_priority = getattr(self.kernel, "task_priority", None)
+        priority = task_priority(job.task_id) if callable(task_priority) else None
+        if priority is None:
+            priority = 50
+        if priority >= self.config.urgent_job_priority:
+            return False
+        if getattr(job, "expert_type", "") == "CombatExpert" and priority >= self.config.combat_job_priority:
+            return False
+        return True
+
+    async def _wait_job_ticks(self, submitted: list[_JobTick]) -> None:
+        """Wait until every submitted tick finishes or can no longer finish in time.
+
+        Returns early once each unfinished tick has either run past its
+        deadline or is queued behind workers that are all held by overrunning
+        ticks.
+        """
+        deadline_s = self.config.job_deadline_s
+        workers = max(1, int(self.config.job_workers))
+        pending = {tick.future: tick for tick in submitted}
+        while pending:
+            clock = time.monotonic()
+            running = [tick for tick in pending.values() if tick.outcome.started_at is not None]
+            remaining = [
+                tick.outcome.started_at + deadline_s - clock
+                for tick in running
+                if not tick.overran(deadline_s, clock)
+            ]
+            if not remaining:
+                stuck = sum(1 for tick in self._inflight_jobs.values() if not tick.future.done())
+                stuck += len(running)
+                if len(running) == len(pending) or stuck >= workers:
+                    return
+            timeout = min(remaining) if remaining else deadline_s
+            done, _ = await asyncio.wait(list(pending), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                pending.pop(future, None)
+
+    async def _drain_inflight_jobs(self, now: float) -> None:
+        """Wait up to the tick budget for overrunning Job ticks and apply their outcomes.
+
+        Ticks still running after that stay in ``_inflight_jobs`` and are not
+        re-ticked; each one that has run past its deadline counts another
+        overrun. The rest of the tick goes ahead instead of stalling on them.
+        """
+        ticks = list(self._inflight_jobs.values())
+        await asyncio.wait([tick.future for tick in ticks], timeout=self.config.tick_budget)
+        deadline_s = self.config.job_deadline_s
+        clock = time.monotonic()
+        for tick in ticks:
+            if not tick.future.done():
+                if tick.overran(deadline_s, clock):
+                    tick.reg.overruns += 1
+                    slog.warn(
+                        "Job tick still running at next tick",
+                        event="job_tick_overrun",
+                        job_id=tick.reg.job.job_id,
+                        task_id=tick.reg.job.task_id,
+                        deadline_s=deadline_s,
+                        overruns=tick.reg.overruns,
+                    )
+                continue
+            self._inflight_jobs.pop(tick.reg.job.job_id, None)
+            self._finish_job_tick(tick, now)
+
+    @staticmethod
+    def _run_job_tick(job: BaseJob, outcome: _JobTickOutcome) -> _JobTickOutcome:
+        """Worker-thread body: tick one Job with its Signals captured."""
+        outcome.started_at = time.monotonic()
+        with capture_signals() as signals:
             try:
-                await asyncio.to_thread(job.do_tick)
+                job.do_tick()
             except Exception as exc:
-                logger.exception("Job tick error: %s", job.job_id)
-                slog.error("Job tick raised exception", event="job_tick_failed", job_id=job.job_id, error=str(exc))
-                job.status = JobStatus.FAILED
-                self._paused_for_recovery.discard(job.job_id)
-                job.emit_signal(
-                    kind=SignalKind.TASK_COMPLETE,
-                    summary=f"Job {job.job_id} failed: {exc}",
-                    result="failed",
-                    data={"error": str(exc), "error_type": type(exc).__name__},
+                outcome.error = exc
+        outcome.signals = signals
+        return outcome
+
+    def _finish_job_tick(self, tick: _JobTick, now: float) -> None:
+        """Apply one finished Job tick on the loop thread."""
+        job = tick.reg.job
+        outcome = tick.future.result()
+        if self._jobs.get(job.job_id) is not tick.reg:
+            # Unregistered while its tick was running: its Signals and status
+            # no longer belong to a live Job.
+            slog.debug("Dropped tick outcome of unregistered job", event="job_tick_dropped", job_id=job.job_id)
+            return
+        for callback, signal in outcome.signals:
+            callback(signal)
+        if outcome.error is not None:
+            exc = outcome.error
+            logger.error("Job tick error: %s", job.job_id, exc_info=exc)
+            slog.error("Job tick raised exception", event="job_tick_failed", job_id=job.job_id, error=str(exc))
+            job.status = JobStatus.FAILED
+            self._paused_for_recovery.discard(job.job_id)
+            job.emit_signal(
+                kind=SignalKind.TASK_COMPLETE,
+                summary=f"Job {job.job_id} failed: {exc}",
+                result="failed",
+                data={"error": str(exc), "error_type": type(exc).__name__},
+            )
+
+        new_status = job.status.value
+        produced_after = int(getattr(job, "produced_count", 0) or 0)
+        tick.reg.last_status = new_status
+        self._maybe_route_synthetic_production_complete(
+            job,
+            produced_before=tick.produced_before,
+            produced_after=produced_after,
+            now=now,
+        )
+
+        # If the job just became terminal, immediately wake its Task Agent
+        # from the event-loop thread. asyncio.Event.set() from a worker-thread
+        # callback is not reliably thread-safe; firing trigger_review() here
+        # (after the thread returns) ensures the agent wakes promptly instead
+        # of waiting for the next review_interval.
+        if new_status in self._TERMINAL_STATUSES and tick.prev_status not in self._TERMINAL_STATUSES:
+            reg_agent = self._agents.get(job.task_id)
+            if reg_agent is not None:
+                reg_agent.agent_queue.trigger_review()
+                slog.debug(
+                    "Job terminal — immediate agent wake",
+                    event="job_terminal_wake",
+                    job_id=job.job_id,
+                    task_id=job.task_id,
+                    status=new_status,
                 )
 
-            new_status = job.status.value
-            produced_after = int(getattr(job, "produced_count", 0) or 0)
-            reg.last_status = new_status
-            self._maybe_route_synthetic_production_complete(
-                job,
-                produced_before=produced_before,
-                produced_after=produced_after,
-                now=now,
+    def _ensure_job_executor(self) -> ThreadPoolExecutor:
+        if self._job_executor is None:
+            self._job_executor = ThreadPoolExecutor(
+                max_workers=max(1, int(self.config.job_workers)),
+                thread_name_prefix="job-tick",
             )
+        return self._job_executor
 
-            # If the job just became terminal, immediately wake its Task Agent
-            # from the event-loop thread. asyncio.Event.set() from a to_thread
-            # callback is not reliably thread-safe; firing trigger_review() here
-            # (after the thread returns) ensures the agent wakes promptly instead
-            # of waiting for the next review_interval.
-            if new_status in self._TERMINAL_STATUSES and prev_status not in self._TERMINAL_STATUSES:
-                reg_agent = self._agents.get(job.task_id)
-                if reg_agent is not None:
-                    reg_agent.agent_queue.trigger_review()
-                    slog.debug(
-                        "Job terminal — immediate agent wake",
-                        event="job_terminal_wake",
-                        job_id=job.job_id,
-                        task_id=job.task_id,
-                        status=new_status,
-                    )
+    def _shutdown_job_executor(self) -> None:
+        executor, self._job_executor = self._job_executor, None
+        self._inflight_jobs.clear()
+        if executor is not None:
+            executor.shutdown(wait=False)
 
     def _check_agent_reviews(self, now: float) -> None:
         """Wake Task Agents whose review_interval has elapsed.
@@ -890,6 +890,10 @@ class Kernel:
     def list_tasks(self) -> list[Task]:
         return list_tasks_runtime(tasks=self.tasks.values())
 
+    def task_priority(self, task_id: str) -> Optional[int]:
+        task = self.tasks.get(task_id)
+        return task.priority if task is not None else None
+
     def list_jobs(self) -> list[Job]:
         return list_jobs_runtime(jobs=self._jobs.values())
 
@@ -11,6 +11,8 @@ from .core import (
     clear,
     current_session_dir,
     export_json,
+    first_record_offset,
+    flush_persistence_session,
     get_logger,
     latest_session_dir,
     list_persistence_sessions,
@@ -21,6 +23,7 @@ from .core import (
     read_task_replay_records,
     records,
     records_from,
+    records_since,
     replay,
     start_persistence_session,
     stop_persistence_session,
@@ -36,6 +39,8 @@ __all__ = [
     "current_session_dir",
     "export_benchmark_report_json",
     "export_json",
+    "first_record_offset",
+    "flush_persistence_session",
     "get_logger",
     "install_benchmark_logging",
     "latest_session_dir",
@@ -47,6 +52,7 @@ __all__ = [
     "read_task_replay_records",
     "records",
     "records_from",
+    "records_since",
     "replay",
     "start_persistence_session",
     "stop_persistence_session",
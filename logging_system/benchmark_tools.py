@@ -30,7 +30,18 @@ def summarize_benchmarks(
     tag: Optional[str] = None,
     start_time: Optional[Union[datetime, float, int]] = None,
     end_time: Optional[Union[datetime, float, int]] = None,
+    window_s: Optional[float] = None,
 ) -> list[dict[str, Any]]:
+    """Per-tag latency summary.
+
+    Without a time range this reads the store's streaming histograms (whole
+    process lifetime, or the last ``window_s`` seconds). An explicit
+    ``start_time``/``end_time`` range is computed exactly from the retained
+    raw records.
+    """
+    if start_time is None and end_time is None:
+        return benchmark.stats(tag=tag, window_s=window_s)
+
     records = benchmark.query(tag=tag, start_time=start_time, end_time=end_time, slowest_first=False)
     grouped: dict[str, list[float]] = {}
     for record in records:
@@ -44,7 +55,9 @@ def summarize_benchmarks(
                 "tag": record_tag,
                 "count": len(durations),
                 "avg_ms": sum(durations) / len(durations),
+                "p50_ms": _percentile(durations, 0.50),
                 "p95_ms": _percentile(durations, 0.95),
+                "p99_ms": _percentile(durations, 0.99),
                 "max_ms": max(durations),
                 "total_ms": sum(durations),
             }
@@ -58,9 +71,10 @@ def export_benchmark_report_json(
     tag: Optional[str] = None,
     start_time: Optional[Union[datetime, float, int]] = None,
     end_time: Optional[Union[datetime, float, int]] = None,
+    window_s: Optional[float] = None,
     indent: int = 2,
 ) -> str:
-    payload = summarize_benchmarks(tag=tag, start_time=start_time, end_time=end_time)
+    payload = summarize_benchmarks(tag=tag, start_time=start_time, end_time=end_time, window_s=window_s)
     serialized = json.dumps(payload, ensure_ascii=False, indent=indent)
     if path is not None:
         Path(path).write_text(serialized + "\n", encoding="utf-8")
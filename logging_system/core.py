@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import atexit
+from collections import OrderedDict, deque
 from dataclasses import asdict, dataclass, field, is_dataclass
 from datetime import datetime, timezone
 from enum import Enum
@@ -9,9 +11,10 @@ import json
 import logging
 import os
 from pathlib import Path
-from threading import RLock
+import queue
+from threading import Event, RLock, Thread
 import time
-from typing import Any, Dict, Iterable, Literal, Optional, Union
+from typing import Any, Dict, Iterable, Literal, Optional, Sequence, Union
 
 from .task_rollup import compact_task_rollup, summarize_task_rollup
 ComponentName = Literal["kernel", "task_agent", "expert", "world_model", "adjutant", "game_loop", "benchmark"]
@@ -25,13 +28,33 @@ _LEVEL_TO_STD = {
 }
 
 
+_WRITER_STOP = object()
+
+
 def _safe_filename(value: str) -> str:
     cleaned = "".join(ch if ch.isalnum() or ch in {"-", "_", "."} else "_" for ch in value)
     return cleaned or "unknown"
 
 
 class PersistentLogSession:
-    def __init__(self, session_dir: Path) -> None:
+    """Persists log records to ``all.jsonl`` plus per-component and per-task JSONL files.
+
+    ``append`` only enqueues the record; a background writer thread serializes
+    records, keeps the session files open and writes them in batches once
+    ``max_batch`` records are pending or ``flush_interval_s`` has elapsed.
+    The queue is bounded, so a stalled disk applies backpressure instead of
+    growing memory. ``flush`` and ``finalize`` drain everything synchronously.
+    """
+
+    def __init__(
+        self,
+        session_dir: Path,
+        *,
+        flush_interval_s: float = 0.25,
+        max_batch: int = 256,
+        max_queue: int = 10000,
+        max_open_files: int = 64,
+    ) -> None:
         self.session_dir = session_dir
         self.tasks_dir = session_dir / "tasks"
         self.components_dir = session_dir / "components"
@@ -44,25 +67,71 @@ class PersistentLogSession:
         self.component_counts: dict[str, int] = {}
         self.world_health_summary = _empty_world_health_summary()
         self.runtime_fault_summary = _empty_runtime_fault_summary()
+        self.flush_interval_s = max(0.0, float(flush_interval_s))
+        self.max_batch = max(1, int(max_batch))
+        self.max_open_files = max(1, int(max_open_files))
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, int(max_queue)))
+        self._handles: "OrderedDict[Path, Any]" = OrderedDict()
+        self._closed = False
+        self._writer = Thread(target=self._writer_loop, name="log-session-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
 
     def append(self, record: "LogRecord") -> None:
+        if self._closed:
+            return
+        self._queue.put(record)
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until every record appended so far is written; False on timeout."""
+        if self._closed or not self._writer.is_alive():
+            return True
+        done = Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def _writer_loop(self) -> None:
+        pending: dict[Path, list[str]] = {}
+        pending_count = 0
+        deadline: Optional[float] = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if isinstance(item, LogRecord):
+                try:
+                    self._stage(item, pending)
+                except Exception:
+                    logging.getLogger(__name__).exception("Failed to stage log record for persistence")
+                pending_count += 1
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval_s
+                if pending_count < self.max_batch and time.monotonic() < deadline:
+                    continue
+            # Batch full, interval elapsed, or an explicit flush/stop marker.
+            self._write_pending(pending)
+            pending_count = 0
+            deadline = None
+            if isinstance(item, Event):
+                item.set()
+            elif item is _WRITER_STOP:
+                break
+        self._close_handles()
+
+    def _stage(self, record: "LogRecord", pending: dict[Path, list[str]]) -> None:
         payload = record.to_json() + "\n"
-        self.all_path.parent.mkdir(parents=True, exist_ok=True)
-        with self.all_path.open("a", encoding="utf-8") as handle:
-            handle.write(payload)
+        pending.setdefault(self.all_path, []).append(payload)
         self.record_count += 1
 
         component_name = _safe_filename(record.component)
-        component_path = self.components_dir / f"{component_name}.jsonl"
-        with component_path.open("a", encoding="utf-8") as handle:
-            handle.write(payload)
+        pending.setdefault(self.components_dir / f"{component_name}.jsonl", []).append(payload)
         self.component_counts[record.component] = self.component_counts.get(record.component, 0) + 1
 
         task_id = record.data.get("task_id")
         if isinstance(task_id, str) and task_id:
-            task_path = self.tasks_dir / f"{_safe_filename(task_id)}.jsonl"
-            with task_path.open("a", encoding="utf-8") as handle:
-                handle.write(payload)
+            pending.setdefault(self.tasks_dir / f"{_safe_filename(task_id)}.jsonl", []).append(payload)
             self.task_counts[task_id] = self.task_counts.get(task_id, 0) + 1
         if record.component == "world_model":
             _update_world_health_summary_from_event(
@@ -78,7 +147,54 @@ class PersistentLogSession:
             timestamp=record.timestamp,
         )
 
+    def _write_pending(self, pending: dict[Path, list[str]]) -> None:
+        for path, lines in pending.items():
+            try:
+                handle = self._handle(path)
+                handle.writelines(lines)
+                handle.flush()
+            except OSError:
+                logging.getLogger(__name__).exception("Failed to persist log records to %s", path)
+                self._drop_handle(path)
+        pending.clear()
+
+    def _handle(self, path: Path) -> Any:
+        handle = self._handles.get(path)
+        if handle is not None:
+            self._handles.move_to_end(path)
+            return handle
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle = path.open("a", encoding="utf-8")
+        self._handles[path] = handle
+        while len(self._handles) > self.max_open_files:
+            _, oldest = self._handles.popitem(last=False)
+            oldest.close()
+        return handle
+
+    def _drop_handle(self, path: Path) -> None:
+        handle = self._handles.pop(path, None)
+        if handle is not None:
+            try:
+                handle.close()
+            except OSError:
+                pass
+
+    def _close_handles(self) -> None:
+        for path in list(self._handles):
+            self._drop_handle(path)
+
+    def close(self) -> None:
+        """Drain the queue and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.flush)
+        if self._writer.is_alive():
+            self._queue.put(_WRITER_STOP)
+            self._writer.join()
+
     def finalize(self) -> None:
+        self.close()
         if not self.metadata_path.exists():
             return
         payload = json.loads(self.metadata_path.read_text(encoding="utf-8"))
@@ -159,9 +275,26 @@ class LogRecord:
         return json.dumps(self.to_dict(), ensure_ascii=False, sort_keys=True)
 
 
+DEFAULT_LOG_CAPACITY = 50000
+
+
 class LogStore:
-    def __init__(self) -> None:
+    """In-memory log records kept in a capacity-bounded ring buffer.
+
+    Every record gets a monotonic offset (reset only by ``clear``), so
+    ``records_from`` consumers keep their position after old records are
+    evicted. Per-component, per-event and per-task_id offset indexes let
+    filtered queries and tails visit only matching records.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_LOG_CAPACITY) -> None:
+        self.capacity = max(1, int(capacity))
         self._records: list[LogRecord] = []
+        self._first_offset = 0
+        self._next_offset = 0
+        self._by_component: dict[str, deque[int]] = {}
+        self._by_event: dict[str, deque[int]] = {}
+        self._by_task: dict[str, deque[int]] = {}
         self._lock = RLock()
         self._persistent_session: Optional[PersistentLogSession] = None
 
@@ -184,12 +317,83 @@ class LogStore:
             data=dict(_serialize(data or {})),
         )
         with self._lock:
-            self._records.append(record)
+            self._append_locked(record)
             session = self._persistent_session
         if session is not None:
             session.append(record)
         return record
 
+    def _append_locked(self, record: LogRecord) -> None:
+        offset = self._next_offset
+        if len(self._records) < self.capacity:
+            self._records.append(record)
+        else:
+            slot = offset % self.capacity
+            self._unindex_locked(self._records[slot])
+            self._records[slot] = record
+            self._first_offset += 1
+        self._next_offset += 1
+        for index, key in self._index_keys(record):
+            index.setdefault(key, deque()).append(offset)
+
+    def _unindex_locked(self, record: LogRecord) -> None:
+        # The evicted record always holds the oldest offset in each of its indexes.
+        for index, key in self._index_keys(record):
+            offsets = index.get(key)
+            if not offsets:
+                continue
+            offsets.popleft()
+            if not offsets:
+                del index[key]
+
+    def _index_keys(self, record: LogRecord) -> list[tuple[dict[str, deque[int]], str]]:
+        keys = [(self._by_component, record.component)]
+        if record.event is not None:
+            keys.append((self._by_event, record.event))
+        task_id = record.data.get("task_id")
+        if isinstance(task_id, str) and task_id:
+            keys.append((self._by_task, task_id))
+        return keys
+
+    def _record_at_locked(self, offset: int) -> LogRecord:
+        return self._records[offset % self.capacity]
+
+    def _candidate_offsets_locked(
+        self,
+        *,
+        component: Optional[str],
+        event: Optional[str],
+        task_id: Optional[str],
+    ) -> Optional[Sequence[int]]:
+        """Smallest matching index (ascending offsets), or None when no indexed filter applies."""
+        candidates: Optional[Sequence[int]] = None
+        for index, key in ((self._by_component, component), (self._by_event, event), (self._by_task, task_id)):
+            if key is None:
+                continue
+            offsets = index.get(key, ())
+            if candidates is None or len(offsets) < len(candidates):
+                candidates = offsets
+        return candidates
+
+    @staticmethod
+    def _matches(
+        record: LogRecord,
+        *,
+        component: Optional[str] = None,
+        level: Optional[str] = None,
+        event: Optional[str] = None,
+        task_id: Optional[str] = None,
+    ) -> bool:
+        if component is not None and record.component != component:
+            return False
+        if level is not None and record.level != level:
+            return False
+        if event is not None and record.event != event:
+            return False
+        if task_id is not None and record.data.get("task_id") != task_id:
+            return False
+        return True
+
     def query(
         self,
         *,
@@ -198,34 +402,44 @@ class LogStore:
         start_time: Optional[Union[datetime, float, int]] = None,
         end_time: Optional[Union[datetime, float, int]] = None,
         event: Optional[str] = None,
+        task_id: Optional[str] = None,
         limit: Optional[int] = None,
     ) -> list[LogRecord]:
         start_ts = _normalize_time(start_time)
         end_ts = _normalize_time(end_time)
         with self._lock:
-            records = list(self._records)
-        if component is not None:
-            records = [record for record in records if record.component == component]
-        if level is not None:
-            records = [record for record in records if record.level == level]
-        if start_ts is not None:
-            records = [record for record in records if record.timestamp >= start_ts]
-        if end_ts is not None:
-            records = [record for record in records if record.timestamp <= end_ts]
-        if event is not None:
-            records = [record for record in records if record.event == event]
+            candidates = self._candidate_offsets_locked(component=component, event=event, task_id=task_id)
+            if candidates is None:
+                candidates = range(self._first_offset, self._next_offset)
+            records = [
+                record
+                for record in map(self._record_at_locked, candidates)
+                if self._matches(record, component=component, level=level, event=event, task_id=task_id)
+                and (start_ts is None or record.timestamp >= start_ts)
+                and (end_ts is None or record.timestamp <= end_ts)
+            ]
         records.sort(key=lambda record: record.timestamp)
         if limit is not None:
             records = records[-limit:]
         return records
 
-    def records_from(self, offset: int, *, limit: Optional[int] = None) -> list[LogRecord]:
-        start = max(0, int(offset))
+    def first_offset(self) -> int:
+        """Offset of the oldest record still retained."""
+        with self._lock:
+            return self._first_offset
+
+    def records_since(self, offset: int, *, limit: Optional[int] = None) -> tuple[list[LogRecord], int]:
+        """Records from ``offset`` on plus the offset to resume from.
+
+        Offsets that were already evicted resume at the oldest retained record.
+        """
         with self._lock:
-            if start >= len(self._records):
-                return []
-            records = self._records[start:] if limit is None else self._records[start : start + max(0, int(limit))]
-            return list(records)
+            start = min(max(self._first_offset, int(offset)), self._next_offset)
+            stop = self._next_offset if limit is None else min(self._next_offset, start + max(0, int(limit)))
+            return [self._record_at_locked(item) for item in range(start, stop)], stop
+
+    def records_from(self, offset: int, *, limit: Optional[int] = None) -> list[LogRecord]:
+        return self.records_since(offset, limit=limit)[0]
 
     def tail(
         self,
@@ -233,20 +447,19 @@ class LogStore:
         component: Optional[str] = None,
         level: Optional[LogLevel] = None,
         event: Optional[str] = None,
+        task_id: Optional[str] = None,
         limit: int = 100,
     ) -> list[LogRecord]:
         remaining = max(0, int(limit))
         if remaining == 0:
             return []
         with self._lock:
-            source = self._records
+            candidates = self._candidate_offsets_locked(component=component, event=event, task_id=task_id)
+            if candidates is None:
+                candidates = range(self._first_offset, self._next_offset)
             results: list[LogRecord] = []
-            for record in reversed(source):
-                if component is not None and record.component != component:
-                    continue
-                if level is not None and record.level != level:
-                    continue
-                if event is not None and record.event != event:
+            for record in map(self._record_at_locked, reversed(candidates)):
+                if not self._matches(record, component=component, level=level, event=event, task_id=task_id):
                     continue
                 results.append(record)
                 if len(results) >= remaining:
@@ -285,6 +498,11 @@ class LogStore:
     def clear(self) -> None:
         with self._lock:
             self._records.clear()
+            self._first_offset = 0
+            self._next_offset = 0
+            self._by_component.clear()
+            self._by_event.clear()
+            self._by_task.clear()
 
     def start_persistence_session(
         self,
@@ -309,7 +527,10 @@ class LogStore:
         metadata_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
         (base / "latest.txt").write_text(str(session_dir) + "\n", encoding="utf-8")
         with self._lock:
+            previous = self._persistent_session
             self._persistent_session = PersistentLogSession(session_dir)
+        if previous is not None:
+            previous.close()
         return session_dir
 
     def stop_persistence_session(self) -> None:
@@ -319,6 +540,13 @@ class LogStore:
         if session is not None:
             session.finalize()
 
+    def flush_persistence(self) -> None:
+        """Write out records still queued for the active persistence session."""
+        with self._lock:
+            session = self._persistent_session
+        if session is not None:
+            session.flush()
+
     def current_session_dir(self) -> Optional[Path]:
         with self._lock:
             session = self._persistent_session
@@ -326,7 +554,7 @@ class LogStore:
 
     def __len__(self) -> int:
         with self._lock:
-            return len(self._records)
+            return self._next_offset - self._first_offset
 
 
 _DEFAULT_STORE = LogStore()
@@ -382,6 +610,7 @@ def query(
     start_time: Optional[Union[datetime, float, int]] = None,
     end_time: Optional[Union[datetime, float, int]] = None,
     event: Optional[str] = None,
+    task_id: Optional[str] = None,
     limit: Optional[int] = None,
 ) -> list[LogRecord]:
     return _DEFAULT_STORE.query(
@@ -390,6 +619,7 @@ def query(
         start_time=start_time,
         end_time=end_time,
         event=event,
+        task_id=task_id,
         limit=limit,
     )
 
@@ -433,14 +663,23 @@ def records_from(offset: int, *, limit: Optional[int] = None) -> list[LogRecord]
     return _DEFAULT_STORE.records_from(offset, limit=limit)
 
 
+def records_since(offset: int, *, limit: Optional[int] = None) -> tuple[list[LogRecord], int]:
+    return _DEFAULT_STORE.records_since(offset, limit=limit)
+
+
+def first_record_offset() -> int:
+    return _DEFAULT_STORE.first_offset()
+
+
 def tail_records(
     *,
     component: Optional[str] = None,
     level: Optional[LogLevel] = None,
     event: Optional[str] = None,
+    task_id: Optional[str] = None,
     limit: int = 100,
 ) -> list[LogRecord]:
-    return _DEFAULT_STORE.tail(component=component, level=level, event=event, limit=limit)
+    return _DEFAULT_STORE.tail(component=component, level=level, event=event, task_id=task_id, limit=limit)
 
 
 def start_persistence_session(
@@ -456,10 +695,20 @@ def stop_persistence_session() -> None:
     _DEFAULT_STORE.stop_persistence_session()
 
 
+def flush_persistence_session() -> None:
+    _DEFAULT_STORE.flush_persistence()
+
+
 def current_session_dir() -> Optional[Path]:
     return _DEFAULT_STORE.current_session_dir()
 
 
+def _flush_if_active_session(session_dir: Path) -> None:
+    active = current_session_dir()
+    if active is not None and Path(session_dir).resolve() == active:
+        flush_persistence_session()
+
+
 def latest_session_dir(
     base_dir: Union[str, Path] = "Logs/runtime",
 ) -> Optional[Path]:
@@ -914,6 +1163,7 @@ def list_session_tasks(
 ) -> list[dict[str, Any]]:
     """Build a lightweight task catalog from persisted task JSONL files."""
     base = Path(session_dir)
+    _flush_if_active_session(base)
     tasks_dir = base / "tasks"
     if not tasks_dir.exists():
         return []
@@ -1055,6 +1305,7 @@ def read_session_log_records(
 ) -> list[dict[str, Any]]:
     """Read persisted session-wide log records from ``all.jsonl``."""
     base = Path(session_dir)
+    _flush_if_active_session(base)
     log_path = base / "all.jsonl"
     if not log_path.exists():
         return []
@@ -1084,6 +1335,7 @@ def read_task_replay_records(
             candidates.append(latest)
 
     for base in candidates:
+        _flush_if_active_session(Path(base))
         task_path = Path(base) / "tasks" / f"{_safe_filename(task_id)}.jsonl"
         if not task_path.exists():
             continue
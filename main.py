@@ -69,7 +69,7 @@ from task_agent import AgentConfig
 from task_replay import build_live_task_replay_bundle, build_task_replay_bundle
 from task_triage import build_live_task_payload, build_runtime_unit_pipeline_focus, build_runtime_unit_pipeline_preview
 from unit_registry import UnitRegistry, set_default_registry
-from world_model import GameAPIWorldSource, RefreshPolicy, WorldModel, WorldModelSource
+from world_model import GameAPISnapshotWorldSource, GameAPIWorldSource, RefreshPolicy, WorldModel, WorldModelSource
 from ws_server import InboundHandler, WSServer, WSServerConfig
 
 
@@ -82,9 +82,15 @@ class RuntimeConfig:
     game_host: str = "localhost"
     game_port: int = 7445
     game_language: str = "zh"
+    game_api_multiplex: bool = False
+    world_snapshot_batch: bool = False
+    actor_delta_refresh: bool = False
     ws_host: str = "0.0.0.0"
     ws_port: int = 8765
     tick_hz: float = 10.0
+    job_workers: int = 1
+    job_deadline_s: float = 0.5
+    tick_budget_s: Optional[float] = None
     actors_refresh_s: float = 0.1
     economy_refresh_s: float = 0.5
     map_refresh_s: float = 5.0
@@ -578,9 +584,20 @@ class RuntimeBridge(InboundHandler):
                     }
                     for task in self.kernel.list_tasks()
                 ],
+                current_loop_stats=self._loop_stats(),
             ),
         )
 
+    def _loop_stats(self) -> dict[str, Any]:
+        tick_stats = getattr(self.game_loop, "tick_stats", None)
+        if not callable(tick_stats):
+            return {}
+        stats = dict(tick_stats() or {})
+        job_overruns = getattr(self.game_loop, "job_overruns", None)
+        if callable(job_overruns):
+            stats["job_overruns"] = job_overruns()
+        return stats
+
     async def _send_session_tasks_to_client(
         self,
         client_id: str,
@@ -747,10 +764,18 @@ class ApplicationRuntime:
         task_agent_factory: Optional[TaskAgentFactory] = None,
     ) -> None:
         self.config = config
-        self.api = api or GameAPI(config.game_host, port=config.game_port, language=config.game_language)
+        self.api = api or GameAPI(
+            config.game_host,
+            port=config.game_port,
+            language=config.game_language,
+            multiplex=config.game_api_multiplex,
+        )
         self.unit_registry = UnitRegistry.load()
         set_default_registry(self.unit_registry)
-        self.world_source = world_source or GameAPIWorldSource(self.api)
+        if world_source is None:
+            source_cls = GameAPISnapshotWorldSource if config.world_snapshot_batch else GameAPIWorldSource
+            world_source = source_cls(self.api, actor_delta=config.actor_delta_refresh)
+        self.world_source = world_source
 
         refresh_policy = RefreshPolicy(
             actors_s=config.actors_refresh_s,
@@ -801,7 +826,12 @@ class ApplicationRuntime:
         self.game_loop = GameLoop(
             self.world_model,
             self.kernel,
-            config=GameLoopConfig(tick_hz=config.tick_hz),
+            config=GameLoopConfig(
+                tick_hz=config.tick_hz,
+                job_workers=config.job_workers,
+                job_deadline_s=config.job_deadline_s,
+                tick_budget_s=config.tick_budget_s,
+            ),
             queue_manager=self.queue_manager,
         )
         self.bridge = RuntimeBridge(
@@ -973,9 +1003,45 @@ def parse_args(argv: Optional[list[str]] = None) -> RuntimeConfig:
     parser.add_argument("--game-host", default=os.environ.get("OPENRA_HOST", "localhost"))
     parser.add_argument("--game-port", type=int, default=int(os.environ.get("OPENRA_PORT", "7445")))
     parser.add_argument("--game-language", default=os.environ.get("OPENRA_LANGUAGE", "zh"))
+    parser.add_argument(
+        "--game-api-multiplex",
+        action="store_true",
+        default=_env_bool("GAME_API_MULTIPLEX", False),
+        help="Pipeline GameAPI requests on the persistent connection and dispatch responses by requestId",
+    )
+    parser.add_argument(
+        "--world-snapshot-batch",
+        action="store_true",
+        default=_env_bool("WORLD_SNAPSHOT_BATCH", False),
+        help="Refresh WorldModel actors/economy/queues with one world_snapshot request per tick",
+    )
+    parser.add_argument(
+        "--actor-delta-refresh",
+        action="store_true",
+        default=_env_bool("ACTOR_DELTA_REFRESH", False),
+        help="Refresh the WorldModel actors layer with versioned query_actor_delta patches",
+    )
     parser.add_argument("--ws-host", default=os.environ.get("WS_HOST", "0.0.0.0"))
     parser.add_argument("--ws-port", type=int, default=int(os.environ.get("WS_PORT", "8765")))
     parser.add_argument("--tick-hz", type=float, default=float(os.environ.get("TICK_HZ", "10.0")))
+    parser.add_argument(
+        "--job-workers",
+        type=int,
+        default=int(os.environ.get("GAME_LOOP_JOB_WORKERS", "1")),
+        help="Threads ticking Jobs each GameLoop tick; >1 ticks due Jobs concurrently",
+    )
+    parser.add_argument(
+        "--job-deadline-s",
+        type=float,
+        default=float(os.environ.get("GAME_LOOP_JOB_DEADLINE_S", "0.5")),
+        help="Run time of one Job tick before it counts as an overrun",
+    )
+    parser.add_argument(
+        "--tick-budget-s",
+        type=float,
+        default=float(os.environ["GAME_LOOP_TICK_BUDGET_S"]) if os.environ.get("GAME_LOOP_TICK_BUDGET_S") else None,
+        help="Work budget per GameLoop tick before low-priority work is shed (default: the tick interval)",
+    )
     parser.add_argument("--actors-refresh-s", type=float, default=float(os.environ.get("WORLD_ACTORS_REFRESH_S", "0.1")))
     parser.add_argument("--economy-refresh-s", type=float, default=float(os.environ.get("WORLD_ECONOMY_REFRESH_S", "0.5")))
     parser.add_argument("--map-refresh-s", type=float, default=float(os.environ.get("WORLD_MAP_REFRESH_S", "5.0")))
@@ -1004,9 +1070,15 @@ def parse_args(argv: Optional[list[str]] = None) -> RuntimeConfig:
         game_host=args.game_host,
         game_port=args.game_port,
         game_language=args.game_language,
+        game_api_multiplex=args.game_api_multiplex,
+        world_snapshot_batch=args.world_snapshot_batch,
+        actor_delta_refresh=args.actor_delta_refresh,
         ws_host=args.ws_host,
         ws_port=args.ws_port,
         tick_hz=args.tick_hz,
+        job_workers=args.job_workers,
+        job_deadline_s=args.job_deadline_s,
+        tick_budget_s=args.tick_budget_s,
         actors_refresh_s=args.actors_refresh_s,
         economy_refresh_s=args.economy_refresh_s,
         map_refresh_s=args.map_refresh_s,
@@ -20,6 +20,7 @@ from .command_dict import (
     RANGE_ALIASES,
     SEQUENCE_CONNECTORS,
 )
+from .intent_matcher import CompiledIntentMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -92,6 +93,12 @@ class CommandRouter:
         self._faction_kp = self._build_keyword_processor(self.faction_aliases)
         self._range_kp = self._build_keyword_processor(self.range_aliases)
 
+        self._intent_matcher = CompiledIntentMatcher(
+            self.command_dict,
+            normalize=self._normalize,
+            similarity=self._similarity,
+        )
+
     def route(self, command: str) -> RouteResult:
         if not self.enabled:
             return RouteResult(matched=False, reason="disabled")
@@ -428,28 +435,7 @@ class CommandRouter:
         return out.rstrip("!！。?？~～,，;； ")
 
     def _match_intent(self, command: str) -> tuple[Optional[str], float]:
-        best_intent: Optional[str] = None
-        best_score = 0.0
-        best_match_len = 0  # tie-break: prefer longer synonym match
-
-        for intent, rule in self.command_dict.items():
-            synonyms = rule.get("synonyms", [])
-            for s in synonyms:
-                s_norm = self._normalize(s)
-                if not s_norm:
-                    continue
-                if s_norm in command:
-                    score = 1.0
-                    match_len = len(s_norm)
-                else:
-                    score = self._similarity(command, s_norm)
-                    match_len = 0
-                if score > best_score or (score == best_score and match_len > best_match_len):
-                    best_score = score
-                    best_intent = intent
-                    best_match_len = match_len
-
-        return best_intent, best_score
+        return self._intent_matcher.match(command)
 
     def _apply_entity_heuristics(
         self,
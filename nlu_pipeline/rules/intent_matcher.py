@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+class AhoCorasick:
+    """Character-level Aho-Corasick automaton; reports which patterns occur in a text."""
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self._goto: list[Dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        for pattern_id, pattern in enumerate(patterns):
+            if pattern:
+                self._add(pattern, pattern_id)
+        self._link()
+
+    def _add(self, pattern: str, pattern_id: int) -> None:
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] += (pattern_id,)
+
+    def _link(self) -> None:
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def matches(self, text: str) -> set[int]:
+        goto, fail, out = self._goto, self._fail, self._out
+        found: set[int] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+@dataclass(frozen=True)
+class _Synonym:
+    intent: str
+    text: str
+    chars: Counter
+
+
+class CompiledIntentMatcher:
+    """Precompiled form of ``CommandRouter._match_intent``.
+
+    Synonyms are normalized once at build time. Exact substring hits come from
+    one Aho-Corasick pass; without a hit, a character index bounds every
+    synonym's similarity (``2 * shared_chars / total_len`` caps both
+    ``SequenceMatcher.ratio`` and ``token_set_ratio`` on whitespace-free text)
+    and only synonyms whose bound can still win are scored. Results, including
+    tie-breaks, are identical to the linear ``scan``.
+    """
+
+    def __init__(
+        self,
+        command_dict: Dict[str, Dict[str, Any]],
+        *,
+        normalize: Callable[[str], str],
+        similarity: Callable[[str, str], float],
+    ) -> None:
+        self._similarity = similarity
+        self._synonyms: list[_Synonym] = []
+        for intent, rule in command_dict.items():
+            for synonym in rule.get("synonyms", []):
+                text = normalize(synonym)
+                if text:
+                    self._synonyms.append(_Synonym(intent, text, Counter(text)))
+        self._automaton = AhoCorasick(s.text for s in self._synonyms)
+        self._char_index: Dict[str, list[tuple[int, int]]] = {}
+        for order, synonym in enumerate(self._synonyms):
+            for ch, count in synonym.chars.items():
+                self._char_index.setdefault(ch, []).append((order, count))
+
+    def __len__(self) -> int:
+        return len(self._synonyms)
+
+    def match(self, command: str) -> tuple[Optional[str], float]:
+        synonyms = self._synonyms
+        hits = self._automaton.matches(command)
+        if hits:
+            # Longest synonym wins; earlier synonyms win ties.
+            order = min(hits, key=lambda i: (-len(synonyms[i].text), i))
+            return synonyms[order].intent, 1.0
+        if not command:
+            return None, 0.0
+
+        shared: Dict[int, int] = {}
+        for ch, count in Counter(command).items():
+            for order, syn_count in self._char_index.get(ch, ()):
+                shared[order] = shared.get(order, 0) + min(count, syn_count)
+        size = len(command)
+        bounds = sorted(
+            ((2.0 * common / (size + len(synonyms[order].text)), order) for order, common in shared.items()),
+            key=lambda item: (-item[0], item[1]),
+        )
+
+        best_order = -1
+        best_score = 0.0
+        for bound, order in bounds:
+            if bound < best_score:
+                break
+            score = self._similarity(command, synonyms[order].text)
+            if score > best_score or (score == best_score and best_order >= 0 and order < best_order):
+                best_score = score
+                best_order = order
+        if best_order < 0:
+            return None, 0.0
+        return synonyms[best_order].intent, best_score
+
+    def scan(self, command: str) -> tuple[Optional[str], float]:
+        """Uncompiled linear scan over every synonym (reference for tests and benchmarks)."""
+        best_intent: Optional[str] = None
+        best_score = 0.0
+        best_match_len = 0
+        for synonym in self._synonyms:
+            if synonym.text in command:
+                score = 1.0
+                match_len = len(synonym.text)
+            else:
+                score = self._similarity(command, synonym.text)
+                match_len = 0
+            if score > best_score or (score == best_score and match_len > best_match_len):
+                best_score = score
+                best_intent = synonym.intent
+                best_match_len = match_len
+        return best_intent, best_score
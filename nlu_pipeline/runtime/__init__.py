@@ -1,4 +1,4 @@
 from .execution import ExecutionResult
-from .intent_runtime import PortableIntentModel
+from .intent_runtime import PortableIntentModel, binary_artifact_path, write_binary_artifact
 
-__all__ = ["ExecutionResult", "PortableIntentModel"]
+__all__ = ["ExecutionResult", "PortableIntentModel", "binary_artifact_path", "write_binary_artifact"]
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import hashlib
 import json
-import math
+import struct
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 import numpy as np
 
+# Binary artifact layout: magic, uint32 header length, JSON header, then
+# 16-byte aligned little-endian sections described by the header. The header
+# records the sha256 of the JSON artifact it was converted from.
+BINARY_MAGIC = b"IRMBIN01"
+BINARY_SUFFIX = ".bin"
+_ALIGN = 16
+
 
 @dataclass
 class PortableIntentPrediction:
@@ -15,8 +24,160 @@ class PortableIntentPrediction:
     confidence: float
 
 
+class IntentScoringIndex:
+    """Vocabulary index plus a ``(vocab + 1, labels)`` log-prob matrix.
+
+    Row ``len(vocab)`` holds each label's unknown-token log-prob, so scoring a
+    batch is a gather of token rows followed by a per-text segment sum (a
+    sparse count-matrix product without needing SciPy). ``log_prob`` may be a
+    read-only memory map; the vocabulary can be decoded lazily on first use.
+    """
+
+    def __init__(
+        self,
+        log_prob: np.ndarray,
+        prior: np.ndarray,
+        *,
+        vocab: Optional[Dict[str, int]] = None,
+        load_tokens: Optional[Callable[[], List[str]]] = None,
+    ) -> None:
+        self.log_prob = log_prob
+        self.prior = prior
+        self.unk_id = int(log_prob.shape[0]) - 1
+        self._vocab = vocab
+        self._load_tokens = load_tokens
+
+    @classmethod
+    def from_tables(
+        cls,
+        labels: Sequence[str],
+        class_log_prior: Dict[str, float],
+        token_log_prob: Dict[str, Dict[str, float]],
+        unk_log_prob: Dict[str, float],
+    ) -> "IntentScoringIndex":
+        vocab: Dict[str, int] = {}
+        for label in labels:
+            for tok in token_log_prob.get(label, {}):
+                vocab.setdefault(tok, len(vocab))
+        prior = np.array([float(class_log_prior.get(label, -100.0)) for label in labels], dtype=np.float64)
+        unk = np.array([float(unk_log_prob.get(label, -30.0)) for label in labels], dtype=np.float64)
+        log_prob = np.tile(unk, (len(vocab) + 1, 1))
+        for col, label in enumerate(labels):
+            tok_prob = token_log_prob.get(label, {})
+            if tok_prob:
+                rows = np.fromiter((vocab[tok] for tok in tok_prob), dtype=np.intp, count=len(tok_prob))
+                log_prob[rows, col] = np.fromiter(tok_prob.values(), dtype=np.float64, count=len(tok_prob))
+        return cls(log_prob, prior, vocab=vocab)
+
+    @property
+    def vocab(self) -> Dict[str, int]:
+        if self._vocab is None:
+            tokens = self._load_tokens() if self._load_tokens is not None else []
+            self._vocab = {tok: idx for idx, tok in enumerate(tokens)}
+        return self._vocab
+
+    def tokens(self) -> List[str]:
+        """Vocabulary in row order."""
+        return list(self.vocab)
+
+    def encode(self, grams: Sequence[str]) -> np.ndarray:
+        vocab = self.vocab
+        unk_id = self.unk_id
+        return np.fromiter((vocab.get(g, unk_id) for g in grams), dtype=np.intp, count=len(grams))
+
+    def scores(self, token_ids: Sequence[np.ndarray]) -> np.ndarray:
+        """Unnormalized log scores, one row per encoded text."""
+        if not token_ids:
+            return np.zeros((0, self.prior.size), dtype=np.float64)
+        lengths = np.fromiter((ids.size for ids in token_ids), dtype=np.intp, count=len(token_ids))
+        offsets = np.zeros(len(token_ids), dtype=np.intp)
+        np.cumsum(lengths[:-1], out=offsets[1:])
+        rows = self.log_prob[np.concatenate(token_ids)]
+        summed = np.add.reduceat(rows, offsets, axis=0, dtype=np.float64)
+        return summed + self.prior
+
+
+def _aligned(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def write_binary_artifact(model: "PortableIntentModel", path: Path) -> Path:
+    """Write ``model`` as a compact binary artifact (string table + float32 log-probs)."""
+    index = model.index
+    encoded = [tok.encode("utf-8") for tok in index.tokens()]
+    token_offsets = np.zeros(len(encoded) + 1, dtype="<u4")
+    np.cumsum([len(b) for b in encoded], out=token_offsets[1:])
+    arrays = {
+        "prior": np.ascontiguousarray(index.prior, dtype="<f8"),
+        "log_prob": np.ascontiguousarray(index.log_prob, dtype="<f4"),
+        "token_offsets": token_offsets,
+        "token_blob": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+    }
+
+    # Header size depends on the section offsets; iterate until it is stable.
+    header_len = 0
+    while True:
+        cursor = _aligned(len(BINARY_MAGIC) + 4 + header_len)
+        sections: Dict[str, Any] = {}
+        for name, array in arrays.items():
+            sections[name] = {"offset": cursor, "dtype": array.dtype.str, "shape": list(array.shape)}
+            cursor = _aligned(cursor + array.nbytes)
+        header = json.dumps(
+            {
+                "format": "char_ngram_nb_runtime",
+                "ngram_min": model.ngram_min,
+                "ngram_max": model.ngram_max,
+                "labels": list(model.labels),
+                "source_sha256": model.source_sha256,
+                "sections": sections,
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+        if len(header) == header_len:
+            break
+        header_len = len(header)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as f:
+        f.write(BINARY_MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        for name, array in arrays.items():
+            f.write(b"\0" * (sections[name]["offset"] - f.tell()))
+            f.write(array.tobytes())
+    tmp.replace(path)
+    return path
+
+
+def binary_artifact_path(path: Path) -> Path:
+    """Sibling binary artifact for a JSON artifact path."""
+    return Path(path).with_suffix(BINARY_SUFFIX)
+
+
+def _is_binary_artifact(path: Path) -> bool:
+    try:
+        with Path(path).open("rb") as f:
+            return f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+    except OSError:
+        return False
+
+
+def _read_binary_header(path: Path) -> Dict[str, Any]:
+    with Path(path).open("rb") as f:
+        if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            raise ValueError(f"not a binary intent model artifact: {path}")
+        (header_len,) = struct.unpack("<I", f.read(4))
+        return json.loads(f.read(header_len).decode("utf-8"))
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
 class PortableIntentModel:
-    """Portable char ngram NB runtime model loaded from JSON artifact."""
+    """Portable char ngram NB runtime model loaded from a JSON or binary artifact."""
 
     def __init__(
         self,
@@ -28,19 +189,83 @@ class PortableIntentModel:
         token_log_prob: Dict[str, Dict[str, float]],
         unk_log_prob: Dict[str, float],
     ) -> None:
+        self._init(
+            ngram_min,
+            ngram_max,
+            labels,
+            IntentScoringIndex.from_tables(labels, class_log_prior, token_log_prob, unk_log_prob),
+        )
+        self._token_log_prob: Optional[Dict[str, Dict[str, float]]] = token_log_prob
+
+    def _init(self, ngram_min: int, ngram_max: int, labels: List[str], index: IntentScoringIndex) -> None:
         self.ngram_min = ngram_min
         self.ngram_max = ngram_max
         self.labels = labels
-        self.class_log_prior = class_log_prior
-        self.token_log_prob = token_log_prob
-        self.unk_log_prob = unk_log_prob
+        self.index = index
+        self.class_log_prior = {label: float(v) for label, v in zip(labels, index.prior)}
+        self.unk_log_prob = {label: float(v) for label, v in zip(labels, index.log_prob[index.unk_id])}
+        self._token_log_prob = None
+        self._token_ids = lru_cache(maxsize=4096)(self._encode)
+        # Artifact the model was read from, and the sha256 of its source JSON.
+        self.artifact_path: Optional[Path] = None
+        self.source_sha256: Optional[str] = None
+
+    @classmethod
+    def from_index(
+        cls, *, ngram_min: int, ngram_max: int, labels: List[str], index: IntentScoringIndex
+    ) -> "PortableIntentModel":
+        model = cls.__new__(cls)
+        model._init(ngram_min, ngram_max, labels, index)
+        return model
+
+    @property
+    def token_log_prob(self) -> Dict[str, Dict[str, float]]:
+        """Per-label token log-prob tables (rebuilt from the index for binary artifacts)."""
+        if self._token_log_prob is None:
+            index = self.index
+            unk = index.log_prob[index.unk_id]
+            tables: Dict[str, Dict[str, float]] = {label: {} for label in self.labels}
+            for tok, row in index.vocab.items():
+                values = index.log_prob[row]
+                for col, label in enumerate(self.labels):
+                    if values[col] != unk[col]:
+                        tables[label][tok] = float(values[col])
+            self._token_log_prob = tables
+        return self._token_log_prob
 
     @classmethod
     def load(cls, path: Path) -> "PortableIntentModel":
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        """Load an artifact; a JSON path prefers a sibling binary converted from that exact JSON.
+
+        The binary is used only when the source sha256 in its header matches the
+        JSON on disk, so a restored or edited JSON is never shadowed by a stale
+        binary. ``artifact_path`` on the result names the file actually loaded.
+        """
+        path = Path(path)
+        if _is_binary_artifact(path):
+            return cls.load_binary(path)
+        raw = path.read_bytes()
+        binary = binary_artifact_path(path)
+        if binary != path and binary.exists():
+            try:
+                header = _read_binary_header(binary)
+            except (OSError, ValueError):
+                header = {}
+            if header.get("source_sha256") == _sha256(raw):
+                return cls.load_binary(binary)
+        return cls._from_json_bytes(raw, path)
+
+    @classmethod
+    def load_json(cls, path: Path) -> "PortableIntentModel":
+        path = Path(path)
+        return cls._from_json_bytes(path.read_bytes(), path)
+
+    @classmethod
+    def _from_json_bytes(cls, raw: bytes, path: Path) -> "PortableIntentModel":
+        payload = json.loads(raw.decode("utf-8"))
         model = payload.get("model", {})
 
-        return cls(
+        loaded = cls(
             ngram_min=int(model.get("ngram_min", 1)),
             ngram_max=int(model.get("ngram_max", 3)),
             labels=[str(x) for x in model.get("labels", [])],
@@ -55,6 +280,45 @@ class PortableIntentModel:
                 str(k): float(v) for k, v in dict(model.get("unk_log_prob", {})).items()
             },
         )
+        loaded.artifact_path = path
+        loaded.source_sha256 = _sha256(raw)
+        return loaded
+
+    @classmethod
+    def load_binary(cls, path: Path) -> "PortableIntentModel":
+        """Memory-map a binary artifact; pages are shared between processes loading the same file."""
+        path = Path(path)
+        header = _read_binary_header(path)
+
+        def section(name: str) -> np.ndarray:
+            spec = header["sections"][name]
+            shape = tuple(int(n) for n in spec["shape"])
+            if 0 in shape:
+                return np.zeros(shape, dtype=np.dtype(spec["dtype"]))
+            return np.memmap(path, dtype=np.dtype(spec["dtype"]), mode="r", offset=int(spec["offset"]), shape=shape)
+
+        def load_tokens() -> List[str]:
+            offsets = section("token_offsets")
+            blob = bytes(section("token_blob"))
+            return [blob[offsets[i] : offsets[i + 1]].decode("utf-8") for i in range(len(offsets) - 1)]
+
+        index = IntentScoringIndex(
+            section("log_prob"),
+            np.array(section("prior"), dtype=np.float64),
+            load_tokens=load_tokens,
+        )
+        loaded = cls.from_index(
+            ngram_min=int(header.get("ngram_min", 1)),
+            ngram_max=int(header.get("ngram_max", 3)),
+            labels=[str(x) for x in header.get("labels", [])],
+            index=index,
+        )
+        loaded.artifact_path = path
+        loaded.source_sha256 = header.get("source_sha256")
+        return loaded
+
+    def save_binary(self, path: Path) -> Path:
+        return write_binary_artifact(self, path)
 
     def _ngrams(self, text: str) -> List[str]:
         text = "".join((text or "").strip().lower().split())
@@ -65,24 +329,21 @@ class PortableIntentModel:
             grams.extend(text[i : i + n] for i in range(len(text) - n + 1))
         return grams or [text]
 
+    def _encode(self, text: str) -> np.ndarray:
+        ids = self.index.encode(self._ngrams(text))
+        ids.flags.writeable = False
+        return ids
+
     def predict_proba(self, texts: List[str]) -> np.ndarray:
-        rows = []
-        for text in texts:
-            grams = self._ngrams(text)
-            scores = []
-            for label in self.labels:
-                s = float(self.class_log_prior.get(label, -100.0))
-                tok_prob = self.token_log_prob.get(label, {})
-                unk = float(self.unk_log_prob.get(label, -30.0))
-                for g in grams:
-                    s += float(tok_prob.get(g, unk))
-                scores.append(s)
-            m = max(scores)
-            exps = [math.exp(v - m) for v in scores]
-            z = sum(exps)
-            probs = [v / z for v in exps]
-            rows.append(probs)
-        return np.array(rows)
+        if not self.labels:
+            return np.zeros((len(texts), 0))
+        scores = self.index.scores([self._token_ids(text) for text in texts])
+        exps = np.exp(scores - scores.max(axis=1, keepdims=True))
+        return exps / exps.sum(axis=1, keepdims=True)
+
+    def predict(self, texts: List[str]) -> List[str]:
+        probs = self.predict_proba(texts)
+        return [self.labels[i] for i in np.argmax(probs, axis=1)]
 
     def predict_one(self, text: str) -> PortableIntentPrediction:
         probs = self.predict_proba([text])[0]
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmark.histogram import LatencyHistogram
+from nlu_pipeline.rules import CommandRouter
+from nlu_pipeline.scripts.common import read_jsonl
+
+DEFAULT_INPUTS = [
+    "nlu_pipeline/data/manual/manual_gold_seed.jsonl",
+    "nlu_pipeline/data/manual/annotation_queue.jsonl",
+    "nlu_pipeline/data/raw/online_batch/commands_online_batch.jsonl",
+    "nlu_pipeline/data/raw/web/commands_from_hf_dialogue.jsonl",
+    "nlu_pipeline/data/raw/web/commands_from_web_20260208.jsonl",
+]
+
+
+def load_commands(paths: List[str], limit: int) -> List[str]:
+    commands: List[str] = []
+    for raw in paths:
+        path = Path(raw)
+        if not path.is_absolute():
+            path = PROJECT_ROOT / path
+        for row in read_jsonl(path):
+            text = str(row.get("text") or "").strip()
+            if text:
+                commands.append(text)
+    if limit > 0:
+        commands = commands[:limit]
+    return commands
+
+
+def bench(router: CommandRouter, commands: List[str], repeat: int) -> Dict[str, Any]:
+    matcher = router._intent_matcher
+    clauses = [clause for command in commands for clause in router._split_sequence_clauses(router._normalize(command))]
+    clauses = [clause for clause in clauses if clause]
+
+    mismatches: List[Dict[str, Any]] = []
+    for clause in clauses:
+        compiled = matcher.match(clause)
+        reference = matcher.scan(clause)
+        if compiled != reference:
+            mismatches.append({"clause": clause, "compiled": compiled, "scan": reference})
+
+    timings = {"scan": LatencyHistogram(), "compiled": LatencyHistogram(), "route": LatencyHistogram()}
+    for _ in range(max(1, repeat)):
+        for clause in clauses:
+            t0 = time.perf_counter()
+            matcher.scan(clause)
+            t1 = time.perf_counter()
+            matcher.match(clause)
+            t2 = time.perf_counter()
+            timings["scan"].record((t1 - t0) * 1000)
+            timings["compiled"].record((t2 - t1) * 1000)
+        for command in commands:
+            t0 = time.perf_counter()
+            router.route(command)
+            timings["route"].record((time.perf_counter() - t0) * 1000)
+
+    scan_total = timings["scan"].total
+    compiled_total = timings["compiled"].total
+    return {
+        "commands": len(commands),
+        "clauses": len(clauses),
+        "synonyms": len(matcher),
+        "repeat": max(1, repeat),
+        "mismatches": mismatches,
+        "speedup": (scan_total / compiled_total) if compiled_total > 0 else 0.0,
+        "latency_ms": {name: histogram.summary() for name, histogram in timings.items()},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Micro-benchmark CommandRouter intent matching over the NLU datasets.")
+    parser.add_argument("--input", action="append", default=None, help="jsonl file with a text field (repeatable)")
+    parser.add_argument("--limit", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", default="")
+    args = parser.parse_args()
+
+    commands = load_commands(args.input or DEFAULT_INPUTS, args.limit)
+    report = bench(CommandRouter(), commands, args.repeat)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        out = Path(args.out)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(text + "\n", encoding="utf-8")
+    print(text)
+    if report["mismatches"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
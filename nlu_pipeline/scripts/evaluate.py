@@ -8,7 +8,7 @@ from typing import Any, Dict, List
 
 from common import load_yaml, read_jsonl
 import intent_models  # noqa: F401  # ensure classes are importable during unpickle
-from intent_models import CharNgramNB
+from nlu_pipeline.runtime import PortableIntentModel
 from metrics import classification_metrics, confusion, label_counts
 from rule_weak_labeler import WeakLabeler
 
@@ -20,10 +20,8 @@ def load_pickle_model(path: Path) -> Any:
 
 
 def load_runtime_model(path: Path) -> tuple[str, Any]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    model_payload = payload.get("model", {})
-    model = CharNgramNB.from_dict(model_payload)
-    return "char_ngram_nb_runtime", model
+    # Same array-backed scorer the runtime gateway uses; batch predict over the test set.
+    return "char_ngram_nb_runtime", PortableIntentModel.load(path)
 
 
 def main() -> None:
@@ -5,6 +5,7 @@ import hashlib
 import json
 import shutil
 import subprocess
+import sys
 from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
@@ -12,6 +13,11 @@ from typing import Any, Dict, List
 
 from common import PROJECT_ROOT, load_yaml, read_jsonl
 
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from nlu_pipeline.runtime import PortableIntentModel, binary_artifact_path
+
 
 def file_sha256(path: Path) -> str:
     h = hashlib.sha256()
@@ -189,6 +195,12 @@ def main() -> None:
     artifact_copy_path = release_path / "intent_model_runtime.json"
     shutil.copy2(runtime_model_path, artifact_copy_path)
 
+    # Compact mmap-able artifact for runtime cold start; written next to the
+    # source artifact too so the gateway picks it up in place of the JSON.
+    runtime_model = PortableIntentModel.load_json(runtime_model_path)
+    binary_copy_path = runtime_model.save_binary(binary_artifact_path(artifact_copy_path))
+    runtime_model.save_binary(binary_artifact_path(runtime_model_path))
+
     # Snapshot key reports with normalized runtime-facing names.
     snapshots = [
         (Path(args.eval), "eval_metrics.json"),
@@ -211,6 +223,10 @@ def main() -> None:
             "path": str(artifact_copy_path),
             "sha256": file_sha256(artifact_copy_path),
         },
+        "runtime_model_binary": {
+            "path": str(binary_copy_path),
+            "sha256": file_sha256(binary_copy_path),
+        },
         "dataset": {
             "total": dataset_total,
             "attack_samples": attack_samples,
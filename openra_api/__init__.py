@@ -2,6 +2,7 @@ from .game_api import GameAPI, GameAPIError
 from .intel import IntelModel, IntelSerializer, IntelService
 from .models import (
     Actor,
+    ActorDeltaResult,
     ControlPoint,
     ControlPointQueryResult,
     FrozenActor,
@@ -11,6 +12,7 @@ from .models import (
     PlayerBaseInfo,
     ScreenInfoResult,
     TargetsQueryParam,
+    WorldSnapshotResult,
 )
 
 __all__ = [
@@ -19,6 +21,7 @@ __all__ = [
     'Location',
     'TargetsQueryParam',
     'Actor',
+    'ActorDeltaResult',
     'MapQueryResult',
     'FrozenActor',
     'ControlPoint',
@@ -26,6 +29,7 @@ __all__ = [
     'MatchInfoQueryResult',
     'PlayerBaseInfo',
     'ScreenInfoResult',
+    'WorldSnapshotResult',
     'IntelService',
     'IntelModel',
     'IntelSerializer',
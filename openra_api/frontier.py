@@ -0,0 +1,235 @@
+"""Shared frontier engine over the ``IsExplored`` grid.
+
+``ReconJob`` and ``ExploreJob`` both need the same derivatives of the explored
+grid: per-cell lookups, the frontier mask (unexplored cells with an explored
+4-neighbour), 8x8 block counts and unexplored ratios along scout paths.
+``FrontierGrid`` computes them with array operations, lazily per layout, and
+``frontier_grid`` hands every scout and job the same instance until the map
+layer is refreshed (the grid object changes).
+
+Origin and layout are properties of the map rather than of a tick: the world
+model detects them once per map and publishes them on ``map_raw`` as
+``grid_origin`` / ``grid_layout``; ``detect_grid_origin`` and
+``FrontierGrid.choose_layout`` are the detectors it (and callers without a world
+model) use.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Iterable, Optional
+
+import numpy as np
+
+from .map_grid import as_grid_array
+
+LAYOUTS: tuple[str, ...] = ("col_major", "row_major")
+DEFAULT_BLOCK = 8
+
+
+def bresenham_cells(x0: int, y0: int, x1: int, y1: int) -> list[tuple[int, int]]:
+    """4-connected Bresenham line cells from (x0, y0) to (x1, y1)."""
+    pts: list[tuple[int, int]] = []
+    dx, dy = abs(x1 - x0), abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    err = dx - dy
+    x, y = x0, y0
+    while True:
+        pts.append((x, y))
+        if x == x1 and y == y1:
+            break
+        e2 = err * 2
+        if e2 > -dy:
+            err -= dy
+            x += sx
+        if e2 < dx:
+            err += dx
+            y += sy
+    return pts
+
+
+def detect_grid_origin(positions: Iterable[tuple[int, int]], w: int, h: int) -> int:
+    """Infer whether world cell coordinates are 0- or 1-indexed relative to the grid."""
+    positions = list(positions)
+    if not positions or not w or not h:
+        return 1
+    xs = [p[0] for p in positions]
+    ys = [p[1] for p in positions]
+    if any(v == 0 for v in xs + ys):
+        return 0
+    if any(v == w or v == h for v in xs + ys):
+        return 1
+    if max(xs) <= w - 1 and max(ys) <= h - 1:
+        return 0
+    return 1
+
+
+class FrontierGrid:
+    """Explored-grid derivatives for one map refresh.
+
+    Every array is indexed ``[x, y]`` in grid (0-based) coordinates regardless of
+    the raw layout; cells missing from a ragged or empty grid count as
+    unexplored.
+    """
+
+    def __init__(self, grid: Any, width: int, height: int) -> None:
+        self.width = max(int(width or 0), 0)
+        self.height = max(int(height or 0), 0)
+        self._raw = as_grid_array(grid, bool)
+        self._explored: dict[str, np.ndarray] = {}
+        self._frontier: dict[str, np.ndarray] = {}
+        self._blocks: dict[tuple[str, str, int], np.ndarray] = {}
+
+    @property
+    def is_empty(self) -> bool:
+        return self._raw is None
+
+    def explored(self, layout: str) -> np.ndarray:
+        """``(w, h)`` bool array of explored cells for ``layout``."""
+        array = self._explored.get(layout)
+        if array is None:
+            w, h = self.width, self.height
+            array = np.zeros((w, h), dtype=bool)
+            raw = self._raw
+            if raw is not None:
+                view = raw if layout == "col_major" else raw.T
+                cw, ch = min(w, view.shape[0]), min(h, view.shape[1])
+                array[:cw, :ch] = view[:cw, :ch]
+            self._explored[layout] = array
+        return array
+
+    def frontier(self, layout: str) -> np.ndarray:
+        """``(w, h)`` bool mask of unexplored cells with an explored 4-neighbour."""
+        mask = self._frontier.get(layout)
+        if mask is None:
+            explored = self.explored(layout)
+            padded = np.pad(explored, 1, constant_values=False)
+            neighbour = padded[:-2, 1:-1] | padded[2:, 1:-1] | padded[1:-1, :-2] | padded[1:-1, 2:]
+            mask = ~explored & neighbour
+            self._frontier[layout] = mask
+        return mask
+
+    def is_explored(self, x: int, y: int, layout: str) -> bool:
+        if x < 0 or y < 0 or x >= self.width or y >= self.height:
+            return False
+        return bool(self.explored(layout)[x, y])
+
+    def choose_layout(
+        self,
+        origin: int,
+        positions: Iterable[tuple[int, int]],
+        prefer: str = "col_major",
+    ) -> str:
+        """Pick the layout under which the probe positions look explored.
+
+        Each probe scores +/-1000 for its own cell plus one point per explored
+        cell in its 3x3 neighbourhood; ties go to ``prefer``.
+        """
+        w, h = self.width, self.height
+        if not w or not h:
+            return prefer
+        cells = [
+            (max(0, min(w - 1, px - origin)), max(0, min(h - 1, py - origin)))
+            for px, py in positions
+        ]
+
+        def score(layout: str) -> int:
+            explored = self.explored(layout)
+            s = 0
+            for gx, gy in cells:
+                s += 1000 if explored[gx, gy] else -1000
+                s += int(np.count_nonzero(explored[max(0, gx - 1) : gx + 2, max(0, gy - 1) : gy + 2]))
+            return s
+
+        other = "row_major" if prefer == "col_major" else "col_major"
+        return other if score(other) > score(prefer) else prefer
+
+    def detect_geometry(
+        self,
+        positions: Iterable[tuple[int, int]],
+        prefer: str = "col_major",
+    ) -> tuple[int, str]:
+        """``(origin, layout)`` inferred from positions known to be explored."""
+        positions = list(positions)
+        origin = detect_grid_origin(positions, self.width, self.height)
+        return origin, self.choose_layout(origin, positions, prefer)
+
+    def unexplored_ratio(
+        self,
+        layout: str,
+        origin: int,
+        cur: tuple[int, int],
+        tgt: tuple[int, int],
+    ) -> float:
+        """Fraction of cells along cur->tgt (skipping the start) that are unexplored."""
+        w, h = self.width, self.height
+        if not w or not h:
+            return 0.0
+        x0 = max(0, min(w - 1, cur[0] - origin))
+        y0 = max(0, min(h - 1, cur[1] - origin))
+        x1 = max(0, min(w - 1, tgt[0] - origin))
+        y1 = max(0, min(h - 1, tgt[1] - origin))
+        pts = bresenham_cells(x0, y0, x1, y1)
+        if len(pts) <= 1:
+            return 0.0
+        cells = np.asarray(pts[1:], dtype=np.intp)
+        explored = self.explored(layout)[cells[:, 0], cells[:, 1]]
+        return float(explored.size - np.count_nonzero(explored)) / explored.size
+
+    def block_counts(self, layout: str, kind: str = "frontier", block: int = DEFAULT_BLOCK) -> np.ndarray:
+        """Per-block cell counts, shape ``(ceil(w/block), ceil(h/block))``.
+
+        ``kind`` is ``"frontier"`` (frontier cells) or ``"unexplored"``.
+        """
+        key = (layout, kind, block)
+        counts = self._blocks.get(key)
+        if counts is None:
+            if kind == "frontier":
+                cells = self.frontier(layout)
+            elif kind == "unexplored":
+                cells = ~self.explored(layout)
+            else:
+                raise ValueError(f"Unknown block count kind: {kind}")
+            w, h = cells.shape
+            nbx, nby = -(-w // block), -(-h // block)
+            padded = np.zeros((nbx * block, nby * block), dtype=np.int32)
+            padded[:w, :h] = cells
+            counts = padded.reshape(nbx, block, nby, block).sum(axis=(1, 3))
+            self._blocks[key] = counts
+        return counts
+
+    def blocks(
+        self,
+        layout: str,
+        kind: str = "frontier",
+        block: int = DEFAULT_BLOCK,
+    ) -> list[tuple[int, int, int]]:
+        """Non-empty blocks as ``(bx, by, count)`` grid origins, in row-major scan order."""
+        counts = self.block_counts(layout, kind, block)
+        bys, bxs = np.nonzero(counts.T)
+        values = counts[bxs, bys]
+        return [
+            (int(bx) * block, int(by) * block, int(count))
+            for bx, by, count in zip(bxs.tolist(), bys.tolist(), values.tolist())
+        ]
+
+
+_cache_lock = threading.Lock()
+_cached: Optional[tuple[Any, int, int, FrontierGrid]] = None
+
+
+def frontier_grid(grid: Any, width: int, height: int) -> FrontierGrid:
+    """Shared ``FrontierGrid`` for ``grid``, rebuilt only when the grid object changes.
+
+    The world model and intel service replace the ``IsExplored`` object on every
+    map refresh, so identity is the refresh generation.
+    """
+    global _cached
+    with _cache_lock:
+        cached = _cached
+        if cached is not None and cached[0] is grid and cached[1] == width and cached[2] == height:
+            return cached[3]
+        engine = FrontierGrid(grid, width, height)
+        _cached = (grid, width, height, engine)
+        return engine
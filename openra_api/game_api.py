@@ -1,10 +1,15 @@
 import socket
+import select
 import json
 import time
 import threading
 import uuid
 import logging
 from typing import List, Optional, Tuple, Dict, Any
+
+import numpy as np
+
+from .map_grid import as_grid_array, unpack_bool_grid
 from .models import *
 from .production_names import production_name_unit_id, production_name_variants
 
@@ -21,17 +26,21 @@ class GameAPIError(Exception):
         super().__init__(f"{code}: {message}")
 
 
-def _unpack_bool_grid(packed: list[int], w: int, h: int) -> list[list[bool]]:
-    """Unpack a bitpacked int array into a w×h 2D bool grid (col-major)."""
-    grid: list[list[bool]] = []
-    idx = 0
-    for _x in range(w):
-        col: list[bool] = []
-        for _y in range(h):
-            col.append(bool(packed[idx // 32] & (1 << (idx % 32))) if idx // 32 < len(packed) else False)
-            idx += 1
-        grid.append(col)
-    return grid
+def _unpack_bool_grid(packed: list[int], w: int, h: int) -> "np.ndarray":
+    """Unpack a bitpacked int array into a w×h bool grid (col-major NumPy array)."""
+    return unpack_bool_grid(packed, w, h)
+
+
+class _PendingRequest:
+    """Multiplex 模式下一个在途请求的响应槽位。"""
+
+    __slots__ = ("sock", "event", "response", "error")
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.event = threading.Event()
+        self.response: Optional[dict] = None
+        self.error: Optional[BaseException] = None
 
 
 class GameAPI:
@@ -93,17 +102,26 @@ class GameAPI:
         except Exception:
             return False
 
-    def __init__(self, host, port=7445, language="zh"):
+    def __init__(self, host, port=7445, language="zh", multiplex: bool = False):
         self.server_address = (host, port)
         self.language = language
+        self.multiplex = multiplex
         self._socket: Optional[socket.socket] = None
         self._socket_lock = threading.RLock()
+        self._pending: Dict[str, _PendingRequest] = {}
+        self._pending_lock = threading.Lock()
+        self._reader_thread: Optional[threading.Thread] = None
+        # None: 尚未探测；False: 桥接不认识 batch_orders，退回逐组下发
+        self._batch_orders_supported: Optional[bool] = None
         '''初始化 GameAPI 类
 
         Args:
             host (str): 游戏服务器地址，本地就填"localhost"。
             port (int): 游戏服务器端口，默认为 7445。
             language (str): 接口返回语言，默认为 "zh"，支持 "zh" 和 "en"。
+            multiplex (bool): 是否启用多路复用模式。启用后同一持久连接上允许多个
+                在途请求，由后台读线程按 requestId 分发响应；默认关闭，保持
+                一问一答的串行模式。
         '''
 
     def _generate_request_id(self) -> str:
@@ -118,14 +136,17 @@ class GameAPI:
     def _close_socket_locked(self) -> None:
         if self._socket is None:
             return
+        sock = self._socket
         try:
-            self._socket.shutdown(socket.SHUT_RDWR)
+            sock.shutdown(socket.SHUT_RDWR)
         except OSError:
             pass
         try:
-            self._socket.close()
+            sock.close()
         finally:
             self._socket = None
+            if self.multiplex:
+                self._fail_pending(sock, ConnectionError("连接已关闭"))
 
     def _ensure_connection_locked(self) -> socket.socket:
         if self._socket is not None:
@@ -140,8 +161,96 @@ class GameAPI:
             raise
 
         self._socket = sock
+        if self.multiplex:
+            self._reader_thread = threading.Thread(
+                target=self._reader_loop,
+                args=(sock,),
+                name="GameAPIReader",
+                daemon=True,
+            )
+            self._reader_thread.start()
         return sock
 
+    def _reader_loop(self, sock: socket.socket) -> None:
+        """Multiplex 模式读线程：持续读取换行分隔的响应，并按 requestId 唤醒等待方。"""
+        buf = bytearray()
+        error: BaseException = ConnectionError("连接已关闭")
+        try:
+            while True:
+                try:
+                    chunk = sock.recv(65536)
+                except socket.timeout:
+                    self._dispatch_unterminated(buf)
+                    continue
+                if not chunk:
+                    self._dispatch_unterminated(buf)
+                    break
+                buf.extend(chunk)
+                while True:
+                    newline_index = buf.find(b"\n")
+                    if newline_index < 0:
+                        break
+                    line = bytes(buf[:newline_index]).rstrip(b"\r")
+                    del buf[:newline_index + 1]
+                    if line:
+                        self._dispatch_response(line)
+                if buf and buf.rstrip()[-1:] in (b"}", b"]") and not self._socket_readable(sock):
+                    # 大响应还在陆续到达时不重复解析整个缓冲区，只在连接空闲时尝试
+                    self._dispatch_unterminated(buf)
+        except OSError as e:
+            error = e
+        finally:
+            with self._socket_lock:
+                if self._socket is sock:
+                    self._close_socket_locked()
+            self._fail_pending(sock, error)
+
+    @staticmethod
+    def _socket_readable(sock: socket.socket) -> bool:
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return bool(readable)
+
+    def _dispatch_unterminated(self, buf: bytearray) -> None:
+        """兼容不带换行的单个完整 JSON 包；解析成功则清空缓冲区。"""
+        if not buf:
+            return
+        try:
+            candidate = self._parse_complete_json(buf.decode("utf-8"))
+        except UnicodeDecodeError:
+            candidate = None
+        if candidate is not None:
+            buf.clear()
+            self._dispatch_response(candidate.encode("utf-8"))
+
+    def _dispatch_response(self, line: bytes) -> None:
+        try:
+            response = json.loads(line.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            logger.warning("GameAPI multiplex reader dropped invalid JSON frame")
+            return
+        request_id = response.get("requestId") if isinstance(response, dict) else None
+        with self._pending_lock:
+            pending = self._pending.pop(request_id, None) if request_id is not None else None
+        if pending is None:
+            logger.debug("GameAPI multiplex reader dropped unmatched response: %s", request_id)
+            return
+        pending.response = response
+        pending.event.set()
+
+    def _fail_pending(self, sock: socket.socket, error: BaseException) -> None:
+        with self._pending_lock:
+            failed = [
+                request_id for request_id, pending in self._pending.items()
+                if pending.sock is sock
+            ]
+            entries = [self._pending.pop(request_id) for request_id in failed]
+        for pending in entries:
+            pending.error = error
+            pending.event.set()
+
     @staticmethod
     def _parse_complete_json(payload: str) -> Optional[str]:
         candidate = payload.strip()
@@ -233,6 +342,8 @@ class GameAPI:
             "params": params,
             "language": self.language
         }
+        if self.multiplex:
+            return self._send_request_multiplexed(request_data)
 
         retries = 0
         while retries < self.MAX_RETRIES:
@@ -303,6 +414,78 @@ class GameAPI:
                 raise GameAPIError("UNEXPECTED_ERROR",
                                  "发生未预期的错误: {0}".format(str(e)))
 
+    def _send_request_multiplexed(self, request_data: dict) -> dict:
+        '''Multiplex 模式下发送请求：仅在写入时持锁，等待响应期间不阻塞其他请求。
+
+        重试与错误语义与串行模式一致：初次连接失败立即报错，连接中断时重连重试。
+        '''
+        request_id = request_data["requestId"]
+        payload = (json.dumps(request_data) + "\n").encode('utf-8')
+
+        retries = 0
+        while retries < self.MAX_RETRIES:
+            pending: Optional[_PendingRequest] = None
+            try:
+                with self._socket_lock:
+                    had_socket = self._socket is not None
+                    try:
+                        sock = self._ensure_connection_locked()
+                    except Exception as e:
+                        self._close_socket_locked()
+                        if not had_socket:
+                            raise GameAPIError(
+                                "CONNECTION_ERROR",
+                                "连接服务器失败: {0}".format(str(e)),
+                            )
+                        raise
+
+                    pending = _PendingRequest(sock)
+                    with self._pending_lock:
+                        self._pending[request_id] = pending
+                    sock.sendall(payload)
+
+                if not pending.event.wait(self.SOCKET_TIMEOUT):
+                    raise socket.timeout("等待响应超时")
+                if pending.error is not None:
+                    raise ConnectionError(str(pending.error))
+
+                response = pending.response
+                if not isinstance(response, dict):
+                    raise GameAPIError("INVALID_RESPONSE",
+                                     "服务器返回的响应格式无效")
+                if response.get("status", 0) < 0:
+                    error = response.get("error", {})
+                    raise GameAPIError(
+                        error.get("code", "UNKNOWN_ERROR"),
+                        error.get("message", "未知错误"),
+                        error.get("details")
+                    )
+                return response
+
+            except (socket.timeout, ConnectionError, OSError) as e:
+                with self._pending_lock:
+                    self._pending.pop(request_id, None)
+                if not isinstance(e, socket.timeout):
+                    with self._socket_lock:
+                        if pending is None or self._socket is pending.sock:
+                            self._close_socket_locked()
+                retries += 1
+                if retries >= self.MAX_RETRIES:
+                    raise GameAPIError("CONNECTION_ERROR",
+                                     "连接服务器失败: {0}".format(str(e)))
+                time.sleep(self.RETRY_DELAY)
+
+            except GameAPIError:
+                with self._pending_lock:
+                    self._pending.pop(request_id, None)
+                raise
+
+            except Exception as e:
+                with self._pending_lock:
+                    self._pending.pop(request_id, None)
+                raise GameAPIError("UNEXPECTED_ERROR",
+                                 "发生未预期的错误: {0}".format(str(e)))
+
     def _receive_data(self, sock: socket.socket) -> str:
         """从socket接收完整的响应数据。优先使用换行定界，同时兼容单个完整JSON包。"""
         return self._receive_payload(sock)
@@ -633,6 +816,13 @@ class GameAPI:
         except KeyError as e:
             raise GameAPIError("INVALID_ACTOR_DATA", "Actor数据格式无效: {0}".format(str(e)))
 
+    @staticmethod
+    def _hydrate_frozen_actor(data: dict) -> FrozenActor:
+        try:
+            return FrozenActor(data["type"], data["faction"], Location(data["position"]["x"], data["position"]["y"]))
+        except KeyError as e:
+            raise GameAPIError("INVALID_FROZEN_ACTOR_DATA", "FrozenActor数据格式无效: {0}".format(str(e)))
+
     def query_actor(self, query_params: TargetsQueryParam) -> List[Actor]:
         try:
             response = self._send_request('query_actor', {
@@ -682,11 +872,7 @@ class GameAPI:
                 actors.append(actor)
 
             for data in frozen_actors_data:
-                try:
-                    frozen_actor = FrozenActor( data["type"], data["faction"], Location(data["position"]["x"], data["position"]["y"]))
-                    frozen_actors.append(frozen_actor)
-                except KeyError as e:
-                    raise GameAPIError("INVALID_FROZEN_ACTOR_DATA", "FrozenActor数据格式无效: {0}".format(str(e)))
+                frozen_actors.append(self._hydrate_frozen_actor(data))
 
             return actors, frozen_actors
 
@@ -695,6 +881,41 @@ class GameAPI:
         except Exception as e:
             raise GameAPIError("QUERY_ACTOR_ERROR", "查询Actor时发生错误: {0}".format(str(e)))
 
+    def query_actor_delta(self, since_version: Optional[int] = None) -> ActorDeltaResult:
+        '''增量查询己方与敌方单位：只返回自 since_version 以来新增、变化和消失的单位
+
+        Args:
+            since_version (int, optional): 上次结果的 Version；为 None 时请求全量。
+
+        Returns:
+            ActorDeltaResult: 增量结果；服务端丢失该版本时 Full 为 True 并返回全量
+
+        Raises:
+            GameAPIError: 当查询失败时；服务端不支持该命令时错误码为 INVALID_COMMAND
+        '''
+        params: dict = {
+            "selfTargets": TargetsQueryParam(faction="自己").to_dict(),
+            "enemyTargets": TargetsQueryParam(faction="敌人").to_dict(),
+        }
+        if since_version is not None:
+            params["sinceVersion"] = since_version
+        try:
+            response = self._send_request('query_actor_delta', params)
+            result = self._handle_response(response, "增量查询Actor失败") or {}
+
+            return ActorDeltaResult(
+                Version=int(result.get("version", 0)),
+                Full=bool(result.get("full", since_version is None)),
+                Added=[self._hydrate_actor(data) for data in result.get("added", [])],
+                Changed=[self._hydrate_actor(data) for data in result.get("changed", [])],
+                Removed=[int(actor_id) for actor_id in result.get("removed", [])],
+                FrozenActors=[self._hydrate_frozen_actor(data) for data in result.get("frozenActors", [])],
+            )
+        except GameAPIError:
+            raise
+        except Exception as e:
+            raise GameAPIError("QUERY_ACTOR_ERROR", "增量查询Actor时发生错误: {0}".format(str(e)))
+
     def find_path(self, actors: List[Actor], destination: Location, method: str) -> List[Location]:
         '''为Actor找到到目标的路径
 
@@ -865,6 +1086,90 @@ class GameAPI:
         except Exception as e:
             raise GameAPIError("ATTACK_ERROR", "攻击命令执行时发生错误: {0}".format(str(e)))
 
+    def batch_orders(self, orders: List[Tuple[str, dict]]) -> List[bool]:
+        '''一次请求下发多条单位指令（move_actor / attack / stop 等），服务端在同一帧内依次执行
+
+        Args:
+            orders (List[Tuple[str, dict]]): (command, params) 列表，params 与对应单条命令相同
+
+        Returns:
+            List[bool]: 每条指令是否执行成功，顺序与 orders 一致
+
+        Raises:
+            GameAPIError: 当请求失败时；服务端不支持该命令时错误码为 INVALID_COMMAND
+        '''
+        if not orders:
+            return []
+        try:
+            response = self._send_request('batch_orders', {
+                "orders": [{"command": command, "params": params} for command, params in orders]
+            })
+            result = self._handle_response(response, "批量指令执行失败") or {}
+            results = result.get("results") or []
+            return [
+                isinstance(item, dict) and item.get("status", 0) > 0
+                for item in results
+            ] + [False] * (len(orders) - len(results))
+        except GameAPIError:
+            raise
+        except Exception as e:
+            raise GameAPIError("BATCH_ORDERS_ERROR", "批量下发指令时发生错误: {0}".format(str(e)))
+
+    def _submit_orders(self, orders: List[Tuple[str, dict]]) -> List[bool]:
+        '''优先通过 batch_orders 一次下发；旧版桥接返回 INVALID_COMMAND 后改为逐条下发'''
+        if len(orders) > 1 and self._batch_orders_supported is not False:
+            try:
+                results = self.batch_orders(orders)
+                self._batch_orders_supported = True
+                return results
+            except GameAPIError as e:
+                if e.code != "INVALID_COMMAND":
+                    raise
+                self._batch_orders_supported = False
+                logger.info("batch_orders unsupported by game bridge; falling back to per-group orders")
+        results = []
+        for command, params in orders:
+            try:
+                response = self._send_request(command, params)
+                self._handle_response(response, "指令执行失败")
+                results.append(response.get("status", 0) > 0)
+            except GameAPIError as e:
+                if e.code != "COMMAND_EXECUTION_ERROR":
+                    raise
+                logger.debug("%s command rejected: %s", command, e)
+                results.append(False)
+        return results
+
+    def attack_targets(self, pairs: List[Tuple[Actor, Actor]]) -> Dict[int, bool]:
+        '''批量攻击：按目标分组，每个目标一条 attack 指令（多个攻击者），整批一次请求下发
+
+        Args:
+            pairs (List[Tuple[Actor, Actor]]): (攻击者, 目标) 列表
+
+        Returns:
+            Dict[int, bool]: 目标ID -> 该组攻击是否成功发起
+
+        Raises:
+            GameAPIError: 当攻击命令执行失败时
+        '''
+        # 同一攻击者出现多次时以最后一次分配为准（与逐条下发的覆盖顺序一致）
+        latest: Dict[int, int] = {}
+        for attacker, target in pairs:
+            latest[attacker.actor_id] = target.actor_id
+        groups: Dict[int, List[int]] = {}
+        for attacker_id, target_id in latest.items():
+            groups.setdefault(target_id, []).append(attacker_id)
+        orders = [
+            ('attack', {"attackers": {"actorId": attackers}, "targets": {"actorId": [target_id]}})
+            for target_id, attackers in groups.items()
+        ]
+        try:
+            return dict(zip(groups, self._submit_orders(orders)))
+        except GameAPIError:
+            raise
+        except Exception as e:
+            raise GameAPIError("ATTACK_ERROR", "批量攻击命令执行时发生错误: {0}".format(str(e)))
+
     def can_attack_target(self, attacker: Actor, target: Actor) -> bool:
         '''检查是否可以攻击目标
 
@@ -1316,15 +1621,19 @@ class GameAPI:
             if is_visible is None and 'IsVisible_packed' in result:
                 is_visible = _unpack_bool_grid(result['IsVisible_packed'], w, h)
 
+            def numeric_grid(value: Any, dtype: Any) -> Any:
+                array = as_grid_array(value, dtype)
+                return array if array is not None else [[]]
+
             return MapQueryResult(
                 MapWidth=w,
                 MapHeight=h,
-                Height=result.get('Height', [[]]),
-                IsVisible=is_visible or [[]],
-                IsExplored=is_explored or [[]],
+                Height=numeric_grid(result.get('Height'), np.int32),
+                IsVisible=numeric_grid(is_visible, bool),
+                IsExplored=numeric_grid(is_explored, bool),
                 Terrain=result.get('Terrain', [[]]),
                 ResourcesType=result.get('ResourcesType', [[]]),
-                Resources=result.get('Resources', [[]]),
+                Resources=numeric_grid(result.get('Resources'), np.int32),
                 explored_pct=result.get('explored_pct'),
             )
         except GameAPIError:
@@ -1345,18 +1654,75 @@ class GameAPI:
             response = self._send_request('player_baseinfo_query', {})
             result = self._handle_response(response, "查询玩家基地信息失败")
 
-            return PlayerBaseInfo(
-                Cash=result.get('Cash', 0),
-                Resources=result.get('Resources', 0),
-                Power=result.get('Power', 0),
-                PowerDrained=result.get('PowerDrained', 0),
-                PowerProvided=result.get('PowerProvided', 0)
-            )
+            return self._parse_base_info(result)
         except GameAPIError:
             raise
         except Exception as e:
             raise GameAPIError("BASE_INFO_QUERY_ERROR", "查询玩家基地信息时发生错误: {0}".format(str(e)))
 
+    @staticmethod
+    def _parse_base_info(result: dict) -> PlayerBaseInfo:
+        return PlayerBaseInfo(
+            Cash=result.get('Cash', 0),
+            Resources=result.get('Resources', 0),
+            Power=result.get('Power', 0),
+            PowerDrained=result.get('PowerDrained', 0),
+            PowerProvided=result.get('PowerProvided', 0)
+        )
+
+    def world_snapshot(
+        self,
+        queue_types: Optional[List[str]] = None,
+        *,
+        include_actors: bool = True,
+        include_base_info: bool = True,
+    ) -> WorldSnapshotResult:
+        '''一次往返批量查询世界状态：己方/敌方单位、敌方残像、基地信息和生产队列。
+
+        等价于 query_actor(己方) + query_actor(敌人，含残像) + player_baseinfo_query
+        + 每个队列一次 query_production_queue，但只占用一次请求。
+
+        Args:
+            queue_types (List[str], optional): 需要带回的生产队列类型；为空则不查询队列。
+            include_actors (bool): 是否带回单位与残像。
+            include_base_info (bool): 是否带回基地信息。
+
+        Returns:
+            WorldSnapshotResult: 世界快照
+
+        Raises:
+            GameAPIError: 当查询失败时；服务端不支持该命令时错误码为 INVALID_COMMAND
+        '''
+        queue_types = list(queue_types or [])
+        params: dict = {
+            "includeActors": include_actors,
+            "includeBaseInfo": include_base_info,
+            "queueTypes": queue_types,
+        }
+        if include_actors:
+            params["selfTargets"] = TargetsQueryParam(faction="自己").to_dict()
+            params["enemyTargets"] = TargetsQueryParam(faction="敌人").to_dict()
+        try:
+            response = self._send_request('world_snapshot', params)
+            result = self._handle_response(response, "查询世界快照失败") or {}
+
+            base_info_data = result.get("baseInfo")
+            queues_data = result.get("productionQueues") or {}
+            return WorldSnapshotResult(
+                SelfActors=[self._hydrate_actor(data) for data in result.get("selfActors", [])],
+                EnemyActors=[self._hydrate_actor(data) for data in result.get("enemyActors", [])],
+                FrozenActors=[self._hydrate_frozen_actor(data) for data in result.get("frozenActors", [])],
+                BaseInfo=self._parse_base_info(base_info_data) if isinstance(base_info_data, dict) else None,
+                ProductionQueues={
+                    queue_type: queues_data.get(queue_type) or {"queue_type": queue_type, "queue_items": [], "has_ready_item": False}
+                    for queue_type in queue_types
+                },
+            )
+        except GameAPIError:
+            raise
+        except Exception as e:
+            raise GameAPIError("WORLD_SNAPSHOT_QUERY_ERROR", "查询世界快照时发生错误: {0}".format(str(e)))
+
     def screen_info_query(self) -> ScreenInfoResult:
         '''查询当前玩家看到的屏幕信息
 
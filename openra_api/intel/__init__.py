@@ -9,6 +9,7 @@ from .rules import (
     DEFAULT_UNIT_CATEGORY_RULES,
     DEFAULT_UNIT_VALUE_WEIGHTS,
 )
+from .sections import SectionGraph
 from .serializer import IntelSerializer
 from .service import IntelService
 
@@ -17,6 +18,7 @@ __all__ = [
     "IntelModel",
     "IntelSerializer",
     "IntelService",
+    "SectionGraph",
     "normalize_unit_name",
     "DEFAULT_NAME_ALIASES",
     "DEFAULT_UNIT_CATEGORY_RULES",
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+
+class SectionGraph:
+    """按输入版本增量重算的情报分段依赖图。
+
+    输入（单位、地图、队列等）每次采集后通过 ``set_input`` 登记，内容与上次相同则
+    版本不变；分段通过 ``compute`` 求值，只有其依赖（输入或其它分段）的版本变化时
+    才重新计算，否则直接复用上次结果。分段结果会在多次构建之间共享，调用方应视为只读。
+    """
+
+    def __init__(self, dependencies: Mapping[str, Tuple[str, ...]]) -> None:
+        self.dependencies = dict(dependencies)
+        self._inputs: Dict[str, Tuple[Any, Any]] = {}
+        self._versions: Dict[str, int] = {}
+        self._sections: Dict[str, Tuple[Tuple[int, ...], Any]] = {}
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+
+    def set_input(self, name: str, value: Any, key: Any = None) -> bool:
+        """登记一个输入；``key`` 默认为 ``value`` 本身，变化时递增版本。返回是否变化。"""
+        if name in self.dependencies:
+            raise ValueError(f"输入名与分段重名: {name}")
+        key = value if key is None else key
+        previous = self._inputs.get(name)
+        self._inputs[name] = (key, value)
+        if previous is not None and (previous[0] is key or previous[0] == key):
+            return False
+        self._versions[name] = self._versions.get(name, 0) + 1
+        return True
+
+    def value(self, name: str) -> Any:
+        return self._inputs[name][1]
+
+    def version(self, name: str) -> int:
+        return self._versions.get(name, 0)
+
+    def compute(self, name: str, build: Callable[[], Any]) -> Any:
+        deps = tuple(self.version(dep) for dep in self.dependencies[name])
+        cached = self._sections.get(name)
+        if cached is not None and cached[0] == deps:
+            self._hits[name] = self._hits.get(name, 0) + 1
+            return cached[1]
+        self._misses[name] = self._misses.get(name, 0) + 1
+        result = build()
+        self._sections[name] = (deps, result)
+        self._versions[name] = self._versions.get(name, 0) + 1
+        return result
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """丢弃某个（或全部）分段的缓存结果。"""
+        if name is None:
+            self._sections.clear()
+        else:
+            self._sections.pop(name, None)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """每个分段的命中/重算次数与命中率。"""
+        stats: Dict[str, Dict[str, Any]] = {}
+        for name in self.dependencies:
+            hits = self._hits.get(name, 0)
+            misses = self._misses.get(name, 0)
+            total = hits + misses
+            stats[name] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": (hits / total) if total else None,
+            }
+        return stats
@@ -4,12 +4,16 @@ import logging
 import time
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from ..actor_view import ActorView
 from ..game_api import GameAPI, GameAPIError
+from ..map_grid import as_grid_array, grid_to_lists
 from ..models import Actor, Location, MapQueryResult, TargetsQueryParam
 from .memory import IntelMemory
 from .model import IntelModel
 from .names import normalize_unit_name
+from .sections import SectionGraph
 from openra_api.production_names import production_name_entry
 from openra_state.data.dataset import (
     dataset_actor_category_for,
@@ -29,6 +33,22 @@ HIGH_VALUE_TARGETS = DEFAULT_HIGH_VALUE_TARGETS
 UNIT_CATEGORY_RULES = DEFAULT_UNIT_CATEGORY_RULES
 UNIT_VALUE_WEIGHTS = DEFAULT_UNIT_VALUE_WEIGHTS
 
+# 情报分段 -> 依赖（输入或其它分段）。经济、告警、元信息和敌军记忆带有时间差分/
+# 记忆副作用，每次构建都重算，不在图中。
+SECTION_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    "base_center": ("my_actors",),
+    "my_summary": ("my_actors",),
+    "enemy_summary": ("enemy_actors",),
+    "threats": ("enemy_actors", "base_center"),
+    "map_summary": ("map", "base_center"),
+    "tech": ("my_summary",),
+    "my_force": ("my_actors", "my_summary"),
+    "enemy_force": ("enemy_actors", "enemy_summary"),
+    "battle": ("threats", "enemy_actors", "attributes"),
+    "opportunities": ("enemy_actors", "base_center", "my_force"),
+    "actors_actions": ("my_actors", "enemy_actors"),
+}
+
 
 class IntelService:
     """负责状态采集、摘要与缓存"""
@@ -50,6 +70,7 @@ class IntelService:
         self._snapshot_cache: Optional[Tuple[float, Dict[str, Any]]] = None
         self._intel_cache: Optional[Tuple[float, IntelModel]] = None
         self.memory = IntelMemory()
+        self.sections = SectionGraph(SECTION_DEPENDENCIES)
 
     def get_snapshot(self, force: bool = False) -> Dict[str, Any]:
         cached = self._get_cached(self._snapshot_cache, self.cache_ttl, force)
@@ -87,6 +108,10 @@ class IntelService:
         self._intel_cache = (time.time(), intel)
         return intel
 
+    def section_stats(self) -> Dict[str, Dict[str, Any]]:
+        """各情报分段的缓存命中统计"""
+        return self.sections.stats()
+
     def get_base_center(self, snapshot: Dict[str, Any]) -> Location:
         buildings = []
         for actor in snapshot.get("my_actors", []):
@@ -224,27 +249,38 @@ class IntelService:
         queues: Dict[str, Any],
         unit_attrs: Dict[str, Any],
     ) -> IntelModel:
-        my_views = [ActorView.from_actor(actor) for actor in snapshot.get("my_actors", [])]
-        enemy_views = [ActorView.from_actor(actor) for actor in snapshot.get("enemy_actors", [])]
-        base_center = self.get_base_center(snapshot)
-
-        my_summary = self._summarize_actors(my_views)
-        enemy_summary = self._summarize_actors(enemy_views)
-
-        enemy_summary["threats"] = self._compute_threats(enemy_views, base_center)
-
-        map_summary, explored_ratio = self._summarize_map(map_info, base_center)
-        economy_summary = self._summarize_economy(snapshot.get("base_info"), my_summary, map_info, base_center, queues)
-        tech_summary = self._summarize_tech(my_summary)
+        graph = self.sections
+        # 输入按内容登记：单位视图、基地信息、队列、单位属性按值比较；地图按对象比较
+        #（只有重新拉取地图才会换对象）
+        graph.set_input("my_actors", tuple(ActorView.from_actor(actor) for actor in snapshot.get("my_actors", [])))
+        graph.set_input("enemy_actors", tuple(ActorView.from_actor(actor) for actor in snapshot.get("enemy_actors", [])))
+        graph.set_input("map", map_info, key=id(map_info))
+        graph.set_input("attributes", unit_attrs)
+        my_views = list(graph.value("my_actors"))
+        enemy_views = list(graph.value("enemy_actors"))
+
+        base_center = graph.compute("base_center", lambda: self.get_base_center(snapshot))
+        my_summary = graph.compute("my_summary", lambda: self._summarize_actors(my_views))
+        enemy_summary = graph.compute("enemy_summary", lambda: self._summarize_actors(enemy_views))
+        threats = graph.compute("threats", lambda: self._compute_threats(enemy_views, base_center))
+
+        map_summary, explored_ratio = graph.compute("map_summary", lambda: self._summarize_map(map_info, base_center))
+        economy_summary = self._summarize_economy(
+            snapshot.get("base_info"), my_summary, map_summary.get("resource_summary"), queues
+        )
+        tech_summary = graph.compute("tech", lambda: self._summarize_tech(my_summary))
+        my_force = graph.compute("my_force", lambda: self._build_force_summary(my_views, my_summary))
+        enemy_force = graph.compute("enemy_force", lambda: self._build_force_summary(enemy_views, enemy_summary))
+        enemy_last_seen = self._update_enemy_memory(enemy_views)
         forces = {
-            "my": self._build_force_summary(my_views, my_summary),
-            "enemy": self._build_force_summary(enemy_views, enemy_summary),
+            "my": my_force,
+            "enemy": {**enemy_force, "threats": threats, "last_seen": enemy_last_seen},
         }
-        forces["enemy"]["threats"] = enemy_summary.get("threats", [])
-        enemy_last_seen = self._update_enemy_memory(enemy_views)
-        forces["enemy"]["last_seen"] = enemy_last_seen
-        battle = self._build_battle_section(enemy_views, base_center, unit_attrs)
-        opportunities = self._build_opportunities(enemy_views, base_center, forces["my"].get("centroid"))
+        battle = graph.compute("battle", lambda: self._build_battle_section(enemy_views, threats, unit_attrs))
+        opportunities = graph.compute(
+            "opportunities",
+            lambda: self._build_opportunities(enemy_views, base_center, my_force.get("centroid")),
+        )
         map_control = self._build_map_control(map_summary, map_info, base_center)
         alerts, scout_stalled = self._build_alerts(
             economy_summary,
@@ -256,7 +292,7 @@ class IntelService:
 
         meta = self._build_meta(snapshot, explored_ratio, scout_stalled)
         legacy = {"match": {}}
-        actors_actions = self._build_actors_actions_intel(my_views, enemy_views)
+        actors_actions = graph.compute("actors_actions", lambda: self._build_actors_actions_intel(my_views, enemy_views))
 
         return IntelModel(
             meta=meta,
@@ -370,8 +406,9 @@ class IntelService:
         width = map_info.MapWidth
         height = map_info.MapHeight
         explored_ratio = None
-        if map_info.IsExplored and width and height:
-            explored_cells = sum(1 for column in map_info.IsExplored for explored in column if explored)
+        explored_grid = as_grid_array(map_info.IsExplored, bool)
+        if explored_grid is not None and width and height:
+            explored_cells = int(np.count_nonzero(explored_grid))
             total_cells = width * height
             explored_ratio = explored_cells / total_cells if total_cells else None
 
@@ -399,20 +436,18 @@ class IntelService:
         )
 
     def _summarize_resources(self, map_info: MapQueryResult, base_center: Location) -> Optional[Dict[str, Any]]:
-        resources_grid = map_info.Resources or [[]]
-        positions: List[Location] = []
-        for y, row in enumerate(resources_grid):
-            for x, val in enumerate(row):
-                if val and isinstance(val, (int, float)) and val > 0:
-                    positions.append(Location(x, y))
-        if not positions:
+        resources_grid = as_grid_array(map_info.Resources, np.int64)
+        if resources_grid is None:
+            return None
+        # Outer index is treated as y, inner as x (matches the original row scan).
+        ys, xs = np.nonzero(resources_grid > 0)
+        total = int(xs.size)
+        if not total:
             return None
 
-        total = len(positions)
-        avg_x = sum(p.x for p in positions) / total
-        avg_y = sum(p.y for p in positions) / total
-        centroid = Location(int(avg_x), int(avg_y))
-        nearest = min(positions, key=lambda p: p.manhattan_distance(base_center))
+        centroid = Location(int(xs.mean()), int(ys.mean()))
+        nearest_index = int(np.argmin(np.abs(xs - base_center.x) + np.abs(ys - base_center.y)))
+        nearest = Location(int(xs[nearest_index]), int(ys[nearest_index]))
         return {
             "tiles": total,
             "centroid": {"x": centroid.x, "y": centroid.y},
@@ -421,7 +456,7 @@ class IntelService:
 
     def _compute_frontier(self, map_info: MapQueryResult, limit: int = 12) -> List[Dict[str, int]]:
         frontier: List[Location] = []
-        explored = map_info.IsExplored or []
+        explored = grid_to_lists(map_info.IsExplored)
         width = map_info.MapWidth or 0
         height = map_info.MapHeight or 0
         for y in range(min(height, len(explored))):
@@ -442,8 +477,7 @@ class IntelService:
         self,
         base_info: Any,
         my_summary: Dict[str, Any],
-        map_info: Optional[MapQueryResult],
-        base_center: Location,
+        resource_summary: Optional[Dict[str, Any]],
         queues: Dict[str, Any],
     ) -> Dict[str, Any]:
         buildings = my_summary.get("buildings", {})
@@ -471,10 +505,8 @@ class IntelService:
             "idle_miners": None,
             "nearby_resource": None,
         }
-        if map_info:
-            resource_summary = self._summarize_resources(map_info, base_center)
-            if resource_summary:
-                harvest["nearby_resource"] = resource_summary.get("nearest_to_base")
+        if resource_summary:
+            harvest["nearby_resource"] = resource_summary.get("nearest_to_base")
 
         return {
             "cash": getattr(base_info, "Cash", None) if base_info else None,
@@ -718,10 +750,9 @@ class IntelService:
     def _build_battle_section(
         self,
         enemy_views: List[ActorView],
-        base_center: Location,
+        threats: List[Dict[str, Any]],
         unit_attrs: Dict[str, Any],
     ) -> Dict[str, Any]:
-        threats = self._compute_threats(enemy_views, base_center)
         engagements = {"engaged_units": 0, "target_types": {}, "reachable_enemies": []}
 
         attrs = unit_attrs.get("attributes") or []
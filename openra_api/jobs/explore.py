@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Set, Tuple
 
 from ..action.move import MoveAction
+from ..frontier import FrontierGrid, frontier_grid
 from ..models import Actor, Location, MapQueryResult
 from .base import ActorAssignment, Job, TickContext
 from .utils import actor_pos, clamp_location
@@ -14,117 +15,10 @@ from .utils import actor_pos, clamp_location
 # Grid helpers
 # ----------------------------
 
-def _is_explored(exp: List[List[bool]], x: int, y: int, w: int, h: int, layout: str) -> bool:
-    if x < 0 or y < 0 or x >= w or y >= h:
-        return False
-    try:
-        if layout == "col_major":
-            if x >= len(exp):
-                return False
-            col = exp[x] or []
-            if y >= len(col):
-                return False
-            return bool(col[y])
-        if y >= len(exp):
-            return False
-        row = exp[y] or []
-        if x >= len(row):
-            return False
-        return bool(row[x])
-    except Exception:
-        return False
-
-
-def _detect_origin(scout_positions: List[Location], w: int, h: int) -> int:
-    if not scout_positions or not w or not h:
-        return 1
-    xs = [p.x for p in scout_positions]
-    ys = [p.y for p in scout_positions]
-    if any(v == 0 for v in xs + ys):
-        return 0
-    if any(v == w or v == h for v in xs + ys):
-        return 1
-    if max(xs) <= w - 1 and max(ys) <= h - 1:
-        return 0
-    return 1
-
-
-def _choose_layout(exp: List[List[bool]], w: int, h: int, origin: int, scouts: List[Location]) -> str:
-    # 用“侦察兵脚下通常应当是 explored”来判 row/col（方形图避免你之前的斜角坑）
-    def score(layout: str) -> int:
-        s = 0
-        for p in scouts:
-            gx = max(0, min(w - 1, p.x - origin))
-            gy = max(0, min(h - 1, p.y - origin))
-            s += 1000 if _is_explored(exp, gx, gy, w, h, layout) else -1000
-            # 再加一点局部密度
-            cnt = 0
-            for dy in (-1, 0, 1):
-                for dx in (-1, 0, 1):
-                    x, y = gx + dx, gy + dy
-                    if 0 <= x < w and 0 <= y < h and _is_explored(exp, x, y, w, h, layout):
-                        cnt += 1
-            s += cnt
-        return s
-
-    return "row_major" if score("row_major") >= score("col_major") else "col_major"
-
-
 def _manhattan(a: Location, b: Location) -> int:
     return abs(a.x - b.x) + abs(a.y - b.y)
 
 
-def _bresenham(x0: int, y0: int, x1: int, y1: int) -> List[Tuple[int, int]]:
-    # 4-connected 采样用直线格子序列
-    pts: List[Tuple[int, int]] = []
-    dx = abs(x1 - x0)
-    dy = abs(y1 - y0)
-    sx = 1 if x0 < x1 else -1
-    sy = 1 if y0 < y1 else -1
-    err = dx - dy
-    x, y = x0, y0
-    while True:
-        pts.append((x, y))
-        if x == x1 and y == y1:
-            break
-        e2 = err * 2
-        if e2 > -dy:
-            err -= dy
-            x += sx
-        if e2 < dx:
-            err += dx
-            y += sy
-    return pts
-
-
-def _unexplored_ratio_on_line(
-    exp: List[List[bool]],
-    w: int,
-    h: int,
-    layout: str,
-    origin: int,
-    cur: Location,
-    tgt: Location,
-) -> float:
-    x0 = max(0, min(w - 1, cur.x - origin))
-    y0 = max(0, min(h - 1, cur.y - origin))
-    x1 = max(0, min(w - 1, tgt.x - origin))
-    y1 = max(0, min(h - 1, tgt.y - origin))
-
-    pts = _bresenham(x0, y0, x1, y1)
-    if len(pts) <= 1:
-        return 0.0
-
-    # 跳过起点（起点大概率已探索，不然阈值会很难达成）
-    total = 0
-    unexp = 0
-    for x, y in pts[1:]:
-        total += 1
-        if not _is_explored(exp, x, y, w, h, layout):
-            unexp += 1
-    return float(unexp) / float(total) if total > 0 else 0.0
-
-
 def _xorshift32(v: int) -> int:
     v &= 0xFFFFFFFF
     v ^= (v << 13) & 0xFFFFFFFF
@@ -208,6 +102,7 @@ class ExploreJob(Job):
         self.repulsion_radius = int(repulsion_radius)
 
         self._scout_state: Dict[int, _ScoutState] = {}
+        self._grid_geometry: Optional[Tuple[Tuple[int, int], int, str]] = None
 
     def on_unassigned(self, actor_id: int) -> None:
         super().on_unassigned(actor_id)
@@ -226,8 +121,8 @@ class ExploreJob(Job):
 
         w = int(getattr(map_info, "MapWidth", 0) or 0)
         h = int(getattr(map_info, "MapHeight", 0) or 0)
-        exp = getattr(map_info, "IsExplored", None) or []
-        if not w or not h or not exp:
+        grid = frontier_grid(getattr(map_info, "IsExplored", None), w, h)
+        if not w or not h or grid.is_empty:
             self.last_summary = "地图维度/IsExplored 异常"
             return
 
@@ -247,8 +142,11 @@ class ExploreJob(Job):
             self.last_summary = "侦察兵位置不可用"
             return
 
-        origin = _detect_origin([p for _, _, p in scout_info], w, h)
-        layout = _choose_layout(exp, w, h, origin, [p for _, _, p in scout_info])
+        # origin/layout 是地图属性：每张地图只判定一次（job 随对局重建）
+        if self._grid_geometry is None or self._grid_geometry[0] != (w, h):
+            origin, layout = grid.detect_geometry([(p.x, p.y) for _, _, p in scout_info], prefer="row_major")
+            self._grid_geometry = ((w, h), origin, layout)
+        _, origin, layout = self._grid_geometry
 
         # 本 tick 已选目标（用于 repulsion）
         chosen_targets: List[Location] = []
@@ -279,7 +177,7 @@ class ExploreJob(Job):
                 gy = loc.y - origin
                 if gx < 0 or gy < 0 or gx >= w or gy >= h:
                     return False
-                return not _is_explored(exp, gx, gy, w, h, layout)
+                return not grid.is_explored(gx, gy, layout)
 
             def too_close_to_others(loc: Location) -> bool:
                 for ot in chosen_targets:
@@ -304,7 +202,7 @@ class ExploreJob(Job):
                     ctx=ctx,
                     sid=sid,
                     cur=cur,
-                    exp=exp,
+                    grid=grid,
                     w=w,
                     h=h,
                     layout=layout,
@@ -342,7 +240,7 @@ class ExploreJob(Job):
         ctx: TickContext,
         sid: int,
         cur: Location,
-        exp: List[List[bool]],
+        grid: FrontierGrid,
         w: int,
         h: int,
         layout: str,
@@ -389,7 +287,7 @@ class ExploreJob(Job):
                 if too_close_to_others(tgt):
                     continue
 
-                ratio = _unexplored_ratio_on_line(exp, w, h, layout, origin, cur, tgt)
+                ratio = grid.unexplored_ratio(layout, origin, (cur.x, cur.y), (tgt.x, tgt.y))
                 if ratio >= thr:
                     return tgt
 
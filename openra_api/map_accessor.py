@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, List
+from typing import Any
 
+from .map_grid import grid_is_empty
 from .models import MapQueryResult
 
 
@@ -13,14 +14,14 @@ class MapAccessor:
         self.width = map_info.MapWidth or 0
         self.height = map_info.MapHeight or 0
 
-        explored = map_info.IsExplored or []
+        explored = map_info.IsExplored
         # len == width → [x][y] 列主；否则默认 [y][x] 行主
-        self.col_major = bool(explored and self.width > 0 and len(explored) == self.width)
+        self.col_major = bool(not grid_is_empty(explored) and self.width > 0 and len(explored) == self.width)
 
-    def _get_cell(self, grid: List[List[Any]], x: int, y: int) -> Any:
+    def _get_cell(self, grid: Any, x: int, y: int) -> Any:
         if x < 0 or y < 0 or x >= self.width or y >= self.height:
             return None
-        if not grid:
+        if grid_is_empty(grid):
             return None
         try:
             return grid[x][y] if self.col_major else grid[y][x]
@@ -28,11 +29,10 @@ class MapAccessor:
             return None
 
     def is_explored(self, x: int, y: int) -> bool:
-        return bool(self._get_cell(self.map_info.IsExplored or [], x, y))
+        return bool(self._get_cell(self.map_info.IsExplored, x, y))
 
     def is_visible(self, x: int, y: int) -> bool:
-        return bool(self._get_cell(self.map_info.IsVisible or [], x, y))
+        return bool(self._get_cell(self.map_info.IsVisible, x, y))
 
     def resource(self, x: int, y: int) -> Any:
-        return self._get_cell(self.map_info.Resources or [], x, y)
-
+        return self._get_cell(self.map_info.Resources, x, y)
@@ -0,0 +1,84 @@
+"""Array-backed map grids for ``map_query`` results.
+
+Grids are NumPy arrays indexed the same way as the nested lists the bridge
+returns (``grid[x][y]`` for OpenRA's native col-major layout), so existing
+cell-by-cell code keeps working while whole-map passes can use vectorized
+operations.  ``grid_to_lists`` is the compatibility accessor for code that
+still wants plain Python lists.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+
+
+def unpack_bool_grid(packed: Any, w: int, h: int) -> np.ndarray:
+    """Unpack bitpacked 32-bit words (LSB first) into a ``(w, h)`` col-major bool array.
+
+    Missing trailing words are treated as unexplored, matching the bridge's
+    behaviour of truncating the packed array.
+    """
+    w = max(int(w or 0), 0)
+    h = max(int(h or 0), 0)
+    total = w * h
+    if total == 0:
+        return np.zeros((w, h), dtype=bool)
+    # C# serialises the words as signed int32; mask back to the unsigned bit pattern.
+    words = (np.asarray(packed, dtype=np.int64) & 0xFFFFFFFF).astype("<u4")
+    bits = np.unpackbits(words.view(np.uint8), bitorder="little")
+    if bits.size < total:
+        bits = np.concatenate([bits, np.zeros(total - bits.size, dtype=np.uint8)])
+    return bits[:total].astype(bool).reshape(w, h)
+
+
+def as_grid_array(grid: Any, dtype: Any = None) -> Optional[np.ndarray]:
+    """Return ``grid`` as a 2-D array, or ``None`` when it is missing or empty (``[]`` / ``[[]]``).
+
+    Ragged nested lists are right-padded with zeros so indexing stays aligned
+    with the original rows.
+    """
+    if grid is None:
+        return None
+    if isinstance(grid, np.ndarray):
+        array = grid if dtype is None or grid.dtype == dtype else grid.astype(dtype)
+    else:
+        if len(grid) == 0:
+            return None
+        try:
+            array = np.asarray(grid, dtype=dtype)
+        except ValueError:
+            width = max((len(row) for row in grid), default=0)
+            array = np.zeros((len(grid), width), dtype=dtype or np.int64)
+            for index, row in enumerate(grid):
+                array[index, : len(row)] = row
+    if array.ndim != 2 or array.size == 0:
+        return None
+    return array
+
+
+def grid_is_empty(grid: Any) -> bool:
+    """True for ``None``, ``[]``, ``[[]]`` and zero-sized arrays."""
+    if grid is None:
+        return True
+    if isinstance(grid, np.ndarray):
+        return grid.size == 0
+    return len(grid) == 0 or all(len(row) == 0 for row in grid)
+
+
+def grid_to_lists(grid: Any) -> list:
+    """Compatibility accessor: the grid as nested Python lists (``[]`` when missing)."""
+    if grid is None:
+        return []
+    if isinstance(grid, np.ndarray):
+        return grid.tolist()
+    return list(grid)
+
+
+def grid_ratio(grid: Any) -> float:
+    """Fraction of truthy cells in a boolean grid (0.0 when empty)."""
+    array = as_grid_array(grid, bool)
+    if array is None:
+        return 0.0
+    return float(np.count_nonzero(array)) / array.size
@@ -1,6 +1,10 @@
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 from dataclasses import dataclass
 
+import numpy as np
+
+from .map_grid import as_grid_array, grid_to_lists
+
 @dataclass
 class Location:
     # 表示游戏中的二维位置坐标，左上角是原点，x 轴向右，y 轴向下
@@ -120,18 +124,28 @@ class FrozenActor:
     position: Optional[Location] = None  # 单位的位置。
 
 # 地图信息查询返回结构体，IsVisible 是当前视野可见的部分为 True，IsExplored 是探索过的格子为 True。
+# GameAPI.map_query 返回的数值网格（Height/IsVisible/IsExplored/Resources）是 NumPy 数组，
+# 索引方式与嵌套列表相同（grid[x][y]）；需要纯列表时用 grid_lists()。
 @dataclass
 class MapQueryResult:
     MapWidth: int  # 地图宽度。
     MapHeight: int  # 地图高度。
-    Height: List[List[int]]  # 每个格子的高度。
-    IsVisible: List[List[bool]]  # 每个格子是否可见。
-    IsExplored: List[List[bool]]  # 每个格子是否已探索。
+    Height: Any  # 每个格子的高度（int 数组或嵌套列表）。
+    IsVisible: Any  # 每个格子是否可见（bool 数组或嵌套列表）。
+    IsExplored: Any  # 每个格子是否已探索（bool 数组或嵌套列表）。
     Terrain: List[List[str]]  # 每个格子的地形类型。
     ResourcesType: List[List[str]]  # 每个格子的资源类型。
-    Resources: List[List[int]]  # 每个格子的资源数量。
+    Resources: Any  # 每个格子的资源数量（int 数组或嵌套列表）。
     explored_pct: Optional[float] = None  # 已探索百分比（C#端计算）。
 
+    def array(self, grid_name: str, dtype: Any = None) -> Optional["np.ndarray"]:
+        # 以二维 NumPy 数组形式返回指定网格；网格缺失或为空时返回 None。
+        return as_grid_array(getattr(self, grid_name), dtype)
+
+    def grid_lists(self, grid_name: str) -> list:
+        # 兼容访问：以嵌套列表形式返回指定网格。
+        return grid_to_lists(getattr(self, grid_name))
+
     def get_value_at_location(self, grid_name: str, location: 'Location'):
         # 根据位置获取指定网格中的值。
         grid = getattr(self, grid_name, None)
@@ -151,6 +165,25 @@ class PlayerBaseInfo:
     PowerDrained: int  # 玩家消耗的电力。
     PowerProvided: int  # 玩家提供的电力。
 
+# 世界快照批量查询返回结构体，一次请求同时带回己方/敌方单位、残像、基地信息与各生产队列。
+@dataclass
+class WorldSnapshotResult:
+    SelfActors: List[Actor]  # 己方单位列表。
+    EnemyActors: List[Actor]  # 敌方可见单位列表。
+    FrozenActors: List[FrozenActor]  # 敌方残像（战争迷雾中最后看到的位置）。
+    BaseInfo: Optional[PlayerBaseInfo]  # 玩家基地信息。
+    ProductionQueues: Dict[str, Dict]  # 队列类型 -> query_production_queue 同结构的队列信息。
+
+# 增量单位查询返回结构体。Full 为 True 时 Added 即为完整单位列表（服务端无法从 since 版本增量时会退回全量）。
+@dataclass
+class ActorDeltaResult:
+    Version: int  # 服务端当前单位快照版本号，下次请求作为 sinceVersion 传回。
+    Full: bool  # 是否为全量结果。
+    Added: List[Actor]  # 新出现的单位（全量时为全部单位）。
+    Changed: List[Actor]  # 属性发生变化的单位。
+    Removed: List[int]  # 已消失的单位 ID。
+    FrozenActors: List[FrozenActor]  # 敌方残像（每次全量返回）。
+
 # 屏幕信息查询返回结果，Min 是屏幕左上角，Max 是右下角，MousePosition 是当前鼠标所在位置，Location 都是整数坐标。
 @dataclass
 class ScreenInfoResult:
@@ -4,6 +4,9 @@ from dataclasses import dataclass, field
 import logging
 import math
 
+import numpy as np
+
+from openra_api.map_grid import as_grid_array
 from openra_api.models import Location, MapQueryResult, Actor
 from ..data.structure_data import StructureData
 from ..data.combat_data import CombatData
@@ -105,7 +108,7 @@ class ZoneManager:
     def update_resource_values(self, map_data: MapQueryResult, mine_actors: List[Actor] = None) -> None:
         width = map_data.MapWidth
         height = map_data.MapHeight
-        resources = map_data.Resources
+        resources = as_grid_array(map_data.Resources, np.int64)
         resource_types = map_data.ResourcesType
         zone_mines: Dict[int, List[Actor]] = {}
         if mine_actors:
@@ -125,19 +128,18 @@ class ZoneManager:
             min_y = max(0, bbox[1])
             max_x = min(width - 1, bbox[2])
             max_y = min(height - 1, bbox[3])
-            for y in range(min_y, max_y + 1):
-                for x in range(min_x, max_x + 1):
-                    if x >= len(resources) or y >= len(resources[0]):
-                        continue
-                    val = resources[x][y]
-                    if val > 0:
-                        if self.get_zone_id(Location(x, y)) == zone.id:
-                            r_type = resource_types[x][y]
-                            r_type_str = str(r_type).lower()
-                            if r_type_str == "2" or "gem" in r_type_str:
-                                gem_count += 1
-                            else:
-                                ore_count += 1
+            if resources is not None and max_x >= min_x and max_y >= min_y:
+                # Only cells that actually hold resources need the per-cell zone lookup.
+                window = resources[min_x : max_x + 1, min_y : max_y + 1]
+                for dx, dy in zip(*(axis.tolist() for axis in np.nonzero(window > 0))):
+                    x, y = min_x + dx, min_y + dy
+                    if self.get_zone_id(Location(x, y)) == zone.id:
+                        r_type = resource_types[x][y]
+                        r_type_str = str(r_type).lower()
+                        if r_type_str == "2" or "gem" in r_type_str:
+                            gem_count += 1
+                        else:
+                            ore_count += 1
             ore_mines = 0
             gem_mines = 0
             if zone.id in zone_mines:
@@ -350,20 +352,15 @@ class ZoneManager:
     def _find_resource_clusters(self, map_data: MapQueryResult) -> List[Tuple[Location, int, Tuple[int, int, int, int]]]:
         width = map_data.MapWidth
         height = map_data.MapHeight
-        resources = map_data.Resources
+        resources = as_grid_array(map_data.Resources, np.int64)
         points = []
         point_values = {}
-        array_width = len(resources)
-        array_height = len(resources[0]) if array_width > 0 else 0
-        scan_width = min(width, array_width)
-        scan_height = min(height, array_height)
-        for x in range(scan_width):
-            for y in range(scan_height):
-                val = resources[x][y]
-                if val > 0:
-                    loc = Location(x, y)
-                    points.append(loc)
-                    point_values[(x, y)] = val
+        if resources is not None:
+            scanned = resources[: max(width, 0), : max(height, 0)]
+            xs, ys = np.nonzero(scanned > 0)
+            for x, y, val in zip(xs.tolist(), ys.tolist(), scanned[xs, ys].tolist()):
+                points.append(Location(x, y))
+                point_values[(x, y)] = val
         if not points:
             return []
         initial_clusters = SpatialClustering.dbscan_grid(points, eps=4.0, min_samples=5)
@@ -208,6 +208,7 @@ def build_session_catalog_payload(
     current_world_health: Optional[dict[str, Any]] = None,
     current_runtime_fault_state: Optional[dict[str, Any]] = None,
     current_tasks: Optional[list[dict[str, Any]]] = None,
+    current_loop_stats: Optional[dict[str, Any]] = None,
 ) -> dict[str, Any]:
     """Assemble the session catalog payload for the diagnostics UI."""
     sessions = list_persistence_sessions(log_session_root, limit=30)
@@ -241,10 +242,14 @@ def build_session_catalog_payload(
             if item.get("is_current"):
                 item["task_rollup"] = live_task_rollup
                 break
-    return {
+    payload: dict[str, Any] = {
         "sessions": sessions,
         "selected_session_dir": str(selected_session_dir) if selected_session_dir is not None else None,
     }
+    if current_loop_stats:
+        # Live GameLoop tick budget telemetry (phase histograms, overruns, shed work).
+        payload["loop_stats"] = current_loop_stats
+    return payload
 
 
 def build_session_task_catalog_payload(
@@ -6,46 +6,158 @@ Tactical Core 独立 API 客户端
 
 import socket
 import json
+import threading
 import uuid
 import time
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 class TacticalClient:
+    """
+    持久连接客户端：复用同一条 TCP 连接，按换行符分帧读取响应，
+    不再为每个请求新建连接、也不再依赖读超时判断响应结束。
+    """
+
+    SOCKET_TIMEOUT = 2.0
+
     def __init__(self, host="localhost", port=7445):
         self.server_address = (host, port)
         self.api_version = "1.0"
+        self._sock: Optional[socket.socket] = None
+        self._buf = bytearray()
+        self._decoder = json.JSONDecoder()
+        self._lock = threading.Lock()
+        # None: 尚未探测；False: 桥接不认识 batch_orders
+        self._batch_orders_supported: Optional[bool] = None
 
-    def _send_request(self, command: str, params: dict) -> dict:
-        request_id = str(uuid.uuid4())
-        request_data = {
-            "apiVersion": self.api_version,
-            "requestId": request_id,
-            "command": command,
-            "params": params,
-            "language": "zh"
-        }
-        
+    def close(self) -> None:
+        with self._lock:
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._buf.clear()
+
+    def _ensure_connection_locked(self) -> socket.socket:
+        if self._sock is None:
+            sock = socket.create_connection(self.server_address, timeout=self.SOCKET_TIMEOUT)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._sock = sock
+        return self._sock
+
+    def _read_frame_locked(self, sock: socket.socket) -> bytes:
+        """读取一帧响应：换行分隔；兼容对端不带换行的 JSON 包（已完整即返回，或直接关闭连接）"""
+        while True:
+            newline = self._buf.find(b"\n")
+            if newline >= 0:
+                line = bytes(self._buf[:newline]).rstrip(b"\r")
+                del self._buf[:newline + 1]
+                if line:
+                    return line
+                continue
+            frame = self._take_complete_json_locked()
+            if frame is not None:
+                return frame
+            chunk = sock.recv(65536)
+            if not chunk:
+                line = bytes(self._buf).strip()
+                self._close_locked()
+                if not line:
+                    raise ConnectionError("连接在收到完整响应前关闭")
+                return line
+            self._buf.extend(chunk)
+
+    def _take_complete_json_locked(self) -> Optional[bytes]:
+        """缓冲区开头已是一个完整 JSON 对象（对端未发换行）时取出它，否则返回 None"""
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.settimeout(2.0)
-                sock.connect(self.server_address)
-                sock.sendall(json.dumps(request_data).encode('utf-8'))
-                
-                chunks = []
-                while True:
-                    try:
-                        chunk = sock.recv(4096)
-                        if not chunk: break
-                        chunks.append(chunk)
-                    except socket.timeout:
-                        break
-                        
-                response_str = b''.join(chunks).decode('utf-8')
-                return json.loads(response_str)
-        except Exception as e:
-            # 战术模块允许偶尔通信失败，不抛出致命异常，仅返回空
-            print(f"[TacticalClient] Error: {e}")
+            text = self._buf.decode("utf-8")
+        except UnicodeDecodeError:
+            return None  # 多字节字符尚未收全
+        start = len(text) - len(text.lstrip())
+        if start == len(text):
             return None
+        try:
+            _, end = self._decoder.raw_decode(text, start)
+        except ValueError:
+            return None
+        consumed = len(text[:end].encode("utf-8"))
+        frame = bytes(self._buf[:consumed]).strip()
+        del self._buf[:consumed]
+        return frame
+
+    def _send_requests(self, requests: List[Tuple[str, dict]]) -> List[Optional[dict]]:
+        """流水线发送：多条请求一次写出，再按 requestId 收齐响应；失败的请求对应位置为 None"""
+        request_ids = []
+        frames = []
+        for command, params in requests:
+            request_id = str(uuid.uuid4())
+            request_ids.append(request_id)
+            frames.append(json.dumps({
+                "apiVersion": self.api_version,
+                "requestId": request_id,
+                "command": command,
+                "params": params,
+                "language": "zh"
+            }) + "\n")
+        payload = "".join(frames).encode('utf-8')
+
+        with self._lock:
+            # 复用的连接可能已被对端关闭：尚未收到任何响应时重连重试一次
+            for attempt in range(2):
+                responses: Dict[str, dict] = {}
+                try:
+                    sock = self._ensure_connection_locked()
+                    sock.sendall(payload)
+                    while len(responses) < len(request_ids):
+                        response = json.loads(self._read_frame_locked(sock).decode('utf-8'))
+                        request_id = response.get("requestId") if isinstance(response, dict) else None
+                        if request_id is None:
+                            # 对端未回传 requestId 时按发送顺序对应
+                            request_id = next(rid for rid in request_ids if rid not in responses)
+                        if request_id in request_ids:
+                            responses[request_id] = response
+                        # 其余为上一次超时请求遗留的过期响应，丢弃
+                    return [responses[rid] for rid in request_ids]
+                except Exception as e:
+                    self._close_locked()
+                    if attempt == 0 and not responses and not isinstance(e, (socket.timeout, ValueError)):
+                        continue
+                    # 战术模块允许偶尔通信失败，不抛出致命异常，仅返回空
+                    print(f"[TacticalClient] Error: {e}")
+                    return [responses.get(rid) for rid in request_ids]
+        return [None] * len(request_ids)
+
+    def _send_request(self, command: str, params: dict) -> Optional[dict]:
+        return self._send_requests([(command, params)])[0]
+
+    def submit_orders(self, orders: List[Tuple[str, dict]]) -> List[bool]:
+        """
+        批量下发单位指令：优先一条 batch_orders 请求；
+        旧版桥接返回 INVALID_COMMAND 后改为在同一连接上流水线逐条下发
+        """
+        if not orders:
+            return []
+        if len(orders) > 1 and self._batch_orders_supported is not False:
+            resp = self._send_request("batch_orders", {
+                "orders": [{"command": command, "params": params} for command, params in orders]
+            })
+            if resp is None:
+                return [False] * len(orders)
+            if resp.get("status", 0) > 0:
+                self._batch_orders_supported = True
+                results = (resp.get("data") or {}).get("results") or []
+                return [
+                    isinstance(item, dict) and item.get("status", 0) > 0
+                    for item in results
+                ] + [False] * (len(orders) - len(results))
+            if (resp.get("error") or {}).get("code") != "INVALID_COMMAND":
+                return [False] * len(orders)
+            self._batch_orders_supported = False
+        return [resp is not None and resp.get("status", 0) > 0 for resp in self._send_requests(orders)]
 
     def query_all_units(self, faction: str) -> Optional[List[dict]]:
         """查询指定阵营的所有单位（包含建筑等所有实体）"""
@@ -79,3 +191,36 @@ class TacticalClient:
             "isAssaultMove": 1 if assault else 0
         }
         self._send_request("move_actor", params)
+
+    def attack_targets(self, pairs: List[Tuple[int, int]]) -> None:
+        """批量攻击：按目标分组，每个目标一条 attack 指令（多个攻击者）"""
+        # 同一攻击者出现多次时以最后一次分配为准（与逐条下发的覆盖顺序一致）
+        latest: Dict[int, int] = {}
+        for attacker_id, target_id in pairs:
+            latest[attacker_id] = target_id
+        groups: Dict[int, List[int]] = {}
+        for attacker_id, target_id in latest.items():
+            groups.setdefault(target_id, []).append(attacker_id)
+        self.submit_orders([
+            ("attack", {"attackers": {"actorId": attackers}, "targets": {"actorId": [target_id]}})
+            for target_id, attackers in groups.items()
+        ])
+
+    def move_units(self, moves: List[Tuple[int, str, int, bool, bool]]) -> None:
+        """
+        批量移动：moves 为 (actor_id, direction, distance, assault, is_attack_move)，
+        参数相同的单位合并为一条 move_actor 指令
+        """
+        groups: Dict[Tuple[str, int, bool, bool], List[int]] = {}
+        for actor_id, direction, distance, assault, is_attack_move in moves:
+            groups.setdefault((direction, distance, assault, is_attack_move), []).append(actor_id)
+        self.submit_orders([
+            ("move_actor", {
+                "targets": {"actorId": actor_ids},
+                "direction": direction,
+                "distance": distance,
+                "isAttackMove": 1 if is_attack_move else 0,
+                "isAssaultMove": 1 if assault else 0
+            })
+            for (direction, distance, assault, is_attack_move), actor_ids in groups.items()
+        ])
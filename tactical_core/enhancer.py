@@ -17,22 +17,25 @@ from .decision_guard import DecisionGuard
 from .potential_field import PotentialField
 from .interrupt_logic import InterruptLogic
 from .client import TacticalClient
-from .ui import TacticalLogWindow
+from .feed import ActorFeed, ClientActorFeed, WorldModelActorFeed
 
 from .constants import UnitCategory
 
 class BiodsEnhancer:
-    def __init__(self, enabled: bool = True):
+    def __init__(self, enabled: bool = True, world_model: Any = None):
         self.enabled = enabled
+        # 共享的 WorldModel：提供时实体状态直接读取其快照，不再自行轮询游戏
+        self._world_model = world_model
         self._running = False
         self._manager_thread: Optional[threading.Thread] = None
         self._lock = threading.RLock()
         
-        # 内部独立客户端
+        # 内部独立客户端（持久连接，仅用于下发指令；无 WorldModel 时兼作数据源）
         self._client: Optional[TacticalClient] = None
+        self._feed: Optional[ActorFeed] = None
         
         # 日志窗口
-        self._log_window: Optional[TacticalLogWindow] = None
+        self._log_window: Optional[Any] = None
         
         # 子模块实例
         self.em: Optional[EntityManager] = None
@@ -44,17 +47,23 @@ class BiodsEnhancer:
         # 延迟恢复队列 {tick_to_execute: [pairs]}
         self._delayed_attack_restores = {}
 
-    def start(self, api_client_placeholder, show_log_window: bool = False) -> None:
+    def start(self, api_client_placeholder, show_log_window: bool = False, world_model: Any = None) -> None:
         """启动战术核心后台线程"""
         with self._lock:
             if self._running:
                 return
+            if world_model is not None:
+                self._world_model = world_model
             
             # 初始化独立客户端
             self._client = TacticalClient()
+            if self._world_model is not None:
+                self._feed = WorldModelActorFeed(self._world_model)
+            else:
+                self._feed = ClientActorFeed(self._client)
             
-            # 初始化子模块 (注入独立客户端)
-            self.em = EntityManager(self._client)
+            # 初始化子模块 (注入数据源)
+            self.em = EntityManager(self._feed)
             self.decision_guard = DecisionGuard(self.em)
             self.potential_field = PotentialField(self.em)
             self.interrupt_logic = InterruptLogic(self.em)
@@ -68,10 +77,25 @@ class BiodsEnhancer:
             
             self._log_debug("Tactical Core V2 started")
 
+    def attach_world_model(self, world_model: Any) -> None:
+        """接入主程序的 WorldModel；运行中调用时立即把实体数据源切换为其快照"""
+        with self._lock:
+            self._world_model = world_model
+            if self.em is not None:
+                self._feed = WorldModelActorFeed(world_model)
+                self.em.feed = self._feed
+                self._log_debug("Actor feed switched to WorldModel snapshot")
+
     def show_log_window(self):
         """显示日志窗口"""
         with self._lock:
             if not self._log_window:
+                try:
+                    # 调试窗口为可选组件，缺失时不影响战术核心运行
+                    from .ui import TacticalLogWindow
+                except ImportError:
+                    self._log_debug("Log Window unavailable: tactical_core.ui not installed")
+                    return
                 self._log_window = TacticalLogWindow()
                 self._log_window.start()
                 self._log_debug("Log Window Initialized")
@@ -106,6 +130,8 @@ class BiodsEnhancer:
             except Exception:
                 pass
             self._log_debug("Tactical Core V2 stopped")
+        if self._client:
+            self._client.close()
 
     def enhance_execute(self, api_client_placeholder, pairs: List[Tuple[int, int]]) -> Tuple[bool, str]:
         """
@@ -227,7 +253,9 @@ class BiodsEnhancer:
     def _execute_moves(self, moves: dict) -> None:
         if not moves or not self._client:
             return
-        # 按方向分组以备未来优化，目前简单遍历
+        # 收集整帧移动指令，由客户端按 (方向, 距离, 碾压) 分组后一次下发
+        orders = []
+        logs = []
         for aid, move_data in moves.items():
             direction = None
             distance = 1
@@ -261,20 +289,22 @@ class BiodsEnhancer:
                     if "脱离" not in reason:
                         is_assault = True
 
-            self._client.move_unit(aid, direction, distance=distance, assault=is_assault, is_attack_move=False)
-            self._log_debug(f"{reason} Move: Unit {aid} -> {direction} ({distance}) [Assault={is_assault}]")
+            orders.append((aid, direction, distance, is_assault, False))
+            logs.append(f"{reason} Move: Unit {aid} -> {direction} ({distance}) [Assault={is_assault}]")
+
+        self._client.move_units(orders)
+        for msg in logs:
+            self._log_debug(msg)
 
     def _execute_attacks(self, pairs: List[Union[Tuple[int, int], Tuple[int, int, str]]], log: bool = True) -> None:
         if not pairs or not self._client:
             return
-        for item in pairs:
-            aid = item[0]
-            tid = item[1]
-            reason = item[2] if len(item) > 2 else ""
-            
-            self._client.attack_target(aid, tid)
-            if log:
-                self._log_debug(f"{reason} Attack: Unit {aid} -> Target {tid}")
+        # 整批攻击指令按目标分组后一次下发
+        self._client.attack_targets([(item[0], item[1]) for item in pairs])
+        if log:
+            for item in pairs:
+                reason = item[2] if len(item) > 2 else ""
+                self._log_debug(f"{reason} Attack: Unit {item[0]} -> Target {item[1]}")
 
     def _log_debug(self, msg: str) -> None:
         debug_on = str(os.environ.get("LLM_DEBUG", "0")).lower() in ("1", "true", "yes")
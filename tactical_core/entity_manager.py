@@ -4,7 +4,15 @@ import time
 import math
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from .constants import UnitCategory, UNIT_CATEGORY_MAP, IGNORED_UNIT_CODES, STANDARD_NAME_MAP
+from .entity_table import EntityTable, GridIndex
+from .feed import ActorFeed, ClientActorFeed
+
+# 威胁评估半径（曼哈顿距离，格）与敌方网格索引的格子大小
+THREAT_RADIUS = 15
+THREAT_GRID_CELL = 16
 
 @dataclass
 class TacticalEntity:
@@ -26,8 +34,11 @@ class EntityManager:
     实时数据哨兵 (State Sentinel)
     负责维护战场实体的生命周期、状态同步与衍生数据计算。
     """
-    def __init__(self, client):
-        self.client = client
+    def __init__(self, feed):
+        # 兼容旧调用方式：直接传入 TacticalClient 时包装为逐 Tick 查询的 feed
+        if not hasattr(feed, "snapshot") and hasattr(feed, "query_all_units"):
+            feed = ClientActorFeed(feed)
+        self.feed: ActorFeed = feed
         
         # 实体仓库 {actor_id: TacticalEntity}
         self.allies: Dict[int, TacticalEntity] = {}
@@ -38,6 +49,12 @@ class EntityManager:
         self._distance_cache: Dict[Tuple[int, int], int] = {}
         
         self.last_update_time: float = 0.0
+        self._last_snapshot: Optional[Tuple[List[dict], List[dict]]] = None
+
+        # 列式快照：每次同步后重建一次，供威胁评估/势场等向量化计算复用
+        self.ally_table = EntityTable([])
+        self.enemy_table = EntityTable([])
+        self.enemy_grid = GridIndex(self.enemy_table.positions, THREAT_GRID_CELL)
 
     def _get_unit_code(self, actor_type: str) -> str:
         """
@@ -112,28 +129,26 @@ class EntityManager:
         """
         self.last_update_time = time.time()
         
-        # --- 1. 拉取数据 (使用独立 client) ---
-        raw_allies = []
-        raw_enemies = []
+        # --- 1. 拉取数据 (优先复用 WorldModel 快照，见 feed.py) ---
         try:
-            # 查询己方
-            resp_allies = self.client.query_all_units(faction="己方")
-            if resp_allies is None:
-                raise ConnectionError("Failed to query allies")
-            raw_allies = resp_allies
-            
-            # 查询敌方
-            resp_enemies = self.client.query_all_units(faction="敌方")
-            if resp_enemies is None:
-                raise ConnectionError("Failed to query enemies")
-            raw_enemies = resp_enemies
+            snapshot = self.feed.snapshot()
+            if snapshot is None:
+                raise ConnectionError("Actor feed unavailable")
+            raw_allies, raw_enemies = snapshot
 
         except Exception:
             # 关键修复：如果连接断开，应该清空所有实体，而不是保持僵尸状态
             self.allies.clear()
             self.enemies.clear()
+            self._last_snapshot = None
+            self._rebuild_tables()
             return
 
+        # 快照未变化（WorldModel 尚未刷新）时实体与威胁值均无需重算
+        if snapshot is self._last_snapshot:
+            return
+        self._last_snapshot = snapshot
+
         # --- 2. 同步状态 (Mark & Sweep) ---
         
         # 己方同步
@@ -161,8 +176,15 @@ class EntityManager:
                 del self.enemies[aid]
 
         # --- 3. 计算衍生数据 (威胁值与距离) ---
+        self._rebuild_tables()
         self._calculate_threat_levels()
 
+    def _rebuild_tables(self) -> None:
+        """根据当前实体仓库重建列式快照与敌方网格索引"""
+        self.ally_table = EntityTable(list(self.allies.values()))
+        self.enemy_table = EntityTable(list(self.enemies.values()))
+        self.enemy_grid = GridIndex(self.enemy_table.positions, THREAT_GRID_CELL)
+
     def _manhattan_dist(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> int:
         return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
 
@@ -170,38 +192,30 @@ class EntityManager:
         """
         计算每个己方单位的威胁等级
         Threat = sum(Enemy_Weight / Distance) for enemies in range
+        通过敌方网格索引只枚举半径内的 (己方, 敌方) 对，再按己方单位分组求和。
         """
-        # 简单的威胁评估示例：
-        # 对每个己方单位，遍历所有敌方单位，如果距离够近，则累加威胁值
+        allies = self.ally_table
+        enemies = self.enemy_table
+        
         # 优化：仅对核心战斗单位计算
+        rows = np.flatnonzero(~allies.is_category(UnitCategory.OTHER))
+        if rows.size == 0:
+            return
         
-        for ally in self.allies.values():
-            if ally.category == UnitCategory.OTHER:
-                continue
-                
-            threat = 0.0
-            ax, ay = ally.position
-            
-            for enemy in self.enemies.values():
-                ex, ey = enemy.position
-                dist = abs(ax - ex) + abs(ay - ey)
-                
-                # 忽略过远的敌人 (例如 > 15格)
-                if dist > 15:
-                    continue
-                
-                # 基础威胁权重 (可根据 enemy.category 细化)
-                base_threat = 10.0
-                if enemy.category == UnitCategory.ARTY:
-                    base_threat = 15.0 # 火炮高威胁
-                elif enemy.category == UnitCategory.INF_AT and ally.category in (UnitCategory.MBT, UnitCategory.AFV):
-                    base_threat = 20.0 # 反坦克步兵对载具高威胁
-                
-                # 距离衰减：距离越近威胁越大，防止除零
-                weight = base_threat / max(1.0, float(dist))
-                threat += weight
-            
-            ally.threat_level = threat
+        qi, ei, dist = self.enemy_grid.pairs_within(allies.positions[rows], THREAT_RADIUS)
+        
+        # 基础威胁权重 (可根据 enemy.category 细化)
+        base_threat = np.full(qi.size, 10.0)
+        base_threat[enemies.is_category(UnitCategory.ARTY)[ei]] = 15.0  # 火炮高威胁
+        armored = allies.is_category(UnitCategory.MBT, UnitCategory.AFV)[rows]
+        base_threat[enemies.is_category(UnitCategory.INF_AT)[ei] & armored[qi]] = 20.0  # 反坦克步兵对载具高威胁
+        
+        # 距离衰减：距离越近威胁越大，防止除零
+        weight = base_threat / np.maximum(1.0, dist)
+        threat = np.bincount(qi, weights=weight, minlength=rows.size)
+        
+        for row, value in zip(rows, threat):
+            allies.entities[row].threat_level = float(value)
 
     def get_entity(self, actor_id: int) -> Optional[TacticalEntity]:
         """通过ID获取实体（己方或敌方）"""
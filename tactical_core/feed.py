@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+战术实体数据源 (Actor Feed)
+EntityManager 每 Tick 通过 feed.snapshot() 获取 (己方, 敌方) 原始 Actor 列表，
+列表元素沿用 query_actor 的字典格式：{id, type, position{x,y}, hp, maxHp}。
+
+- WorldModelActorFeed: 直接复用 WorldModel 已发布的快照，不产生额外网络往返
+- ClientActorFeed: 兼容模式，通过 TacticalClient 自行查询（每 Tick 两次请求）
+"""
+import threading
+from typing import Any, List, Optional, Protocol, Tuple
+
+ActorSnapshot = Tuple[List[dict], List[dict]]
+
+
+class ActorFeed(Protocol):
+    def snapshot(self) -> Optional[ActorSnapshot]:
+        """返回 (己方, 敌方) 原始 Actor 列表；数据源不可用时返回 None"""
+        ...
+
+
+class ClientActorFeed:
+    """通过独立 TacticalClient 拉取数据（旧行为）"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def snapshot(self) -> Optional[ActorSnapshot]:
+        allies = self.client.query_all_units(faction="己方")
+        if allies is None:
+            return None
+        enemies = self.client.query_all_units(faction="敌方")
+        if enemies is None:
+            return None
+        return allies, enemies
+
+
+class WorldModelActorFeed:
+    """
+    读取 WorldModel 已刷新的 Actor 快照。
+    以 WorldModel 的 actors 层代数（layer_generation）为键缓存转换结果：同一快照内多次 Tick
+    复用同一份列表，WorldModel 的 Actor 数据变化后才重新转换。
+    """
+
+    def __init__(self, world_model: Any):
+        self.world_model = world_model
+        self._lock = threading.Lock()
+        self._cached_version: Any = None
+        self._cached: Optional[ActorSnapshot] = None
+
+    @staticmethod
+    def _to_raw(view: Any) -> dict:
+        x, y = view.position
+        return {
+            "id": view.actor_id,
+            "type": view.name,
+            "position": {"x": x, "y": y},
+            "hp": view.hp,
+            "maxHp": view.hp_max,
+        }
+
+    def _actors(self, query_type: str) -> List[dict]:
+        result = self.world_model.query_view(query_type)
+        return [self._to_raw(view) for view in result.get("actors", []) if view.is_alive]
+
+    def _version(self) -> Any:
+        layer_generation = getattr(self.world_model, "layer_generation", None)
+        if callable(layer_generation):
+            return layer_generation("actors")
+        return getattr(self.world_model.state, "timestamp", None)
+
+    def snapshot(self) -> Optional[ActorSnapshot]:
+        if not self.world_model.state.actors:
+            # WorldModel 尚未完成首次刷新（或对局刚重置）
+            return None
+        version = self._version()
+        with self._lock:
+            if self._cached is not None and self._cached_version == version:
+                return self._cached
+            snapshot = (self._actors("my_actors"), self._actors("enemy_actors"))
+            self._cached_version = version
+            self._cached = snapshot
+            return snapshot
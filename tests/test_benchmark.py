@@ -75,5 +75,44 @@ def test_records_from_and_tail_records_follow_append_order() -> None:
     assert [record.name for record in sliced] == ["step-1", "step-2"]
     assert [record.name for record in tail] == ["step-3", "step-4"]
 
+def test_store_keeps_streaming_percentiles_after_raw_records_are_evicted() -> None:
+    from datetime import datetime, timezone
+
+    store = benchmark.BenchmarkStore(max_records=10)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for idx in range(1000):
+        store.add(
+            tag="job_tick",
+            name="explore" if idx % 2 else "combat",
+            started_at=start,
+            ended_at=start + timedelta(seconds=idx),
+            duration_ms=float(idx + 1),
+        )
+
+    assert len(store) == 10
+    assert [record.duration_ms for record in store.records_from(0, limit=2)] == [991.0, 992.0]
+    records, next_offset = store.records_since(995)
+    assert [record.duration_ms for record in records] == [996.0, 997.0, 998.0, 999.0, 1000.0]
+    assert next_offset == 1000
+
+    [summary] = store.stats(tag="job_tick")
+    assert summary["count"] == 1000
+    assert summary["max_ms"] == 1000.0
+    assert summary["total_ms"] == sum(range(1, 1001))
+    for key, exact in (("p50_ms", 500.5), ("p95_ms", 950.05), ("p99_ms", 990.01)):
+        assert abs(summary[key] - exact) / exact < 0.02, (key, summary[key])
+
+    by_name = {item["name"]: item for item in store.stats(by_name=True)}
+    assert by_name["explore"]["count"] == 500 and by_name["combat"]["count"] == 500
+
+    # Only the last minute of samples (10s slices) falls inside the window.
+    [recent] = store.stats(tag="job_tick", window_s=60, now=start + timedelta(seconds=1000))
+    assert 60 <= recent["count"] <= 70
+    assert recent["max_ms"] == 1000.0
+
+    store.clear()
+    assert store.stats() == [] and store.records_since(0) == ([], 0)
+
+
 if __name__ == "__main__":
     raise SystemExit(pytest.main([__file__, *sys.argv[1:]]))
@@ -28,6 +28,7 @@ class MockGameAPI:
     def __init__(self):
         self.move_calls: list[dict] = []
         self.attack_calls: list[dict] = []
+        self.attack_batches: list[list[tuple[int, int]]] = []
 
     def move_units_by_location(self, actors, location, attack_move=False):
         self.move_calls.append({
@@ -40,6 +41,12 @@ class MockGameAPI:
         self.attack_calls.append({"attacker": attacker.actor_id, "target": target.actor_id})
         return True
 
+    def attack_targets(self, pairs):
+        self.attack_batches.append([(attacker.actor_id, target.actor_id) for attacker, target in pairs])
+        for attacker, target in pairs:
+            self.attack_target(attacker, target)
+        return {target.actor_id: True for _, target in pairs}
+
     def deploy_units(self, actors):
         pass
 
@@ -354,6 +361,8 @@ def test_assault_focus_fire_lowest_hp():
     targets_used = {c["target"] for c in api.attack_calls}
     # All units should focus the lowest HP enemy (202)
     assert targets_used == {202}, f"All units should focus enemy 202 (lowest HP), got {targets_used}"
+    # The whole squad's focus fire goes out as one batched order.
+    assert api.attack_batches == [[(57, 202), (58, 202)]]
     print("  PASS: assault_focus_fire_lowest_hp")
 
 
@@ -0,0 +1,49 @@
+"""Tests for CommandRouter's compiled intent matcher."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nlu_pipeline.rules import CommandRouter
+from nlu_pipeline.rules.intent_matcher import AhoCorasick
+from nlu_pipeline.scripts.common import PROJECT_ROOT, read_jsonl
+
+
+def test_aho_corasick_matches_naive_substring_search() -> None:
+    patterns = ["he", "she", "his", "hers", "", "攻击", "停止攻击", "击"]
+    automaton = AhoCorasick(patterns)
+    for text in ("ushers", "this", "停止攻击敌人", "攻", "", "hishe"):
+        expected = {index for index, pattern in enumerate(patterns) if pattern and pattern in text}
+        assert automaton.matches(text) == expected, text
+    print("  PASS: aho_corasick_matches_naive_substring_search")
+
+
+def test_compiled_intent_matcher_agrees_with_linear_scan() -> None:
+    router = CommandRouter()
+    matcher = router._intent_matcher
+    rows = read_jsonl(PROJECT_ROOT / "nlu_pipeline" / "data" / "manual" / "manual_gold_seed.jsonl")
+    commands = [row["text"] for row in rows] + ["状态", "全面进攻", "造", "xyz", "先停手", "部署"]
+    checked = 0
+    for command in commands:
+        for clause in router._split_sequence_clauses(router._normalize(command)):
+            assert matcher.match(clause) == matcher.scan(clause), clause
+            checked += 1
+    assert checked >= len(commands)
+
+    # Synonyms are normalized once at build time, not per command.
+    calls: list[str] = []
+    original = router._normalize
+    router._normalize = lambda text: calls.append(text) or original(text)  # type: ignore[method-assign]
+    router._match_intent("停止攻击")
+    assert calls == []
+    assert router.route("停止攻击").intent == "stop_attack"
+    print("  PASS: compiled_intent_matcher_agrees_with_linear_scan")
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, *sys.argv[1:]]))
@@ -61,6 +61,11 @@ class MockGameAPI:
         self.attack_calls.append({"attacker": attacker.actor_id, "target": target.actor_id})
         return True
 
+    def attack_targets(self, pairs):
+        for attacker, target in pairs:
+            self.attack_target(attacker, target)
+        return {target.actor_id: True for _, target in pairs}
+
     def can_produce(self, unit_type):
         return True
 
@@ -182,6 +182,190 @@ def test_game_api_serializes_concurrent_requests() -> None:
         server.close()
 
 
+class _OutOfOrderJsonServer:
+    """Accepts one client, waits for ``batch`` pipelined requests, then answers them in reverse order."""
+
+    def __init__(self, *, batch: int) -> None:
+        self.batch = batch
+        self.accept_count = 0
+        self.commands: list[str] = []
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen()
+        self._server.settimeout(2.0)
+        self.port = self._server.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        try:
+            self._server.close()
+        except OSError:
+            pass
+        self._thread.join(timeout=1.0)
+
+    def _serve(self) -> None:
+        try:
+            client, _ = self._server.accept()
+        except OSError:
+            return
+        self.accept_count += 1
+        with client:
+            client.settimeout(2.0)
+            buf = b""
+            requests: list[dict] = []
+            while len(requests) < self.batch:
+                try:
+                    chunk = client.recv(4096)
+                except OSError:
+                    return
+                if not chunk:
+                    return
+                buf += chunk
+                while b"\n" in buf:
+                    line, buf = buf.split(b"\n", 1)
+                    if line.strip():
+                        requests.append(json.loads(line))
+            self.commands = [request["command"] for request in requests]
+            for request in reversed(requests):
+                response = {
+                    "status": 1,
+                    "requestId": request["requestId"],
+                    "data": {"echo": request["command"]},
+                }
+                client.sendall((json.dumps(response) + "\n").encode("utf-8"))
+            time.sleep(0.2)
+
+
+def test_game_api_multiplex_dispatches_out_of_order_responses() -> None:
+    server = _OutOfOrderJsonServer(batch=4)
+    api = GameAPI("127.0.0.1", port=server.port, multiplex=True)
+    try:
+        def call(index: int) -> str:
+            response = api._send_request(f"cmd_{index}", {"index": index})
+            return response["data"]["echo"]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(call, range(4)))
+
+        # The server only answers once all four requests are in flight, so a
+        # serialized client would deadlock here instead of completing.
+        assert results == [f"cmd_{index}" for index in range(4)]
+        assert server.accept_count == 1
+        assert sorted(server.commands) == [f"cmd_{index}" for index in range(4)]
+        assert api._pending == {}
+        print("  PASS: game_api_multiplex_dispatches_out_of_order_responses")
+    finally:
+        api.close()
+        server.close()
+
+
+class _ChunkedUnterminatedJsonServer:
+    """Answers one request with a large JSON reply that has no trailing newline, sent in pieces."""
+
+    def __init__(self, *, payload_bytes: int, chunk_bytes: int) -> None:
+        self.payload_bytes = payload_bytes
+        self.chunk_bytes = chunk_bytes
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen()
+        self._server.settimeout(2.0)
+        self.port = self._server.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        try:
+            self._server.close()
+        except OSError:
+            pass
+        self._thread.join(timeout=2.0)
+
+    def _serve(self) -> None:
+        try:
+            client, _ = self._server.accept()
+        except OSError:
+            return
+        with client:
+            client.settimeout(2.0)
+            buf = b""
+            while b"\n" not in buf:
+                chunk = client.recv(4096)
+                if not chunk:
+                    return
+                buf += chunk
+            request = json.loads(buf.split(b"\n", 1)[0])
+            response = {
+                "status": 1,
+                "requestId": request["requestId"],
+                "data": {"blob": "x" * self.payload_bytes},
+            }
+            encoded = json.dumps(response).encode("utf-8")
+            for start in range(0, len(encoded), self.chunk_bytes):
+                client.sendall(encoded[start:start + self.chunk_bytes])
+                time.sleep(0.005)
+            # Keep the connection open: the reply is only complete once the reader goes idle.
+            time.sleep(0.5)
+
+
+def test_game_api_multiplex_parses_unterminated_reply_once() -> None:
+    server = _ChunkedUnterminatedJsonServer(payload_bytes=1 << 20, chunk_bytes=64 * 1024)
+    api = GameAPI("127.0.0.1", port=server.port, multiplex=True)
+    parsed: list[int] = []
+
+    def counting_parse(payload: str) -> Optional[str]:
+        parsed.append(len(payload))
+        return GameAPI._parse_complete_json(payload)
+
+    api._parse_complete_json = counting_parse  # type: ignore[method-assign]
+    try:
+        response = api._send_request("map_query", {})
+        assert len(response["data"]["blob"]) == 1 << 20
+        # Pieces that cannot end a JSON document are never re-parsed.
+        assert len(parsed) == 1
+        assert api._pending == {}
+        print("  PASS: game_api_multiplex_parses_unterminated_reply_once")
+    finally:
+        api.close()
+        server.close()
+
+
+def test_game_api_multiplex_reconnects_after_server_side_close() -> None:
+    server = _PersistentJsonServer(close_after_requests=1)
+    api = GameAPI("127.0.0.1", port=server.port, multiplex=True)
+    try:
+        first = api._send_request("ping", {})
+        second = api._send_request("query_actor", {})
+        assert first["data"]["echo"] == "ping"
+        assert second["data"]["echo"] == "query_actor"
+        assert server.accept_count == 2
+        print("  PASS: game_api_multiplex_reconnects_after_server_side_close")
+    finally:
+        api.close()
+        server.close()
+
+
+def test_game_api_multiplex_fast_fails_on_initial_connection_refused() -> None:
+    probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    probe.bind(("127.0.0.1", 0))
+    port = probe.getsockname()[1]
+    probe.close()
+
+    api = GameAPI("127.0.0.1", port=port, multiplex=True)
+    try:
+        try:
+            api._send_request("ping", {})
+            raise AssertionError("expected connection failure")
+        except GameAPIError as exc:
+            assert exc.code == "CONNECTION_ERROR"
+        assert api._pending == {}
+        print("  PASS: game_api_multiplex_fast_fails_on_initial_connection_refused")
+    finally:
+        api.close()
+
+
 def test_game_api_fast_fails_on_initial_connection_refused() -> None:
     probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     probe.bind(("127.0.0.1", 0))
@@ -371,6 +555,83 @@ def test_query_actor_parses_power_state_flags() -> None:
     print("  PASS: query_actor_parses_power_state_flags")
 
 
+def test_query_actor_delta_sends_since_version_and_parses_patch() -> None:
+    api = GameAPI("127.0.0.1", port=1)
+    captured = {}
+
+    def fake_send(command: str, params: dict) -> dict:
+        captured["command"] = command
+        captured["params"] = dict(params)
+        return {
+            "status": 1,
+            "data": {
+                "version": 42,
+                "full": False,
+                "added": [{"id": 7, "type": "步兵", "faction": "自己", "hp": 50, "maxHp": 50, "position": {"x": 1, "y": 2}}],
+                "changed": [{"id": 8, "type": "重型坦克", "faction": "敌人", "hp": 300, "maxHp": 600, "position": {"x": 3, "y": 4}}],
+                "removed": [9, "10"],
+                "frozenActors": [{"type": "矿场", "faction": "敌人", "position": {"x": 5, "y": 6}}],
+            },
+        }
+
+    api._send_request = fake_send  # type: ignore[method-assign]
+
+    delta = api.query_actor_delta(41)
+
+    assert captured["command"] == "query_actor_delta"
+    assert captured["params"]["sinceVersion"] == 41
+    assert delta.Version == 42
+    assert delta.Full is False
+    assert [actor.actor_id for actor in delta.Added] == [7]
+    assert delta.Changed[0].hppercent == 50
+    assert delta.Removed == [9, 10]
+    assert delta.FrozenActors[0].position.x == 5
+    print("  PASS: query_actor_delta_sends_since_version_and_parses_patch")
+
+
+def test_map_query_unpacks_packed_grids_into_arrays() -> None:
+    api = GameAPI("127.0.0.1", port=1)
+    w, h = 5, 7
+    cells = [(x * h + y) % 3 == 0 for x in range(w) for y in range(h)]
+    cells[w * h - 1] = True  # top bit of the second word -> negative int32 on the wire
+    words = [0, 0]
+    for index, flag in enumerate(cells):
+        if flag:
+            words[index // 32] |= 1 << (index % 32)
+    signed = [word - (1 << 32) if word >= (1 << 31) else word for word in words]
+
+    def fake_send(command: str, params: dict) -> dict:
+        assert command == "map_query"
+        return {
+            "status": 1,
+            "data": {
+                "MapWidth": w,
+                "MapHeight": h,
+                "Height": [[1] * h for _ in range(w)],
+                "Resources": [[x + y for y in range(h)] for x in range(w)],
+                "Terrain": [["clear"] * h for _ in range(w)],
+                "ResourcesType": [[""] * h for _ in range(w)],
+                "IsExplored_packed": signed,
+                "IsVisible_packed": signed[:1],
+            },
+        }
+
+    api._send_request = fake_send  # type: ignore[method-assign]
+    api._handle_response = lambda response, _error: response["data"]  # type: ignore[method-assign]
+
+    result = api.map_query()
+
+    expected = [[cells[x * h + y] for y in range(h)] for x in range(w)]
+    assert result.IsExplored.shape == (w, h)
+    assert result.IsExplored.tolist() == expected
+    # Truncated packed arrays leave the missing tail unexplored.
+    assert result.IsVisible.tolist() == [[cells[x * h + y] and x * h + y < 32 for y in range(h)] for x in range(w)]
+    assert result.Resources[2][3] == 5
+    assert result.grid_lists("Resources")[4] == [4, 5, 6, 7, 8, 9, 10]
+    assert bool(result.IsExplored[w - 1][h - 1]) is True
+    print("  PASS: map_query_unpacks_packed_grids_into_arrays")
+
+
 def test_occupy_units_sends_precise_actor_ids() -> None:
     api = GameAPI("127.0.0.1", port=1)
     captured = {}
@@ -395,6 +656,49 @@ def test_occupy_units_sends_precise_actor_ids() -> None:
     print("  PASS: occupy_units_sends_precise_actor_ids")
 
 
+def test_attack_targets_groups_by_target_and_falls_back_without_batch_orders() -> None:
+    api = GameAPI("127.0.0.1", port=1)
+    bridge = {"batch_orders": True}
+    sent: list[tuple[str, dict]] = []
+
+    def fake_send(command: str, params: dict) -> dict:
+        sent.append((command, params))
+        if command == "batch_orders":
+            if not bridge["batch_orders"]:
+                raise GameAPIError("INVALID_COMMAND", "未知的命令")
+            return {"status": 1, "data": {"results": [{"status": 1}, {"status": -1}]}}
+        return {"status": 1, "data": None}
+
+    api._send_request = fake_send  # type: ignore[method-assign]
+    pairs = [
+        (Actor(actor_id=1), Actor(actor_id=90)),
+        (Actor(actor_id=2), Actor(actor_id=91)),
+        (Actor(actor_id=3), Actor(actor_id=90)),
+        (Actor(actor_id=1), Actor(actor_id=91)),
+        (Actor(actor_id=1), Actor(actor_id=90)),  # the last assignment per attacker wins
+    ]
+
+    assert api.attack_targets(pairs) == {90: True, 91: False}
+    assert sent == [(
+        "batch_orders",
+        {"orders": [
+            {"command": "attack", "params": {"attackers": {"actorId": [1, 3]}, "targets": {"actorId": [90]}}},
+            {"command": "attack", "params": {"attackers": {"actorId": [2]}, "targets": {"actorId": [91]}}},
+        ]},
+    )]
+
+    # An older bridge rejects batch_orders once; later calls go straight to per-group attack orders.
+    api._batch_orders_supported = None
+    bridge["batch_orders"] = False
+    sent.clear()
+    assert api.attack_targets(pairs) == {90: True, 91: True}
+    assert [command for command, _ in sent] == ["batch_orders", "attack", "attack"]
+    sent.clear()
+    api.attack_targets(pairs)
+    assert [command for command, _ in sent] == ["attack", "attack"]
+    print("  PASS: attack_targets_groups_by_target_and_falls_back_without_batch_orders")
+
+
 def test_game_api_dependency_names_follow_demo_truth() -> None:
     assert GameAPI._dependency_display_names("矿场") == ["发电厂", "建造厂"]
     assert GameAPI._dependency_display_names("雷达站") == ["矿场", "建造厂"]
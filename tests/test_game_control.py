@@ -1354,6 +1354,18 @@ def test_parse_args_cli_flags_override_entry_defaults(monkeypatch: pytest.Monkey
     assert cfg.verify_game_api is False
 
 
+def test_parse_args_game_loop_job_scheduling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GAME_LOOP_TICK_BUDGET_S", "0.08")
+    cfg = main_module.parse_args(["--job-workers", "4", "--job-deadline-s", "0.25"])
+
+    assert cfg.job_workers == 4
+    assert cfg.job_deadline_s == 0.25
+    assert cfg.tick_budget_s == 0.08
+
+    monkeypatch.delenv("GAME_LOOP_TICK_BUDGET_S")
+    assert main_module.parse_args([]).tick_budget_s is None
+
+
 def test_run_runtime_preflight_failure_finalizes_persistence_session(
     monkeypatch: pytest.MonkeyPatch,
     capsys: pytest.CaptureFixture[str],
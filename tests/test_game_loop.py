@@ -623,6 +623,354 @@ def test_blocking_queue_manager_does_not_starve_adjutant_llm():
 
 # --- Run all tests ---
 
+class SleepySignalJob(BaseJob):
+    tick_interval = 0.0
+
+    def __init__(self, *, sleep_s: float, **kwargs):
+        super().__init__(**kwargs)
+        self.sleep_s = sleep_s
+
+    @property
+    def expert_type(self) -> str:
+        return "MockExpert"
+
+    def tick(self) -> None:
+        time.sleep(self.sleep_s)
+        self.emit_signal(kind=SignalKind.PROGRESS, summary=f"{self.job_id} ticked")
+
+
+def test_jobs_tick_concurrently_and_deliver_signals_in_registration_order():
+    wm = MockWorldModel()
+    kernel = MockKernel()
+    loop = GameLoop(wm, kernel, config=GameLoopConfig(tick_hz=10, job_workers=4, job_deadline_s=2.0))
+
+    delivered: list[str] = []
+    # Later-registered jobs finish first; delivery must still follow registration order.
+    for index, sleep_s in enumerate([0.15, 0.1, 0.05, 0.0]):
+        loop.register_job(
+            SleepySignalJob(
+                job_id=f"j{index}",
+                task_id=f"t{index}",
+                config=ReconJobConfig(search_region="full_map", target_type="base", target_owner="enemy"),
+                signal_callback=lambda signal: delivered.append(signal.job_id),
+                sleep_s=sleep_s,
+            )
+        )
+
+    async def run():
+        started = time.monotonic()
+        await loop._tick_jobs(time.time())
+        return time.monotonic() - started
+
+    elapsed = asyncio.run(run())
+
+    assert delivered == ["j0", "j1", "j2", "j3"]
+    assert elapsed < 0.28, f"jobs ran serially ({elapsed:.3f}s)"
+    assert loop.job_overruns() == {}
+    print("  PASS: jobs_tick_concurrently_and_deliver_signals_in_registration_order")
+
+
+def test_job_overrunning_deadline_is_counted_and_applied_later():
+    wm = MockWorldModel()
+    kernel = MockKernel()
+    loop = GameLoop(wm, kernel, config=GameLoopConfig(tick_hz=10, job_deadline_s=0.02))
+
+    delivered: list[str] = []
+    slow = SleepySignalJob(
+        job_id="slow",
+        task_id="t1",
+        config=ReconJobConfig(search_region="full_map", target_type="base", target_owner="enemy"),
+        signal_callback=lambda signal: delivered.append(signal.job_id),
+        sleep_s=0.15,
+    )
+    loop.register_job(slow)
+
+    async def run():
+        await loop._tick_jobs(time.time())
+        assert delivered == []
+        # Still running: not resubmitted, no second overrun.
+        await loop._tick_jobs(time.time())
+        await asyncio.sleep(0.2)
+        await loop._tick_jobs(time.time())
+
+    asyncio.run(run())
+
+    # Third tick applied the late outcome, then resubmitted the job, which overran again.
+    assert delivered == ["slow"]
+    assert loop.job_overruns() == {"slow": 2}
+    print("  PASS: job_overrunning_deadline_is_counted_and_applied_later")
+
+
+def test_job_deadline_runs_from_tick_start_not_submission():
+    wm = MockWorldModel()
+    kernel = MockKernel()
+    loop = GameLoop(wm, kernel, config=GameLoopConfig(tick_hz=10, job_deadline_s=0.2))
+    assert loop.config.job_workers == 1
+
+    delivered: list[str] = []
+    for index in range(4):
+        loop.register_job(
+            SleepySignalJob(
+                job_id=f"j{index}",
+                task_id=f"t{index}",
+                config=ReconJobConfig(search_region="full_map", target_type="base", target_owner="enemy"),
+                signal_callback=lambda signal: delivered.append(signal.job_id),
+                sleep_s=0.1,
+            )
+        )
+
+    asyncio.run(loop._tick_jobs(time.time()))
+
+    # Each tick ran well within its own deadline, even though the last one
+    # finished ~0.4s after submission.
+    assert loop.job_overruns() == {}
+    assert delivered == ["j0", "j1", "j2", "j3"]
+    print("  PASS: job_deadline_runs_from_tick_start_not_submission")
+
+
+def test_jobs_queued_behind_overrunning_job_are_not_counted():
+    wm = MockWorldModel()
+    kernel = MockKernel()
+    loop = GameLoop(wm, kernel, config=GameLoopConfig(tick_hz=10, job_deadline_s=0.05))
+
+    delivered: list[str] = []
+    for job_id, sleep_s in (("slow", 0.2), ("queued", 0.0)):
+        loop.register_job(
+            SleepySignalJob(
+                job_id=job_id,
+                task_id=f"t_{job_id}",
+                config=ReconJobConfig(search_region="full_map", target_type="base", target_owner="enemy"),
+                signal_callback=lambda signal: delivered.append(signal.job_id),
+                sleep_s=sleep_s,
+            )
+        )
+
+    async def run():
+        started = time.monotonic()
+        await loop._tick_jobs(time.time())
+        elapsed = time.monotonic() - started
+        assert delivered == []
+        await asyncio.sleep(0.2)
+        await loop._drain_inflight_jobs(time.time())
+        return elapsed
+
+    elapsed = asyncio.run(run())
+
+    assert elapsed < 0.15, f"waited for the overrunning job ({elapsed:.3f}s)"
+    assert loop.job_overruns() == {"slow": 1}
+    assert delivered == ["slow", "queued"]
+    print("  PASS: jobs_queued_behind_overrunning_job_are_not_counted")
+
+
+class OrderRecordingWorldModel(MockWorldModel):
+    def __init__(self, order: list[str]):
+        super().__init__()
+        self.order = order
+
+    def refresh(self, *, now=None, force=False) -> list[Event]:
+        self.order.append("refresh")
+        return super().refresh(now=now, force=force)
+
+
+def test_overrunning_job_finishes_before_next_world_refresh():
+    order: list[str] = []
+    wm = OrderRecordingWorldModel(order)
+    kernel = MockKernel()
+    loop = GameLoop(wm, kernel, config=GameLoopConfig(tick_hz=10, job_deadline_s=0.02))
+    assert loop.config.job_workers == 1
+
+    class RecordingJob(SleepySignalJob):
+        def tick(self) -> None:
+            super().tick()
+            order.append("job_done")
+
+    delivered: list[str] = []
+    loop.register_job(
+        RecordingJob(
+            job_id="slow",
+            task_id="t1",
+            config=ReconJobConfig(search_region="full_map", target_type="base", target_owner="enemy"),
+            signal_callback=lambda signal: delivered.append(signal.job_id),
+            sleep_s=0.1,
+        )
+    )
+
+    async def run():
+        await loop._tick()
+        assert order == ["refresh"] and delivered == []
+        await loop._tick()
+
+    asyncio.run(run())
+
+    # Tick 2 waited for tick 1's job before refreshing, then applied its Signal.
+    assert order[:3] == ["refresh", "job_done", "refresh"]
+    assert delivered[:1] == ["slow"]
+    assert loop.tick_stats()["phases"]["job_drain"]["count"] == 1
+    print("  PASS: overrunning_job_finishes_before_next_world_refresh")
+
+
+def test_stuck_job_does_not_stall_later_ticks():
+    order: list[str] = []
+    wm = OrderRecordingWorldModel(order)
+    kernel = MockKernel()
+    loop = GameLoop(wm, kernel, config=GameLoopConfig(tick_hz=10, job_workers=2, job_deadline_s=0.02))
+
+    delivered: list[str] = []
+    for job_id, sleep_s in (("stuck", 0.6), ("fast", 0.0)):
+        loop.register_job(
+            SleepySignalJob(
+                job_id=job_id,
+                task_id=f"t_{job_id}",
+                config=ReconJobConfig(search_region="full_map", target_type="base", target_owner="enemy"),
+                signal_callback=lambda signal: delivered.append(signal.job_id),
+                sleep_s=sleep_s,
+            )
+        )
+
+    async def run():
+        await loop._tick()
+        started = time.monotonic()
+        await loop._tick()
+        elapsed = time.monotonic() - started
+        await asyncio.sleep(0.6)
+        await loop._tick()
+        return elapsed
+
+    elapsed = asyncio.run(run())
+
+    # Tick 2 gave up on the stuck job after the tick budget, refreshed and
+    # ticked the other job; tick 3 applied the stuck job's late outcome.
+    assert elapsed < 0.3, f"tick stalled on the stuck job ({elapsed:.3f}s)"
+    assert order.count("refresh") == 3
+    assert delivered.count("fast") == 3
+    assert delivered.count("stuck") == 1
+    assert loop.job_overruns()["stuck"] >= 2
+    print("  PASS: stuck_job_does_not_stall_later_ticks")
+
+
+def test_unregistered_job_outcome_is_dropped():
+    wm = MockWorldModel()
+    kernel = MockKernel()
+    loop = GameLoop(wm, kernel, config=GameLoopConfig(tick_hz=10, job_deadline_s=0.02))
+
+    delivered: list[str] = []
+    loop.register_job(
+        SleepySignalJob(
+            job_id="slow",
+            task_id="t1",
+            config=ReconJobConfig(search_region="full_map", target_type="base", target_owner="enemy"),
+            signal_callback=lambda signal: delivered.append(signal.job_id),
+            sleep_s=0.1,
+        )
+    )
+
+    async def run():
+        await loop._tick()
+        loop.unregister_job("slow")
+        await loop._tick()
+
+    asyncio.run(run())
+
+    assert delivered == []
+    print("  PASS: unregistered_job_outcome_is_dropped")
+
+
+def test_over_budget_ticks_shed_dashboard_and_non_overdue_jobs():
+    wm = BlockingWorldModel(block_s=0.03)
+    kernel = MockKernel()
+    pushes: list[int] = []
+    loop = GameLoop(
+        wm,
+        kernel,
+        config=GameLoopConfig(tick_hz=10, tick_budget_s=0.01, max_dashboard_deferrals=2),
+        dashboard_callback=lambda tick, _now: pushes.append(tick),
+    )
+    job = MockTickJob(
+        job_id="j1",
+        task_id="t1",
+        config=ReconJobConfig(search_region="full_map", target_type="base", target_owner="enemy"),
+        signal_callback=lambda _signal: None,
+    )
+    job.tick_interval = 0.05
+    loop.register_job(job)
+
+    async def run():
+        for _ in range(3):
+            await loop._tick()
+
+    asyncio.run(run())
+
+    # Dashboard shed twice, then forced through. The job ran on tick 1 (never ticked
+    # before); on tick 3 it is due (~60ms > 50ms) but not overdue (< 100ms), so it waits.
+    assert pushes == [3]
+    assert job.tick_count == 1
+    stats = loop.tick_stats()
+    assert stats["ticks"] == 3
+    assert stats["overruns"] == 3
+    assert stats["deferred"] == {"dashboard": 2, "jobs": 1, "info_analysis": 0}
+    assert stats["phases"]["refresh"]["count"] == 3
+    assert stats["phases"]["refresh"]["p50_ms"] >= 25.0
+    assert stats["phases"]["dashboard"]["count"] == 1
+    print("  PASS: over_budget_ticks_shed_dashboard_and_non_overdue_jobs")
+
+
+class CombatTickJob(MockTickJob):
+    @property
+    def expert_type(self) -> str:
+        return "CombatExpert"
+
+
+class PriorityKernel(MockKernel):
+    def __init__(self, priorities: dict[str, int]):
+        super().__init__()
+        self.priorities = priorities
+
+    def task_priority(self, task_id: str) -> Optional[int]:
+        return self.priorities.get(task_id)
+
+
+class DeferringWorldModel(BlockingWorldModel):
+    def __init__(self, block_s: float):
+        super().__init__(block_s=block_s)
+        self.info_deferrals: list[bool] = []
+
+    def defer_info_analysis(self, deferred: bool) -> None:
+        self.info_deferrals.append(deferred)
+
+
+def test_over_budget_ticks_shed_jobs_by_task_priority():
+    wm = DeferringWorldModel(block_s=0.03)
+    kernel = PriorityKernel({"low": 20, "combat": 60, "urgent": 90, "recon": 60})
+    loop = GameLoop(wm, kernel, config=GameLoopConfig(tick_hz=10, tick_budget_s=0.01))
+    recon_config = ReconJobConfig(search_region="full_map", target_type="base", target_owner="enemy")
+    jobs = {
+        "low": MockTickJob(job_id="low", task_id="low", config=recon_config, signal_callback=lambda _s: None),
+        "recon": MockTickJob(job_id="recon", task_id="recon", config=recon_config, signal_callback=lambda _s: None),
+        "combat": CombatTickJob(job_id="combat", task_id="combat", config=recon_config, signal_callback=lambda _s: None),
+        "urgent": MockTickJob(job_id="urgent", task_id="urgent", config=recon_config, signal_callback=lambda _s: None),
+    }
+    for job in jobs.values():
+        loop.register_job(job)
+
+    async def run():
+        for _ in range(3):
+            await loop._tick()
+
+    asyncio.run(run())
+
+    # Every tick overruns; due-but-not-overdue ticks are shed only for low/mid-priority
+    # non-combat work, while combat and urgent Jobs keep their cadence.
+    assert jobs["low"].tick_count == 1
+    assert jobs["recon"].tick_count == 1
+    assert jobs["combat"].tick_count == 2
+    assert jobs["urgent"].tick_count == 2
+    stats = loop.tick_stats()
+    assert stats["deferred"]["jobs"] == 2
+    assert stats["deferred"]["info_analysis"] == 3
+    assert wm.info_deferrals == [True, True, True]
+    print("  PASS: over_budget_ticks_shed_jobs_by_task_priority")
+
+
 if __name__ == "__main__":
     import pytest
     raise SystemExit(pytest.main([__file__, *sys.argv[1:]]))
@@ -0,0 +1,122 @@
+"""Tests for IntelService incremental section recomputation."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openra_api.game_api import GameAPI
+from openra_api.intel import IntelService
+from openra_api.models import Actor, Location, MapQueryResult, PlayerBaseInfo
+
+
+class _FakeIntelAPI:
+    def __init__(self) -> None:
+        self.my_actors = [
+            Actor(actor_id=1, type="建造厂", faction="自己", position=Location(10, 10), hppercent=100),
+            Actor(actor_id=2, type="矿车", faction="自己", position=Location(14, 12), hppercent=80, activity="Harvest"),
+            Actor(actor_id=3, type="重型坦克", faction="自己", position=Location(20, 18), hppercent=60),
+        ]
+        self.enemy_actors = [
+            Actor(actor_id=90, type="重型坦克", faction="敌人", position=Location(30, 30), hppercent=100),
+            Actor(actor_id=91, type="步兵", faction="敌人", position=Location(33, 31), hppercent=40),
+        ]
+        self.base_info = PlayerBaseInfo(Cash=1000, Resources=200, Power=10, PowerDrained=20, PowerProvided=30)
+        self.map = self.make_map(explored_upto=12)
+        self.map_queries = 0
+
+    @staticmethod
+    def make_map(explored_upto: int) -> MapQueryResult:
+        size = 40
+        return MapQueryResult(
+            MapWidth=size,
+            MapHeight=size,
+            Height=[[0] * size for _ in range(size)],
+            IsVisible=[[False] * size for _ in range(size)],
+            IsExplored=[[x < explored_upto for _ in range(size)] for x in range(size)],
+            Terrain=[["clear"] * size for _ in range(size)],
+            ResourcesType=[["ore"] * size for _ in range(size)],
+            Resources=[[50 if (x + y) % 7 == 0 else 0 for y in range(size)] for x in range(size)],
+        )
+
+    def query_actor(self, params):
+        return list(self.my_actors if params.faction == "自己" else self.enemy_actors)
+
+    def player_base_info_query(self):
+        return self.base_info
+
+    def map_query(self):
+        self.map_queries += 1
+        return self.map
+
+    def query_production_queue(self, queue_type):
+        return {"queue_type": queue_type, "queue_items": [], "has_ready_item": False}
+
+    def unit_attribute_query(self, actors):
+        return {"attributes": [{"id": 3, "targets": [90]}]}
+
+    def get_unexplored_nearby_positions(self, map_info, pos, max_distance):
+        return GameAPI.get_unexplored_nearby_positions(self, map_info, pos, max_distance)
+
+
+_CACHED_FIELDS = ("tech", "battle", "opportunities", "map_control", "actors_actions")
+
+
+def _comparable(model) -> dict:
+    economy = {k: v for k, v in model.economy.items() if k != "income_rate_est"}
+    enemy = {k: v for k, v in model.forces["enemy"].items() if k != "last_seen"}
+    return {
+        "economy": economy,
+        "forces": {"my": model.forces["my"], "enemy": enemy},
+        **{name: getattr(model, name) for name in _CACHED_FIELDS},
+    }
+
+
+def test_intel_sections_recompute_only_when_their_inputs_change() -> None:
+    api = _FakeIntelAPI()
+    service = IntelService(api)  # type: ignore[arg-type]
+
+    def build_and_check():
+        model = service.get_intel(force=True)
+        reference = IntelService(api).get_intel(force=True)  # type: ignore[arg-type]
+        assert _comparable(model) == _comparable(reference)
+        return model
+
+    first = build_and_check()
+
+    # Only economy numbers change: every graph section is reused.
+    api.base_info = PlayerBaseInfo(Cash=1500, Resources=260, Power=10, PowerDrained=20, PowerProvided=30)
+    second = build_and_check()
+    assert second.economy["cash"] == 1500
+    assert second.map_control is first.map_control
+    assert second.actors_actions is first.actors_actions
+    stats = service.section_stats()
+    assert all(entry["misses"] == 1 and entry["hits"] == 1 for entry in stats.values()), stats
+
+    # An enemy moves: enemy-dependent sections recompute, my-side and map sections do not.
+    api.enemy_actors[1] = Actor(actor_id=91, type="步兵", faction="敌人", position=Location(12, 12), hppercent=40)
+    third = build_and_check()
+    assert third.battle["threats_to_base"][0]["id"] == "91"
+    assert third.map_control is first.map_control
+    assert third.forces["my"] is first.forces["my"]
+    stats = service.section_stats()
+    assert stats["threats"]["misses"] == 2 and stats["opportunities"]["misses"] == 2
+    assert stats["map_summary"]["misses"] == 1 and stats["tech"]["misses"] == 1
+
+    # A fresh map object recomputes the map section only.
+    service.memory.map_cache = None
+    api.map = api.make_map(explored_upto=20)
+    fourth = build_and_check()
+    assert fourth.map_control["explored_ratio"] == 0.5
+    stats = service.section_stats()
+    assert stats["map_summary"]["misses"] == 2 and stats["threats"]["misses"] == 2
+    assert stats["tech"]["hit_rate"] == 0.75
+    print("  PASS: intel_sections_recompute_only_when_their_inputs_change")
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, *sys.argv[1:]]))
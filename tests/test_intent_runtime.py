@@ -0,0 +1,167 @@
+"""Tests for the portable intent model runtime."""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nlu_pipeline.runtime import PortableIntentModel, binary_artifact_path
+
+
+def _dict_scores(model: PortableIntentModel, text: str) -> list[float]:
+    grams = model._ngrams(text)
+    scores = []
+    for label in model.labels:
+        s = float(model.class_log_prior.get(label, -100.0))
+        tok_prob = model.token_log_prob.get(label, {})
+        unk = float(model.unk_log_prob.get(label, -30.0))
+        for g in grams:
+            s += float(tok_prob.get(g, unk))
+        scores.append(s)
+    m = max(scores)
+    exps = [math.exp(v - m) for v in scores]
+    return [v / sum(exps) for v in exps]
+
+
+def test_portable_intent_model_matrix_scoring_matches_dict_lookup() -> None:
+    model = PortableIntentModel(
+        ngram_min=1,
+        ngram_max=2,
+        labels=["attack", "produce", "explore"],
+        class_log_prior={"attack": math.log(0.5), "produce": math.log(0.3)},  # explore falls back to -100
+        token_log_prob={
+            "attack": {"攻": -1.0, "击": -1.2, "攻击": -0.5},
+            "produce": {"造": -0.7, "建造": -0.4, "击": -4.0},
+        },
+        unk_log_prob={"attack": -6.0, "produce": -5.0},
+    )
+    texts = ["攻击", "建造电厂", "", "侦察", "攻击", "Attack  Now"]
+    probs = model.predict_proba(texts)
+    expected = np.array([_dict_scores(model, text) for text in texts])
+    assert probs.shape == (len(texts), 3)
+    assert np.allclose(probs, expected, rtol=0, atol=1e-12)
+    assert model.predict(texts[:2]) == ["attack", "produce"]
+    assert model.predict_one("攻击").intent == "attack"
+    # Repeated texts reuse the cached n-gram encoding.
+    assert model._token_ids("攻击") is model._token_ids("攻击")
+    assert model.predict_proba([]).shape == (0, 3)
+    print("  PASS: portable_intent_model_matrix_scoring_matches_dict_lookup")
+
+
+def test_binary_artifact_roundtrips_and_is_preferred_when_fresh() -> None:
+    tables = {
+        "ngram_min": 1,
+        "ngram_max": 2,
+        "labels": ["attack", "produce"],
+        "class_log_prior": {"attack": -0.7, "produce": -0.7},
+        "token_log_prob": {"attack": {"攻": -1.0, "攻击": -0.5, "x": -9.0}, "produce": {"造": -0.7, "建造": -0.4}},
+        "unk_log_prob": {"attack": -6.0, "produce": -5.0},
+    }
+    texts = ["攻击", "建造电厂", "", "unknown"]
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "intent_model_runtime.json"
+        json_path.write_text(json.dumps({"model": tables}, ensure_ascii=False), encoding="utf-8")
+        from_json = PortableIntentModel.load(json_path)
+        assert not isinstance(from_json.index.log_prob, np.memmap)
+
+        binary_path = from_json.save_binary(binary_artifact_path(json_path))
+        assert binary_path.suffix == ".bin"
+        loaded = PortableIntentModel.load(json_path)
+        assert isinstance(loaded.index.log_prob, np.memmap)
+        assert loaded.index._vocab is None  # vocabulary decoded lazily
+        assert loaded.labels == from_json.labels and loaded.ngram_max == 2
+        assert np.allclose(loaded.predict_proba(texts), from_json.predict_proba(texts), atol=1e-6)
+        assert loaded.token_log_prob["attack"]["攻击"] == -0.5
+        assert PortableIntentModel.load(binary_path).predict(texts) == from_json.predict(texts)
+
+        assert loaded.artifact_path == binary_path
+        assert loaded.source_sha256 == from_json.source_sha256
+
+        # Restoring an older JSON with copy2 keeps its old mtime; the binary built from
+        # the newer JSON must not shadow it.
+        backup_path = Path(tmp) / "backup.json"
+        older = dict(tables, class_log_prior={"attack": -3.0, "produce": -0.1})
+        backup_path.write_text(json.dumps({"model": older}, ensure_ascii=False), encoding="utf-8")
+        stat = binary_path.stat()
+        os.utime(backup_path, (stat.st_atime - 100, stat.st_mtime - 100))
+        shutil.copy2(backup_path, json_path)
+        assert json_path.stat().st_mtime < binary_path.stat().st_mtime
+        restored = PortableIntentModel.load(json_path)
+        assert not isinstance(restored.index.log_prob, np.memmap)
+        assert restored.artifact_path == json_path
+        assert restored.class_log_prior["attack"] == -3.0
+
+        # Binaries without a recorded source hash are never trusted for a JSON path.
+        from_json.source_sha256 = None
+        from_json.save_binary(binary_path)
+        assert PortableIntentModel.load(json_path).artifact_path == json_path
+    print("  PASS: binary_artifact_roundtrips_and_is_preferred_when_fresh")
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__(logging.INFO)
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+def test_gateway_and_router_log_the_artifact_actually_loaded() -> None:
+    from adjutant import runtime_nlu
+    from agents import nlu_gateway
+    from unit_registry import UnitRegistry
+
+    tables = {
+        "ngram_min": 1,
+        "ngram_max": 1,
+        "labels": ["attack"],
+        "class_log_prior": {"attack": 0.0},
+        "token_log_prob": {"attack": {"攻": -1.0}},
+        "unk_log_prob": {"attack": -6.0},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "intent_model_runtime.json"
+        json_path.write_text(json.dumps({"model": tables}), encoding="utf-8")
+        binary_path = PortableIntentModel.load_json(json_path).save_binary(binary_artifact_path(json_path))
+        missing_config = Path(tmp) / "missing.yaml"
+
+        handler = _ListHandler()
+        loggers = [nlu_gateway.logger, runtime_nlu.logger]
+        levels = [log.level for log in loggers]
+        for log in loggers:
+            log.addHandler(handler)
+            log.setLevel(logging.INFO)
+        try:
+            gateway = nlu_gateway.Phase2NLUGateway(
+                name="t", config_path=str(missing_config), runtime_model_path=str(json_path)
+            )
+            router = runtime_nlu.RuntimeNLURouter(
+                unit_registry=UnitRegistry([]), config_path=missing_config, model_path=json_path
+            )
+        finally:
+            for log, level in zip(loggers, levels):
+                log.removeHandler(handler)
+                log.setLevel(level)
+
+        assert gateway.model.artifact_path == binary_path
+        assert router.model is not None and router.model.artifact_path == binary_path
+        loaded_lines = [message for message in handler.messages if "runtime model loaded" in message]
+        assert len(loaded_lines) == 2
+        assert all(f"artifact={binary_path}" in line for line in loaded_lines)
+    print("  PASS: gateway_and_router_log_the_artifact_actually_loaded")
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, *sys.argv[1:]]))
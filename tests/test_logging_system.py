@@ -124,6 +124,40 @@ def test_log_records_from_and_tail_records() -> None:
     assert logging_system.tail_records(component="kernel", limit=1)[0].message == "event-4"
 
 
+def test_log_store_ring_buffer_evicts_and_keeps_offsets_and_indexes() -> None:
+    store = logging_system.LogStore(capacity=4)
+    for index in range(6):
+        store.add(
+            component="kernel" if index % 2 else "expert",
+            level="INFO",
+            message=f"event-{index}",
+            event=f"e{index % 3}",
+            data={"task_id": "t_a" if index < 3 else "t_b"},
+            timestamp=100.0 + index,
+        )
+
+    assert len(store) == 4
+    assert store.first_offset() == 2
+    assert [record.message for record in store.query()] == ["event-2", "event-3", "event-4", "event-5"]
+    assert [record.message for record in store.query(component="kernel")] == ["event-3", "event-5"]
+    assert [record.message for record in store.query(event="e0")] == ["event-3"]
+    assert [record.message for record in store.query(task_id="t_a")] == ["event-2"]
+    assert [record.message for record in store.tail(component="expert", limit=1)] == ["event-4"]
+    assert [record.message for record in store.tail(task_id="t_b", event="e2", limit=5)] == ["event-5"]
+    assert store._by_task.keys() == {"t_a", "t_b"}
+
+    # Evicted offsets resume at the oldest retained record; later offsets stay stable.
+    records, next_offset = store.records_since(0, limit=3)
+    assert [record.message for record in records] == ["event-2", "event-3", "event-4"]
+    assert next_offset == 5
+    assert [record.message for record in store.records_from(5)] == ["event-5"]
+    assert store.records_since(6) == ([], 6)
+
+    store.clear()
+    assert len(store) == 0 and store.first_offset() == 0
+    assert store.query(component="kernel") == []
+
+
 def test_persistent_log_session_writes_all_and_task_files() -> None:
     with tempfile.TemporaryDirectory() as tmpdir:
         session_dir = logging_system.start_persistence_session(
@@ -154,6 +188,30 @@ def test_persistent_log_session_writes_all_and_task_files() -> None:
     assert json.loads(task_lines[0])["data"]["task_id"] == "t_1"
 
 
+def test_persistent_log_session_batches_writes_off_the_logging_thread() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        session_dir = logging_system.start_persistence_session(tmpdir, session_name="batched-session")
+        logger = logging_system.get_logger("kernel")
+        for index in range(50):
+            logger.info(f"tick {index}", event="tick", task_id=f"t_{index % 2}")
+
+        # Live readers flush the active session before reading.
+        replay = logging_system.read_task_replay_records("t_1", latest_base_dir=None)
+        assert [item["message"] for item in replay[:2]] == ["tick 1", "tick 3"]
+        assert len(replay) == 25
+
+        logger.info("after flush", event="tick")
+        logging_system.flush_persistence_session()
+        all_lines = (session_dir / "all.jsonl").read_text(encoding="utf-8").strip().splitlines()
+        assert len(all_lines) == 51
+        assert json.loads(all_lines[-1])["message"] == "after flush"
+        logging_system.stop_persistence_session()
+
+        session_meta = json.loads((session_dir / "session.json").read_text(encoding="utf-8"))
+    assert session_meta["record_count"] == 51
+    assert session_meta["task_counts"] == {"t_0": 25, "t_1": 25}
+
+
 def test_persistent_log_session_persists_world_health_summary() -> None:
     with tempfile.TemporaryDirectory() as tmpdir:
         session_dir = logging_system.start_persistence_session(tmpdir, session_name="health-session")
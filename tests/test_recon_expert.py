@@ -9,7 +9,8 @@ import pytest
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models import JobStatus, ResourceKind, SignalKind, ReconJobConfig
-from experts.recon import ReconExpert, ReconJob, _ScoutState, _is_explored_cell, _bresenham_pts, _unexplored_ratio
+from experts.recon import ReconExpert, ReconJob, _ScoutState
+from openra_api.frontier import FrontierGrid, bresenham_cells, frontier_grid
 
 
 class MockGameAPI:
@@ -97,45 +98,89 @@ def make_config(**overrides) -> ReconJobConfig:
 # -----------------------------------------------------------------------
 
 def test_grid_helpers_is_explored_cell() -> None:
-    """_is_explored_cell correctly indexes into row-major and col-major grids."""
+    """FrontierGrid.is_explored correctly indexes into row-major and col-major grids."""
     # Row-major: exp[y][x]
     exp_rm = [[False, False, True], [True, True, False]]  # h=2, w=3
-    assert not _is_explored_cell(exp_rm, 0, 0, 3, 2, "row_major")
-    assert _is_explored_cell(exp_rm, 2, 0, 3, 2, "row_major")   # exp_rm[0][2]=True
-    assert _is_explored_cell(exp_rm, 0, 1, 3, 2, "row_major")   # exp_rm[1][0]=True
+    grid = FrontierGrid(exp_rm, 3, 2)
+    assert not grid.is_explored(0, 0, "row_major")
+    assert grid.is_explored(2, 0, "row_major")   # exp_rm[0][2]=True
+    assert grid.is_explored(0, 1, "row_major")   # exp_rm[1][0]=True
+
+    # Col-major: exp[x][y]
+    exp_cm = [[exp_rm[y][x] for y in range(2)] for x in range(3)]
+    assert FrontierGrid(exp_cm, 3, 2).is_explored(2, 0, "col_major")
 
     # Out-of-bounds returns False
-    assert not _is_explored_cell(exp_rm, -1, 0, 3, 2, "row_major")
-    assert not _is_explored_cell(exp_rm, 0, 5, 3, 2, "row_major")
+    assert not grid.is_explored(-1, 0, "row_major")
+    assert not grid.is_explored(0, 5, "row_major")
     print("  PASS: grid_helpers_is_explored_cell")
 
 
 def test_grid_helpers_bresenham() -> None:
-    """_bresenham_pts includes start, end, and intermediate cells."""
-    pts = _bresenham_pts(0, 0, 3, 0)
+    """bresenham_cells includes start, end, and intermediate cells."""
+    pts = bresenham_cells(0, 0, 3, 0)
     assert pts == [(0, 0), (1, 0), (2, 0), (3, 0)]
-    pts_diag = _bresenham_pts(0, 0, 2, 2)
+    pts_diag = bresenham_cells(0, 0, 2, 2)
     assert (0, 0) in pts_diag
     assert (2, 2) in pts_diag
     print("  PASS: grid_helpers_bresenham")
 
 
 def test_grid_helpers_unexplored_ratio() -> None:
-    """_unexplored_ratio returns fraction of unexplored cells on the path."""
+    """FrontierGrid.unexplored_ratio returns fraction of unexplored cells on the path."""
     w, h = 10, 10
     # Row-major grid: all explored
     exp_all = [[True] * w for _ in range(h)]
-    ratio_all = _unexplored_ratio(exp_all, w, h, "row_major", 0, (0, 0), (5, 0))
+    ratio_all = FrontierGrid(exp_all, w, h).unexplored_ratio("row_major", 0, (0, 0), (5, 0))
     assert ratio_all == 0.0
 
     # All unexplored
     exp_none = [[False] * w for _ in range(h)]
-    ratio_none = _unexplored_ratio(exp_none, w, h, "row_major", 0, (0, 0), (5, 0))
+    ratio_none = FrontierGrid(exp_none, w, h).unexplored_ratio("row_major", 0, (0, 0), (5, 0))
     assert ratio_none == 1.0
 
     print("  PASS: grid_helpers_unexplored_ratio")
 
 
+def test_frontier_grid_blocks_match_cell_scan() -> None:
+    """FrontierGrid block counts equal the per-cell scan for both layouts and are shared per grid."""
+    w, h = 21, 13
+    exp_rm = _make_is_explored(w, h, lambda x, y: (x * 7 + y * 3) % 5 < 2 or x < 4)
+    exp_cm = [[exp_rm[y][x] for y in range(h)] for x in range(w)]
+
+    for exp, layout in ((exp_rm, "row_major"), (exp_cm, "col_major")):
+        grid = FrontierGrid(exp, w, h)
+        expected_frontier: dict[tuple[int, int], int] = {}
+        expected_unexplored: dict[tuple[int, int], int] = {}
+        for x in range(w):
+            for y in range(h):
+                if grid.is_explored(x, y, layout):
+                    continue
+                key = (x // 8 * 8, y // 8 * 8)
+                expected_unexplored[key] = expected_unexplored.get(key, 0) + 1
+                if any(
+                    grid.is_explored(nx, ny, layout)
+                    for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1))
+                ):
+                    expected_frontier[key] = expected_frontier.get(key, 0) + 1
+        frontier = grid.blocks(layout, "frontier")
+        assert {(bx, by): c for bx, by, c in frontier} == expected_frontier
+        assert [(bx, by) for bx, by, _ in frontier] == sorted(expected_frontier, key=lambda k: (k[1], k[0]))
+        assert {(bx, by): c for bx, by, c in grid.blocks(layout, "unexplored")} == expected_unexplored
+        path = bresenham_cells(0, 0, 20, 12)[1:]
+        unexplored = sum(not grid.is_explored(x, y, layout) for x, y in path)
+        assert grid.unexplored_ratio(layout, 0, (0, 0), (20, 12)) == unexplored / len(path)
+
+    # Ragged / missing cells count as unexplored.
+    ragged = FrontierGrid([[True, True], [True]], 2, 3)
+    assert ragged.is_explored(0, 1, "row_major") and not ragged.is_explored(1, 1, "row_major")
+    assert not ragged.is_explored(0, 2, "row_major")
+
+    assert frontier_grid(exp_rm, w, h) is frontier_grid(exp_rm, w, h)
+    assert frontier_grid(exp_cm, w, h) is not frontier_grid(exp_rm, w, h)
+    print("  PASS: frontier_grid_blocks_match_cell_scan")
+
+
 # -----------------------------------------------------------------------
 # ReconExpert factory
 # -----------------------------------------------------------------------
@@ -265,6 +310,33 @@ def test_recon_job_random_ray_targets_unexplored_area() -> None:
     print(f"  PASS: recon_job_random_ray_targets_unexplored_area (target=({x},{y}))")
 
 
+def test_recon_job_uses_published_grid_geometry() -> None:
+    """Origin/layout published on map_raw win over per-pick probing."""
+    world = MockWorldModel()
+    W, H = 40, 20
+    world.map_info = {
+        "width": W, "height": H,
+        "explored_pct": 0.5, "visible_pct": 0.3,
+        "is_explored": _make_is_explored(W, H, lambda x, y: x < 10),
+    }
+    job = ReconJob(
+        job_id="j1",
+        task_id="t1",
+        config=make_config(),
+        signal_callback=lambda _s: None,
+        game_api=MockGameAPI(),
+        world_model=world,
+    )
+    grid = job._frontier_grid()
+    assert job._grid_geometry(grid, (8, 10)) == (0, "row_major")
+
+    world.map_info = dict(world.map_info, grid_origin=1, grid_layout="col_major")
+    job._cached_grid = None
+    grid = job._frontier_grid()
+    assert job._grid_geometry(grid, (8, 10)) == (1, "col_major")
+    print("  PASS: recon_job_uses_published_grid_geometry")
+
+
 def test_recon_job_keeps_same_destination_until_arrival() -> None:
     """Scout holds the same target across ticks until it arrives."""
     api = MockGameAPI()
@@ -0,0 +1,200 @@
+"""Tests for the tactical core actor feeds and its persistent TacticalClient."""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openra_api.models import Actor, Location, PlayerBaseInfo
+from tactical_core.client import TacticalClient
+from tactical_core.entity_manager import EntityManager
+from tactical_core.feed import WorldModelActorFeed
+from tests.test_world_model import Frame, MockWorldSource, make_map
+from world_model import WorldModel
+
+
+def _frame(tank_hp: int) -> Frame:
+    return Frame(
+        self_actors=[
+            Actor(actor_id=1, type="重型坦克", faction="自己", position=Location(10, 12), hppercent=tank_hp),
+        ],
+        enemy_actors=[
+            Actor(actor_id=90, type="步兵", faction="敌人", position=Location(-3, 40), hppercent=50),
+        ],
+        economy=PlayerBaseInfo(Cash=1000, Resources=0, Power=0, PowerDrained=0, PowerProvided=0),
+        map_info=make_map(0.5, 0.25),
+        queues={},
+    )
+
+
+class _CountingWorldModel(WorldModel):
+    def __init__(self, source) -> None:
+        super().__init__(source)
+        self.view_queries = 0
+
+    def query_view(self, query_type, params=None):
+        self.view_queries += 1
+        return super().query_view(query_type, params)
+
+
+def test_world_model_feed_waits_for_first_refresh_and_caches_per_actor_generation() -> None:
+    source = MockWorldSource([_frame(100), _frame(40)])
+    world = _CountingWorldModel(source)
+    feed = WorldModelActorFeed(world)
+
+    # WorldState carries a timestamp before any refresh; the feed must still wait.
+    assert feed.snapshot() is None
+    assert world.view_queries == 0
+
+    world.refresh(now=100.0, force=True)
+    allies, enemies = feed.snapshot()
+    assert [actor["id"] for actor in allies] == [1]
+    assert allies[0]["type"] == "重型坦克"
+    assert allies[0]["position"] == {"x": 10, "y": 12}
+    assert set(allies[0]) == {"id", "type", "position", "hp", "maxHp"}
+    assert enemies[0]["id"] == 90
+    assert enemies[0]["position"] == {"x": -3, "y": 40}
+    assert world.view_queries == 2
+
+    # Repeated ticks within one WorldModel snapshot reuse the converted lists.
+    assert feed.snapshot()[0] is allies
+    assert world.view_queries == 2
+
+    source.set_frame(1)
+    world.refresh(now=101.0, force=True)
+    refreshed_allies, _ = feed.snapshot()
+    assert refreshed_allies is not allies
+    assert world.view_queries == 4
+
+    # EntityManager consumes the raw dict shape unchanged.
+    manager = EntityManager(feed)
+    manager.update()
+    assert 1 in manager.allies and 90 in manager.enemies
+    print("  PASS: world_model_feed_waits_for_first_refresh_and_caches_per_actor_generation")
+
+
+class _ScriptedJsonServer:
+    """Accepts one client and answers each batch of ``batch`` requests via ``respond``."""
+
+    def __init__(self, *, batch: int, respond) -> None:
+        self.batch = batch
+        self.respond = respond
+        self.accept_count = 0
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen()
+        self._server.settimeout(2.0)
+        self.port = self._server.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        try:
+            self._server.close()
+        except OSError:
+            pass
+        self._thread.join(timeout=2.0)
+
+    def _serve(self) -> None:
+        try:
+            client, _ = self._server.accept()
+        except OSError:
+            return
+        self.accept_count += 1
+        with client:
+            client.settimeout(2.0)
+            buf = b""
+            requests: list[dict] = []
+            while True:
+                while len(requests) < self.batch:
+                    try:
+                        chunk = client.recv(4096)
+                    except OSError:
+                        return
+                    if not chunk:
+                        return
+                    buf += chunk
+                    while b"\n" in buf:
+                        line, buf = buf.split(b"\n", 1)
+                        if line.strip():
+                            requests.append(json.loads(line))
+                for piece in self.respond(requests[: self.batch]):
+                    client.sendall(piece)
+                    time.sleep(0.005)
+                requests = requests[self.batch:]
+
+
+def _response(request: dict, echo: str) -> dict:
+    return {"status": 1, "requestId": request["requestId"], "data": {"echo": echo}}
+
+
+def test_tactical_client_reassembles_split_frames_and_drops_stale_request_ids() -> None:
+    def respond(requests):
+        stale = {"status": 1, "requestId": "stale-from-timed-out-call", "data": {"echo": "stale"}}
+        frames = [stale] + [_response(request, request["command"]) for request in reversed(requests)]
+        payload = "".join(json.dumps(frame) + "\n" for frame in frames).encode("utf-8")
+        # Split mid-frame so no read lines up with a frame boundary.
+        return [payload[index:index + 7] for index in range(0, len(payload), 7)]
+
+    server = _ScriptedJsonServer(batch=2, respond=respond)
+    client = TacticalClient(port=server.port)
+    try:
+        first = client._send_requests([("move_actor", {}), ("attack", {})])
+        assert [item["data"]["echo"] for item in first] == ["move_actor", "attack"]
+        second = client._send_requests([("query_actor", {}), ("stop", {})])
+        assert [item["data"]["echo"] for item in second] == ["query_actor", "stop"]
+        assert server.accept_count == 1
+        print("  PASS: tactical_client_reassembles_split_frames_and_drops_stale_request_ids")
+    finally:
+        client.close()
+        server.close()
+
+
+def test_tactical_client_matches_responses_without_request_id_in_send_order() -> None:
+    def respond(requests):
+        frames = [{"status": 1, "data": {"echo": request["command"]}} for request in requests]
+        return ["".join(json.dumps(frame) + "\r\n" for frame in frames).encode("utf-8")]
+
+    server = _ScriptedJsonServer(batch=2, respond=respond)
+    client = TacticalClient(port=server.port)
+    try:
+        responses = client._send_requests([("move_actor", {}), ("attack", {})])
+        assert [item["data"]["echo"] for item in responses] == ["move_actor", "attack"]
+        print("  PASS: tactical_client_matches_responses_without_request_id_in_send_order")
+    finally:
+        client.close()
+        server.close()
+
+
+def test_tactical_client_parses_unterminated_reply_on_open_connection() -> None:
+    def respond(requests):
+        # Complete JSON without a trailing newline; the server keeps the socket open.
+        return [json.dumps(_response(request, request["command"]), ensure_ascii=False).encode("utf-8") for request in requests]
+
+    server = _ScriptedJsonServer(batch=1, respond=respond)
+    client = TacticalClient(port=server.port)
+    try:
+        started = time.monotonic()
+        first = client._send_request("query_actor", {})
+        second = client._send_request("move_actor", {})
+        assert first is not None and first["data"]["echo"] == "query_actor"
+        assert second is not None and second["data"]["echo"] == "move_actor"
+        assert time.monotonic() - started < TacticalClient.SOCKET_TIMEOUT
+        assert server.accept_count == 1
+        print("  PASS: tactical_client_parses_unterminated_reply_on_open_connection")
+    finally:
+        client.close()
+        server.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, *sys.argv[1:]]))
@@ -0,0 +1,333 @@
+"""Equivalence tests for the vectorized tactical kernels (threat levels and potential-field moves).
+
+The reference functions below are the per-entity loops that EntityManager and
+PotentialField used before the NumPy rewrite; every batched result must match them.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import random
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tactical_core.constants import UnitCategory
+from tactical_core.entity_manager import EntityManager, THREAT_RADIUS
+from tactical_core.entity_table import EntityTable, GridIndex, masked_argmin
+from tactical_core.potential_field import PotentialField
+
+UNIT_TYPES = ["v2rl", "3tnk", "4tnk", "ftrk", "jeep", "e1", "e3", "harv"]
+
+
+class _StaticFeed:
+    def __init__(self, allies: list[dict], enemies: list[dict]) -> None:
+        self.allies = allies
+        self.enemies = enemies
+
+    def snapshot(self):
+        return self.allies, self.enemies
+
+
+def _raw(actor_id: int, unit_type: str, x: int, y: int, hp: int = 100) -> dict:
+    return {"id": actor_id, "type": unit_type, "position": {"x": x, "y": y}, "hp": hp, "maxHp": 100}
+
+
+def _manager(allies: list[dict], enemies: list[dict]) -> EntityManager:
+    manager = EntityManager(_StaticFeed(allies, enemies))
+    manager.update()
+    return manager
+
+
+# --- Reference loop implementations ---
+
+def _reference_threat(manager: EntityManager) -> dict[int, float]:
+    threats: dict[int, float] = {}
+    for ally in manager.allies.values():
+        if ally.category == UnitCategory.OTHER:
+            continue
+        threat = 0.0
+        ax, ay = ally.position
+        for enemy in manager.enemies.values():
+            ex, ey = enemy.position
+            dist = abs(ax - ex) + abs(ay - ey)
+            if dist > 15:
+                continue
+            base_threat = 10.0
+            if enemy.category == UnitCategory.ARTY:
+                base_threat = 15.0
+            elif enemy.category == UnitCategory.INF_AT and ally.category in (UnitCategory.MBT, UnitCategory.AFV):
+                base_threat = 20.0
+            threat += base_threat / max(1.0, float(dist))
+        threats[ally.actor_id] = threat
+    return threats
+
+
+def _reference_nearest(me, candidates):
+    nearest = None
+    min_dist = 99999.0
+    mx, my = me.position
+    for c in candidates:
+        if not c.is_active:
+            continue
+        dist = abs(c.position[0] - mx) + abs(c.position[1] - my)
+        if dist < min_dist:
+            min_dist = dist
+            nearest = c
+    return nearest
+
+
+def _reference_force(field: PotentialField, me, enemies, allies) -> tuple[float, float]:
+    fx, fy = 0.0, 0.0
+    mx, my = me.position
+
+    def pull(target, weight):
+        nonlocal fx, fy
+        dx, dy = target.position[0] - mx, target.position[1] - my
+        norm = max(abs(dx) + abs(dy), 0.1)
+        fx += (dx / norm) * weight
+        fy += (dy / norm) * weight
+
+    if me.assigned_target_id:
+        target = field.em.get_entity(me.assigned_target_id)
+        if target and target.is_active:
+            dist = abs(target.position[0] - mx) + abs(target.position[1] - my)
+            if dist > field.ranges.get(me.unit_code, 3):
+                pull(target, field.W_ATT_TARGET_LLM)
+
+    if me.category == UnitCategory.AFV:
+        target = _reference_nearest(me, [e for e in enemies if e.category == UnitCategory.ARTY])
+        if target:
+            pull(target, field.W_ATT_HV_ARTY)
+
+    if me.category == UnitCategory.INF_MEAT:
+        target = _reference_nearest(me, [e for e in enemies if e.category in (UnitCategory.ARTY, UnitCategory.INF_AT)])
+        if target:
+            pull(target, field.W_ATT_FODDER_PRIORITY)
+        else:
+            target = _reference_nearest(me, enemies)
+            if target:
+                pull(target, field.W_ATT_FODDER)
+
+    if me.category == UnitCategory.MBT:
+        my_range = field.ranges.get(me.unit_code, 4.0)
+        candidates = []
+        for e in enemies:
+            if e.category in (UnitCategory.MBT, UnitCategory.ARTY, UnitCategory.AFV) and e.health_ratio < 0.35:
+                dist = math.hypot(mx - e.position[0], my - e.position[1])
+                if my_range < dist < my_range + 4.0:
+                    candidates.append((dist, e))
+        if candidates:
+            candidates.sort(key=lambda item: item[0])
+            pull(candidates[0][1], field.W_ATT_ARMOR_HARVEST)
+
+    if me.category in (UnitCategory.MBT, UnitCategory.AFV):
+        for inf in [e for e in enemies if e.category == UnitCategory.INF_AT]:
+            ex, ey = inf.position
+            dist = abs(ex - mx) + abs(ey - my)
+            if dist < field.DIST_DEATHZONE:
+                weight = field.W_REP_DEATHZONE / (dist + 0.1)
+                fx += (mx - ex) * weight
+                fy += (my - ey) * weight
+
+    infantry = (UnitCategory.INF_MEAT, UnitCategory.INF_AT)
+    if me.category in infantry and field.enable_infantry_spread:
+        for ally in allies:
+            if ally.actor_id == me.actor_id or not ally.is_active or ally.category not in infantry:
+                continue
+            ax, ay = ally.position
+            dist = abs(ax - mx) + abs(ay - my)
+            if dist < field.DIST_FRIENDLY_REP:
+                weight = field.W_REP_FRIENDLY / (dist + 0.1)
+                fx += (mx - ax) * weight
+                fy += (my - ay) * weight
+    return fx, fy
+
+
+def _reference_moves(field: PotentialField, allies) -> dict[int, tuple[str, int, str]]:
+    enemies = list(field.em.enemies.values())
+    moves = {}
+    for ally in allies:
+        if not ally.is_active:
+            continue
+        fx, fy = _reference_force(field, ally, enemies, allies)
+        if abs(fx) < 0.1 and abs(fy) < 0.1:
+            continue
+        direction = field._vector_to_direction(fx, fy)
+        if direction:
+            moves[ally.actor_id] = (direction, 1, "[势场微操]")
+    return moves
+
+
+def _random_battle(rng: random.Random, *, allies: int, enemies: int, span: int) -> tuple[list[dict], list[dict]]:
+    def side(first_id: int, count: int) -> list[dict]:
+        return [
+            _raw(
+                first_id + index,
+                rng.choice(UNIT_TYPES),
+                rng.randint(-span, span),
+                rng.randint(-span, span),
+                hp=rng.choice([10, 30, 34, 35, 60, 100]),
+            )
+            for index in range(count)
+        ]
+
+    return side(1, allies), side(1000, enemies)
+
+
+def _assign_targets(rng: random.Random, manager: EntityManager) -> None:
+    enemy_ids = list(manager.enemies)
+    for ally in manager.allies.values():
+        roll = rng.random()
+        if roll < 0.4 and enemy_ids:
+            ally.assigned_target_id = rng.choice(enemy_ids)
+        elif roll < 0.5:
+            ally.assigned_target_id = 99999  # target no longer known
+    for enemy in manager.enemies.values():
+        if rng.random() < 0.1:
+            enemy.is_active = False
+    manager._rebuild_tables()
+
+
+# --- Kernel edge cases ---
+
+def test_masked_argmin_breaks_ties_toward_first_column_and_flags_empty_rows() -> None:
+    dist = np.array([[3.0, 1.0, 1.0], [2.0, 2.0, 0.5], [1.0, 1.0, 1.0]])
+    mask = np.array([[True, True, True], [True, True, False], [False, False, False]])
+    assert masked_argmin(dist, mask).tolist() == [1, 0, -1]
+    assert masked_argmin(np.zeros((2, 0)), np.zeros((2, 0), dtype=bool)).tolist() == [-1, -1]
+    print("  PASS: masked_argmin_breaks_ties_toward_first_column_and_flags_empty_rows")
+
+
+def test_grid_pairs_within_matches_brute_force_including_radius_boundaries() -> None:
+    rng = np.random.default_rng(7)
+    points = rng.integers(-40, 40, size=(150, 2)).astype(np.float64)
+    query = rng.integers(-40, 40, size=(60, 2)).astype(np.float64)
+    for cell_size in (4, 10, 16):
+        grid = GridIndex(points, cell_size)
+        for radius in (0.0, 2.0, 5.0, 15.0):
+            for strict in (False, True):
+                qi, pi, dist = grid.pairs_within(query, radius, strict=strict)
+                brute = np.abs(query[:, None, :] - points[None, :, :]).sum(axis=2)
+                hits = brute < radius if strict else brute <= radius
+                expected = {(int(q), int(p)) for q, p in zip(*np.nonzero(hits))}
+                assert {(int(q), int(p)) for q, p in zip(qi, pi)} == expected
+                assert np.array_equal(dist, brute[qi, pi])
+
+    # Exactly on the radius: kept when inclusive, dropped when strict (also across negative cells).
+    grid = GridIndex(np.array([[-3.0, -2.0], [0.0, 5.0]]), 4)
+    origin = np.array([[0.0, 0.0]])
+    assert sorted(grid.pairs_within(origin, 5.0)[1].tolist()) == [0, 1]
+    assert grid.pairs_within(origin, 5.0, strict=True)[1].tolist() == []
+    empty = GridIndex(np.zeros((0, 2)), 4)
+    assert all(part.size == 0 for part in empty.pairs_within(origin, 5.0))
+    assert all(part.size == 0 for part in grid.pairs_within(np.zeros((0, 2)), 5.0))
+    print("  PASS: grid_pairs_within_matches_brute_force_including_radius_boundaries")
+
+
+# --- Threat levels ---
+
+def test_threat_levels_match_loop_reference_on_hand_computed_case() -> None:
+    manager = _manager(
+        [_raw(1, "3tnk", 0, 0), _raw(2, "e1", -10, -10), _raw(3, "harv", 0, 0)],
+        [
+            _raw(100, "e3", 0, -15),  # exactly on the radius: 20 / 15 against armor
+            _raw(101, "v2rl", 0, 1),  # distance 1: 15 / 1
+            _raw(102, "e1", 16, 0),  # just outside the radius
+            _raw(103, "e3", -10, -10),  # stacked on the infantry: 10 / max(1, 0)
+        ],
+    )
+    assert manager.allies[1].threat_level == pytest.approx(20.0 / 15 + 15.0)
+    assert manager.allies[2].threat_level == pytest.approx(10.0 + 10.0 / 15)
+    assert manager.allies[3].threat_level == 0.0  # OTHER units are never assessed
+    assert THREAT_RADIUS == 15
+    print("  PASS: threat_levels_match_loop_reference_on_hand_computed_case")
+
+
+def test_threat_levels_are_zero_without_enemies_and_skip_without_allies() -> None:
+    manager = _manager([_raw(1, "3tnk", -5, -5), _raw(2, "e1", 3, 3)], [])
+    assert [ally.threat_level for ally in manager.allies.values()] == [0.0, 0.0]
+    manager = _manager([], [_raw(100, "e3", 0, 0)])
+    assert manager.allies == {} and len(manager.ally_table) == 0
+    print("  PASS: threat_levels_are_zero_without_enemies_and_skip_without_allies")
+
+
+# --- Potential field ---
+
+def test_potential_field_handles_empty_tables() -> None:
+    manager = _manager([_raw(1, "e1", 0, 0), _raw(2, "3tnk", 4, 4)], [])
+    manager.allies[2].assigned_target_id = 12345
+    field = PotentialField(manager)
+    assert field.calculate_moves(list(manager.allies.values())) == {}
+    fx, fy = field._compute_forces(EntityTable([]))
+    assert fx.shape == (0,) and fy.shape == (0,)
+
+    manager = _manager([], [_raw(100, "e3", 0, 0)])
+    assert PotentialField(manager).calculate_moves([]) == {}
+    print("  PASS: potential_field_handles_empty_tables")
+
+
+def test_potential_field_ties_pick_first_enemy_like_the_loop() -> None:
+    # Two ARTY targets equidistant from the AFV; the first one listed wins, so it pulls east.
+    manager = _manager(
+        [_raw(1, "ftrk", 0, 0)],
+        [_raw(100, "v2rl", 3, 0), _raw(101, "v2rl", 0, -3)],
+    )
+    field = PotentialField(manager)
+    assert field.calculate_moves(list(manager.allies.values())) == {1: ("东", 1, "[势场微操]")}
+    assert _reference_moves(field, list(manager.allies.values())) == {1: ("东", 1, "[势场微操]")}
+    print("  PASS: potential_field_ties_pick_first_enemy_like_the_loop")
+
+
+def test_potential_field_death_zone_is_strict_at_its_radius() -> None:
+    manager = _manager(
+        [_raw(1, "3tnk", 0, 0), _raw(2, "3tnk", 20, 20)],
+        [_raw(100, "e3", 5, 0), _raw(101, "e3", 20, 16)],
+    )
+    field = PotentialField(manager)
+    fx, fy = field._compute_forces(manager.ally_table)
+    assert fx[0] == 0.0 and fy[0] == 0.0  # distance 5 sits on the boundary: no repulsion
+    assert fy[1] == pytest.approx(4 * field.W_REP_DEATHZONE / 4.1)
+    print("  PASS: potential_field_death_zone_is_strict_at_its_radius")
+
+
+@pytest.mark.parametrize("spread", [False, True])
+def test_vectorized_threat_and_moves_match_loop_reference_on_random_battles(spread: bool) -> None:
+    rng = random.Random(2024 + spread)
+    for battle in range(30):
+        allies, enemies = _random_battle(
+            rng,
+            allies=rng.randint(0, 40),
+            enemies=rng.randint(0, 40),
+            span=rng.choice([6, 15, 40]),
+        )
+        manager = _manager(allies, enemies)
+        _assign_targets(rng, manager)
+        manager._calculate_threat_levels()
+
+        expected_threat = _reference_threat(manager)
+        for actor_id, value in expected_threat.items():
+            assert manager.allies[actor_id].threat_level == pytest.approx(value, rel=1e-12, abs=1e-12), battle
+
+        field = PotentialField(manager)
+        field.enable_infantry_spread = spread
+        ally_list = list(manager.allies.values())
+        table = EntityTable(ally_list)
+        fx, fy = field._compute_forces(table)
+        enemy_list = list(manager.enemies.values())
+        for row, ally in enumerate(ally_list):
+            if not ally.is_active:
+                continue
+            ref_fx, ref_fy = _reference_force(field, ally, enemy_list, ally_list)
+            assert fx[row] == pytest.approx(ref_fx, abs=1e-9), (battle, ally.actor_id)
+            assert fy[row] == pytest.approx(ref_fy, abs=1e-9), (battle, ally.actor_id)
+        assert field.calculate_moves(ally_list) == _reference_moves(field, ally_list), battle
+    print(f"  PASS: vectorized_threat_and_moves_match_loop_reference_on_random_battles[spread={spread}]")
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, *sys.argv[1:]]))
@@ -5,6 +5,7 @@ Covers:
   - voice.tts.synthesize_sync: success path (mocked SDK), missing key error, SDK error
   - WSServer /api/asr HTTP handler: happy path, no audio, ASR failure
   - WSServer /api/tts HTTP handler: happy path, missing text, TTS failure
+  - voice.streaming session + WSServer streaming voice channel (fake recognizer)
 """
 
 from __future__ import annotations
@@ -406,6 +407,131 @@ def test_ws_tts_handler_tts_error():
     print("  PASS: ws_tts_handler_tts_error")
 
 
+# ===== streaming voice tests =====
+
+class _FakeWS:
+    def __init__(self) -> None:
+        self.sent: list[dict] = []
+
+    async def send_str(self, data: str) -> None:
+        self.sent.append(json.loads(data))
+
+
+class _RecordingInbound:
+    def __init__(self) -> None:
+        self.commands: list[tuple[str, str]] = []
+
+    async def on_command_submit(self, text: str, client_id: str) -> None:
+        self.commands.append((text, client_id))
+
+
+def test_streaming_session_delivers_partials_before_final():
+    from voice.streaming import FakeStreamingRecognizer, StreamingASRSession
+
+    seen: list[tuple[str, bool]] = []
+
+    async def on_transcript(text, sentence_end):
+        seen.append((text, sentence_end))
+
+    async def run():
+        recognizer = FakeStreamingRecognizer()
+        session = StreamingASRSession(recognizer, on_transcript)
+        await session.start()
+        for frame in ("造", "电厂", "\n", "进攻"):
+            await session.feed(frame.encode("utf-8"))
+        text = await session.finish()
+        assert text == "造电厂 进攻"
+        assert recognizer.stopped and session.frames == 4
+        assert not session.active
+
+    asyncio.run(run())
+    assert seen == [
+        ("造", False),
+        ("造电厂", False),
+        ("造电厂", True),
+        ("造电厂 进攻", False),
+        ("造电厂 进攻", True),
+    ]
+    print("  PASS: streaming_session_delivers_partials_before_final")
+
+
+def test_ws_voice_stream_pushes_partials_and_submits_final():
+    from voice.streaming import FakeStreamingRecognizer
+    from ws_server.server import WSServer, WSServerConfig
+
+    inbound = _RecordingInbound()
+    opened: list[tuple[str, int]] = []
+
+    def factory(audio_format, sample_rate):
+        opened.append((audio_format, sample_rate))
+        return FakeStreamingRecognizer()
+
+    server = WSServer(
+        config=WSServerConfig(host="127.0.0.1", port=0, voice_enabled=True),
+        inbound_handler=inbound,
+        asr_stream_factory=factory,
+    )
+    ws = _FakeWS()
+    server._clients["client_1"] = ws
+
+    async def run():
+        await server._handle_inbound({"type": "voice_start", "submit": True}, "client_1")
+        for frame in ("全军", "进攻"):
+            await server._handle_voice_frame(frame.encode("utf-8"), "client_1")
+        await server._handle_inbound({"type": "voice_stop"}, "client_1")
+
+    asyncio.run(run())
+    assert opened == [("pcm", 16000)]
+    kinds = [(m["type"], m["data"]) for m in ws.sent]
+    assert kinds == [
+        ("asr_partial", {"text": "全军", "sentence_end": False}),
+        ("asr_partial", {"text": "全军进攻", "sentence_end": False}),
+        ("asr_partial", {"text": "全军进攻", "sentence_end": True}),
+        ("asr_final", {"ok": True, "text": "全军进攻", "submitted": True}),
+    ]
+    assert inbound.commands == [("全军进攻", "client_1")]
+    assert "client_1" not in server._voice_streams
+    print("  PASS: ws_voice_stream_pushes_partials_and_submits_final")
+
+
+def test_ws_voice_stream_rejects_frames_without_stream_and_when_disabled():
+    from voice.streaming import FakeStreamingRecognizer
+    from ws_server.server import WSServer, WSServerConfig
+
+    recognizers: list[FakeStreamingRecognizer] = []
+
+    def factory(audio_format, sample_rate):
+        recognizers.append(FakeStreamingRecognizer())
+        return recognizers[-1]
+
+    disabled = WSServer(
+        config=WSServerConfig(host="127.0.0.1", port=0, voice_enabled=False),
+        asr_stream_factory=factory,
+    )
+    enabled = WSServer(
+        config=WSServerConfig(host="127.0.0.1", port=0, voice_enabled=True),
+        asr_stream_factory=factory,
+    )
+    ws_off, ws_on = _FakeWS(), _FakeWS()
+    disabled._clients["c"] = ws_off
+    enabled._clients["c"] = ws_on
+
+    async def run():
+        await disabled._handle_inbound({"type": "voice_start"}, "c")
+        await enabled._handle_voice_frame(b"abc", "c")
+        await enabled._handle_inbound({"type": "voice_start", "format": "opus", "sample_rate": 8000}, "c")
+        await enabled._handle_voice_frame("撤退".encode("utf-8"), "c")
+        await enabled._handle_inbound({"type": "voice_cancel"}, "c")
+        await enabled._handle_inbound({"type": "voice_stop"}, "c")
+
+    asyncio.run(run())
+    assert ws_off.sent[0]["code"] == "VOICE_UNAVAILABLE"
+    assert [m.get("inbound_type") for m in ws_on.sent if m["type"] == "error"] == ["voice_frame", "voice_stop"]
+    assert not any(m["type"] == "asr_final" for m in ws_on.sent)
+    assert len(recognizers) == 1 and recognizers[0].stopped
+    print("  PASS: ws_voice_stream_rejects_frames_without_stream_and_when_disabled")
+
+
 # --- Run all ---
 
 if __name__ == "__main__":
@@ -12,7 +12,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import benchmark
 import logging_system
 import pytest
-from models import Constraint, ConstraintEnforcement, EventType
+from models import ActorOwner, Constraint, ConstraintEnforcement, EventType
 from openra_api.game_api import GameAPIError
 from openra_api.models import Actor, Location, MapQueryResult, PlayerBaseInfo
 from world_model import WorldModel
@@ -1518,6 +1518,518 @@ def test_world_summary_and_runtime_facts_expose_structure_power_states() -> None
     assert by_id[2]["disabled_reason"] == "powerdown"
 
 
+class SnapshotGameAPI:
+    """GameAPI stand-in recording which queries a snapshot-backed source issues."""
+
+    def __init__(self, *, supports_snapshot: bool = True) -> None:
+        self.supports_snapshot = supports_snapshot
+        self.calls: list[str] = []
+        frame = make_frames()[0]
+        self.self_actors = frame.self_actors
+        self.enemy_actors = frame.enemy_actors
+        self.economy = frame.economy
+
+    def world_snapshot(self, queue_types, *, include_actors=True, include_base_info=True):
+        from openra_api.models import FrozenActor, WorldSnapshotResult
+
+        self.calls.append("world_snapshot")
+        if not self.supports_snapshot:
+            raise GameAPIError("INVALID_COMMAND", "未知的命令")
+        return WorldSnapshotResult(
+            SelfActors=list(self.self_actors) if include_actors else [],
+            EnemyActors=list(self.enemy_actors) if include_actors else [],
+            FrozenActors=[FrozenActor("矿场", "敌人", Location(500, 500))] if include_actors else [],
+            BaseInfo=self.economy if include_base_info else None,
+            ProductionQueues={
+                queue_type: {
+                    "queue_type": queue_type,
+                    "queue_items": [{"name": "2tnk", "chineseName": "重型坦克", "done": False}] if queue_type == "Vehicle" else [],
+                    "has_ready_item": False,
+                }
+                for queue_type in queue_types
+            },
+        )
+
+    def query_actor(self, params):
+        self.calls.append("query_actor")
+        return list(self.self_actors) if params.faction == "自己" else list(self.enemy_actors)
+
+    def query_actorwithfrozen(self, params):
+        self.calls.append("query_actorwithfrozen")
+        return list(self.enemy_actors), []
+
+    def player_base_info_query(self):
+        self.calls.append("player_baseinfo_query")
+        return self.economy
+
+    def query_production_queue(self, queue_type):
+        self.calls.append("query_production_queue")
+        return {"queue_type": queue_type, "queue_items": [], "has_ready_item": False}
+
+    def map_query(self, fields=None):
+        self.calls.append("map_query")
+        return make_map(explored=0.5, visible=0.25)
+
+
+def test_snapshot_world_source_refreshes_actors_and_economy_in_one_round_trip() -> None:
+    from world_model import GameAPISnapshotWorldSource
+
+    api = SnapshotGameAPI()
+    world = WorldModel(GameAPISnapshotWorldSource(api))
+
+    world.refresh(now=100.0, force=True)
+
+    assert api.calls == ["world_snapshot", "map_query"]
+    assert world.state.self_ids == {1, 2, 3}
+    assert world.state.enemy_ids == {100, 101}
+    assert world.state.economy["cash"] == 2500
+    assert world.state.production_queues["Vehicle"]["items"][0]["display_name"] == "重型坦克"
+    assert world.state.frozen_enemies == [{"type": "矿场", "faction": "敌人", "position": [500, 500]}]
+
+    api.calls.clear()
+    world.refresh(now=100.2)
+    assert api.calls == ["world_snapshot"]
+    assert world.last_refresh_layers() == ["actors"]
+    print("  PASS: snapshot_world_source_refreshes_actors_and_economy_in_one_round_trip")
+
+
+def test_snapshot_world_source_falls_back_when_bridge_lacks_command() -> None:
+    from world_model import GameAPISnapshotWorldSource
+
+    api = SnapshotGameAPI(supports_snapshot=False)
+    source = GameAPISnapshotWorldSource(api)
+    world = WorldModel(source)
+
+    world.refresh(now=100.0, force=True)
+    assert source.snapshot_supported is False
+    assert api.calls[0] == "world_snapshot"
+    assert "query_actor" in api.calls
+    assert api.calls.count("query_production_queue") == 5
+    assert world.state.self_ids == {1, 2, 3}
+    assert world.state.stale is False
+
+    api.calls.clear()
+    world.refresh(now=100.2)
+    assert "world_snapshot" not in api.calls
+    print("  PASS: snapshot_world_source_falls_back_when_bridge_lacks_command")
+
+
+def test_snapshot_world_source_failure_marks_layers_stale() -> None:
+    from world_model import GameAPISnapshotWorldSource
+
+    api = SnapshotGameAPI()
+    world = WorldModel(GameAPISnapshotWorldSource(api))
+    world.refresh(now=100.0, force=True)
+
+    def broken_snapshot(*_args, **_kwargs):
+        api.calls.append("world_snapshot")
+        raise GameAPIError("QUERY_EXECUTION_ERROR", "查询执行失败")
+
+    api.world_snapshot = broken_snapshot  # type: ignore[method-assign]
+    api.calls.clear()
+    world.refresh(now=101.0)
+
+    assert api.calls == ["world_snapshot"]
+    assert world.state.stale is True
+    assert world.state.self_ids == {1, 2, 3}
+    assert "actors:" in (world.refresh_health().get("last_error") or "")
+    print("  PASS: snapshot_world_source_failure_marks_layers_stale")
+
+
+class DeltaWorldSource(MockWorldSource):
+    """Serves queued actor deltas and records the sinceVersion it was asked for."""
+
+    def __init__(self, frames: list[Frame], deltas: list) -> None:
+        super().__init__(frames)
+        self.deltas = deltas
+        self.since_versions: list = []
+
+    def fetch_actor_delta(self, since_version):
+        self.since_versions.append(since_version)
+        return self.deltas.pop(0)
+
+
+def test_actor_delta_refresh_patches_actors_in_place() -> None:
+    from openra_api.models import ActorDeltaResult
+
+    frame = make_frames()[0]
+    full = ActorDeltaResult(
+        Version=10,
+        Full=True,
+        Added=[*frame.self_actors, *frame.enemy_actors],
+        Changed=[],
+        Removed=[],
+        FrozenActors=[],
+    )
+    patch = ActorDeltaResult(
+        Version=11,
+        Full=False,
+        Added=[Actor(actor_id=4, type="步兵", faction="自己", position=Location(12, 12), hppercent=100, activity="Idle")],
+        Changed=[Actor(actor_id=2, type="重坦", faction="自己", position=Location(22, 20), hppercent=60, activity="AttackMove")],
+        Removed=[101],
+        FrozenActors=[],
+    )
+    source = DeltaWorldSource(make_frames(), [full, patch])
+    world = WorldModel(source)
+
+    world.refresh(now=100.0, force=True)
+    assert source.actor_fetches == 0
+    assert world.state.self_ids == {1, 2, 3}
+    assert world.state.enemy_ids == {100, 101}
+    untouched = world.state.actors[1]
+
+    normalized: list[int] = []
+    original_normalize = world._normalize_actor
+
+    def counting_normalize(raw, default_owner, timestamp):
+        normalized.append(raw.actor_id)
+        return original_normalize(raw, default_owner, timestamp)
+
+    world._normalize_actor = counting_normalize  # type: ignore[method-assign]
+    events = world.refresh(now=100.2)
+
+    assert source.since_versions == [None, 10]
+    assert sorted(normalized) == [2, 4]
+    assert world.state.actors[1] is untouched
+    assert world.state.self_ids == {1, 2, 3, 4}
+    assert world.state.enemy_ids == {100}
+    assert world.state.actors[2].hp == 60
+    event_types = {(event.type, event.actor_id) for event in events}
+    assert (EventType.UNIT_DIED, 101) in event_types
+    assert (EventType.UNIT_DAMAGED, 2) in event_types
+    print("  PASS: actor_delta_refresh_patches_actors_in_place")
+
+
+def test_actor_delta_refresh_reads_query_actor_faction_strings() -> None:
+    from openra_api.models import ActorDeltaResult
+
+    frame = make_frames()[0]
+    full = ActorDeltaResult(
+        Version=10,
+        Full=True,
+        Added=[*frame.self_actors, *frame.enemy_actors],
+        Changed=[],
+        Removed=[],
+        FrozenActors=[],
+    )
+    patch = ActorDeltaResult(
+        Version=11,
+        Full=False,
+        Added=[
+            Actor(actor_id=4, type="步兵", faction="己方", position=Location(12, 12), hppercent=100, activity="Idle"),
+            Actor(actor_id=5, type="步兵", faction="友方", position=Location(13, 12), hppercent=100, activity="Idle"),
+            Actor(actor_id=102, type="步兵", faction="敌方", position=Location(60, 60), hppercent=100, activity="Idle"),
+        ],
+        Changed=[],
+        Removed=[],
+        FrozenActors=[],
+    )
+    world = WorldModel(DeltaWorldSource(make_frames(), [full, patch]))
+
+    world.refresh(now=100.0, force=True)
+    world.refresh(now=100.2)
+
+    assert world.state.self_ids == {1, 2, 3, 4, 5}
+    assert world.state.enemy_ids == {100, 101, 102}
+    print("  PASS: actor_delta_refresh_reads_query_actor_faction_strings")
+
+
+def test_actor_delta_refresh_resyncs_after_reset_and_full_reply() -> None:
+    from openra_api.models import ActorDeltaResult
+
+    frame = make_frames()[0]
+    deltas = [
+        ActorDeltaResult(Version=5, Full=True, Added=list(frame.self_actors), Changed=[], Removed=[], FrozenActors=[]),
+        ActorDeltaResult(Version=9, Full=True, Added=list(frame.enemy_actors), Changed=[], Removed=[], FrozenActors=[]),
+        ActorDeltaResult(Version=2, Full=True, Added=list(frame.self_actors), Changed=[], Removed=[], FrozenActors=[]),
+    ]
+    source = DeltaWorldSource(make_frames(), deltas)
+    world = WorldModel(source)
+
+    world.refresh(now=100.0, force=True)
+    world.refresh(now=100.2)
+    # A full reply replaces the layer instead of patching it.
+    assert world.state.self_ids == set()
+    assert world.state.enemy_ids == {100, 101}
+
+    world.reset_snapshot()
+    world.refresh(now=200.0, force=True)
+    assert source.since_versions == [None, 5, None]
+    assert world.state.self_ids == {1, 2, 3}
+    print("  PASS: actor_delta_refresh_resyncs_after_reset_and_full_reply")
+
+
+def test_actor_delta_source_falls_back_when_bridge_lacks_command() -> None:
+    from world_model import GameAPIWorldSource
+
+    api = SnapshotGameAPI()
+
+    def unsupported_delta(_since_version):
+        api.calls.append("query_actor_delta")
+        raise GameAPIError("INVALID_COMMAND", "未知的命令")
+
+    api.query_actor_delta = unsupported_delta  # type: ignore[attr-defined]
+    source = GameAPIWorldSource(api, actor_delta=True)
+    world = WorldModel(source)
+
+    world.refresh(now=100.0, force=True)
+    assert source.actor_delta is False
+    assert api.calls[:3] == ["query_actor_delta", "query_actor", "query_actor"]
+    assert world.state.self_ids == {1, 2, 3}
+    assert world.state.stale is False
+    print("  PASS: actor_delta_source_falls_back_when_bridge_lacks_command")
+
+
+def test_refresh_shares_unchanged_layers_copy_on_write() -> None:
+    from openra_api.models import ActorDeltaResult
+
+    frame = make_frames()[0]
+    deltas = [
+        ActorDeltaResult(Version=1, Full=True, Added=[*frame.self_actors, *frame.enemy_actors], Changed=[], Removed=[], FrozenActors=[]),
+        ActorDeltaResult(Version=2, Full=False, Added=[], Changed=[], Removed=[], FrozenActors=[]),
+        ActorDeltaResult(Version=3, Full=False, Added=[], Changed=[], Removed=[101], FrozenActors=[]),
+    ]
+    source = DeltaWorldSource(make_frames(), deltas)
+    world = WorldModel(source)
+    world.refresh(now=100.0, force=True)
+
+    snapshot = world.state.share()
+    actors_before = world.state.actors
+    actor_generation = world.layer_generation("actors")
+    economy_generation = world.layer_generation("economy")
+    actor_diffs: list[float] = []
+    original_detect = world._detect_actor_events
+
+    def counting_detect(previous, current, timestamp):
+        actor_diffs.append(timestamp)
+        return original_detect(previous, current, timestamp)
+
+    world._detect_actor_events = counting_detect  # type: ignore[method-assign]
+
+    # Empty delta + economy refresh: the actors layer is neither copied nor diffed.
+    world.refresh(now=100.6)
+    assert world.state.actors is actors_before
+    assert world.layer_generation("actors") == actor_generation
+    assert world.layer_generation("economy") == economy_generation + 1
+    assert actor_diffs == []
+
+    events = world.refresh(now=100.8)
+    assert actor_diffs == [100.8]
+    assert world.state.actors is not actors_before
+    assert 101 not in world.state.actors
+    # The shared snapshot still sees the pre-patch layer.
+    assert 101 in snapshot.actors and 101 in snapshot.enemy_ids
+    assert (EventType.UNIT_DIED, 101) in {(event.type, event.actor_id) for event in events}
+
+    world.reset_snapshot()
+    assert world.layer_generation("actors") > actor_generation + 1
+    print("  PASS: refresh_shares_unchanged_layers_copy_on_write")
+
+
+def test_spatial_queries_match_linear_scan() -> None:
+    import random
+    from types import SimpleNamespace
+    from world_model.spatial import SpatialIndex
+
+    rng = random.Random(7)
+    points = [SimpleNamespace(actor_id=i, position=(rng.randint(0, 200), rng.randint(0, 200))) for i in range(300)]
+    index = SpatialIndex(points, cell_size=16)
+    for _ in range(50):
+        center = (rng.uniform(-20, 220), rng.uniform(-20, 220))
+        radius = rng.uniform(0, 90)
+        expected = {p.actor_id for p in points if (p.position[0] - center[0]) ** 2 + (p.position[1] - center[1]) ** 2 <= radius**2}
+        assert {p.actor_id for p in index.within(center, radius)} == expected
+        best = min(points, key=lambda p: ((p.position[0] - center[0]) ** 2 + (p.position[1] - center[1]) ** 2, p.actor_id))
+        assert index.nearest(center) is best
+
+    source = MockWorldSource(make_frames())
+    world = WorldModel(source)
+    world.refresh(now=100.0, force=True)
+    assert [actor.actor_id for actor in world.actors_within((12, 12), 12)] == [1, 2, 3]
+    assert [actor.actor_id for actor in world.actors_within((12, 12), 200, owner="enemy")] == [101]
+    assert world.nearest((90, 90), owner="self").actor_id == 2
+    assert world.nearest((90, 90), owner="self", max_distance=50) is None
+    assert [actor.actor_id for actor in world.find_actors(near=(12, 12), max_distance=5)] == [1, 3]
+
+    source.set_frame(1)
+    world.refresh(now=101.0)
+    # The index follows the refreshed actors layer.
+    assert world.nearest((75, 65), owner="enemy").actor_id == 101
+    print("  PASS: spatial_queries_match_linear_scan")
+
+
+def test_world_summary_and_battlefield_snapshot_are_memoized_until_inputs_change() -> None:
+    source = MockWorldSource(make_frames())
+    world = WorldModel(source)
+    world.refresh(now=100.0, force=True)
+
+    built: list[str] = []
+    original_build = world._build_battlefield_snapshot
+
+    def counting_build():
+        built.append("battlefield")
+        return original_build()
+
+    world._build_battlefield_snapshot = counting_build  # type: ignore[method-assign]
+
+    first = world.world_summary()
+    sections = world._summary_sections()
+    first["military"]["self_units"] = -1  # callers get their own top-level dicts
+    second = world.world_summary()
+    assert second["military"]["self_units"] == 3
+    snapshot = world.battlefield_snapshot()
+    repeat = world.battlefield_snapshot()
+    assert repeat == snapshot and repeat is not snapshot
+    repeat["disposition"] = "mutated"
+    for value in repeat.values():
+        if isinstance(value, (list, dict)):
+            value.clear()
+    assert world.battlefield_snapshot() == snapshot
+    assert world._summary_sections() is sections
+    assert built == ["battlefield"]
+
+    # Binding changes are visible immediately and invalidate the battlefield snapshot only.
+    world.bind_resource("actor:1", "job_1")
+    assert world.world_summary()["military"]["bound_resources"] == 1
+    world.battlefield_snapshot()
+    assert world._summary_sections() is sections
+    assert built == ["battlefield", "battlefield"]
+
+    # A refresh that replaces the actor layer rebuilds both.
+    source.set_frame(1)
+    world.refresh(now=100.2)
+    world.battlefield_snapshot()
+    assert world._summary_sections() is not sections
+    assert len(built) == 3
+    print("  PASS: world_summary_and_battlefield_snapshot_are_memoized_until_inputs_change")
+
+
+def test_actor_counters_track_deltas_like_a_full_rescan() -> None:
+    from openra_api.models import ActorDeltaResult
+    from world_model.counters import ActorCounters
+
+    frame = make_frames()[0]
+    deltas = [
+        ActorDeltaResult(Version=1, Full=True, Added=[*frame.self_actors, *frame.enemy_actors], Changed=[], Removed=[], FrozenActors=[]),
+        ActorDeltaResult(
+            Version=2,
+            Full=False,
+            Added=[
+                Actor(actor_id=5, type="发电厂", faction="自己", position=Location(18, 18), hppercent=100, activity="Idle"),
+                Actor(actor_id=6, type="步兵", faction="自己", position=Location(12, 12), hppercent=100, activity="Idle"),
+            ],
+            Changed=[
+                Actor(
+                    actor_id=3, type="矿场", faction="自己", position=Location(15, 15), hppercent=80, activity="Idle",
+                    is_disabled=True, has_low_power=True,
+                ),
+            ],
+            Removed=[1],
+            FrozenActors=[],
+        ),
+    ]
+    world = WorldModel(DeltaWorldSource(make_frames(), deltas))
+    world.refresh(now=100.0, force=True)
+    before = world.actor_counters().counts()
+    assert before["harvester_count"] == 1 and before["combat_unit_count"] == 1
+
+    world.refresh(now=100.6, force=True)
+    counters = world.actor_counters()
+    rescan = ActorCounters.build(world.state.actors.values())
+    assert counters.counts() == rescan.counts()
+    assert counters.power_state() == rescan.power_state()
+    counts = counters.counts()
+    assert counts["harvester_count"] == 0
+    assert counts["combat_unit_count"] == 2
+    power = counters.power_state()
+    assert power["disabled_structure_count"] == 1
+    assert power["low_power_disabled_structure_count"] == 1
+    assert len(power["disabled_structures"]) == 1
+    # Reads are served from the maintained counters, not a rebuild.
+    assert world.actor_counters() is counters
+    print("  PASS: actor_counters_track_deltas_like_a_full_rescan")
+
+
+def test_query_view_returns_zero_copy_actor_views_matching_query() -> None:
+    import json
+    from world_model import ActorView, query_view
+
+    world = WorldModel(MockWorldSource(make_frames()))
+    world.refresh(now=100.0, force=True)
+
+    for query_type, params in (
+        ("enemy_actors", None),
+        ("my_actors", {"category": "building"}),
+        ("find_actors", {"owner": "self", "can_attack": True}),
+    ):
+        plain = world.query(query_type, params)["actors"]
+        views = world.query_view(query_type, params)["actors"]
+        assert views == plain
+        assert all(isinstance(view, ActorView) for view in views)
+        assert all(view.actor is world.state.actors[view["actor_id"]] for view in views)
+        assert json.dumps([view.to_dict() for view in views]) == json.dumps(plain)
+
+    view = world.query_view("actor_by_id", {"actor_id": 2})["actor"]
+    assert view.position == (20, 20) and view["position"] == [20, 20]
+    assert view.owner is ActorOwner.SELF and view["owner"] == "self"
+    assert view.get("unit_type") is None
+    assert world.query_view("actor_by_id", {"actor_id": 999})["actor"] is None
+    assert world.query_view("economy") == world.query("economy")
+
+    class DictOnlyWorld:
+        def query(self, query_type, params=None):
+            return {"actors": [{"actor_id": 1}]}
+
+    assert query_view(DictOnlyWorld(), "my_actors") == {"actors": [{"actor_id": 1}]}
+    print("  PASS: query_view_returns_zero_copy_actor_views_matching_query")
+
+
+def test_grid_geometry_detected_once_per_map_and_revalidated_on_reset() -> None:
+    width, height = 32, 24
+    # Row-major rows[y][x]; only the south-west corner around our base is explored.
+    explored = [[x < 8 and y > 14 for x in range(width)] for y in range(height)]
+
+    def frame(positions: list[tuple[int, int]]) -> Frame:
+        base = make_frames()[0]
+        return Frame(
+            self_actors=[
+                Actor(actor_id=index + 1, type="矿场", faction="自己", position=Location(x, y), hppercent=100, activity="Idle")
+                for index, (x, y) in enumerate(positions)
+            ],
+            enemy_actors=[],
+            economy=base.economy,
+            map_info=MapQueryResult(
+                MapWidth=width,
+                MapHeight=height,
+                Height=[],
+                IsVisible=[],
+                IsExplored=[list(row) for row in explored],
+                Terrain=[],
+                ResourcesType=[],
+                Resources=[],
+            ),
+            queues={},
+        )
+
+    # Positions on the far edge would make origin detection pick 1-indexed cells.
+    source = MockWorldSource([frame([(3, 20), (5, 18)]), frame([(width, height)])])
+    world = WorldModel(source)
+    world.refresh(now=100.0, force=True)
+    raw = world.query("map_raw")
+    assert (raw["grid_origin"], raw["grid_layout"]) == (0, "row_major")
+
+    source.set_frame(1)
+    world.refresh(now=200.0, force=True)
+    raw = world.query("map_raw")
+    assert raw["is_explored"] is world.state.map_info["is_explored"]
+    assert (raw["grid_origin"], raw["grid_layout"]) == (0, "row_major")
+
+    world.reset_snapshot()
+    world.refresh(now=300.0, force=True)
+    assert world.query("map_raw")["grid_origin"] == 1
+    print("  PASS: grid_geometry_detected_once_per_map_and_revalidated_on_reset")
+
+
 def main() -> None:
     test_refresh_layers_and_summary()
     test_layered_refresh_respects_intervals()
@@ -1545,9 +2057,53 @@ def main() -> None:
     test_runtime_facts_injected_in_context_packet()
     test_runtime_facts_exposes_ready_queue_items_and_capability_context_renders_them()
     test_world_summary_and_runtime_facts_expose_structure_power_states()
+    test_snapshot_world_source_refreshes_actors_and_economy_in_one_round_trip()
+    test_snapshot_world_source_falls_back_when_bridge_lacks_command()
+    test_snapshot_world_source_failure_marks_layers_stale()
+    test_actor_delta_refresh_patches_actors_in_place()
+    test_actor_delta_refresh_resyncs_after_reset_and_full_reply()
+    test_actor_delta_source_falls_back_when_bridge_lacks_command()
+    test_refresh_shares_unchanged_layers_copy_on_write()
+    test_spatial_queries_match_linear_scan()
+    test_world_summary_and_battlefield_snapshot_are_memoized_until_inputs_change()
+    test_actor_counters_track_deltas_like_a_full_rescan()
+    test_query_view_returns_zero_copy_actor_views_matching_query()
+    test_grid_geometry_detected_once_per_map_and_revalidated_on_reset()
     print("OK: WorldModel tests passed")
 
 
+class CountingInfoExpert:
+    def __init__(self, threat_level: str = "low") -> None:
+        self.threat_level = threat_level
+        self.calls = 0
+
+    def analyze(self, facts, *, enemy_actors, recent_events):
+        del facts, enemy_actors, recent_events
+        self.calls += 1
+        return {"threat_level": self.threat_level, "calls": self.calls}
+
+
+def test_deferred_info_analysis_reuses_non_urgent_result() -> None:
+    source = MockWorldSource(make_frames())
+    wm = WorldModel(source)
+    wm.refresh(now=100.0, force=True)
+    expert = CountingInfoExpert()
+    wm.register_info_expert(expert)
+
+    assert wm.compute_runtime_facts("t1")["info_experts"]["calls"] == 1
+    wm.defer_info_analysis(True)
+    assert wm.compute_runtime_facts("t1")["info_experts"]["calls"] == 1
+    wm.defer_info_analysis(False)
+    assert wm.compute_runtime_facts("t1")["info_experts"]["calls"] == 2
+
+    # A high threat is never served from the deferred cache.
+    expert.threat_level = "high"
+    assert wm.compute_runtime_facts("t1")["info_experts"]["calls"] == 3
+    wm.defer_info_analysis(True)
+    assert wm.compute_runtime_facts("t1")["info_experts"]["calls"] == 4
+    print("  PASS: deferred_info_analysis_reuses_non_urgent_result")
+
+
 if __name__ == "__main__":
     import pytest
     raise SystemExit(pytest.main([__file__, *sys.argv[1:]]))
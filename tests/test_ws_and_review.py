@@ -27,7 +27,7 @@ from task_replay import build_live_task_replay_bundle, build_task_replay_bundle
 from task_triage import build_live_task_payload
 from task_agent.queue import AgentQueue
 from game_loop import GameLoop, GameLoopConfig
-from ws_server import WSServer, WSServerConfig
+from ws_server import WSServer, WSServerConfig, apply_patch, diff_documents
 from ws_server.server import _THROTTLE_INTERVAL
 
 
@@ -438,6 +438,66 @@ def test_ws_multi_client():
     print("  PASS: ws_multi_client")
 
 
+def test_delta_diff_roundtrip():
+    old = {"economy": {"cash": 5000, "power": 20}, "units": [{"id": 1, "hp": 100}], "tags": ["a"], "a/b": 1}
+    new = {"economy": {"cash": 4200}, "units": [{"id": 1, "hp": 80}], "tags": ["a", "b"], "a/b": 2, "tick": 9}
+    ops = diff_documents(old, new)
+    assert apply_patch(old, ops) == new
+    assert old["economy"]["power"] == 20  # input untouched
+    assert {"op": "remove", "path": "/economy/power"} in ops
+    assert {"op": "replace", "path": "/units/0/hp", "value": 80} in ops
+    assert {"op": "replace", "path": "/a~1b", "value": 2} in ops
+    assert diff_documents(new, new) == []
+    print("  PASS: delta_diff_roundtrip")
+
+
+def test_ws_world_snapshot_deltas_for_opted_in_clients():
+    """Delta clients get patches against their last version; legacy clients keep full snapshots."""
+    server = WSServer(config=WSServerConfig(host="127.0.0.1", port=18790))
+    first = {"economy": {"cash": 5000}, "military": {"units": 10}, "tick": 1}
+    second = {"economy": {"cash": 4200}, "military": {"units": 10}, "tick": 2}
+    legacy_msgs: list[dict] = []
+    delta_msgs: list[dict] = []
+
+    async def run():
+        await server.start()
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect("http://127.0.0.1:18790/ws") as legacy:
+                async with session.ws_connect("http://127.0.0.1:18790/ws") as delta:
+                    await delta.send_str(json.dumps({"type": "sync_request", "delta": True}))
+                    await asyncio.sleep(0.05)
+
+                    await server.send_world_snapshot(first)
+                    server._last_world_snapshot_at = 0.0
+                    await server.send_world_snapshot(second)
+                    server._last_world_snapshot_at = 0.0
+                    await server.send_world_snapshot(second)  # unchanged: nothing for the delta client
+
+                    for _ in range(3):
+                        legacy_msgs.append(json.loads((await asyncio.wait_for(legacy.receive(), timeout=1.0)).data))
+                    for _ in range(2):
+                        delta_msgs.append(json.loads((await asyncio.wait_for(delta.receive(), timeout=1.0)).data))
+
+                    await delta.send_str(json.dumps({"type": "snapshot_resync", "stream": "world_snapshot"}))
+                    delta_msgs.append(json.loads((await asyncio.wait_for(delta.receive(), timeout=1.0)).data))
+        await server.stop()
+
+    asyncio.run(run())
+
+    assert [m["type"] for m in legacy_msgs] == ["world_snapshot"] * 3
+    assert legacy_msgs[1]["data"] == second
+    assert legacy_msgs[0]["version"] == 1 and legacy_msgs[1]["version"] == 2
+
+    full, patch, resync = delta_msgs
+    assert full["type"] == "world_snapshot" and full["data"] == first
+    assert patch["type"] == "world_snapshot_patch"
+    assert patch["data"]["base_version"] == 1 and patch["data"]["version"] == 2
+    assert apply_patch(full["data"], patch["data"]["ops"]) == second
+    assert "military" not in json.dumps(patch["data"]["ops"])
+    assert resync["type"] == "world_snapshot" and resync["data"] == second and resync["version"] == 2
+    print("  PASS: ws_world_snapshot_deltas_for_opted_in_clients")
+
+
 def test_ws_query_response_envelope():
     """`query_response` keeps the payload under the WS `data` envelope."""
     server = WSServer(config=WSServerConfig(host="127.0.0.1", port=18769))
@@ -849,6 +909,12 @@ def test_diagnostics_sync_request_refreshes_current_state_without_replaying_gene
         def unregister_job(self, *args, **kwargs):
             pass
 
+        def tick_stats(self):
+            return {"ticks": 12, "overruns": 2, "deferred": {"dashboard": 1, "jobs": 3, "info_analysis": 2}}
+
+        def job_overruns(self):
+            return {"j1": 1}
+
     class FakeWS:
         def __init__(self):
             self.is_running = True
@@ -905,6 +971,10 @@ def test_diagnostics_sync_request_refreshes_current_state_without_replaying_gene
     sent_types = [msg_type for msg_type, _ in ws.sent]
     assert sent_types[:5] == ["world_snapshot", "task_list", "session_catalog", "session_task_catalog", "session_history"]
     assert sent_types.count("world_snapshot") == 1
+    catalog_payload = next(item for item in ws.sent if item[0] == "session_catalog")[1]["payload"]
+    assert catalog_payload["loop_stats"]["overruns"] == 2
+    assert catalog_payload["loop_stats"]["deferred"]["jobs"] == 3
+    assert catalog_payload["loop_stats"]["job_overruns"] == {"j1": 1}
     history_payload = next(item for item in ws.sent if item[0] == "session_history")[1]["payload"]
     assert history_payload["is_live"] is True
     assert [entry["message"] for entry in history_payload["log_entries"]] == ["历史日志"]
@@ -2877,6 +2947,94 @@ def test_dashboard_publisher_publish_all_continues_after_stage_failure(monkeypat
     print("  PASS: dashboard_publisher_publish_all_continues_after_stage_failure")
 
 
+def test_dashboard_publisher_task_updates_follow_task_stream_version():
+    class FakeKernel:
+        def list_tasks(self):
+            raise AssertionError("task payloads come from the dashboard stage")
+
+    class FakeWS:
+        def __init__(self):
+            self.is_running = True
+            self.updates: list[dict] = []
+
+        async def send_world_snapshot(self, snapshot):
+            pass
+
+        async def send_task_list(self, tasks, pending_questions=None):
+            pass
+
+        async def send_task_update(self, payload):
+            self.updates.append(payload)
+
+    task_lists = iter(
+        [
+            [{"task_id": "t1", "status": "running"}, {"task_id": "t2", "status": "pending"}],
+            [{"task_id": "t1", "status": "running"}, {"task_id": "t2", "status": "pending"}],
+            [{"task_id": "t1", "status": "running"}, {"task_id": "t2", "status": "running"}],
+        ]
+    )
+    ws = FakeWS()
+    publisher = dashboard_publish_module.DashboardPublisher(
+        kernel=FakeKernel(),
+        ws_server=ws,
+        dashboard_payload_builder=lambda: {"world_snapshot": {}, "tasks": next(task_lists), "pending_questions": []},
+        task_payload_builder=lambda *args, **kwargs: {},
+    )
+
+    async def _noop():
+        return None
+
+    publisher.publish_task_messages = _noop
+    publisher.publish_notifications = _noop
+    publisher.publish_logs = _noop
+    publisher.publish_benchmarks = _noop
+
+    async def run():
+        versions = []
+        for _ in range(3):
+            await publisher.publish_all()
+            versions.append(publisher.task_update_version)
+        return versions
+
+    versions = asyncio.run(run())
+
+    # The unchanged second publish keeps the stream version and pushes nothing;
+    # the third pushes only the task that changed.
+    assert versions == [1, 1, 2]
+    assert [(u["task_id"], u["status"]) for u in ws.updates] == [("t1", "running"), ("t2", "pending"), ("t2", "running")]
+    print("  PASS: dashboard_publisher_task_updates_follow_task_stream_version")
+
+
+def test_ws_stream_skips_versioning_until_a_client_opts_into_deltas():
+    server = WSServer(config=WSServerConfig(host="127.0.0.1", port=0))
+    sent: dict[str, list[dict]] = {"legacy": [], "delta": []}
+
+    class FakeClientWS:
+        def __init__(self, name: str):
+            self.name = name
+
+        async def send_str(self, data: str) -> None:
+            sent[self.name].append(json.loads(data))
+
+    server._clients["legacy"] = FakeClientWS("legacy")
+
+    async def run():
+        await server._broadcast_stream("world_snapshot", {"tick": 1})
+        assert server._streams["world_snapshot"].version == 0
+        server._clients["delta"] = FakeClientWS("delta")
+        await server._handle_inbound({"type": "sync_request", "delta": True}, "delta")
+        await server._broadcast_stream("world_snapshot", {"tick": 2})
+        await server._broadcast_stream("world_snapshot", {"tick": 3})
+
+    asyncio.run(run())
+
+    assert sent["legacy"][0] == {"type": "world_snapshot", "data": {"tick": 1}, "timestamp": sent["legacy"][0]["timestamp"]}
+    first, patch = sent["delta"]
+    assert first["type"] == "world_snapshot" and first["data"] == {"tick": 2} and first["version"] == 1
+    assert patch["type"] == "world_snapshot_patch" and patch["data"]["base_version"] == 1
+    print("  PASS: ws_stream_skips_versioning_until_a_client_opts_into_deltas")
+
+
 def test_dashboard_publisher_runtime_fault_state_clears_after_clean_publish():
     class FakeWS:
         def __init__(self):
@@ -3,6 +3,11 @@
 Usage:
     from voice.asr import transcribe
     text = await transcribe(audio_bytes, audio_format="wav", sample_rate=16000)
+
+Streaming (frames forwarded as they are captured):
+    from voice.asr import DashScopeStreamingRecognizer
+    from voice.streaming import StreamingASRSession
+    session = StreamingASRSession(DashScopeStreamingRecognizer(audio_format="pcm"), on_transcript)
 """
 
 from __future__ import annotations
@@ -13,7 +18,9 @@ import tempfile
 from typing import Optional
 
 import dashscope
-from dashscope.audio.asr import Recognition, RecognitionCallback
+from dashscope.audio.asr import Recognition, RecognitionCallback, RecognitionResult
+
+from .streaming import TranscriptAssembler, TranscriptCallback
 
 _ASR_MODEL = "paraformer-realtime-v2"
 
@@ -22,6 +29,13 @@ def _api_key() -> str:
     return os.getenv("DASHSCOPE_API_KEY") or os.getenv("QWEN_API_KEY", "")
 
 
+def _configure_key() -> None:
+    key = _api_key()
+    if not key:
+        raise RuntimeError("No DashScope API key (set DASHSCOPE_API_KEY or QWEN_API_KEY)")
+    dashscope.api_key = key
+
+
 def transcribe_sync(
     audio_bytes: bytes,
     *,
@@ -33,11 +47,7 @@ def transcribe_sync(
     Returns the transcript string, or None if result is empty.
     Raises RuntimeError on API error.
     """
-    key = _api_key()
-    if not key:
-        raise RuntimeError("No DashScope API key (set DASHSCOPE_API_KEY or QWEN_API_KEY)")
-
-    dashscope.api_key = key
+    _configure_key()
 
     suffix = f".{audio_format}"
     with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as f:
@@ -82,3 +92,64 @@ async def transcribe(
         None,
         lambda: transcribe_sync(audio_bytes, audio_format=audio_format, sample_rate=sample_rate),
     )
+
+
+class _StreamingCallback(RecognitionCallback):
+    """Forwards DashScope sentence events to a TranscriptCallback."""
+
+    def __init__(self, on_transcript: TranscriptCallback) -> None:
+        super().__init__()
+        self.on_transcript = on_transcript
+        self.assembler = TranscriptAssembler()
+        self.error: Optional[str] = None
+
+    def on_event(self, result: RecognitionResult) -> None:
+        sentence = result.get_sentence()
+        if not isinstance(sentence, dict) or "text" not in sentence:
+            return
+        sentence_end = bool(RecognitionResult.is_sentence_end(sentence))
+        text = self.assembler.update(sentence.get("text", ""), sentence_end)
+        self.on_transcript(text, sentence_end)
+
+    def on_error(self, result: RecognitionResult) -> None:
+        self.error = f"ASR HTTP {result.status_code}: {result.message}"
+
+
+class DashScopeStreamingRecognizer:
+    """Streaming recognizer over DashScope's realtime Recognition session.
+
+    ``start`` opens the session, ``send_audio_frame`` forwards raw frames
+    (pcm/opus; containerized formats such as wav/webm need the whole file),
+    ``stop`` blocks until the service has flushed its last sentence.
+    """
+
+    def __init__(self, *, audio_format: str = "pcm", sample_rate: int = 16000) -> None:
+        self.audio_format = audio_format
+        self.sample_rate = sample_rate
+        self._recognition: Optional[Recognition] = None
+        self._callback: Optional[_StreamingCallback] = None
+
+    def start(self, on_transcript: TranscriptCallback) -> None:
+        _configure_key()
+        self._callback = _StreamingCallback(on_transcript)
+        self._recognition = Recognition(
+            model=_ASR_MODEL,
+            format=self.audio_format,
+            sample_rate=self.sample_rate,
+            callback=self._callback,
+        )
+        self._recognition.start()
+
+    def send_audio_frame(self, frame: bytes) -> None:
+        if self._recognition is None:
+            raise RuntimeError("Recognizer is not running")
+        self._recognition.send_audio_frame(frame)
+
+    def stop(self) -> str:
+        if self._recognition is None or self._callback is None:
+            return ""
+        recognition, self._recognition = self._recognition, None
+        recognition.stop()
+        if self._callback.error:
+            raise RuntimeError(self._callback.error)
+        return self._callback.assembler.text
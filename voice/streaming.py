@@ -0,0 +1,202 @@
+"""Streaming ASR — recognizer interface and per-utterance session.
+
+Usage:
+    from voice.streaming import StreamingASRSession
+    session = StreamingASRSession(recognizer, on_transcript)
+    await session.start()
+    await session.feed(frame)          # repeat as audio is captured
+    text = await session.finish()      # final transcript
+
+Recognizers are synchronous (vendor SDKs call back from their own threads);
+the session runs them in a thread pool and re-delivers transcript callbacks
+on the event loop, in order, before ``finish`` returns.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional, Protocol
+
+# (transcript_so_far, sentence_end) — called from the recognizer's thread.
+TranscriptCallback = Callable[[str, bool], None]
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingRecognizer(Protocol):
+    """One utterance of streaming recognition."""
+
+    def start(self, on_transcript: TranscriptCallback) -> None: ...
+    def send_audio_frame(self, frame: bytes) -> None: ...
+    def stop(self) -> str: ...
+
+
+class TranscriptAssembler:
+    """Joins finished sentences with the sentence currently being recognized.
+
+    Streaming recognizers revise the in-progress sentence on every event and
+    mark it final once; the full transcript is every final sentence plus the
+    latest revision of the open one.
+    """
+
+    def __init__(self) -> None:
+        self._sentences: list[str] = []
+        self._pending = ""
+
+    def update(self, text: str, sentence_end: bool) -> str:
+        if sentence_end:
+            if text:
+                self._sentences.append(text)
+            self._pending = ""
+        else:
+            self._pending = text
+        return self.text
+
+    @property
+    def text(self) -> str:
+        parts = self._sentences + ([self._pending] if self._pending else [])
+        return " ".join(parts)
+
+
+class FakeStreamingRecognizer:
+    """Local recognizer for tests and offline runs — no network, no API key.
+
+    Each audio frame is decoded as UTF-8 text and appended to the open
+    sentence; ``sentence_break`` (default ``b"\\n"``) closes it.  Every frame
+    produces a partial transcript, and ``stop`` closes the last sentence.
+    """
+
+    def __init__(self, *, sentence_break: bytes = b"\n") -> None:
+        self.sentence_break = sentence_break
+        self.frames: list[bytes] = []
+        self.started = False
+        self.stopped = False
+        self._assembler = TranscriptAssembler()
+        self._sentence = ""
+        self._on_transcript: Optional[TranscriptCallback] = None
+
+    def start(self, on_transcript: TranscriptCallback) -> None:
+        self.started = True
+        self._on_transcript = on_transcript
+
+    def send_audio_frame(self, frame: bytes) -> None:
+        if not self.started or self.stopped:
+            raise RuntimeError("Recognizer is not running")
+        self.frames.append(frame)
+        if frame == self.sentence_break:
+            self._close_sentence()
+            return
+        self._sentence += frame.decode("utf-8", errors="ignore")
+        self._emit(self._assembler.update(self._sentence, False), False)
+
+    def stop(self) -> str:
+        if self.started and not self.stopped and self._sentence:
+            self._close_sentence()
+        self.stopped = True
+        return self._assembler.text
+
+    def _close_sentence(self) -> None:
+        text = self._assembler.update(self._sentence, True)
+        self._sentence = ""
+        self._emit(text, True)
+
+    def _emit(self, text: str, sentence_end: bool) -> None:
+        if self._on_transcript is not None:
+            self._on_transcript(text, sentence_end)
+
+
+class StreamingASRSession:
+    """Bridges a synchronous StreamingRecognizer onto the asyncio loop.
+
+    ``on_transcript`` receives every partial transcript (sentence_end=False
+    while a sentence is still being revised).  Unchanged partials are
+    dropped.  All partials have been delivered when ``finish`` returns.
+    """
+
+    def __init__(
+        self,
+        recognizer: StreamingRecognizer,
+        on_transcript: Callable[[str, bool], Awaitable[None]],
+    ) -> None:
+        self.recognizer = recognizer
+        self.on_transcript = on_transcript
+        self.frames = 0
+        self.bytes = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._delivery: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._last: Optional[tuple[str, bool]] = None
+        self._closed = False
+
+    @property
+    def active(self) -> bool:
+        return self._worker is not None and not self._closed
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._delivery = asyncio.Queue()
+        self._worker = asyncio.create_task(self._deliver())
+        try:
+            await asyncio.to_thread(self.recognizer.start, self._on_recognizer_transcript)
+        except BaseException:
+            await self._close_delivery()
+            raise
+
+    async def feed(self, frame: bytes) -> None:
+        if not self.active:
+            raise RuntimeError("Streaming ASR session is not active")
+        self.frames += 1
+        self.bytes += len(frame)
+        await asyncio.to_thread(self.recognizer.send_audio_frame, frame)
+
+    async def finish(self) -> str:
+        """Stop recognition and return the final transcript."""
+        if not self.active:
+            raise RuntimeError("Streaming ASR session is not active")
+        try:
+            return await asyncio.to_thread(self.recognizer.stop) or ""
+        finally:
+            await self._close_delivery()
+
+    async def cancel(self) -> None:
+        """Abandon the utterance; the transcript and recognizer errors are discarded."""
+        if not self.active:
+            return
+        try:
+            await asyncio.to_thread(self.recognizer.stop)
+        except Exception:
+            pass
+        finally:
+            await self._close_delivery()
+
+    # --- Internal ---
+
+    def _on_recognizer_transcript(self, text: str, sentence_end: bool) -> None:
+        if self._loop is None or self._delivery is None or self._closed:
+            return
+        self._loop.call_soon_threadsafe(self._delivery.put_nowait, (text, sentence_end))
+
+    async def _deliver(self) -> None:
+        assert self._delivery is not None
+        while True:
+            item = await self._delivery.get()
+            if item is None:
+                return
+            if item == self._last:
+                continue
+            self._last = item
+            try:
+                await self.on_transcript(*item)
+            except Exception:
+                logger.exception("Streaming ASR transcript callback failed")
+
+    async def _close_delivery(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        assert self._loop is not None and self._delivery is not None and self._worker is not None
+        # Callbacks the recognizer scheduled before returning ran on the loop
+        # ahead of this coroutine, so they are queued before the sentinel.
+        self._delivery.put_nowait(None)
+        await self._worker
@@ -119,6 +119,10 @@ describe('useWebSocket', () => {
       text: '推进前线',
     })
 
+    const frame = new Int16Array([1, -1]).buffer
+    expect(state.sendBinary(frame)).toBe(true)
+    expect(socket.sent[2]).toBe(frame)
+
     socket.emitMessage({ type: 'query_response', data: { answer: '收到' } })
     expect(handler).toHaveBeenCalledTimes(1)
     expect(wildcard).toHaveBeenCalledTimes(1)
@@ -135,4 +139,46 @@ describe('useWebSocket', () => {
     await vi.advanceTimersByTimeAsync(3000)
     expect(FakeWebSocket.instances).toHaveLength(1)
   })
+
+  it('applies world_snapshot patches and requests a resync when the base version is stale', () => {
+    const { wrapper, state } = mountComposable()
+    const socket = FakeWebSocket.instances[0]
+    socket.open()
+    expect(JSON.parse(socket.sent[0])).toMatchObject({ type: 'sync_request', delta: true })
+
+    const handler = vi.fn()
+    state.on('world_snapshot', handler)
+
+    socket.emitMessage({ type: 'world_snapshot', version: 1, data: { tick: 1, units: [{ id: 1, hp: 100 }] } })
+    socket.emitMessage({
+      type: 'world_snapshot_patch',
+      data: {
+        base_version: 1,
+        version: 2,
+        ops: [
+          { op: 'replace', path: '/tick', value: 2 },
+          { op: 'replace', path: '/units/0/hp', value: 80 },
+        ],
+      },
+    })
+    expect(handler).toHaveBeenCalledTimes(2)
+    expect(handler.mock.calls[1][0]).toMatchObject({
+      type: 'world_snapshot',
+      version: 2,
+      data: { tick: 2, units: [{ id: 1, hp: 80 }] },
+    })
+    expect(handler.mock.calls[0][0].data.tick).toBe(1)
+
+    socket.emitMessage({
+      type: 'world_snapshot_patch',
+      data: { base_version: 7, version: 8, ops: [] },
+    })
+    expect(handler).toHaveBeenCalledTimes(2)
+    expect(JSON.parse(socket.sent[socket.sent.length - 1])).toMatchObject({
+      type: 'snapshot_resync',
+      stream: 'world_snapshot',
+    })
+
+    wrapper.unmount()
+  })
 })
@@ -0,0 +1,17 @@
+import { describe, expect, it } from 'vitest'
+
+import { downsampleToPcm16 } from '../voiceStream.js'
+
+describe('downsampleToPcm16', () => {
+  it('averages 48 kHz float samples into 16 kHz 16-bit PCM', () => {
+    const samples = new Float32Array([1, 1, 1, -1, -1, -1, 0.5, 0.5, 0.5, 0])
+
+    expect(Array.from(downsampleToPcm16(samples, 48000))).toEqual([32767, -32768, 16383])
+  })
+
+  it('keeps the sample count at the target rate and clips out-of-range values', () => {
+    const samples = new Float32Array([0.5, -2, 2])
+
+    expect(Array.from(downsampleToPcm16(samples, 16000))).toEqual([16383, -32768, 32767])
+  })
+})
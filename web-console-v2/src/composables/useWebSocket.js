@@ -1,5 +1,35 @@
 import { ref, onUnmounted } from 'vue'
 
+const PATCH_SUFFIX = '_patch'
+
+function decodePointer(path) {
+  return path.split('/').slice(1).map(token => token.replace(/~1/g, '/').replace(/~0/g, '~'))
+}
+
+// Applies the add/remove/replace ops emitted by ws_server/delta.py.
+export function applyPatch(document, ops) {
+  let result = structuredClone(document)
+  for (const op of ops) {
+    const tokens = decodePointer(op.path)
+    if (tokens.length === 0) {
+      result = structuredClone(op.value)
+      continue
+    }
+    let parent = result
+    for (const token of tokens.slice(0, -1)) {
+      parent = Array.isArray(parent) ? parent[Number(token)] : parent[token]
+    }
+    const last = Array.isArray(parent) ? Number(tokens[tokens.length - 1]) : tokens[tokens.length - 1]
+    if (op.op === 'remove') {
+      if (Array.isArray(parent)) parent.splice(last, 1)
+      else delete parent[last]
+    } else {
+      parent[last] = structuredClone(op.value)
+    }
+  }
+  return result
+}
+
 export function useWebSocket(url = 'ws://localhost:8765/ws') {
   const connected = ref(false)
   const reconnecting = ref(false)
@@ -7,6 +37,8 @@ export function useWebSocket(url = 'ws://localhost:8765/ws') {
   let ws = null
   let reconnectTimer = null
   const handlers = {}
+  // Last full document per delta stream: { world_snapshot: { version, data }, ... }
+  let streams = {}
   let hasConnectedOnce = false
 
   function connect() {
@@ -21,8 +53,9 @@ export function useWebSocket(url = 'ws://localhost:8765/ws') {
         messages.value = []
       }
       hasConnectedOnce = true
-      // Request full state sync on connect/reconnect
-      ws.send(JSON.stringify({ type: 'sync_request', timestamp: Date.now() / 1000 }))
+      streams = {}
+      // Request full state sync on connect/reconnect; opt into delta pushes
+      ws.send(JSON.stringify({ type: 'sync_request', delta: true, timestamp: Date.now() / 1000 }))
     }
     ws.onclose = () => {
       connected.value = false
@@ -37,7 +70,13 @@ export function useWebSocket(url = 'ws://localhost:8765/ws') {
     ws.onerror = () => { ws.close() }
     ws.onmessage = (event) => {
       try {
-        const msg = JSON.parse(event.data)
+        let msg = JSON.parse(event.data)
+        if (msg.type && msg.type.endsWith(PATCH_SUFFIX)) {
+          msg = resolvePatch(msg)
+          if (!msg) return
+        } else if (msg.version !== undefined) {
+          streams[msg.type] = { version: msg.version, data: msg.data }
+        }
         messages.value.push(msg)
         if (msg.type && handlers[msg.type]) {
           handlers[msg.type].forEach(fn => fn(msg))
@@ -49,6 +88,28 @@ export function useWebSocket(url = 'ws://localhost:8765/ws') {
     }
   }
 
+  // Rebuild the full message from a patch, or ask for a resync when our base is stale.
+  function resolvePatch(msg) {
+    const type = msg.type.slice(0, -PATCH_SUFFIX.length)
+    const current = streams[type]
+    const patch = msg.data || {}
+    if (!current || current.version !== patch.base_version) {
+      delete streams[type]
+      send('snapshot_resync', { stream: type })
+      return null
+    }
+    let data
+    try {
+      data = applyPatch(current.data, patch.ops || [])
+    } catch (e) {
+      delete streams[type]
+      send('snapshot_resync', { stream: type })
+      return null
+    }
+    streams[type] = { version: patch.version, data }
+    return { type, data, version: patch.version, timestamp: msg.timestamp }
+  }
+
   function send(type, data = {}) {
     if (ws && ws.readyState === WebSocket.OPEN) {
       ws.send(JSON.stringify({ type, ...data, timestamp: Date.now() / 1000 }))
@@ -57,6 +118,15 @@ export function useWebSocket(url = 'ws://localhost:8765/ws') {
     return false
   }
 
+  // Raw binary frame (streamed voice audio between voice_start and voice_stop).
+  function sendBinary(data) {
+    if (ws && ws.readyState === WebSocket.OPEN) {
+      ws.send(data)
+      return true
+    }
+    return false
+  }
+
   function on(type, fn) {
     if (!handlers[type]) handlers[type] = []
     handlers[type].push(fn)
@@ -80,5 +150,5 @@ export function useWebSocket(url = 'ws://localhost:8765/ws') {
   connect()
   onUnmounted(disconnect)
 
-  return { connected, reconnecting, messages, send, on, disconnect }
+  return { connected, reconnecting, messages, send, sendBinary, on, disconnect }
 }
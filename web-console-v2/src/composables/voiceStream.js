@@ -0,0 +1,47 @@
+// Microphone capture for streaming ASR over /ws (see ws_server/server.py voice_start).
+
+export const STREAM_SAMPLE_RATE = 16000
+const BUFFER_SIZE = 4096  // ~85 ms per frame at 48 kHz
+
+// Averages float samples down to targetRate and encodes them as 16-bit PCM.
+export function downsampleToPcm16(samples, inputRate, targetRate = STREAM_SAMPLE_RATE) {
+  const ratio = inputRate / targetRate
+  const length = ratio > 1 ? Math.floor(samples.length / ratio) : samples.length
+  const pcm = new Int16Array(length)
+  for (let i = 0; i < length; i++) {
+    const start = Math.floor(i * ratio)
+    const end = ratio > 1 ? Math.min(samples.length, Math.floor((i + 1) * ratio)) : start + 1
+    let sum = 0
+    for (let j = start; j < end; j++) sum += samples[j]
+    const value = Math.max(-1, Math.min(1, sum / (end - start)))
+    pcm[i] = value < 0 ? value * 0x8000 : value * 0x7fff
+  }
+  return pcm
+}
+
+export function canStreamVoice() {
+  const Context = window.AudioContext || window.webkitAudioContext
+  return Boolean(Context && Context.prototype.createScriptProcessor)
+}
+
+// Feeds onFrame(ArrayBuffer) with 16 kHz mono PCM while the stream is live.
+// Returns a stop() that releases the audio graph and the microphone.
+export function startPcmCapture(stream, onFrame) {
+  const Context = window.AudioContext || window.webkitAudioContext
+  const context = new Context()
+  const source = context.createMediaStreamSource(stream)
+  const processor = context.createScriptProcessor(BUFFER_SIZE, 1, 1)
+  processor.onaudioprocess = (event) => {
+    const pcm = downsampleToPcm16(event.inputBuffer.getChannelData(0), context.sampleRate)
+    if (pcm.length) onFrame(pcm.buffer)
+  }
+  source.connect(processor)
+  processor.connect(context.destination)
+  return () => {
+    processor.onaudioprocess = null
+    source.disconnect()
+    processor.disconnect()
+    stream.getTracks().forEach(t => t.stop())
+    context.close()
+  }
+}
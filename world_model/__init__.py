@@ -1,11 +1,19 @@
 """WorldModel exports."""
 
-from .core import GameAPIWorldSource, RefreshPolicy, WorldModel, WorldModelSource, WorldState
+from .core import GameAPISnapshotWorldSource, GameAPIWorldSource, RefreshPolicy, WorldModel, WorldModelSource, WorldState
+from .counters import ActorCounters
+from .spatial import SpatialIndex
+from .views import ActorView, query_view
 
 __all__ = [
     "WorldModel",
     "WorldModelSource",
     "GameAPIWorldSource",
+    "GameAPISnapshotWorldSource",
     "RefreshPolicy",
     "WorldState",
+    "SpatialIndex",
+    "ActorCounters",
+    "ActorView",
+    "query_view",
 ]
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import asdict, dataclass, field
 import logging
 import math
 import time
 from typing import Any, Optional, Protocol
 
+import numpy as np
+
 from benchmark import timed
 from logging_system import get_logger
 from models import (
@@ -20,22 +22,22 @@ from models import (
     Mobility,
     NormalizedActor,
 )
-from openra_api.game_api import GameAPI
+from openra_api.game_api import GameAPI, GameAPIError
 from openra_api.intel.names import normalize_unit_name
 from openra_api.intel.rules import DEFAULT_UNIT_CATEGORY_RULES, DEFAULT_UNIT_VALUE_WEIGHTS
-from openra_api.models import Actor, FrozenActor, Location, MapQueryResult, PlayerBaseInfo, TargetsQueryParam
+from openra_api.frontier import frontier_grid
+from openra_api.map_grid import as_grid_array, grid_ratio
+from openra_api.models import Actor, ActorDeltaResult, FrozenActor, Location, MapQueryResult, PlayerBaseInfo, TargetsQueryParam
 from openra_api.production_names import production_name_matches, production_name_entry, production_name_unit_id
 from openra_state.data.dataset import (
     dataset_actor_category_for,
     dataset_cost_for,
-    demo_base_counter_field_for,
     demo_base_progression,
     demo_capability_buildability_snapshot,
     demo_capability_supported_factions,
     demo_capability_units_for_queue_for_faction,
     filter_demo_capability_ready_items,
     demo_display_name_for,
-    demo_faction_hint_for_unit_types,
     demo_capability_queue_types,
     demo_prerequisites_for,
     demo_queue_type_for,
@@ -48,6 +50,10 @@ from runtime_views import (
 from task_triage import build_runtime_unit_pipeline_preview
 from unit_registry import UnitRegistry, get_default_registry
 
+from .counters import ActorCounters
+from .spatial import SpatialIndex
+from .views import ACTOR_QUERY_TYPES, ActorView, actor_view
+
 
 QUEUE_TYPES = ("Building", "Defense", "Infantry", "Vehicle", "Aircraft")
 QUEUE_PRODUCER_UNIT_IDS: dict[str, tuple[str, ...]] = {
@@ -67,11 +73,18 @@ REFRESH_FAILURE_LOG_COOLDOWN_S = 2.0
 CONNECTION_FAILURE_LOG_COOLDOWN_S = 10.0
 SLOW_REFRESH_LOG_COOLDOWN_S = 10.0
 CONNECTION_FAILURE_RETRY_BACKOFF_S = 2.0
+GRID_GEOMETRY_PROBES = 8
+INFO_ANALYSIS_MAX_DEFER_S = 2.0
+URGENT_THREAT_LEVELS = frozenset({"high", "critical"})
 
 logger = logging.getLogger(__name__)
 slog = get_logger("world_model")
 
 
+def _same_objects(left: tuple[Any, ...], right: tuple[Any, ...]) -> bool:
+    return len(left) == len(right) and all(a is b for a, b in zip(left, right))
+
+
 class WorldModelSource(Protocol):
     """Fetches raw game state for the WorldModel."""
 
@@ -103,6 +116,14 @@ class RefreshPolicy:
 
 @dataclass(slots=True)
 class WorldState:
+    """Current world layers.
+
+    Layer containers (``actors``/``self_ids``/``enemy_ids``, ``economy``,
+    ``map_info``, ``production_queues``) are copy-on-write: a refresh swaps in
+    new containers instead of mutating published ones, so :meth:`share` can
+    hand out snapshots without copying.
+    """
+
     actors: dict[int, NormalizedActor] = field(default_factory=dict)
     self_ids: set[int] = field(default_factory=set)
     enemy_ids: set[int] = field(default_factory=set)
@@ -113,12 +134,48 @@ class WorldState:
     timestamp: float = field(default_factory=time.time)
     stale: bool = False
 
+    def share(self) -> "WorldState":
+        """Structurally shared snapshot: same layer containers, independent top-level fields."""
+        return WorldState(
+            actors=self.actors,
+            self_ids=self.self_ids,
+            enemy_ids=self.enemy_ids,
+            frozen_enemies=self.frozen_enemies,
+            economy=self.economy,
+            map_info=self.map_info,
+            production_queues=self.production_queues,
+            timestamp=self.timestamp,
+            stale=self.stale,
+        )
+
 
 class GameAPIWorldSource:
-    """Real source adapter backed by the existing OpenRA GameAPI."""
+    """Real source adapter backed by the existing OpenRA GameAPI.
+
+    With ``actor_delta=True`` the actors layer is refreshed through
+    ``query_actor_delta`` (see :meth:`fetch_actor_delta`); bridges that do not
+    know the command drop the source back to full actor queries.
+    """
 
-    def __init__(self, api: GameAPI) -> None:
+    def __init__(self, api: GameAPI, *, actor_delta: bool = False) -> None:
         self.api = api
+        self.actor_delta = actor_delta
+
+    def fetch_actor_delta(self, since_version: Optional[int]) -> Optional[ActorDeltaResult]:
+        """Return actors changed since ``since_version``, or ``None`` when delta refresh is unavailable."""
+        if not self.actor_delta:
+            return None
+        try:
+            return self.api.query_actor_delta(since_version)
+        except GameAPIError as exc:
+            if exc.code != "INVALID_COMMAND":
+                raise
+            self.actor_delta = False
+            slog.warn(
+                "query_actor_delta unsupported by game bridge; falling back to full actor refresh",
+                event="actor_delta_unsupported",
+            )
+            return None
 
     def fetch_self_actors(self) -> list[Actor]:
         return self.api.query_actor(TargetsQueryParam(faction="自己"))
@@ -140,28 +197,116 @@ class GameAPIWorldSource:
         return self.api.map_query(fields=fields)
 
     def fetch_production_queues(self) -> dict[str, dict[str, Any]]:
-        queues: dict[str, dict[str, Any]] = {}
-        for queue_type in QUEUE_TYPES:
-            raw = self.api.query_production_queue(queue_type)
-            queues[queue_type] = {
-                "queue_type": raw.get("queue_type", queue_type),
-                "items": [
-                    {
-                        "name": item.get("name"),
-                        "display_name": item.get("chineseName"),
-                        "progress": item.get("progress_percent"),
-                        "status": item.get("status"),
-                        "paused": item.get("paused"),
-                        "owner_actor_id": item.get("owner_actor_id"),
-                        "remaining_time": item.get("remaining_time"),
-                        "total_time": item.get("total_time"),
-                        "done": item.get("done"),
-                    }
-                    for item in raw.get("queue_items", [])
-                ],
-                "has_ready_item": raw.get("has_ready_item", False),
+        return {
+            queue_type: self._queue_payload(queue_type, self.api.query_production_queue(queue_type))
+            for queue_type in QUEUE_TYPES
+        }
+
+    @staticmethod
+    def _queue_payload(queue_type: str, raw: Mapping[str, Any]) -> dict[str, Any]:
+        return {
+            "queue_type": raw.get("queue_type", queue_type),
+            "items": [
+                {
+                    "name": item.get("name"),
+                    "display_name": item.get("chineseName"),
+                    "progress": item.get("progress_percent"),
+                    "status": item.get("status"),
+                    "paused": item.get("paused"),
+                    "owner_actor_id": item.get("owner_actor_id"),
+                    "remaining_time": item.get("remaining_time"),
+                    "total_time": item.get("total_time"),
+                    "done": item.get("done"),
+                }
+                for item in raw.get("queue_items", [])
+            ],
+            "has_ready_item": raw.get("has_ready_item", False),
+        }
+
+
+class GameAPISnapshotWorldSource(GameAPIWorldSource):
+    """Source adapter that fetches the actors and economy layers in one ``world_snapshot`` round trip.
+
+    ``WorldModel.refresh`` calls :meth:`prefetch` with the due layers before
+    reading them; each ``fetch_*`` then consumes its section of the snapshot.
+    Sections are single-use, so calls outside a refresh (or for layers the
+    snapshot did not cover) fall back to the per-query GameAPI path.  If the
+    bridge rejects ``world_snapshot`` as an unknown command, the source falls
+    back to per-query fetching permanently.
+    """
+
+    def __init__(self, api: GameAPI, *, actor_delta: bool = False) -> None:
+        super().__init__(api, actor_delta=actor_delta)
+        self.snapshot_supported = True
+        self._sections: dict[str, Any] = {}
+        self._snapshot_error: Optional[Exception] = None
+
+    def prefetch(self, layers: Sequence[str]) -> None:
+        self._sections = {}
+        self._snapshot_error = None
+        # Delta refresh already brings actors in its own (much smaller) reply.
+        include_actors = "actors" in layers and not self.actor_delta
+        include_economy = "economy" in layers
+        if not self.snapshot_supported or not (include_actors or include_economy):
+            return
+        try:
+            snapshot = self.api.world_snapshot(
+                list(QUEUE_TYPES) if include_economy else [],
+                include_actors=include_actors,
+                include_base_info=include_economy,
+            )
+        except GameAPIError as exc:
+            if exc.code == "INVALID_COMMAND":
+                self.snapshot_supported = False
+                slog.warn(
+                    "world_snapshot unsupported by game bridge; falling back to per-query refresh",
+                    event="world_snapshot_unsupported",
+                )
+                return
+            self._snapshot_error = exc
+            return
+        except Exception as exc:
+            self._snapshot_error = exc
+            return
+        if include_actors:
+            self._sections["self_actors"] = snapshot.SelfActors
+            self._sections["enemy_actors"] = snapshot.EnemyActors
+            self._sections["frozen_enemies"] = snapshot.FrozenActors
+        if include_economy:
+            self._sections["economy"] = snapshot.BaseInfo
+            self._sections["production_queues"] = {
+                queue_type: self._queue_payload(queue_type, raw)
+                for queue_type, raw in snapshot.ProductionQueues.items()
             }
-        return queues
+
+    def _take(self, section: str) -> tuple[bool, Any]:
+        if self._snapshot_error is not None:
+            # Surface the batch failure through the layer that asked, so the
+            # WorldModel's per-layer stale/backoff handling still applies.
+            raise self._snapshot_error
+        if section in self._sections:
+            return True, self._sections.pop(section)
+        return False, None
+
+    def fetch_self_actors(self) -> list[Actor]:
+        found, value = self._take("self_actors")
+        return value if found else super().fetch_self_actors()
+
+    def fetch_enemy_actors(self) -> list[Actor]:
+        found, value = self._take("enemy_actors")
+        return value if found else super().fetch_enemy_actors()
+
+    def fetch_frozen_enemies(self) -> list[FrozenActor]:
+        found, value = self._take("frozen_enemies")
+        return (value or []) if found else super().fetch_frozen_enemies()
+
+    def fetch_economy(self) -> Optional[PlayerBaseInfo]:
+        found, value = self._take("economy")
+        return value if found else super().fetch_economy()
+
+    def fetch_production_queues(self) -> dict[str, dict[str, Any]]:
+        found, value = self._take("production_queues")
+        return value if found else super().fetch_production_queues()
 
 
 class WorldModel:
@@ -194,11 +339,30 @@ class WorldModel:
         self._unit_reservations: list[dict[str, Any]] = []
 
         self._info_experts: list[Any] = []
+        # Last Information Expert analysis (computed_at, data), reused while deferred.
+        self._info_analysis: Optional[tuple[float, dict[str, Any]]] = None
+        self._info_analysis_deferred = False
 
         self._last_actor_refresh = 0.0
         self._last_economy_refresh = 0.0
         self._last_map_refresh = 0.0
         self._map_static_fetched = False
+        # Server snapshot version of the last applied actor delta; None forces a full resync.
+        self._actor_delta_version: Optional[int] = None
+        # Actor ids touched by the current refresh when known (delta path); None means "diff everything".
+        self._changed_actor_ids: Optional[set[int]] = None
+        # Bumped whenever a layer's containers are replaced; unchanged layers skip event detection.
+        self._layer_generations: dict[str, int] = {"actors": 0, "economy": 0, "map": 0}
+        # Memoized world_summary sections / battlefield_snapshot (see _summary_sections).
+        self._refresh_version = 0
+        self._runtime_version = 0
+        self._summary_cache: Optional[tuple[tuple[Any, ...], dict[str, dict[str, Any]]]] = None
+        # (actors dict, counters over it); maintained by _normalize_actors / _apply_actor_delta.
+        self._actor_counters: Optional[tuple[dict[int, NormalizedActor], ActorCounters]] = None
+        self._grid_geometry: Optional[tuple[tuple[int, int], int, str]] = None
+        self._battlefield_cache: Optional[tuple[tuple[tuple[Any, ...], tuple[Any, ...]], dict[str, Any]]] = None
+        # Spatial index over the actors dict it was built from; rebuilt when that dict is replaced.
+        self._actor_index: Optional[tuple[dict[int, NormalizedActor], SpatialIndex[NormalizedActor]]] = None
         self._pending_events: list[Event] = []
         self._event_history: list[Event] = []
         self._last_refresh_layers: list[str] = []
@@ -223,49 +387,43 @@ class WorldModel:
             return []
         slog.debug("WorldModel refresh started", event="world_refresh_started", force=force, layers=layers, timestamp=timestamp)
 
-        previous = WorldState(
-            actors=dict(self.state.actors),
-            self_ids=set(self.state.self_ids),
-            enemy_ids=set(self.state.enemy_ids),
-            economy=dict(self.state.economy),
-            map_info=dict(self.state.map_info),
-            production_queues={key: dict(value) for key, value in self.state.production_queues.items()},
-            timestamp=self.state.timestamp,
-            stale=self.state.stale,
-        )
+        previous = self.state.share()
+        previous_generations = dict(self._layer_generations)
 
         stale = False
         refresh_errors: list[str] = []
         layer_timings: dict[str, float] = {}
         connection_failure_active = False
+        prefetch = getattr(self.source, "prefetch", None)
+        if callable(prefetch):
+            t0 = time.time()
+            prefetch(layers)
+            layer_timings["prefetch"] = (time.time() - t0) * 1000
+        self._changed_actor_ids = None
         if "actors" in layers:
             t0 = time.time()
             try:
-                self_actors = self.source.fetch_self_actors()
-                enemy_actors = self.source.fetch_enemy_actors()
-                normalized = self._normalize_actors(self_actors, enemy_actors, timestamp)
-                self.state.actors = normalized["actors"]
-                self.state.self_ids = normalized["self_ids"]
-                self.state.enemy_ids = normalized["enemy_ids"]
-                # Fetch frozen enemies (last-seen positions in fog-of-war)
-                try:
-                    frozen_raw = self.source.fetch_frozen_enemies()
-                    visible_positions = {
-                        (a.position[0], a.position[1])
-                        for a in self.state.actors.values()
-                        if a.owner == ActorOwner.ENEMY and a.position
-                    }
-                    self.state.frozen_enemies = [
-                        {
-                            "type": getattr(f, "type", None),
-                            "faction": getattr(f, "faction", None),
-                            "position": [f.position.x, f.position.y] if f.position else None,
-                        }
-                        for f in frozen_raw
-                        if f.position and (f.position.x, f.position.y) not in visible_positions
-                    ]
-                except Exception:
-                    pass  # frozen fetch is best-effort
+                fetch_actor_delta = getattr(self.source, "fetch_actor_delta", None)
+                delta = fetch_actor_delta(self._actor_delta_version) if callable(fetch_actor_delta) else None
+                if delta is not None:
+                    if self._apply_actor_delta(delta, timestamp):
+                        self._layer_generations["actors"] += 1
+                    self._update_frozen_enemies(delta.FrozenActors)
+                else:
+                    self._actor_delta_version = None
+                    self_actors = self.source.fetch_self_actors()
+                    enemy_actors = self.source.fetch_enemy_actors()
+                    normalized = self._normalize_actors(self_actors, enemy_actors, timestamp)
+                    self.state.actors = normalized["actors"]
+                    self.state.self_ids = normalized["self_ids"]
+                    self.state.enemy_ids = normalized["enemy_ids"]
+                    self._actor_counters = (normalized["actors"], normalized["counters"])
+                    self._layer_generations["actors"] += 1
+                    # Fetch frozen enemies (last-seen positions in fog-of-war)
+                    try:
+                        self._update_frozen_enemies(self.source.fetch_frozen_enemies())
+                    except Exception:
+                        pass  # frozen fetch is best-effort
                 self._last_actor_refresh = timestamp
                 self._layer_retry_after["actors"] = 0.0
                 self._clear_refresh_failure_log_state("actors")
@@ -288,6 +446,7 @@ class WorldModel:
                     queues = self._normalize_queues(self.source.fetch_production_queues(), timestamp)
                     self.state.economy = economy
                     self.state.production_queues = queues
+                    self._layer_generations["economy"] += 1
                     self._last_economy_refresh = timestamp
                     self._layer_retry_after["economy"] = 0.0
                     self._clear_refresh_failure_log_state("economy")
@@ -312,8 +471,11 @@ class WorldModel:
                     else:
                         map_fields = None  # full fetch
                     map_result = self.source.fetch_map(fields=map_fields)
-                    self.state.map_info = self._normalize_map(map_result, timestamp)
+                    map_info = self._normalize_map(map_result, timestamp)
+                    self._apply_grid_geometry(map_info)
+                    self.state.map_info = map_info
                     self._map_static_fetched = True
+                    self._layer_generations["map"] += 1
                     self._last_map_refresh = timestamp
                     self._layer_retry_after["map"] = 0.0
                     self._clear_refresh_failure_log_state("map")
@@ -342,7 +504,11 @@ class WorldModel:
 
         self.state.timestamp = timestamp
         self.state.stale = stale
-        events = self._detect_events(previous, self.state, timestamp)
+        self._refresh_version += 1
+        changed_layers = {
+            layer for layer, generation in self._layer_generations.items() if generation != previous_generations[layer]
+        }
+        events = self._detect_events(previous, self.state, timestamp, changed_layers=changed_layers)
         self._pending_events = list(events)
         self._event_history.extend(events)
         if len(self._event_history) > self.event_history_limit:
@@ -372,23 +538,7 @@ class WorldModel:
         if query_type == "world_summary":
             return self.world_summary()
         if query_type in {"actors", "my_actors", "enemy_actors", "find_actors"}:
-            owner = params.get("owner")
-            if query_type == "my_actors":
-                owner = ActorOwner.SELF.value
-            elif query_type == "enemy_actors":
-                owner = ActorOwner.ENEMY.value
-            actors = self.find_actors(
-                owner=owner,
-                category=params.get("category"),
-                idle_only=params.get("idle_only", False),
-                actor_ids=params.get("actor_ids"),
-                unbound_only=params.get("unbound_only", False),
-                can_attack=params.get("can_attack"),
-                can_harvest=params.get("can_harvest"),
-                name=params.get("name") or params.get("type"),
-                near=params.get("near"),
-                max_distance=params.get("max_distance"),
-            )
+            actors = self._query_actors(query_type, params)
             return {"actors": [self._actor_to_dict(actor) for actor in actors], "timestamp": self.state.timestamp}
         if query_type == "actor_by_id":
             actor_id = params["actor_id"]
@@ -421,6 +571,39 @@ class WorldModel:
             return {"events": [self._event_to_dict(event) for event in events], "timestamp": self.state.timestamp}
         raise ValueError(f"Unsupported query_type: {query_type}")
 
+    def query_view(self, query_type: str, params: Optional[dict[str, Any]] = None) -> Any:
+        """Like ``query``, but actor results are zero-copy ``ActorView`` objects.
+
+        For in-process callers only; use ``query`` when the result crosses a
+        JSON boundary.
+        """
+        if query_type not in ACTOR_QUERY_TYPES:
+            return self.query(query_type, params)
+        params = params or {}
+        if query_type == "actor_by_id":
+            return {"actor": actor_view(self.state.actors.get(params["actor_id"])), "timestamp": self.state.timestamp}
+        actors = self._query_actors(query_type, params)
+        return {"actors": [ActorView(actor) for actor in actors], "timestamp": self.state.timestamp}
+
+    def _query_actors(self, query_type: str, params: dict[str, Any]) -> list[NormalizedActor]:
+        owner = params.get("owner")
+        if query_type == "my_actors":
+            owner = ActorOwner.SELF.value
+        elif query_type == "enemy_actors":
+            owner = ActorOwner.ENEMY.value
+        return self.find_actors(
+            owner=owner,
+            category=params.get("category"),
+            idle_only=params.get("idle_only", False),
+            actor_ids=params.get("actor_ids"),
+            unbound_only=params.get("unbound_only", False),
+            can_attack=params.get("can_attack"),
+            can_harvest=params.get("can_harvest"),
+            name=params.get("name") or params.get("type"),
+            near=params.get("near"),
+            max_distance=params.get("max_distance"),
+        )
+
     def find_actors(
         self,
         *,
@@ -438,7 +621,10 @@ class WorldModel:
     ) -> list[NormalizedActor]:
         requested_ids = set(actor_ids or [])
         matched: list[NormalizedActor] = []
-        for actor in self.state.actors.values():
+        candidates: Any = self.state.actors.values()
+        if near is not None and max_distance is not None:
+            candidates = self._spatial_index(self.state).within(near, max_distance)
+        for actor in candidates:
             if owner and actor.owner.value != owner:
                 continue
             if category and actor.category.value != category:
@@ -455,29 +641,121 @@ class WorldModel:
                 continue
             if name and not production_name_matches(name, actor.name, actor.display_name):
                 continue
-            if near is not None and max_distance is not None:
-                if self._distance(actor.position, near) > max_distance:
-                    continue
             if mobility is not None and actor.mobility.value != mobility:
                 continue
             matched.append(actor)
         matched.sort(key=lambda item: item.actor_id)
         return matched
 
+    def actors_within(
+        self,
+        position: tuple[float, float],
+        radius: float,
+        *,
+        owner: Optional[str] = None,
+        category: Optional[str] = None,
+        can_attack: Optional[bool] = None,
+    ) -> list[NormalizedActor]:
+        """Actors within ``radius`` cells of ``position``, sorted by actor id."""
+        matched = self._spatial_index(self.state).within(
+            position, radius, self._actor_predicate(owner=owner, category=category, can_attack=can_attack)
+        )
+        matched.sort(key=lambda item: item.actor_id)
+        return matched
+
+    def nearest(
+        self,
+        position: tuple[float, float],
+        *,
+        owner: Optional[str] = None,
+        category: Optional[str] = None,
+        can_attack: Optional[bool] = None,
+        max_distance: Optional[float] = None,
+    ) -> Optional[NormalizedActor]:
+        """Closest matching actor to ``position`` (lowest actor id on ties), or None."""
+        return self._spatial_index(self.state).nearest(
+            position,
+            self._actor_predicate(owner=owner, category=category, can_attack=can_attack),
+            max_distance=max_distance,
+        )
+
+    def _spatial_index(self, state: WorldState) -> SpatialIndex[NormalizedActor]:
+        cached = self._actor_index
+        if cached is None or cached[0] is not state.actors:
+            cached = (state.actors, SpatialIndex(state.actors.values()))
+            self._actor_index = cached
+        return cached[1]
+
+    @staticmethod
+    def _actor_predicate(
+        *,
+        owner: Optional[str] = None,
+        category: Optional[str] = None,
+        can_attack: Optional[bool] = None,
+    ) -> Optional[Callable[[NormalizedActor], bool]]:
+        if owner is None and category is None and can_attack is None:
+            return None
+
+        def predicate(actor: NormalizedActor) -> bool:
+            if owner and actor.owner.value != owner:
+                return False
+            if category and actor.category.value != category:
+                return False
+            if can_attack is not None and actor.can_attack != can_attack:
+                return False
+            return True
+
+        return predicate
+
     def world_summary(self) -> dict[str, Any]:
+        sections = self._summary_sections()
+        return {
+            "economy": dict(sections["economy"]),
+            "military": {**sections["military"], "bound_resources": len(self.resource_bindings)},
+            "map": dict(sections["map"]),
+            "known_enemy": dict(sections["known_enemy"]),
+            "timestamp": self.state.timestamp,
+            "stale": self.state.stale,
+            "disconnected": self._last_refresh_disconnected,
+            "last_refresh_error": self._last_refresh_error,
+            "consecutive_refresh_failures": self._consecutive_refresh_failures,
+            "total_refresh_failures": self._total_refresh_failures,
+            "failure_threshold": self.stale_failure_threshold,
+        }
+
+    def _summary_key(self) -> tuple[Any, ...]:
+        # Refresh replaces (never mutates) these containers, so identity is a cheap version.
+        state = self.state
+        return (state.actors, state.economy, state.production_queues, state.map_info, state.frozen_enemies)
+
+    def _summary_sections(self) -> dict[str, dict[str, Any]]:
+        """Actor/economy/map derived sections of world_summary, rebuilt only when a layer changes."""
+        key = self._summary_key()
+        cached = self._summary_cache
+        if cached is not None and _same_objects(cached[0], key):
+            return cached[1]
         queue_block_state = self._queue_block_state()
         structure_power_state = self._self_structure_power_state()
-        self_combat = sum(
-            actor.combat_value
-            for actor in self.state.actors.values()
-            if actor.owner == ActorOwner.SELF and actor.can_attack
-        )
-        enemy_combat = sum(
-            actor.combat_value
-            for actor in self.state.actors.values()
-            if actor.owner == ActorOwner.ENEMY and actor.can_attack
-        )
-        summary = {
+        self_combat = 0.0
+        enemy_combat = 0.0
+        idle_self_units = 0
+        enemy_structures = 0
+        enemy_bases = 0
+        for actor in self.state.actors.values():
+            if actor.owner == ActorOwner.SELF:
+                if actor.can_attack:
+                    self_combat += actor.combat_value
+                if actor.is_idle:
+                    idle_self_units += 1
+            elif actor.owner == ActorOwner.ENEMY:
+                if actor.can_attack:
+                    enemy_combat += actor.combat_value
+                if actor.category == ActorCategory.BUILDING:
+                    enemy_structures += 1
+                    enemy_bases += 1
+                elif actor.category == ActorCategory.MCV:
+                    enemy_bases += 1
+        sections = {
             "economy": {
                 **self.state.economy,
                 "queue_blocked": bool(queue_block_state.get("blocked")),
@@ -496,32 +774,13 @@ class WorldModel:
                 "enemy_units": len(self.state.enemy_ids),
                 "self_combat_value": round(self_combat, 2),
                 "enemy_combat_value": round(enemy_combat, 2),
-                "idle_self_units": len(
-                    [
-                        actor
-                        for actor in self.state.actors.values()
-                        if actor.owner == ActorOwner.SELF and actor.is_idle
-                    ]
-                ),
-                "bound_resources": len(self.resource_bindings),
+                "idle_self_units": idle_self_units,
             },
             "map": {k: v for k, v in self.state.map_info.items() if k != "is_explored"},
             "known_enemy": {
                 "units_spotted": len(self.state.enemy_ids),
-                "structures": len(
-                    [
-                        actor
-                        for actor in self.state.actors.values()
-                        if actor.owner == ActorOwner.ENEMY and actor.category == ActorCategory.BUILDING
-                    ]
-                ),
-                "bases": len(
-                    [
-                        actor
-                        for actor in self.state.actors.values()
-                        if actor.owner == ActorOwner.ENEMY and actor.category in {ActorCategory.BUILDING, ActorCategory.MCV}
-                    ]
-                ),
+                "structures": enemy_structures,
+                "bases": enemy_bases,
                 "combat_value": round(enemy_combat, 2),
                 "frozen_count": len(self.state.frozen_enemies),
                 "frozen_positions": [
@@ -530,15 +789,9 @@ class WorldModel:
                     if f.get("position")
                 ],
             },
-            "timestamp": self.state.timestamp,
-            "stale": self.state.stale,
-            "disconnected": self._last_refresh_disconnected,
-            "last_refresh_error": self._last_refresh_error,
-            "consecutive_refresh_failures": self._consecutive_refresh_failures,
-            "total_refresh_failures": self._total_refresh_failures,
-            "failure_threshold": self.stale_failure_threshold,
         }
-        return summary
+        self._summary_cache = (key, sections)
+        return sections
 
     def runtime_state(self) -> dict[str, Any]:
         return build_runtime_state_snapshot(
@@ -553,6 +806,23 @@ class WorldModel:
         ).to_dict()
 
     def battlefield_snapshot(self) -> dict[str, Any]:
+        """Battlefield overview, memoized until a refresh or a runtime-state/binding/constraint change.
+
+        Each call gets its own top-level dict and list/dict sections, so a
+        caller editing the result cannot corrupt later reads of the memo.
+        """
+        key = (self.state, *self._summary_key())
+        versions = (self._refresh_version, self._runtime_version, self.state.timestamp, self.state.stale)
+        cached = self._battlefield_cache
+        if cached is None or cached[0][1] != versions or not _same_objects(cached[0][0], key):
+            cached = ((key, versions), self._build_battlefield_snapshot())
+            self._battlefield_cache = cached
+        return {
+            name: list(value) if isinstance(value, list) else dict(value) if isinstance(value, dict) else value
+            for name, value in cached[1].items()
+        }
+
+    def _build_battlefield_snapshot(self) -> dict[str, Any]:
         summary = self.world_summary()
         economy = summary.get("economy", {})
         military = summary.get("military", {})
@@ -721,6 +991,7 @@ class WorldModel:
         capability_status: Optional[dict[str, Any]] = None,
         unit_reservations: Optional[list[dict[str, Any]]] = None,
     ) -> None:
+        self._runtime_version += 1
         if active_tasks is not None:
             self.active_tasks = dict(active_tasks)
         if active_jobs is not None:
@@ -970,30 +1241,50 @@ class WorldModel:
 
         # Merge Information Expert analyses under info_experts key.
         if self._info_experts:
-            enemy_actors = [
-                {
-                    "category": a.category.value if hasattr(a.category, "value") else str(a.category),
-                    "position": a.position,
-                }
-                for a in self.state.actors.values()
-                if a.owner == ActorOwner.ENEMY and a.is_alive
-            ]
-            recent_events = [
-                {"type": e.type.value if hasattr(e.type, "value") else str(e.type)}
-                for e in self._event_history[-20:]
-            ]
-            info_expert_data: dict[str, Any] = {}
-            for expert in self._info_experts:
-                try:
-                    info_expert_data.update(
-                        expert.analyze(facts, enemy_actors=enemy_actors, recent_events=recent_events)
-                    )
-                except Exception:
-                    pass  # never let an info expert crash the runtime facts call
-            facts["info_experts"] = info_expert_data
+            facts["info_experts"] = self._info_expert_analysis(facts)
 
         return facts
 
+    def defer_info_analysis(self, deferred: bool) -> None:
+        """Let runtime facts reuse the last non-urgent Information Expert analysis.
+
+        Set by GameLoop after a tick that overran its budget. A reused analysis
+        is at most INFO_ANALYSIS_MAX_DEFER_S old; one reporting an attack on the
+        base or a high threat level is always recomputed.
+        """
+        self._info_analysis_deferred = bool(deferred)
+
+    def _info_expert_analysis(self, facts: dict[str, Any]) -> dict[str, Any]:
+        now = time.time()
+        cached = self._info_analysis
+        if self._info_analysis_deferred and cached is not None and now - cached[0] <= INFO_ANALYSIS_MAX_DEFER_S:
+            data = cached[1]
+            urgent = bool(data.get("base_under_attack")) or str(data.get("threat_level") or "") in URGENT_THREAT_LEVELS
+            if not urgent:
+                return dict(data)
+        enemy_actors = [
+            {
+                "category": a.category.value if hasattr(a.category, "value") else str(a.category),
+                "position": a.position,
+            }
+            for a in self.state.actors.values()
+            if a.owner == ActorOwner.ENEMY and a.is_alive
+        ]
+        recent_events = [
+            {"type": e.type.value if hasattr(e.type, "value") else str(e.type)}
+            for e in self._event_history[-20:]
+        ]
+        info_expert_data: dict[str, Any] = {}
+        for expert in self._info_experts:
+            try:
+                info_expert_data.update(
+                    expert.analyze(facts, enemy_actors=enemy_actors, recent_events=recent_events)
+                )
+            except Exception:
+                pass  # never let an info expert crash the runtime facts call
+        self._info_analysis = (now, info_expert_data)
+        return dict(info_expert_data)
+
     def _demo_capability_issue_now_snapshot(self, *, faction: str | None = None) -> dict[str, dict[str, Any]]:
         """Split demo roster truth into safe-now vs prereq-only-but-blocked views."""
         buildable_now: dict[str, list[str]] = {}
@@ -1027,109 +1318,22 @@ class WorldModel:
             "buildable_blocked": buildable_blocked,
         }
 
+    def actor_counters(self) -> ActorCounters:
+        """O(1) aggregates over live self actors, kept in step with the actors layer."""
+        cached = self._actor_counters
+        actors = self.state.actors
+        if cached is not None and cached[0] is actors:
+            return cached[1]
+        counters = ActorCounters.build(actors.values())
+        self._actor_counters = (actors, counters)
+        return counters
+
     def _count_self_actors(self) -> dict[str, Any]:
         """Count self actors by category/building type. Shared by runtime_facts and buildable."""
-        has_construction_yard = False
-        power_plant_count = 0
-        barracks_count = 0
-        refinery_count = 0
-        war_factory_count = 0
-        radar_count = 0
-        tech_center_count = 0
-        repair_facility_count = 0
-        airfield_count = 0
-        mcv_count = 0
-        mcv_idle = False
-        harvester_count = 0
-        combat_unit_count = 0
-        faction_unit_types: list[str] = []
-        for actor in self.state.actors.values():
-            if actor.owner != ActorOwner.SELF or not actor.is_alive:
-                continue
-            unit_id = production_name_unit_id(actor.name) or production_name_unit_id(actor.display_name)
-            if unit_id:
-                faction_unit_types.append(unit_id)
-            if actor.category == ActorCategory.MCV:
-                mcv_count += 1
-                if actor.is_idle:
-                    mcv_idle = True
-            elif actor.category == ActorCategory.HARVESTER:
-                harvester_count += 1
-            elif actor.category in (ActorCategory.INFANTRY, ActorCategory.VEHICLE):
-                combat_unit_count += 1
-            elif actor.category == ActorCategory.BUILDING:
-                counter_field = demo_base_counter_field_for(unit_id)
-                if counter_field == "has_construction_yard":
-                    has_construction_yard = True
-                elif counter_field == "power_plant_count":
-                    power_plant_count += 1
-                elif counter_field == "barracks_count":
-                    barracks_count += 1
-                elif counter_field == "refinery_count":
-                    refinery_count += 1
-                elif counter_field == "war_factory_count":
-                    war_factory_count += 1
-                elif counter_field == "radar_count":
-                    radar_count += 1
-                elif counter_field == "tech_center_count":
-                    tech_center_count += 1
-                elif counter_field == "repair_facility_count":
-                    repair_facility_count += 1
-                elif counter_field == "airfield_count":
-                    airfield_count += 1
-        return {
-            "has_construction_yard": has_construction_yard,
-            "power_plant_count": power_plant_count,
-            "barracks_count": barracks_count,
-            "refinery_count": refinery_count,
-            "war_factory_count": war_factory_count,
-            "radar_count": radar_count,
-            "tech_center_count": tech_center_count,
-            "repair_facility_count": repair_facility_count,
-            "airfield_count": airfield_count,
-            "mcv_count": mcv_count,
-            "mcv_idle": mcv_idle,
-            "harvester_count": harvester_count,
-            "combat_unit_count": combat_unit_count,
-            "player_faction": demo_faction_hint_for_unit_types(faction_unit_types),
-        }
+        return self.actor_counters().counts()
 
     def _self_structure_power_state(self) -> dict[str, Any]:
-        disabled_structure_count = 0
-        powered_down_structure_count = 0
-        low_power_disabled_structure_count = 0
-        power_outage_structure_count = 0
-        disabled_structures: list[str] = []
-        for actor in self.state.actors.values():
-            if actor.owner != ActorOwner.SELF or not actor.is_alive or actor.category != ActorCategory.BUILDING:
-                continue
-            if actor.is_disabled:
-                disabled_structure_count += 1
-            if actor.is_powered_down:
-                powered_down_structure_count += 1
-            if actor.has_low_power and actor.is_disabled:
-                low_power_disabled_structure_count += 1
-            if actor.has_power_outage:
-                power_outage_structure_count += 1
-            if actor.is_disabled:
-                label = actor.display_name or actor.name
-                reason = actor.disabled_reason or (
-                    "powerdown"
-                    if actor.is_powered_down
-                    else "lowpower"
-                    if actor.has_low_power
-                    else "power-outage"
-                    if actor.has_power_outage
-                    else "disabled"
-                )
-                disabled_structures.append(f"{label}({reason})")
-        return {
-            "disabled_structure_count": disabled_structure_count,
-            "powered_down_structure_count": powered_down_structure_count,
-            "low_power_disabled_structure_count": low_power_disabled_structure_count,
-            "power_outage_structure_count": power_outage_structure_count,
-            "disabled_structures": disabled_structures,
-        }
+        return self.actor_counters().power_state()
 
     def runtime_facts_buildable(self) -> dict[str, list[str]]:
         """Return current buildable units per queue (lightweight, no task_id needed)."""
@@ -1468,22 +1672,32 @@ class WorldModel:
     def register_info_expert(self, expert: Any) -> None:
         """Register an Information Expert whose analyze() output is merged into runtime_facts."""
         self._info_experts.append(expert)
+        self._info_analysis = None
+        self._runtime_version += 1
 
     def bind_resource(self, resource_id: str, job_id: str) -> None:
         self.resource_bindings[resource_id] = job_id
+        self._runtime_version += 1
 
     def unbind_resource(self, resource_id: str) -> None:
         self.resource_bindings.pop(resource_id, None)
+        self._runtime_version += 1
 
     def set_constraint(self, constraint: Constraint) -> None:
         self.constraints[constraint.constraint_id] = constraint
+        self._runtime_version += 1
 
     def remove_constraint(self, constraint_id: str) -> None:
         self.constraints.pop(constraint_id, None)
+        self._runtime_version += 1
 
     def last_refresh_layers(self) -> list[str]:
         return list(self._last_refresh_layers)
 
+    def layer_generation(self, layer: str) -> int:
+        """Monotonic counter bumped whenever ``layer`` ("actors"/"economy"/"map") changes."""
+        return self._layer_generations[layer]
+
     def recent_events(self, limit: int = 20) -> list[Event]:
         return list(self._event_history[-limit:])
 
@@ -1505,6 +1719,16 @@ class WorldModel:
         self._last_map_refresh = 0.0
         self._layer_retry_after = {"actors": 0.0, "economy": 0.0, "map": 0.0}
         self._map_static_fetched = False
+        self._actor_delta_version = None
+        self._changed_actor_ids = None
+        # Generations stay monotonic across resets so cached derivations never match a new match's state.
+        for layer in self._layer_generations:
+            self._layer_generations[layer] += 1
+        self._refresh_version += 1
+        self._summary_cache = None
+        self._battlefield_cache = None
+        self._grid_geometry = None
+        self._info_analysis = None
         self._pending_events = []
         self._last_refresh_layers = []
         self._frontline_weak_active = False
@@ -1660,15 +1884,90 @@ class WorldModel:
         actors: dict[int, NormalizedActor] = {}
         self_ids: set[int] = set()
         enemy_ids: set[int] = set()
+        counters = ActorCounters()
         for raw in self_actors:
             actor = self._normalize_actor(raw, ActorOwner.SELF, timestamp)
+            previous = actors.get(actor.actor_id)
+            if previous is not None:
+                counters.remove(previous)
             actors[actor.actor_id] = actor
             self_ids.add(actor.actor_id)
+            counters.add(actor)
         for raw in enemy_actors:
             actor = self._normalize_actor(raw, ActorOwner.ENEMY, timestamp)
+            previous = actors.get(actor.actor_id)
+            if previous is not None:
+                counters.remove(previous)
             actors[actor.actor_id] = actor
             enemy_ids.add(actor.actor_id)
-        return {"actors": actors, "self_ids": self_ids, "enemy_ids": enemy_ids}
+        return {"actors": actors, "self_ids": self_ids, "enemy_ids": enemy_ids, "counters": counters}
+
+    def _apply_actor_delta(self, delta: ActorDeltaResult, timestamp: float) -> bool:
+        """Patch the actors layer from a server-side actor delta.
+
+        Only added/changed actors are normalized; unchanged actors keep their
+        existing ``NormalizedActor`` (and its ``timestamp`` of last change).
+        The patched containers are copies, so shared snapshots stay intact.
+        Returns False when the delta was empty and the layer was left as is.
+        """
+        self._actor_delta_version = delta.Version
+        if not delta.Full and not (delta.Removed or delta.Added or delta.Changed):
+            self._changed_actor_ids = set()
+            return False
+        if delta.Full:
+            actors: dict[int, NormalizedActor] = {}
+            self_ids: set[int] = set()
+            enemy_ids: set[int] = set()
+            counters = ActorCounters()
+        else:
+            counters = self.actor_counters().copy()
+            actors = dict(self.state.actors)
+            self_ids = set(self.state.self_ids)
+            enemy_ids = set(self.state.enemy_ids)
+        changed: set[int] = set()
+        for actor_id in delta.Removed:
+            removed = actors.pop(actor_id, None)
+            if removed is not None:
+                changed.add(actor_id)
+                counters.remove(removed)
+            self_ids.discard(actor_id)
+            enemy_ids.discard(actor_id)
+        for raw in (*delta.Added, *delta.Changed):
+            known = actors.get(int(getattr(raw, "actor_id")))
+            actor = self._normalize_actor(raw, known.owner if known else ActorOwner.ENEMY, timestamp)
+            if known is not None:
+                counters.remove(known)
+            counters.add(actor)
+            actors[actor.actor_id] = actor
+            changed.add(actor.actor_id)
+            self_ids.discard(actor.actor_id)
+            enemy_ids.discard(actor.actor_id)
+            if actor.owner == ActorOwner.SELF:
+                self_ids.add(actor.actor_id)
+            elif actor.owner == ActorOwner.ENEMY:
+                enemy_ids.add(actor.actor_id)
+        self.state.actors = actors
+        self.state.self_ids = self_ids
+        self.state.enemy_ids = enemy_ids
+        self._actor_counters = (actors, counters)
+        self._changed_actor_ids = None if delta.Full else changed
+        return True
+
+    def _update_frozen_enemies(self, frozen_raw: Sequence[FrozenActor]) -> None:
+        visible_positions = {
+            (a.position[0], a.position[1])
+            for a in self.state.actors.values()
+            if a.owner == ActorOwner.ENEMY and a.position
+        }
+        self.state.frozen_enemies = [
+            {
+                "type": getattr(f, "type", None),
+                "faction": getattr(f, "faction", None),
+                "position": [f.position.x, f.position.y] if f.position else None,
+            }
+            for f in frozen_raw or []
+            if f.position and (f.position.x, f.position.y) not in visible_positions
+        ]
 
     def _normalize_actor(self, raw: Actor, default_owner: ActorOwner, timestamp: float) -> NormalizedActor:
         raw_name = getattr(raw, "type", None) or "unknown"
@@ -1727,16 +2026,16 @@ class WorldModel:
         if map_info is None:
             return {"width": 0, "height": 0, "explored_pct": 0.0, "visible_pct": 0.0, "timestamp": timestamp}
         # Use C#-computed explored_pct if available, otherwise compute from grid.
+        # Grids arrive as NumPy arrays from GameAPI.map_query (nested lists from test doubles).
+        is_explored = as_grid_array(getattr(map_info, "IsExplored", None), bool)
         server_explored_pct = getattr(map_info, "explored_pct", None)
         if server_explored_pct is not None:
             explored_pct = float(server_explored_pct)
         else:
-            explored_pct = self._grid_ratio(getattr(map_info, "IsExplored", []))
-        visible_pct = self._grid_ratio(getattr(map_info, "IsVisible", []))
-        resources = getattr(map_info, "Resources", []) or []
-        remaining_resources = sum(sum(row) for row in resources) if resources else 0
-        # Store IsExplored grid for query("map_raw") consumers (e.g. ReconJob).
-        is_explored = getattr(map_info, "IsExplored", None)
+            explored_pct = grid_ratio(is_explored)
+        visible_pct = grid_ratio(getattr(map_info, "IsVisible", None))
+        resources = as_grid_array(getattr(map_info, "Resources", None), np.int64)
+        remaining_resources = int(resources.sum()) if resources is not None else 0
         result = {
             "width": int(getattr(map_info, "MapWidth", 0) or 0),
             "height": int(getattr(map_info, "MapHeight", 0) or 0),
@@ -1745,10 +2044,39 @@ class WorldModel:
             "remaining_resources": remaining_resources,
             "timestamp": timestamp,
         }
-        if is_explored and is_explored != [[]]:
+        if is_explored is not None:
+            # Stored as a (w, h) bool array for query("map_raw") consumers (e.g. ReconJob).
             result["is_explored"] = is_explored
         return result
 
+    def _apply_grid_geometry(self, map_info: dict[str, Any]) -> None:
+        """Attach ``grid_origin`` / ``grid_layout`` to ``map_info``.
+
+        Both are properties of the map, so they are detected once per map size
+        (probing explored cells under our own actors) and reused until
+        ``reset_snapshot``. Nothing is attached until we own an actor to probe with.
+        """
+        width = int(map_info.get("width") or 0)
+        height = int(map_info.get("height") or 0)
+        grid = map_info.get("is_explored")
+        if not width or not height or grid is None:
+            return
+        cached = self._grid_geometry
+        if cached is None or cached[0] != (width, height):
+            own = [
+                actor
+                for actor in self.state.actors.values()
+                if actor.owner == ActorOwner.SELF and actor.is_alive
+            ]
+            own.sort(key=lambda actor: actor.category != ActorCategory.BUILDING)
+            positions = [tuple(actor.position) for actor in own[:GRID_GEOMETRY_PROBES]]
+            if not positions:
+                return
+            origin, layout = frontier_grid(grid, width, height).detect_geometry(positions)
+            cached = self._grid_geometry = ((width, height), origin, layout)
+        map_info["grid_origin"] = cached[1]
+        map_info["grid_layout"] = cached[2]
+
     def _normalize_queues(self, queues: Mapping[str, dict[str, Any]], timestamp: float) -> dict[str, dict[str, Any]]:
         normalized: dict[str, dict[str, Any]] = {}
         for queue_name, queue in queues.items():
@@ -1760,10 +2088,21 @@ class WorldModel:
             }
         return normalized
 
-    def _detect_events(self, previous: WorldState, current: WorldState, timestamp: float) -> list[Event]:
+    def _detect_events(
+        self,
+        previous: WorldState,
+        current: WorldState,
+        timestamp: float,
+        *,
+        changed_layers: Optional[set[str]] = None,
+    ) -> list[Event]:
         if previous.timestamp <= 0:
             return []
-        if self._is_probable_match_reset(previous, current):
+        changed = {"actors", "economy", "map"} if changed_layers is None else changed_layers
+        if not changed & {"actors", "economy"}:
+            return []
+        actors_changed = "actors" in changed
+        if actors_changed and self._is_probable_match_reset(previous, current):
             return [
                 Event(
                     type=EventType.GAME_RESET,
@@ -1775,9 +2114,11 @@ class WorldModel:
                 )
             ]
         events: list[Event] = []
-        events.extend(self._detect_actor_events(previous, current, timestamp))
-        events.extend(self._detect_queue_events(previous, current, timestamp))
-        events.extend(self._detect_summary_events(current, timestamp))
+        if actors_changed:
+            events.extend(self._detect_actor_events(previous, current, timestamp))
+        if "economy" in changed:
+            events.extend(self._detect_queue_events(previous, current, timestamp))
+        events.extend(self._detect_summary_events(current, timestamp, changed_layers=changed))
         events.sort(key=lambda item: item.timestamp)
         return events
 
@@ -1855,7 +2196,11 @@ class WorldModel:
                 )
             )
 
-        for actor_id in sorted(previous_ids & current_ids):
+        persisted_ids = previous_ids & current_ids
+        if self._changed_actor_ids is not None:
+            # Delta refresh: actors outside the changed set are the same objects as before.
+            persisted_ids &= self._changed_actor_ids
+        for actor_id in sorted(persisted_ids):
             old_actor = previous.actors[actor_id]
             new_actor = current.actors[actor_id]
             if new_actor.hp < old_actor.hp:
@@ -1949,24 +2294,35 @@ class WorldModel:
             )
         return events
 
-    def _detect_summary_events(self, current: WorldState, timestamp: float) -> list[Event]:
+    def _detect_summary_events(
+        self,
+        current: WorldState,
+        timestamp: float,
+        *,
+        changed_layers: Optional[set[str]] = None,
+    ) -> list[Event]:
         events: list[Event] = []
-        self_combat = sum(
-            actor.combat_value for actor in current.actors.values() if actor.owner == ActorOwner.SELF and actor.can_attack
-        )
-        enemy_combat = sum(
-            actor.combat_value for actor in current.actors.values() if actor.owner == ActorOwner.ENEMY and actor.can_attack
-        )
-        frontline_weak = enemy_combat >= max(300.0, self_combat * 1.5)
-        if frontline_weak and not self._frontline_weak_active:
-            events.append(
-                Event(
-                    type=EventType.FRONTLINE_WEAK,
-                    data={"self_combat_value": round(self_combat, 2), "enemy_combat_value": round(enemy_combat, 2)},
-                    timestamp=timestamp,
-                )
+        changed = {"actors", "economy", "map"} if changed_layers is None else changed_layers
+        if "actors" in changed:
+            self_combat = sum(
+                actor.combat_value for actor in current.actors.values() if actor.owner == ActorOwner.SELF and actor.can_attack
             )
-        self._frontline_weak_active = frontline_weak
+            enemy_combat = sum(
+                actor.combat_value for actor in current.actors.values() if actor.owner == ActorOwner.ENEMY and actor.can_attack
+            )
+            frontline_weak = enemy_combat >= max(300.0, self_combat * 1.5)
+            if frontline_weak and not self._frontline_weak_active:
+                events.append(
+                    Event(
+                        type=EventType.FRONTLINE_WEAK,
+                        data={"self_combat_value": round(self_combat, 2), "enemy_combat_value": round(enemy_combat, 2)},
+                        timestamp=timestamp,
+                    )
+                )
+            self._frontline_weak_active = frontline_weak
+
+        if "economy" not in changed:
+            return events
 
         total_credits = float(current.economy.get("total_credits", 0))
         active_queue_items = sum(
@@ -2022,13 +2378,12 @@ class WorldModel:
         return self._has_nearby_enemy_combat_units(new_actor.position, current)
 
     def _has_nearby_enemy_combat_units(self, position: tuple[int, int], current: WorldState) -> bool:
-        for actor_id in current.enemy_ids:
-            actor = current.actors[actor_id]
-            if not actor.can_attack:
-                continue
-            if self._distance(position, actor.position) <= BASE_ATTACK_NEARBY_ENEMY_RADIUS:
-                return True
-        return False
+        nearby = self._spatial_index(current).within(
+            position,
+            BASE_ATTACK_NEARBY_ENEMY_RADIUS,
+            lambda actor: actor.can_attack and actor.actor_id in current.enemy_ids,
+        )
+        return bool(nearby)
 
     def _queue_done_state(self, queues: Mapping[str, dict[str, Any]]) -> dict[tuple[Any, ...], dict[str, Any]]:
         state: dict[tuple[Any, ...], dict[str, Any]] = {}
@@ -2053,9 +2408,9 @@ class WorldModel:
         if faction is None:
             return default_owner
         normalized = str(faction).lower()
-        if normalized in {"self", "ally", "自己"}:
+        if normalized in {"self", "ally", "自己", "己方", "友方"}:
             return ActorOwner.SELF
-        if normalized in {"enemy", "敌人"}:
+        if normalized in {"enemy", "敌人", "敌方"}:
             return ActorOwner.ENEMY
         if normalized in {"neutral", "中立"}:
             return ActorOwner.NEUTRAL
@@ -2171,14 +2526,6 @@ class WorldModel:
             return (int(location[0]), int(location[1]))
         return (0, 0)
 
-    def _grid_ratio(self, grid: Sequence[Sequence[bool]]) -> float:
-        total = 0
-        visible = 0
-        for row in grid:
-            total += len(row)
-            visible += sum(1 for cell in row if cell)
-        return (visible / total) if total else 0.0
-
     def _centroid(self, positions: Sequence[tuple[int, int]]) -> Optional[tuple[int, int]]:
         if not positions:
             return None
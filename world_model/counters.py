@@ -0,0 +1,136 @@
+"""Incrementally maintained aggregates over the player's own actors."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from models import ActorCategory, ActorOwner, NormalizedActor
+from openra_api.production_names import production_name_unit_id
+from openra_state.data.dataset import demo_base_counter_field_for, demo_faction_hint_for_unit_types
+
+BASE_COUNTER_FIELDS: tuple[str, ...] = (
+    "power_plant_count",
+    "barracks_count",
+    "refinery_count",
+    "war_factory_count",
+    "radar_count",
+    "tech_center_count",
+    "repair_facility_count",
+    "airfield_count",
+)
+_POWER_FIELDS: tuple[str, ...] = (
+    "disabled_structure_count",
+    "powered_down_structure_count",
+    "low_power_disabled_structure_count",
+    "power_outage_structure_count",
+)
+
+
+def _disabled_label(actor: NormalizedActor) -> str:
+    label = actor.display_name or actor.name
+    reason = actor.disabled_reason or (
+        "powerdown"
+        if actor.is_powered_down
+        else "lowpower"
+        if actor.has_low_power
+        else "power-outage"
+        if actor.has_power_outage
+        else "disabled"
+    )
+    return f"{label}({reason})"
+
+
+class ActorCounters:
+    """Building/unit counts and structure power state for live self actors.
+
+    ``add``/``remove`` apply one actor's contribution, so an actor delta costs
+    O(changed actors) and every read is O(1) in the number of actors.
+    """
+
+    __slots__ = ("fields", "unit_types", "_disabled")
+
+    def __init__(self) -> None:
+        self.fields: Counter[str] = Counter()
+        self.unit_types: Counter[str] = Counter()
+        self._disabled: dict[int, str] = {}
+
+    @classmethod
+    def build(cls, actors: Iterable[NormalizedActor]) -> "ActorCounters":
+        counters = cls()
+        for actor in actors:
+            counters.add(actor)
+        return counters
+
+    def copy(self) -> "ActorCounters":
+        clone = ActorCounters()
+        clone.fields = Counter(self.fields)
+        clone.unit_types = Counter(self.unit_types)
+        clone._disabled = dict(self._disabled)
+        return clone
+
+    def add(self, actor: NormalizedActor) -> None:
+        self._apply(actor, 1)
+
+    def remove(self, actor: NormalizedActor) -> None:
+        self._apply(actor, -1)
+
+    def _apply(self, actor: NormalizedActor, sign: int) -> None:
+        if actor.owner != ActorOwner.SELF or not actor.is_alive:
+            return
+        fields = self.fields
+        unit_id = production_name_unit_id(actor.name) or production_name_unit_id(actor.display_name)
+        if unit_id:
+            self.unit_types[unit_id] += sign
+            if self.unit_types[unit_id] <= 0:
+                del self.unit_types[unit_id]
+        if actor.category == ActorCategory.MCV:
+            fields["mcv_count"] += sign
+            if actor.is_idle:
+                fields["mcv_idle_count"] += sign
+        elif actor.category == ActorCategory.HARVESTER:
+            fields["harvester_count"] += sign
+        elif actor.category in (ActorCategory.INFANTRY, ActorCategory.VEHICLE):
+            fields["combat_unit_count"] += sign
+        elif actor.category == ActorCategory.BUILDING:
+            counter_field: Optional[str] = demo_base_counter_field_for(unit_id)
+            if counter_field == "has_construction_yard":
+                fields["construction_yard_count"] += sign
+            elif counter_field in BASE_COUNTER_FIELDS:
+                fields[counter_field] += sign
+            if actor.is_disabled:
+                fields["disabled_structure_count"] += sign
+                if sign > 0:
+                    self._disabled[actor.actor_id] = _disabled_label(actor)
+                else:
+                    self._disabled.pop(actor.actor_id, None)
+            if actor.is_powered_down:
+                fields["powered_down_structure_count"] += sign
+            if actor.has_low_power and actor.is_disabled:
+                fields["low_power_disabled_structure_count"] += sign
+            if actor.has_power_outage:
+                fields["power_outage_structure_count"] += sign
+
+    def counts(self) -> dict[str, Any]:
+        """Same shape as ``WorldModel._count_self_actors``."""
+        fields = self.fields
+        result: dict[str, Any] = {"has_construction_yard": fields["construction_yard_count"] > 0}
+        for name in BASE_COUNTER_FIELDS:
+            result[name] = fields[name]
+        result.update(
+            {
+                "mcv_count": fields["mcv_count"],
+                "mcv_idle": fields["mcv_idle_count"] > 0,
+                "harvester_count": fields["harvester_count"],
+                "combat_unit_count": fields["combat_unit_count"],
+                "player_faction": demo_faction_hint_for_unit_types(tuple(self.unit_types)),
+            }
+        )
+        return result
+
+    def power_state(self) -> dict[str, Any]:
+        """Same shape as ``WorldModel._self_structure_power_state``."""
+        result: dict[str, Any] = {name: self.fields[name] for name in _POWER_FIELDS}
+        result["disabled_structures"] = list(self._disabled.values())
+        return result
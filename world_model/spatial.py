@@ -0,0 +1,125 @@
+"""Bucketed spatial index for actor proximity queries."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+import math
+from typing import Any, Generic, Optional, TypeVar
+
+DEFAULT_CELL_SIZE = 16
+
+T = TypeVar("T")
+
+
+class SpatialIndex(Generic[T]):
+    """Uniform-grid buckets over items with a ``position`` ``(x, y)`` attribute.
+
+    Radius queries only visit the buckets overlapping the query circle, so
+    proximity checks cost roughly the number of nearby items instead of a
+    scan over every actor. The index is immutable once built; rebuild it when
+    the underlying actors change.
+    """
+
+    __slots__ = ("cell_size", "_buckets", "_size")
+
+    def __init__(self, items: Iterable[T] = (), *, cell_size: int = DEFAULT_CELL_SIZE) -> None:
+        self.cell_size = max(int(cell_size), 1)
+        self._buckets: dict[tuple[int, int], list[T]] = {}
+        self._size = 0
+        for item in items:
+            position = getattr(item, "position", None)
+            if not position:
+                continue
+            self._buckets.setdefault(self._cell(position[0], position[1]), []).append(item)
+            self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def within(
+        self,
+        position: tuple[float, float],
+        radius: float,
+        predicate: Optional[Callable[[T], bool]] = None,
+    ) -> list[T]:
+        """Items whose Euclidean distance to ``position`` is at most ``radius``."""
+        if radius < 0 or not self._buckets:
+            return []
+        px, py = float(position[0]), float(position[1])
+        min_cx, min_cy = self._cell(px - radius, py - radius)
+        max_cx, max_cy = self._cell(px + radius, py + radius)
+        radius_sq = float(radius) * float(radius)
+        matched: list[T] = []
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(self._buckets):
+            # Query circle covers more cells than are occupied: walk the buckets instead.
+            candidates: Iterable[list[T]] = (
+                bucket
+                for (cx, cy), bucket in self._buckets.items()
+                if min_cx <= cx <= max_cx and min_cy <= cy <= max_cy
+            )
+        else:
+            candidates = (
+                self._buckets[(cx, cy)]
+                for cx in range(min_cx, max_cx + 1)
+                for cy in range(min_cy, max_cy + 1)
+                if (cx, cy) in self._buckets
+            )
+        for bucket in candidates:
+            for item in bucket:
+                ix, iy = item.position[0], item.position[1]
+                if (ix - px) ** 2 + (iy - py) ** 2 > radius_sq:
+                    continue
+                if predicate is not None and not predicate(item):
+                    continue
+                matched.append(item)
+        return matched
+
+    def nearest(
+        self,
+        position: tuple[float, float],
+        predicate: Optional[Callable[[T], bool]] = None,
+        *,
+        max_distance: Optional[float] = None,
+    ) -> Optional[T]:
+        """Closest matching item (ties broken by ``actor_id``), or None."""
+        if not self._buckets:
+            return None
+        px, py = float(position[0]), float(position[1])
+        center_cx, center_cy = self._cell(px, py)
+        span = max(
+            max(abs(cx - center_cx), abs(cy - center_cy)) for cx, cy in self._buckets
+        )
+        if max_distance is not None:
+            span = min(span, int(math.ceil(max_distance / self.cell_size)) + 1)
+        best: Optional[T] = None
+        best_key: Optional[tuple[float, Any]] = None
+        for ring in range(span + 1):
+            # Anything in ring r is at least (r - 1) * cell_size away.
+            if best_key is not None and best_key[0] < ((ring - 1) * self.cell_size) ** 2:
+                break
+            for cell in self._ring(center_cx, center_cy, ring):
+                for item in self._buckets.get(cell, ()):
+                    dist_sq = (item.position[0] - px) ** 2 + (item.position[1] - py) ** 2
+                    if max_distance is not None and dist_sq > max_distance * max_distance:
+                        continue
+                    if predicate is not None and not predicate(item):
+                        continue
+                    key = (dist_sq, getattr(item, "actor_id", 0))
+                    if best_key is None or key < best_key:
+                        best, best_key = item, key
+        return best
+
+    @staticmethod
+    def _ring(cx: int, cy: int, ring: int) -> Iterable[tuple[int, int]]:
+        if ring == 0:
+            yield (cx, cy)
+            return
+        for x in range(cx - ring, cx + ring + 1):
+            yield (x, cy - ring)
+            yield (x, cy + ring)
+        for y in range(cy - ring + 1, cy + ring):
+            yield (cx - ring, y)
+            yield (cx + ring, y)
@@ -0,0 +1,98 @@
+"""Read-only typed views over WorldModel actors for in-process callers.
+
+``WorldModel.query`` materializes a fresh dict per actor so results can cross
+JSON boundaries (tools, WebSocket). In-process callers that only read a few
+fields use ``query_view`` instead: the same envelope, but each actor is an
+``ActorView`` wrapping the live ``NormalizedActor`` without copying it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from enum import Enum
+from typing import Any, Optional
+
+from models import NormalizedActor
+
+ACTOR_FIELDS: tuple[str, ...] = (
+    "actor_id",
+    "name",
+    "display_name",
+    "owner",
+    "category",
+    "position",
+    "hp",
+    "hp_max",
+    "is_alive",
+    "is_idle",
+    "mobility",
+    "combat_value",
+    "can_attack",
+    "can_harvest",
+    "weapon_range",
+    "is_disabled",
+    "is_powered_down",
+    "has_low_power",
+    "has_power_outage",
+    "disabled_reason",
+    "timestamp",
+)
+_FIELD_SET = frozenset(ACTOR_FIELDS)
+
+ACTOR_QUERY_TYPES = frozenset({"actors", "my_actors", "enemy_actors", "find_actors", "actor_by_id"})
+
+
+class ActorView(Mapping[str, Any]):
+    """Zero-copy, read-only view of one ``NormalizedActor``.
+
+    Item access mirrors the dict form of ``WorldModel.query`` (enum fields as
+    their string values, ``position`` as a list), so existing ``actor["hp"]`` /
+    ``actor.get("position")`` call sites keep working. Attribute access
+    (``view.position``, ``view.owner``) returns the typed values directly.
+    """
+
+    __slots__ = ("actor",)
+
+    def __init__(self, actor: NormalizedActor) -> None:
+        object.__setattr__(self, "actor", actor)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        value = getattr(self.actor, key)
+        if isinstance(value, Enum):
+            return value.value
+        if key == "position":
+            return list(value)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(ACTOR_FIELDS)
+
+    def __len__(self) -> int:
+        return len(ACTOR_FIELDS)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.actor, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ActorView is read-only")
+
+    def __repr__(self) -> str:
+        return f"ActorView({self.actor.actor_id}, {self.actor.name!r})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain dict for JSON boundaries."""
+        return {key: self[key] for key in ACTOR_FIELDS}
+
+
+def actor_view(actor: Optional[NormalizedActor]) -> Optional[ActorView]:
+    return ActorView(actor) if actor is not None else None
+
+
+def query_view(world_model: Any, query_type: str, params: Optional[dict[str, Any]] = None) -> Any:
+    """``world_model.query_view`` when available, else the plain dict ``query``."""
+    view = getattr(world_model, "query_view", None)
+    if callable(view):
+        return view(query_type, params)
+    return world_model.query(query_type, params)
@@ -1,5 +1,6 @@
 # WebSocket backend server
 
+from .delta import DeltaStream, apply_patch, diff_documents
 from .server import InboundHandler, NoOpInboundHandler, WSServer, WSServerConfig
 
 __all__ = [
@@ -7,4 +8,7 @@ __all__ = [
     "WSServerConfig",
     "InboundHandler",
     "NoOpInboundHandler",
+    "DeltaStream",
+    "apply_patch",
+    "diff_documents",
 ]
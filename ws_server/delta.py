@@ -0,0 +1,112 @@
+"""Versioned JSON documents pushed as JSON-patch style deltas.
+
+A :class:`DeltaStream` keeps the last few published versions of one outbound
+document (e.g. ``world_snapshot``). Clients that opted into deltas receive
+``{"base_version", "version", "ops"}`` against the version they were last
+sent; everyone else (and anyone whose base fell out of the history) gets the
+full document.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import copy
+import json
+from typing import Any, Optional
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff_documents(old: Any, new: Any, path: str = "") -> list[dict[str, Any]]:
+    """RFC 6902 ``add``/``remove``/``replace`` ops turning ``old`` into ``new``.
+
+    Dicts are diffed key by key and equal-length lists element by element;
+    lists whose length changed are replaced whole.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: list[dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(str(key))}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(str(key))}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            elif old[key] != value:
+                ops.extend(diff_documents(old[key], value, child))
+        return ops
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        ops = []
+        for index, (left, right) in enumerate(zip(old, new)):
+            if left != right:
+                ops.extend(diff_documents(left, right, f"{path}/{index}"))
+        return ops
+    if old == new and type(old) is type(new):
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(document: Any, ops: list[dict[str, Any]]) -> Any:
+    """Apply ops produced by :func:`diff_documents` to a copy of ``document``."""
+    result = copy.deepcopy(document)
+    for op in ops:
+        tokens = [_unescape(token) for token in op["path"].split("/")[1:]]
+        if not tokens:
+            result = copy.deepcopy(op.get("value"))
+            continue
+        parent = result
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last: Any = int(tokens[-1]) if isinstance(parent, list) else tokens[-1]
+        if op["op"] == "remove":
+            del parent[last]
+        else:
+            parent[last] = copy.deepcopy(op.get("value"))
+    return result
+
+
+class DeltaStream:
+    """Version history for one outbound document."""
+
+    def __init__(self, name: str, *, history: int = 8) -> None:
+        self.name = name
+        self.version = 0
+        self._history: OrderedDict[int, Any] = OrderedDict()
+        self._max_history = max(1, int(history))
+
+    @property
+    def document(self) -> Any:
+        return self._history[self.version] if self.version in self._history else None
+
+    def get(self, version: Optional[int]) -> Any:
+        """Document recorded for ``version``, or None once it left the history."""
+        return self._history.get(version) if version is not None else None
+
+    def publish(self, document: Any, *, canonical: bool = True) -> int:
+        """Record ``document`` and return its version (unchanged documents keep the current one).
+
+        With ``canonical=False`` the caller hands over a freshly built document it
+        will not mutate; it is stored and compared as-is instead of through a
+        canonical JSON copy.
+        """
+        # Canonical JSON copy: decouples history from the caller and matches what clients decode.
+        recorded = json.loads(json.dumps(document, ensure_ascii=False)) if canonical else document
+        if self.version in self._history and self._history[self.version] == recorded:
+            return self.version
+        self.version += 1
+        self._history[self.version] = recorded
+        while len(self._history) > self._max_history:
+            self._history.popitem(last=False)
+        return self.version
+
+    def has_version(self, version: Optional[int]) -> bool:
+        return version is not None and version in self._history
+
+    def patch_ops(self, base_version: int) -> list[dict[str, Any]]:
+        return diff_documents(self._history[base_version], self._history[self.version])
@@ -2,12 +2,30 @@
 
 Inbound: command_submit, command_cancel, mode_switch, question_reply, game_restart,
          session_clear, session_select, task_replay_request, sync_request,
-         diagnostics_sync_request
-Outbound: world_snapshot, task_update, task_list, log_entry, player_notification,
+         diagnostics_sync_request, snapshot_resync, voice_start, voice_stop,
+         voice_cancel (+ binary audio frames)
+Outbound: world_snapshot, world_snapshot_patch, task_update, task_list,
+          task_list_patch, log_entry, player_notification,
           query_response, session_cleared, session_catalog, session_task_catalog,
-          session_history
+          session_history, asr_partial, asr_final
 
 All payloads carry timestamp. JSON serialization. Built on aiohttp.
+
+Delta protocol: clients that send ``sync_request`` with ``"delta": true``
+receive versioned world_snapshot / task_list documents and then
+``world_snapshot_patch`` / ``task_list_patch`` messages
+(``{"base_version", "version", "ops"}``, JSON-patch ops) against the version
+they were last sent, or the full document when no usable base exists. A client
+whose state diverged sends ``snapshot_resync`` (optional ``stream``) to get the
+full documents again.
+
+Streaming voice: ``voice_start`` (optional ``format`` default pcm,
+``sample_rate`` default 16000, ``submit``) opens a recognition stream for the
+client; binary frames that follow are forwarded to the recognizer as they
+arrive and ``asr_partial`` (``{"text", "sentence_end"}``) is pushed on every
+transcript revision. ``voice_stop`` returns ``asr_final`` (``{"ok", "text"}``)
+and, with ``submit``, hands the transcript straight to ``on_command_submit``
+without waiting for the client to resend it. ``voice_cancel`` drops the stream.
 """
 
 from __future__ import annotations
@@ -17,10 +35,14 @@ import json
 import logging
 import time
 from dataclasses import dataclass
-from typing import Any, Optional, Protocol
+from typing import Any, Callable, Optional, Protocol
 
 from aiohttp import web, WSMsgType
 
+from voice.streaming import StreamingASRSession, StreamingRecognizer
+
+from .delta import DeltaStream
+
 logger = logging.getLogger(__name__)
 
 _REQUIRED_STRING_FIELDS: dict[str, tuple[str, ...]] = {
@@ -111,7 +133,24 @@ class WSServerConfig:
     voice_enabled: bool = False
 
 
+# (audio_format, sample_rate) -> recognizer for one utterance.
+ASRStreamFactory = Callable[[str, int], StreamingRecognizer]
+
+
+def _dashscope_stream_factory(audio_format: str, sample_rate: int) -> StreamingRecognizer:
+    from voice.asr import DashScopeStreamingRecognizer
+
+    return DashScopeStreamingRecognizer(audio_format=audio_format, sample_rate=sample_rate)
+
+
+@dataclass
+class _VoiceStream:
+    session: StreamingASRSession
+    submit: bool
+
+
 _THROTTLE_INTERVAL: float = 1.0  # seconds — world_snapshot and task_list max rate
+_DELTA_STREAMS: tuple[str, ...] = ("world_snapshot", "task_list")
 
 
 class WSServer:
@@ -121,9 +160,11 @@ class WSServer:
         self,
         config: Optional[WSServerConfig] = None,
         inbound_handler: Optional[InboundHandler] = None,
+        asr_stream_factory: Optional[ASRStreamFactory] = None,
     ) -> None:
         self.config = config or WSServerConfig()
         self.inbound_handler = inbound_handler or NoOpInboundHandler()
+        self.asr_stream_factory = asr_stream_factory or _dashscope_stream_factory
         self._clients: dict[str, web.WebSocketResponse] = {}
         self._client_counter = 0
         self._app: Optional[web.Application] = None
@@ -132,6 +173,11 @@ class WSServer:
         self._last_world_snapshot_at: float = 0.0
         self._last_task_list_at: float = 0.0
         self._broadcast_send_timeout_s: float = 5.0
+        self._streams: dict[str, DeltaStream] = {name: DeltaStream(name) for name in _DELTA_STREAMS}
+        self._delta_clients: set[str] = set()
+        # Last stream version sent to each client: {client_id: {stream: version}}.
+        self._client_versions: dict[str, dict[str, int]] = {}
+        self._voice_streams: dict[str, _VoiceStream] = {}
 
     # --- Lifecycle ---
 
@@ -177,10 +223,14 @@ class WSServer:
     async def stop(self) -> None:
         """Stop the server and disconnect all clients."""
         self._running = False
+        for client_id in list(self._voice_streams):
+            await self._cancel_voice_stream(client_id)
         # Close all WS connections
         for ws in list(self._clients.values()):
             await ws.close()
         self._clients.clear()
+        self._delta_clients.clear()
+        self._client_versions.clear()
         if self._runner:
             await self._runner.cleanup()
         logger.info("WS server stopped")
@@ -224,10 +274,13 @@ class WSServer:
                             "message": str(e),
                             "timestamp": time.time(),
                         })
+                elif msg.type == WSMsgType.BINARY:
+                    await self._handle_voice_frame(msg.data, client_id)
                 elif msg.type == WSMsgType.ERROR:
                     logger.warning("WS error from %s: %s", client_id, ws.exception())
         finally:
-            self._clients.pop(client_id, None)
+            await self._cancel_voice_stream(client_id)
+            self._forget_client(client_id)
             logger.info("Client disconnected: %s (total: %d)", client_id, len(self._clients))
 
         return ws
@@ -277,7 +330,14 @@ class WSServer:
         elif msg_type == "game_restart":
             await self.inbound_handler.on_game_restart(message.get("save_path"), client_id)
         elif msg_type == "sync_request":
+            self._client_versions.pop(client_id, None)
+            if message.get("delta"):
+                self._delta_clients.add(client_id)
+            else:
+                self._delta_clients.discard(client_id)
             await self.inbound_handler.on_sync_request(client_id)
+        elif msg_type == "snapshot_resync":
+            await self._resync_client(client_id, message.get("stream"))
         elif msg_type == "diagnostics_sync_request":
             await self.inbound_handler.on_diagnostics_sync_request(client_id)
         elif msg_type == "session_clear":
@@ -294,6 +354,12 @@ class WSServer:
                 message.get("session_dir"),
                 bool(message.get("include_entries", True)),
             )
+        elif msg_type == "voice_start":
+            await self._start_voice_stream(message, client_id)
+        elif msg_type == "voice_stop":
+            await self._finish_voice_stream(client_id)
+        elif msg_type == "voice_cancel":
+            await self._cancel_voice_stream(client_id)
         else:
             await self._send_to(client_id, {
                 "type": "error",
@@ -316,7 +382,89 @@ class WSServer:
         ]
         disconnected = [client_id for client_id in await asyncio.gather(*tasks) if client_id is not None]
         for client_id in disconnected:
-            self._clients.pop(client_id, None)
+            self._forget_client(client_id)
+
+    async def _broadcast_stream(self, stream_name: str, data: dict[str, Any]) -> None:
+        """Broadcast a versioned document: patches for delta clients, full documents otherwise."""
+        if not self._delta_clients:
+            # No one consumes versions: skip the stream's canonical copy and compare.
+            # A client opting in later has no recorded version and gets a full document.
+            await self.broadcast(stream_name, data)
+            return
+        stream = self._streams[stream_name]
+        version = stream.publish(data)
+        now = time.time()
+        payload_by_base: dict[Optional[int], str] = {}
+        sends: list[Any] = []
+        sent_clients: list[str] = []
+        for client_id, ws in list(self._clients.items()):
+            base: Optional[int] = None
+            if client_id in self._delta_clients:
+                base = self._client_versions.get(client_id, {}).get(stream_name)
+                if base == version:
+                    continue
+                if not stream.has_version(base):
+                    base = None
+            payload = payload_by_base.get(base)
+            if payload is None:
+                payload = self._stream_payload(stream, base, now)
+                payload_by_base[base] = payload
+            sends.append(self._broadcast_to_client(client_id, ws, payload))
+            sent_clients.append(client_id)
+        results = await asyncio.gather(*sends)
+        for client_id, failed in zip(sent_clients, results):
+            if failed is not None:
+                self._forget_client(client_id)
+            elif client_id in self._delta_clients:
+                self._client_versions.setdefault(client_id, {})[stream_name] = version
+
+    @staticmethod
+    def _stream_payload(stream: DeltaStream, base_version: Optional[int], now: float) -> str:
+        if base_version is None:
+            message: dict[str, Any] = {"type": stream.name, "data": stream.document, "version": stream.version}
+        else:
+            message = {
+                "type": f"{stream.name}_patch",
+                "data": {
+                    "base_version": base_version,
+                    "version": stream.version,
+                    "ops": stream.patch_ops(base_version),
+                },
+            }
+        message["timestamp"] = now
+        return json.dumps(message, ensure_ascii=False)
+
+    async def _send_stream_to_client(self, client_id: str, stream_name: str, data: dict[str, Any]) -> None:
+        if client_id not in self._delta_clients:
+            await self.send_to_client(client_id, stream_name, data)
+            return
+        stream = self._streams[stream_name]
+        stream.publish(data)
+        await self._send_stream_document(client_id, stream)
+
+    async def _send_stream_document(self, client_id: str, stream: DeltaStream) -> None:
+        ws = self._clients.get(client_id)
+        if ws is None:
+            return
+        failed = await self._broadcast_to_client(client_id, ws, self._stream_payload(stream, None, time.time()))
+        if failed is not None:
+            self._forget_client(client_id)
+        elif client_id in self._delta_clients:
+            self._client_versions.setdefault(client_id, {})[stream.name] = stream.version
+
+    async def _resync_client(self, client_id: str, stream_name: Any = None) -> None:
+        """Full documents for a client whose patched state diverged."""
+        names = [stream_name] if stream_name in self._streams else list(self._streams)
+        versions = self._client_versions.get(client_id, {})
+        for name in names:
+            versions.pop(name, None)
+            if self._streams[name].document is not None:
+                await self._send_stream_document(client_id, self._streams[name])
+
+    def _forget_client(self, client_id: str) -> None:
+        self._clients.pop(client_id, None)
+        self._delta_clients.discard(client_id)
+        self._client_versions.pop(client_id, None)
 
     async def _broadcast_to_client(
         self,
@@ -379,18 +527,11 @@ class WSServer:
         if now - self._last_world_snapshot_at < _THROTTLE_INTERVAL:
             return
         self._last_world_snapshot_at = now
-        await self.broadcast("world_snapshot", snapshot)
+        await self._broadcast_stream("world_snapshot", snapshot)
 
     async def send_world_snapshot_to_client(self, client_id: str, snapshot: dict[str, Any]) -> None:
         """Send the latest world snapshot directly to one client, bypassing throttle."""
-        await self._send_to(
-            client_id,
-            {
-                "type": "world_snapshot",
-                "data": snapshot,
-                "timestamp": time.time(),
-            },
-        )
+        await self._send_stream_to_client(client_id, "world_snapshot", snapshot)
 
     async def send_benchmark(self, benchmark_data: dict[str, Any]) -> None:
         await self.broadcast("benchmark", benchmark_data)
@@ -413,7 +554,7 @@ class WSServer:
         payload: dict[str, Any] = {"tasks": tasks}
         if pending_questions is not None:
             payload["pending_questions"] = pending_questions
-        await self.broadcast("task_list", payload)
+        await self._broadcast_stream("task_list", payload)
 
     async def send_task_list_to_client(
         self,
@@ -425,14 +566,7 @@ class WSServer:
         payload: dict[str, Any] = {"tasks": tasks}
         if pending_questions is not None:
             payload["pending_questions"] = pending_questions
-        await self._send_to(
-            client_id,
-            {
-                "type": "task_list",
-                "data": payload,
-                "timestamp": time.time(),
-            },
-        )
+        await self._send_stream_to_client(client_id, "task_list", payload)
 
     async def send_log_entry(self, entry: dict[str, Any]) -> None:
         await self.broadcast("log_entry", entry)
@@ -503,6 +637,72 @@ class WSServer:
             logger.exception("ASR handler error")
             return web.json_response({"ok": False, "error": str(e)}, status=500)
 
+    # --- Streaming voice ---
+
+    async def _start_voice_stream(self, message: dict[str, Any], client_id: str) -> None:
+        if not self.config.voice_enabled:
+            await self.send_error_to_client(
+                client_id, "Voice subsystem disabled", code="VOICE_UNAVAILABLE", inbound_type="voice_start"
+            )
+            return
+        # A new utterance replaces one the client never stopped.
+        await self._cancel_voice_stream(client_id)
+        try:
+            audio_format = str(message.get("format") or "pcm")
+            sample_rate = int(message.get("sample_rate") or 16000)
+            recognizer = self.asr_stream_factory(audio_format, sample_rate)
+        except Exception as e:
+            await self.send_error_to_client(
+                client_id, f"ASR stream unavailable: {e}", code="VOICE_UNAVAILABLE", inbound_type="voice_start"
+            )
+            return
+
+        async def on_transcript(text: str, sentence_end: bool) -> None:
+            await self.send_to_client(client_id, "asr_partial", {"text": text, "sentence_end": sentence_end})
+
+        session = StreamingASRSession(recognizer, on_transcript)
+        try:
+            await session.start()
+        except Exception as e:
+            logger.exception("ASR stream start failed for %s", client_id)
+            await self.send_to_client(client_id, "asr_final", {"ok": False, "text": "", "error": str(e)})
+            return
+        self._voice_streams[client_id] = _VoiceStream(session=session, submit=bool(message.get("submit")))
+
+    async def _handle_voice_frame(self, frame: bytes, client_id: str) -> None:
+        stream = self._voice_streams.get(client_id)
+        if stream is None:
+            await self.send_error_to_client(client_id, "No active voice stream", inbound_type="voice_frame")
+            return
+        try:
+            await stream.session.feed(frame)
+        except Exception as e:
+            logger.exception("ASR stream frame failed for %s", client_id)
+            self._voice_streams.pop(client_id, None)
+            await stream.session.cancel()
+            await self.send_to_client(client_id, "asr_final", {"ok": False, "text": "", "error": str(e)})
+
+    async def _finish_voice_stream(self, client_id: str) -> None:
+        stream = self._voice_streams.pop(client_id, None)
+        if stream is None:
+            await self.send_error_to_client(client_id, "No active voice stream", inbound_type="voice_stop")
+            return
+        try:
+            text = await stream.session.finish()
+        except Exception as e:
+            logger.exception("ASR stream stop failed for %s", client_id)
+            await self.send_to_client(client_id, "asr_final", {"ok": False, "text": "", "error": str(e)})
+            return
+        submitted = stream.submit and bool(text.strip())
+        await self.send_to_client(client_id, "asr_final", {"ok": True, "text": text, "submitted": submitted})
+        if submitted:
+            await self.inbound_handler.on_command_submit(text, client_id)
+
+    async def _cancel_voice_stream(self, client_id: str) -> None:
+        stream = self._voice_streams.pop(client_id, None)
+        if stream is not None:
+            await stream.session.cancel()
+
     async def _tts_handler(self, request: web.Request) -> web.Response:
         """POST /api/tts — receive JSON {"text", "voice"?, "format"?}, return audio bytes.
 
@@ -542,4 +742,4 @@ class WSServer:
                 timeout=self._broadcast_send_timeout_s,
             )
         except Exception:
-            self._clients.pop(client_id, None)
+            self._forget_client(client_id)